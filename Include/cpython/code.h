@@ -47,6 +47,11 @@ struct PyCodeObject {
        Type is a void* to keep the format private in codeobject.c to force
        people to go through the proper APIs. */
     void *co_extra;
+    /* Monitors registered by sys.add_code_monitor(): NULL or a tuple of
+       (weak reference to callback, events) pairs, and the union of their
+       events. */
+    PyObject *co_monitors;
+    int co_monitor_events;
 
     /* Per opcodes just-in-time cache
      *
@@ -140,6 +140,7 @@ typedef struct PyConfig {
     int faulthandler;
     int tracemalloc;
     int import_time;
+    int startup_timing;
     int show_ref_count;
     int dump_refs;
     int malloc_stats;
@@ -57,6 +57,17 @@ typedef struct _err_stackitem {
 
 } _PyErr_StackItem;
 
+/* Statistics on the GIL, see sys.getgilstats() */
+typedef struct {
+    uint64_t acquisitions;      /* number of times the GIL was taken */
+    uint64_t switches;          /* ... after another thread held it */
+    uint64_t contentions;       /* ... after waiting for it */
+    uint64_t drop_requests;     /* number of requests to drop the GIL */
+    int64_t wait_time;          /* time spent waiting for the GIL (_PyTime_t) */
+    int64_t max_wait_time;      /* longest wait for the GIL (_PyTime_t) */
+    int64_t hold_time;          /* time spent holding the GIL (_PyTime_t) */
+} _PyGILStats;
+
 
 // The PyThreadState typedef is in Include/pystate.h.
 struct _ts {
@@ -149,6 +160,9 @@ struct _ts {
 
     CFrame root_cframe;
 
+    /* Statistics on the GIL for this thread */
+    _PyGILStats gil_stats;
+
     /* XXX signal handlers should also be here */
 
 };
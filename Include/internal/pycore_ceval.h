@@ -59,6 +59,8 @@ extern int _PyEval_ThreadsInitialized(struct pyruntimestate *runtime);
 #endif
 extern PyStatus _PyEval_InitGIL(PyThreadState *tstate);
 extern void _PyEval_FiniGIL(PyInterpreterState *interp);
+extern void _PyEval_GetGILStats(PyThreadState *tstate, PyThreadState *thread,
+                               _PyGILStats *stats);
 
 extern void _PyEval_ReleaseLock(PyThreadState *tstate);
 
@@ -27,6 +27,19 @@ struct _PyOpcache {
 /* Private API */
 int _PyCode_InitOpcache(PyCodeObject *co);
 
+/* Events of the code monitors (PyCodeObject.co_monitor_events),
+   see sys.add_code_monitor() */
+#define _PyCode_MONITOR_CALL        0x01
+#define _PyCode_MONITOR_LINE        0x02
+#define _PyCode_MONITOR_RETURN      0x04
+#define _PyCode_MONITOR_EXCEPTION   0x08
+#define _PyCode_MONITOR_BRANCH      0x10
+
+/* Return a new reference to the callback of a monitor from its weak
+   reference, see sys.add_code_monitor().  Return NULL without an exception
+   set if the callback was destroyed. */
+extern PyObject* _PyCode_GetMonitorCallback(PyObject *ref);
+
 
 #ifdef __cplusplus
 }
@@ -31,6 +31,10 @@ struct _gil_runtime_state {
     _Py_atomic_int locked;
     /* Number of GIL switches since the beginning. */
     unsigned long switch_number;
+    /* Statistics on the GIL for all threads, and time at which the
+       current holder took it. */
+    _PyGILStats stats;
+    _PyTime_t hold_start;
     /* This condition variable allows one or several threads to wait
        until the GIL is released. In addition, the mutex also protects
        the above variables. */
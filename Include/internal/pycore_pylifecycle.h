@@ -115,6 +115,8 @@ extern void _PyGILState_Fini(PyInterpreterState *interp);
 
 PyAPI_FUNC(void) _PyGC_DumpShutdownStats(PyInterpreterState *interp);
 
+PyAPI_FUNC(void) _Py_StartupTiming(const PyConfig *config, const char *phase);
+
 PyAPI_FUNC(PyStatus) _Py_PreInitializeFromPyArgv(
     const PyPreConfig *src_config,
     const struct _PyArgv *args);
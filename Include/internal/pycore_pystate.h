@@ -118,6 +118,29 @@ static inline PyInterpreterState* _PyInterpreterState_GET(void) {
 }
 
 
+/* Tracing */
+
+/* Bit of CFrame.use_tracing set while evaluating a code object which has
+   monitors (see sys.add_code_monitor()).  The other bits are set while
+   a trace or profile function is set, for the whole thread. */
+#define _PyCFrame_MONITORED 2
+
+static inline void
+_PyThreadState_PauseTracing(PyThreadState *tstate)
+{
+    tstate->cframe->use_tracing &= _PyCFrame_MONITORED;
+}
+
+static inline void
+_PyThreadState_UpdateTracing(PyThreadState *tstate)
+{
+    int use_tracing = (tstate->c_tracefunc != NULL
+                       || tstate->c_profilefunc != NULL);
+    tstate->cframe->use_tracing =
+        (tstate->cframe->use_tracing & _PyCFrame_MONITORED) | use_tracing;
+}
+
+
 /* Other */
 
 PyAPI_FUNC(void) _PyThreadState_Init(
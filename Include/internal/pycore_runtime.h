@@ -117,6 +117,13 @@ typedef struct pyruntimestate {
 
     struct _Py_unicode_runtime_ids unicode_ids;
 
+    // Used by -X startup_timing: time of the runtime initialization and
+    // of the end of the last initialization phase.
+    struct _startup_timing {
+        _PyTime_t start;
+        _PyTime_t last;
+    } startup_timing;
+
     // XXX Consolidate globals found via the check-c-globals script.
 } _PyRuntimeState;
 
@@ -9,11 +9,13 @@
 from .coroutines import *
 from .events import *
 from .exceptions import *
+from .files import *
 from .futures import *
 from .locks import *
 from .protocols import *
 from .runners import *
 from .queues import *
+from .resolvers import *
 from .streams import *
 from .subprocess import *
 from .tasks import *
@@ -24,11 +26,13 @@
            coroutines.__all__ +
            events.__all__ +
            exceptions.__all__ +
+           files.__all__ +
            futures.__all__ +
            locks.__all__ +
            protocols.__all__ +
            runners.__all__ +
            queues.__all__ +
+           resolvers.__all__ +
            streams.__all__ +
            subprocess.__all__ +
            tasks.__all__ +
@@ -39,5 +43,6 @@
     from .windows_events import *
     __all__ += windows_events.__all__
 else:
+    from .prefork import *  # pragma: no cover
     from .unix_events import *  # pragma: no cover
-    __all__ += unix_events.__all__
+    __all__ += prefork.__all__ + unix_events.__all__
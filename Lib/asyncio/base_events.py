@@ -66,6 +66,21 @@
 # Maximum timeout passed to select to avoid OS limitations
 MAXIMUM_SELECT_TIMEOUT = 24 * 3600
 
+# Callbacks running for less than this duration in seconds are not
+# remembered in the event loop metrics as the slowest callbacks
+_MIN_SLOW_CALLBACK_DURATION = 0.001
+
+# Duration in seconds of a tick of the timer wheel
+_TIMER_WHEEL_RESOLUTION = 0.001
+
+# Number of slots of a level of the timer wheel
+_TIMER_WHEEL_BITS = 6
+_TIMER_WHEEL_SIZE = 1 << _TIMER_WHEEL_BITS
+_TIMER_WHEEL_MASK = _TIMER_WHEEL_SIZE - 1
+
+# Number of levels of the timer wheel
+_TIMER_WHEEL_LEVELS = 4
+
 # Used for deprecation and removal of `loop.create_datagram_endpoint()`'s
 # *reuse_address* parameter
 _unset = object()
@@ -80,6 +95,201 @@ def _format_handle(handle):
         return str(handle)
 
 
+class _LoopMetrics:
+    """Counters updated by BaseEventLoop._run_once()."""
+
+    __slots__ = ('iterations', 'callbacks', 'select_time',
+                 'event_processing_time', 'callback_time', 'max_ready',
+                 'timers', 'timer_lag_total', 'max_timer_lag',
+                 'slowest', 'slowest_count', 'slowest_threshold')
+
+    # Number of slowest callbacks remembered by the loop.
+    max_slowest = 10
+
+    def __init__(self):
+        self.iterations = 0
+        self.callbacks = 0
+        self.select_time = 0.0
+        self.event_processing_time = 0.0
+        self.callback_time = 0.0
+        self.max_ready = 0
+        self.timers = 0
+        self.timer_lag_total = 0.0
+        self.max_timer_lag = 0.0
+        # Min-heap of (duration, count, description) tuples
+        self.slowest = []
+        self.slowest_count = 0
+        # Callbacks faster than this are not remembered as the slowest ones.
+        self.slowest_threshold = _MIN_SLOW_CALLBACK_DURATION
+
+    def add_slow_callback(self, handle, dt):
+        """Remember a slow callback and return the new threshold."""
+        self.slowest_count += 1
+        item = (dt, self.slowest_count, _format_handle(handle))
+        if len(self.slowest) < self.max_slowest:
+            heapq.heappush(self.slowest, item)
+            if len(self.slowest) < self.max_slowest:
+                return self.slowest_threshold
+        else:
+            heapq.heapreplace(self.slowest, item)
+        self.slowest_threshold = self.slowest[0][0]
+        return self.slowest_threshold
+
+
+class _TimerWheel:
+    """Hierarchical timer wheel holding the timers scheduled far enough in
+    the future.
+
+    A slot of the level N spans _TIMER_WHEEL_SIZE ** N ticks of
+    _TIMER_WHEEL_RESOLUTION seconds.  Adding and removing a timer is O(1).
+    As time advances, the timers of a slot of a higher level are moved to
+    lower levels, and the timers due in the next tick are pushed to the
+    heap of the event loop, which runs them at their exact time.
+    """
+
+    def __init__(self, now):
+        # Timers due at or before this tick are no longer in the wheel.
+        self._tick = int(now / _TIMER_WHEEL_RESOLUTION) + 1
+        self._wheel = [[{} for index in range(_TIMER_WHEEL_SIZE)]
+                       for level in range(_TIMER_WHEEL_LEVELS)]
+        # Map id(timer) to the slot holding it.
+        self._slots = {}
+        # Cached result of _next_event()
+        self._next = None
+
+    def __len__(self):
+        return len(self._slots)
+
+    def _slot_tick(self, level, index):
+        """Return the next tick when a slot is emptied."""
+        shift = _TIMER_WHEEL_BITS * level
+        base = self._tick >> shift
+        k = (index - base) & _TIMER_WHEEL_MASK or _TIMER_WHEEL_SIZE
+        return (base + k) << shift
+
+    def add(self, timer):
+        """Add a TimerHandle to the wheel.
+
+        Return False if the timer is due in the next tick, the caller must
+        then push it to the heap itself.
+        """
+        try:
+            tick = int(timer._when / _TIMER_WHEEL_RESOLUTION)
+        except (TypeError, ValueError, OverflowError):
+            # Leave the timers with an unusual due time to the heap
+            return False
+        delta = tick - self._tick
+        if delta <= 0:
+            return False
+        level = 0
+        while delta >= _TIMER_WHEEL_SIZE and level < _TIMER_WHEEL_LEVELS - 1:
+            delta >>= _TIMER_WHEEL_BITS
+            level += 1
+        index = (tick >> (_TIMER_WHEEL_BITS * level)) & _TIMER_WHEEL_MASK
+        slot = self._wheel[level][index]
+        slot[id(timer)] = timer
+        self._slots[id(timer)] = slot
+        if (self._next is not None and
+                self._slot_tick(level, index) <= self._next[0]):
+            self._next = None
+        return True
+
+    def remove(self, timer):
+        """Remove a TimerHandle, return False if it is not in the wheel."""
+        slot = self._slots.pop(id(timer), None)
+        if slot is None:
+            return False
+        del slot[id(timer)]
+        return True
+
+    def pop_all(self):
+        """Remove all timers from the wheel and return them."""
+        timers = []
+        for slots in self._wheel:
+            for slot in slots:
+                timers.extend(slot.values())
+                slot.clear()
+        self._slots.clear()
+        self._next = None
+        return timers
+
+    def _next_event(self):
+        """Return a (tick, time) tuple for the next slot to empty, or None.
+
+        time is the earliest due time of the timers in the slot for the
+        first level.  For the other levels, whose timers are moved to lower
+        levels, it is the start of the tick preceding the slot tick.
+        """
+        if not self._slots:
+            self._next = None
+            return None
+        if self._next is None:
+            best = None
+            for level, slots in enumerate(self._wheel):
+                shift = _TIMER_WHEEL_BITS * level
+                base = self._tick >> shift
+                for k in range(1, _TIMER_WHEEL_SIZE + 1):
+                    slot = slots[(base + k) & _TIMER_WHEEL_MASK]
+                    if not slot:
+                        continue
+                    tick = (base + k) << shift
+                    if best is None or tick < best[0]:
+                        if level == 0:
+                            when = min(timer._when for timer in slot.values())
+                        else:
+                            when = (tick - 1) * _TIMER_WHEEL_RESOLUTION
+                        best = (tick, when)
+                    break
+            self._next = best
+        return self._next
+
+    def next_time(self):
+        """Return when advance() should be called, or None if empty."""
+        event = self._next_event()
+        if event is None:
+            return None
+        return event[1]
+
+    def advance(self, now, heap):
+        """Push the timers due before the end of the next tick to heap."""
+        target = int(now / _TIMER_WHEEL_RESOLUTION) + 1
+        if target <= self._tick:
+            return
+        slots = self._slots
+        while True:
+            event = self._next_event()
+            if event is None or event[0] > target:
+                self._tick = target
+                return
+            tick = self._tick = event[0]
+            self._next = None
+            for level in reversed(range(_TIMER_WHEEL_LEVELS)):
+                shift = _TIMER_WHEEL_BITS * level
+                if tick & ((1 << shift) - 1):
+                    continue
+                slot = self._wheel[level][(tick >> shift) & _TIMER_WHEEL_MASK]
+                if not slot:
+                    continue
+                timers = list(slot.values())
+                slot.clear()
+                for timer in timers:
+                    del slots[id(timer)]
+                    if level == 0 or not self.add(timer):
+                        heapq.heappush(heap, timer)
+
+
+_PyTimerWheel = _TimerWheel
+
+try:
+    # _asyncio.TimerWheel links the C TimerHandle objects it holds
+    from _asyncio import TimerWheel as _TimerWheel
+except ImportError:
+    pass
+else:
+    # _CTimerWheel is needed for tests.
+    _CTimerWheel = _TimerWheel
+
+
 def _format_pipe(fd):
     if fd == subprocess.PIPE:
         return '<pipe>'
@@ -389,7 +599,11 @@ def __init__(self):
         self._stopping = False
         self._ready = collections.deque()
         self._scheduled = []
+        # Timers due later than the next tick, if the timer wheel is enabled
+        self._timer_wheel = None
         self._default_executor = None
+        # Thread pool of the asyncio.AsyncFile objects
+        self._file_executor = None
         self._internal_fds = 0
         # Identifier of the thread running the event loop, or None if the
         # event loop is not running
@@ -402,6 +616,7 @@ def __init__(self):
         self.slow_callback_duration = 0.1
         self._current_handle = None
         self._task_factory = None
+        self._resolver = None
         self._coroutine_origin_tracking_enabled = False
         self._coroutine_origin_tracking_saved_depth = None
 
@@ -412,6 +627,7 @@ def __init__(self):
         self._asyncgens_shutdown_called = False
         # Set to True when `loop.shutdown_default_executor` is called.
         self._executor_shutdown_called = False
+        self._metrics = _LoopMetrics()
 
     def __repr__(self):
         return (
@@ -555,7 +771,7 @@ async def shutdown_asyncgens(self):
     async def shutdown_default_executor(self):
         """Schedule the shutdown of the default executor."""
         self._executor_shutdown_called = True
-        if self._default_executor is None:
+        if self._default_executor is None and self._file_executor is None:
             return
         future = self.create_future()
         thread = threading.Thread(target=self._do_shutdown, args=(future,))
@@ -567,7 +783,9 @@ async def shutdown_default_executor(self):
 
     def _do_shutdown(self, future):
         try:
-            self._default_executor.shutdown(wait=True)
+            for executor in (self._default_executor, self._file_executor):
+                if executor is not None:
+                    executor.shutdown(wait=True)
             self.call_soon_threadsafe(future.set_result, None)
         except Exception as ex:
             self.call_soon_threadsafe(future.set_exception, ex)
@@ -665,11 +883,17 @@ def close(self):
         self._closed = True
         self._ready.clear()
         self._scheduled.clear()
+        if self._timer_wheel is not None:
+            self._timer_wheel.pop_all()
         self._executor_shutdown_called = True
         executor = self._default_executor
         if executor is not None:
             self._default_executor = None
             executor.shutdown(wait=False)
+        executor = self._file_executor
+        if executor is not None:
+            self._file_executor = None
+            executor.shutdown(wait=False)
 
     def is_closed(self):
         """Returns True if the event loop was closed."""
@@ -694,6 +918,24 @@ def time(self):
         """
         return time.monotonic()
 
+    def get_timer_wheel(self):
+        return self._timer_wheel is not None
+
+    def set_timer_wheel(self, enabled):
+        """Enable or disable the timer wheel.
+
+        When enabled, timers are kept in a hierarchical timer wheel until
+        they are about to expire instead of in a heap: scheduling and
+        cancelling a timer are O(1), whatever the number of timers.
+        """
+        if enabled:
+            if self._timer_wheel is None:
+                self._timer_wheel = _TimerWheel(self.time())
+        elif self._timer_wheel is not None:
+            for timer in self._timer_wheel.pop_all():
+                heapq.heappush(self._scheduled, timer)
+            self._timer_wheel = None
+
     def call_later(self, delay, callback, *args, context=None):
         """Arrange for a callback to be called at a given time.
 
@@ -728,7 +970,8 @@ def call_at(self, when, callback, *args, context=None):
         timer = events.TimerHandle(when, callback, args, self, context)
         if timer._source_traceback:
             del timer._source_traceback[-1]
-        heapq.heappush(self._scheduled, timer)
+        if self._timer_wheel is None or not self._timer_wheel.add(timer):
+            heapq.heappush(self._scheduled, timer)
         timer._scheduled = True
         return timer
 
@@ -812,6 +1055,18 @@ def run_in_executor(self, executor, func, *args):
         return futures.wrap_future(
             executor.submit(func, *args), loop=self)
 
+    def _get_file_executor(self):
+        # File I/O gets its own thread pool: slow disk operations must not
+        # delay the DNS lookups and the other jobs of the default executor.
+        self._check_default_executor()
+        executor = self._file_executor
+        if executor is None:
+            executor = concurrent.futures.ThreadPoolExecutor(
+                thread_name_prefix='asyncio_file'
+            )
+            self._file_executor = executor
+        return executor
+
     def set_default_executor(self, executor):
         if not isinstance(executor, concurrent.futures.ThreadPoolExecutor):
             warnings.warn(
@@ -845,8 +1100,33 @@ def _getaddrinfo_debug(self, host, port, family, type, proto, flags):
             logger.debug(msg)
         return addrinfo
 
+    def set_resolver(self, resolver):
+        """Set the resolver used by loop.getaddrinfo().
+
+        If resolver is None, host names are resolved with
+        socket.getaddrinfo() in the default executor.
+
+        Otherwise, resolver must have a getaddrinfo() coroutine method with
+        the same signature as loop.getaddrinfo(), such as
+        asyncio.CachingResolver.  It is used by all the methods resolving
+        host names, like loop.create_connection() and open_connection().
+        """
+        if resolver is not None and not hasattr(resolver, 'getaddrinfo'):
+            raise TypeError('resolver must have a getaddrinfo() method '
+                            'or be None')
+        self._resolver = resolver
+
+    def get_resolver(self):
+        """Return the resolver, or None if the default one is in use."""
+        return self._resolver
+
     async def getaddrinfo(self, host, port, *,
                           family=0, type=0, proto=0, flags=0):
+        if self._resolver is not None:
+            return await self._resolver.getaddrinfo(
+                host, port, family=family, type=type, proto=proto,
+                flags=flags)
+
         if self._debug:
             getaddr_func = self._getaddrinfo_debug
         else:
@@ -1801,7 +2081,11 @@ def _add_callback_signalsafe(self, handle):
     def _timer_handle_cancelled(self, handle):
         """Notification that a TimerHandle has been cancelled."""
         if handle._scheduled:
-            self._timer_cancelled_count += 1
+            if (self._timer_wheel is not None and
+                    self._timer_wheel.remove(handle)):
+                handle._scheduled = False
+            else:
+                self._timer_cancelled_count += 1
 
     def _run_once(self):
         """Run one full iteration of the event loop.
@@ -1837,16 +2121,33 @@ def _run_once(self):
         timeout = None
         if self._ready or self._stopping:
             timeout = 0
-        elif self._scheduled:
-            # Compute the desired timeout.
-            when = self._scheduled[0]._when
-            timeout = min(max(0, when - self.time()), MAXIMUM_SELECT_TIMEOUT)
-
+        else:
+            when = None
+            if self._scheduled:
+                when = self._scheduled[0]._when
+            if self._timer_wheel is not None:
+                wheel_when = self._timer_wheel.next_time()
+                if wheel_when is not None and (when is None or
+                                               wheel_when < when):
+                    when = wheel_when
+            if when is not None:
+                # Compute the desired timeout.
+                timeout = min(max(0, when - self.time()),
+                              MAXIMUM_SELECT_TIMEOUT)
+
+        metrics = self._metrics
+        clock = time.monotonic
+        t0 = clock()
         event_list = self._selector.select(timeout)
+        start = clock()
+        metrics.select_time += start - t0
         self._process_events(event_list)
 
         # Handle 'later' callbacks that are ready.
-        end_time = self.time() + self._clock_resolution
+        now = self.time()
+        if self._timer_wheel is not None:
+            self._timer_wheel.advance(now, self._scheduled)
+        end_time = now + self._clock_resolution
         while self._scheduled:
             handle = self._scheduled[0]
             if handle._when >= end_time:
@@ -1854,6 +2155,12 @@ def _run_once(self):
             handle = heapq.heappop(self._scheduled)
             handle._scheduled = False
             self._ready.append(handle)
+            lag = now - handle._when
+            if lag > 0:
+                metrics.timer_lag_total += lag
+                if lag > metrics.max_timer_lag:
+                    metrics.max_timer_lag = lag
+            metrics.timers += 1
 
         # This is the only place where callbacks are actually *called*.
         # All other places just add them to ready.
@@ -1862,6 +2169,14 @@ def _run_once(self):
         # they will be run the next time (after another I/O poll).
         # Use an idiom that is thread-safe without using locks.
         ntodo = len(self._ready)
+        if ntodo > metrics.max_ready:
+            metrics.max_ready = ntodo
+        metrics.callbacks += ntodo
+        threshold = metrics.slowest_threshold
+        # Processing the I/O events and timers above is not accounted to
+        # the first callback.
+        prev = begin = clock()
+        metrics.event_processing_time += begin - start
         for i in range(ntodo):
             handle = self._ready.popleft()
             if handle._cancelled:
@@ -1879,7 +2194,13 @@ def _run_once(self):
                     self._current_handle = None
             else:
                 handle._run()
+            t1 = clock()
+            if t1 - prev > threshold:
+                threshold = metrics.add_slow_callback(handle, t1 - prev)
+            prev = t1
         handle = None  # Needed to break cycles when an exception occurs.
+        metrics.callback_time += prev - begin
+        metrics.iterations += 1
 
     def _set_coroutine_origin_tracking(self, enabled):
         if bool(enabled) == bool(self._coroutine_origin_tracking_enabled):
@@ -1904,3 +2225,29 @@ def set_debug(self, enabled):
 
         if self.is_running():
             self.call_soon_threadsafe(self._set_coroutine_origin_tracking, enabled)
+
+    def get_metrics(self):
+        """Return a dict of event loop performance counters."""
+        metrics = self._metrics
+        scheduled = len(self._scheduled) - self._timer_cancelled_count
+        if self._timer_wheel is not None:
+            scheduled += len(self._timer_wheel)
+        return {
+            'iterations': metrics.iterations,
+            'callbacks': metrics.callbacks,
+            'select_time': metrics.select_time,
+            'event_processing_time': metrics.event_processing_time,
+            'callback_time': metrics.callback_time,
+            'ready': len(self._ready),
+            'max_ready': metrics.max_ready,
+            'scheduled': scheduled,
+            'timers': metrics.timers,
+            'timer_lag_total': metrics.timer_lag_total,
+            'max_timer_lag': metrics.max_timer_lag,
+            'slowest_callbacks': [(dt, description) for dt, _, description
+                                  in sorted(metrics.slowest, reverse=True)],
+        }
+
+    def reset_metrics(self):
+        """Reset the counters returned by get_metrics()."""
+        self._metrics = _LoopMetrics()
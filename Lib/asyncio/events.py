@@ -118,27 +118,27 @@ def __hash__(self):
         return hash(self._when)
 
     def __lt__(self, other):
-        if isinstance(other, TimerHandle):
+        if isinstance(other, _PyTimerHandle):
             return self._when < other._when
         return NotImplemented
 
     def __le__(self, other):
-        if isinstance(other, TimerHandle):
+        if isinstance(other, _PyTimerHandle):
             return self._when < other._when or self.__eq__(other)
         return NotImplemented
 
     def __gt__(self, other):
-        if isinstance(other, TimerHandle):
+        if isinstance(other, _PyTimerHandle):
             return self._when > other._when
         return NotImplemented
 
     def __ge__(self, other):
-        if isinstance(other, TimerHandle):
+        if isinstance(other, _PyTimerHandle):
             return self._when > other._when or self.__eq__(other)
         return NotImplemented
 
     def __eq__(self, other):
-        if isinstance(other, TimerHandle):
+        if isinstance(other, _PyTimerHandle):
             return (self._when == other._when and
                     self._callback == other._callback and
                     self._args == other._args and
@@ -159,6 +159,10 @@ def when(self):
         return self._when
 
 
+_PyHandle = Handle
+_PyTimerHandle = TimerHandle
+
+
 class AbstractServer:
     """Abstract server returned by create_server()."""
 
@@ -270,6 +274,12 @@ def call_at(self, when, callback, *args):
     def time(self):
         raise NotImplementedError
 
+    def get_timer_wheel(self):
+        raise NotImplementedError
+
+    def set_timer_wheel(self, enabled):
+        raise NotImplementedError
+
     def create_future(self):
         raise NotImplementedError
 
@@ -291,6 +301,12 @@ def set_default_executor(self, executor):
 
     # Network I/O methods returning Futures.
 
+    def set_resolver(self, resolver):
+        raise NotImplementedError
+
+    def get_resolver(self):
+        raise NotImplementedError
+
     async def getaddrinfo(self, host, port, *,
                           family=0, type=0, proto=0, flags=0):
         raise NotImplementedError
@@ -585,6 +601,14 @@ def get_debug(self):
     def set_debug(self, enabled):
         raise NotImplementedError
 
+    # Performance metrics.
+
+    def get_metrics(self):
+        raise NotImplementedError
+
+    def reset_metrics(self):
+        raise NotImplementedError
+
 
 class AbstractEventLoopPolicy:
     """Abstract policy for accessing the event loop."""
@@ -816,3 +840,15 @@ def set_child_watcher(watcher):
     _c_get_running_loop = get_running_loop
     _c_get_event_loop = get_event_loop
     _c__get_event_loop = _get_event_loop
+
+
+try:
+    # A handle is created and run for every callback scheduled in the
+    # event loop, and timer handles are compared by heapq.
+    from _asyncio import Handle, TimerHandle
+except ImportError:
+    pass
+else:
+    # _CHandle and _CTimerHandle are needed for tests.
+    _CHandle = Handle
+    _CTimerHandle = TimerHandle
@@ -0,0 +1,221 @@
+"""Asynchronous file objects, running file I/O in a thread pool."""
+
+__all__ = ('AsyncFile', 'open_file')
+
+import collections
+import functools
+import os
+
+from . import events
+
+
+# Methods which don't write to the file: fsync() is not needed again after
+# them.
+_READ_METHODS = frozenset(('read', 'read1', 'readinto', 'readline',
+                           'readlines', 'seek', 'tell'))
+
+
+async def open_file(file, mode='r', buffering=-1, encoding=None,
+                    errors=None, newline=None, closefd=True, opener=None):
+    """Open file like the built-in open() function, in the file I/O thread
+    pool of the running event loop, and return an AsyncFile.
+    """
+    loop = events.get_running_loop()
+    f = await loop.run_in_executor(_get_executor(loop), open, file, mode,
+                                   buffering, encoding, errors, newline,
+                                   closefd, opener)
+    return AsyncFile(f, loop=loop)
+
+
+def _get_executor(loop):
+    # Event loops not derived from BaseEventLoop use their default executor
+    get_executor = getattr(loop, '_get_file_executor', None)
+    if get_executor is None:
+        return None
+    return get_executor()
+
+
+def _run_batch(f, ops):
+    # Run in a thread of the pool: return the outcome of each operation
+    outcomes = []
+    synced = False
+    for method, args in ops:
+        try:
+            if method == 'fsync':
+                if not synced:
+                    f.flush()
+                    os.fsync(f.fileno())
+                    synced = True
+                result = None
+            else:
+                if method not in _READ_METHODS:
+                    synced = False
+                result = getattr(f, method)(*args)
+        except BaseException as exc:
+            outcomes.append((None, exc))
+        else:
+            outcomes.append((result, None))
+    return outcomes
+
+
+class AsyncFile:
+    """Wrap a file object, running its methods in a thread pool.
+
+    The methods performing I/O return an asyncio.Future.  The operations
+    are run in the order of the calls.  The operations requested while
+    previous ones are running are run together, in a single call to the
+    thread pool, and consecutive fsync() calls with no write between them
+    are merged.  An operation cancelled before it started is skipped.
+    """
+
+    def __init__(self, file, *, loop=None):
+        if loop is None:
+            loop = events.get_running_loop()
+        self._file = file
+        self._loop = loop
+        # (future, method name, args) of the operations not started yet
+        self._pending = collections.deque()
+        self._running = False
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} file={self._file!r}>'
+
+    @property
+    def file(self):
+        """The wrapped file object."""
+        return self._file
+
+    @property
+    def name(self):
+        return self._file.name
+
+    @property
+    def mode(self):
+        return self._file.mode
+
+    @property
+    def closed(self):
+        return self._file.closed
+
+    def fileno(self):
+        return self._file.fileno()
+
+    def _submit(self, method, *args):
+        fut = self._loop.create_future()
+        self._pending.append((fut, method, args))
+        if not self._running:
+            self._run_pending()
+        return fut
+
+    def _run_pending(self):
+        # Skip the operations cancelled before they started
+        batch = [op for op in self._pending if not op[0].cancelled()]
+        self._pending.clear()
+        if not batch:
+            self._running = False
+            return
+        self._running = True
+        ops = [(method, args) for fut, method, args in batch]
+        try:
+            batch_fut = self._loop.run_in_executor(
+                _get_executor(self._loop), _run_batch, self._file, ops)
+        except Exception as exc:
+            # The event loop or the executor is closed
+            self._running = False
+            for fut, method, args in batch:
+                fut.set_exception(exc)
+            return
+        batch_fut.add_done_callback(
+            functools.partial(self._batch_done, batch))
+
+    def _batch_done(self, batch, batch_fut):
+        if batch_fut.cancelled():
+            # The executor was shut down with cancel_futures=True
+            for fut, method, args in batch:
+                fut.cancel()
+            self._running = False
+            return
+        exc = batch_fut.exception()
+        if exc is not None:
+            outcomes = [(None, exc)] * len(batch)
+        else:
+            outcomes = batch_fut.result()
+        for (fut, method, args), (result, exc) in zip(batch, outcomes):
+            if fut.cancelled():
+                continue
+            if exc is not None:
+                fut.set_exception(exc)
+            else:
+                fut.set_result(result)
+        # Break a reference cycle: the tracebacks of the exceptions
+        # reference the frames of the worker thread, which reference the
+        # outcomes.
+        outcomes.clear()
+        self._run_pending()
+
+    # The methods below return an asyncio.Future.
+
+    def read(self, size=-1):
+        return self._submit('read', size)
+
+    def read1(self, size=-1):
+        return self._submit('read1', size)
+
+    def readinto(self, b):
+        return self._submit('readinto', b)
+
+    def readline(self, size=-1):
+        return self._submit('readline', size)
+
+    def readlines(self, hint=-1):
+        return self._submit('readlines', hint)
+
+    def write(self, data):
+        return self._submit('write', data)
+
+    def writelines(self, lines):
+        return self._submit('writelines', lines)
+
+    def flush(self):
+        return self._submit('flush')
+
+    def fsync(self):
+        """Flush the file and call os.fsync() on it."""
+        return self._submit('fsync')
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        return self._submit('seek', offset, whence)
+
+    def tell(self):
+        return self._submit('tell')
+
+    def truncate(self, size=None):
+        return self._submit('truncate', size)
+
+    def close(self):
+        return self._submit('close')
+
+    async def sendfile(self, transport, offset=0, count=None, *,
+                       fallback=True):
+        """Send the file to transport with loop.sendfile().
+
+        The file is sent from offset, after the pending operations.
+        """
+        await self.flush()
+        return await self._loop.sendfile(transport, self._file, offset,
+                                         count, fallback=fallback)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        line = await self.readline()
+        if not line:
+            raise StopAsyncIteration
+        return line
@@ -0,0 +1,413 @@
+"""Prefork server: serve connections from several worker processes."""
+
+__all__ = 'PreforkServer',
+
+import os
+import signal
+import socket
+
+from . import events
+from . import exceptions
+from . import runners
+from . import tasks
+from .log import logger
+
+
+class _Worker:
+
+    def __init__(self, index, process, heartbeat_fd, loop):
+        self.index = index
+        self.process = process
+        # Read end of the pipe on which the worker sends heartbeats.
+        self.heartbeat_fd = heartbeat_fd
+        self.last_heartbeat = loop.time()
+        # Done when the worker is serving connections.
+        self.ready = loop.create_future()
+        # Done when the worker process has exited.
+        self.exited = loop.create_future()
+        # True once the worker has been asked to stop.
+        self.retired = False
+        # True if the worker was killed because it was unresponsive.
+        self.killed = False
+        self.kill_handle = None
+
+
+class PreforkServer:
+    """Serve TCP connections with several worker processes.
+
+    The listening sockets are created by the supervisor process, then
+    each worker process runs its own event loop, calling
+    loop.create_server() with *protocol_factory* on these sockets.  If
+    *reuse_port* is true, each worker listens on its own socket bound
+    to the same address with the SO_REUSEPORT option, so that the kernel
+    balances the connections between the workers.
+
+    The supervisor restarts the workers which exit or which stop sending
+    heartbeats for *health_check_timeout* seconds, because their event
+    loop is blocked.  SIGTERM and SIGINT stop the server gracefully, and
+    SIGHUP replaces the workers one at a time.
+
+    Worker processes are forked: this class is only available on Unix.
+    """
+
+    def __init__(self, protocol_factory, host=None, port=None, *,
+                 workers=None,
+                 family=socket.AF_UNSPEC,
+                 flags=socket.AI_PASSIVE,
+                 backlog=100,
+                 ssl=None,
+                 reuse_address=None,
+                 reuse_port=False,
+                 ssl_handshake_timeout=None,
+                 worker_init=None,
+                 health_check_interval=1.0,
+                 health_check_timeout=10.0,
+                 shutdown_timeout=30.0):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 0:
+            raise ValueError('workers must be greater than zero')
+        if health_check_interval <= 0:
+            raise ValueError('health_check_interval must be positive')
+        if health_check_timeout <= health_check_interval:
+            raise ValueError('health_check_timeout must be greater than '
+                             'health_check_interval')
+        self._protocol_factory = protocol_factory
+        self._host = host
+        self._port = port
+        self._num_workers = workers
+        self._family = family
+        self._flags = flags
+        self._backlog = backlog
+        self._ssl = ssl
+        self._reuse_address = reuse_address
+        self._reuse_port = reuse_port
+        self._ssl_handshake_timeout = ssl_handshake_timeout
+        self._worker_init = worker_init
+        self._health_check_interval = health_check_interval
+        self._health_check_timeout = health_check_timeout
+        self._shutdown_timeout = shutdown_timeout
+
+        self._loop = None
+        self._server = None
+        self._workers = []
+        self._started = False
+        self._closing = False
+        self._stopped = None
+        self._health_handle = None
+        self._restart_task = None
+
+    def __repr__(self):
+        return (f'<{self.__class__.__name__} sockets={self.sockets!r} '
+                f'workers={len(self._workers)}>')
+
+    @property
+    def sockets(self):
+        """The listening sockets, as a tuple."""
+        if self._server is None:
+            return ()
+        return self._server.sockets
+
+    @property
+    def pids(self):
+        """The process ids of the running workers, as a tuple."""
+        return tuple(worker.process.pid for worker in self._workers
+                     if not worker.retired)
+
+    def is_serving(self):
+        return self._started and not self._closing
+
+    async def start(self):
+        """Create the listening sockets and start the worker processes.
+
+        Return when all the workers are serving connections.
+        """
+        if self._loop is not None:
+            raise RuntimeError(f'{self!r} was already started')
+        import multiprocessing
+        self._mp_context = multiprocessing.get_context('fork')
+        self._loop = loop = events.get_running_loop()
+        self._stopped = loop.create_future()
+        # The sockets are not listening in the supervisor: the workers
+        # call listen(), or bind their own sockets if reuse_port is true.
+        self._server = await loop.create_server(
+            self._protocol_factory, self._host, self._port,
+            family=self._family, flags=self._flags, backlog=self._backlog,
+            reuse_address=self._reuse_address, reuse_port=self._reuse_port,
+            start_serving=False)
+        try:
+            workers = [self._spawn(index)
+                       for index in range(self._num_workers)]
+            self._schedule_health_check()
+            await tasks.gather(*[worker.ready for worker in workers])
+        except BaseException:
+            await self._shutdown()
+            raise
+        self._started = True
+
+    async def serve_forever(self):
+        """Start the server if needed, and serve until stop() is called
+        or the supervisor receives SIGTERM or SIGINT.
+
+        SIGHUP calls restart().  The workers are stopped gracefully
+        before returning.
+        """
+        if self._loop is None:
+            await self.start()
+        loop = self._loop
+        loop.add_signal_handler(signal.SIGTERM, self.stop)
+        loop.add_signal_handler(signal.SIGINT, self.stop)
+        loop.add_signal_handler(signal.SIGHUP, self.restart)
+        try:
+            await self._stopped
+        finally:
+            for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+                loop.remove_signal_handler(sig)
+            await self._shutdown()
+
+    def stop(self):
+        """Ask serve_forever() to stop the server gracefully."""
+        if self._stopped is not None and not self._stopped.done():
+            self._stopped.set_result(None)
+
+    def restart(self):
+        """Replace the workers one at a time.
+
+        Each new worker is started before the old one is stopped, so
+        that connections are always accepted.
+        """
+        if not self.is_serving():
+            raise RuntimeError(f'{self!r} is not serving')
+        if self._restart_task is None or self._restart_task.done():
+            self._restart_task = self._loop.create_task(self._restart())
+
+    async def wait_restarted(self):
+        """Wait until the pending restart, if any, is complete and the
+        old workers have exited."""
+        if self._restart_task is not None:
+            await tasks.shield(self._restart_task)
+
+    async def _restart(self):
+        retired = []
+        for old in list(self._workers):
+            if old.retired or self._closing:
+                continue
+            new = self._spawn(old.index)
+            try:
+                await new.ready
+            except Exception as exc:
+                logger.error('Restart of %r aborted: %s', self, exc)
+                break
+            self._retire(old)
+            retired.append(old.exited)
+        if retired:
+            await tasks.wait(retired)
+
+    def _spawn(self, index):
+        loop = self._loop
+        read_fd, write_fd = os.pipe()
+        try:
+            process = self._mp_context.Process(
+                target=self._worker_main, args=(index, write_fd),
+                name=f'asyncio-prefork-worker-{index}')
+            process.start()
+        except BaseException:
+            os.close(read_fd)
+            raise
+        finally:
+            os.close(write_fd)
+        os.set_blocking(read_fd, False)
+        worker = _Worker(index, process, read_fd, loop)
+        self._workers.append(worker)
+        loop.add_reader(read_fd, self._read_heartbeat, worker)
+        loop.add_reader(process.sentinel, self._worker_exited, worker)
+        if loop.get_debug():
+            logger.debug('%r started worker %d (pid %d)',
+                         self, index, process.pid)
+        return worker
+
+    def _retire(self, worker):
+        if worker.retired or worker.exited.done():
+            return
+        worker.retired = True
+        worker.process.terminate()
+        worker.kill_handle = self._loop.call_later(
+            self._shutdown_timeout, self._kill, worker)
+
+    def _kill(self, worker):
+        if not worker.exited.done():
+            logger.warning('%r worker %d (pid %d) did not stop in time, '
+                           'killing it',
+                           self, worker.index, worker.process.pid)
+            worker.process.kill()
+
+    def _read_heartbeat(self, worker):
+        try:
+            data = os.read(worker.heartbeat_fd, 4096)
+        except BlockingIOError:
+            return
+        if not data:
+            # The worker exited: _worker_exited() cleans up.
+            self._loop.remove_reader(worker.heartbeat_fd)
+            return
+        worker.last_heartbeat = self._loop.time()
+        if not worker.ready.done():
+            worker.ready.set_result(None)
+
+    def _worker_exited(self, worker):
+        loop = self._loop
+        loop.remove_reader(worker.process.sentinel)
+        loop.remove_reader(worker.heartbeat_fd)
+        os.close(worker.heartbeat_fd)
+        worker.process.join()
+        if worker.kill_handle is not None:
+            worker.kill_handle.cancel()
+        self._workers.remove(worker)
+        exitcode = worker.process.exitcode
+        worker.process.close()
+        worker.exited.set_result(exitcode)
+        if not worker.ready.done():
+            worker.ready.set_exception(RuntimeError(
+                f'worker {worker.index} exited with code {exitcode} '
+                f'before serving'))
+            # Consumed by start() or restart(), if they wait for it.
+            worker.ready.exception()
+        if worker.retired or self._closing:
+            return
+        logger.warning('%r worker %d exited unexpectedly with code %s',
+                       self, worker.index, exitcode)
+        if not self._started:
+            return
+        if worker.ready.cancelled() or worker.ready.exception() is not None:
+            # Don't fork in a loop if the workers fail to start.
+            loop.call_later(self._health_check_interval,
+                            self._respawn, worker.index)
+        else:
+            self._respawn(worker.index)
+
+    def _respawn(self, index):
+        if not self._closing:
+            self._spawn(index)
+
+    def _schedule_health_check(self):
+        self._health_handle = self._loop.call_later(
+            self._health_check_interval, self._check_health)
+
+    def _check_health(self):
+        now = self._loop.time()
+        for worker in self._workers:
+            if (not worker.retired and not worker.killed and
+                    now - worker.last_heartbeat > self._health_check_timeout):
+                logger.warning('%r worker %d (pid %d) sent no heartbeat for '
+                               '%.1f seconds, killing it',
+                               self, worker.index, worker.process.pid,
+                               now - worker.last_heartbeat)
+                worker.killed = True
+                worker.process.kill()
+        self._schedule_health_check()
+
+    async def _shutdown(self):
+        if self._closing:
+            return
+        self._closing = True
+        if self._health_handle is not None:
+            self._health_handle.cancel()
+        if self._restart_task is not None:
+            self._restart_task.cancel()
+        waiters = []
+        for worker in list(self._workers):
+            self._retire(worker)
+            waiters.append(worker.exited)
+        if waiters:
+            await tasks.wait(waiters)
+        self._server.close()
+        self._stopped.cancel()
+
+    # Worker process
+
+    def _worker_main(self, index, heartbeat_fd):
+        # Forget the signal handlers and the other workers of the
+        # supervisor: the worker runs a new event loop.
+        signal.set_wakeup_fd(-1)
+        for sig in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+            signal.signal(sig, signal.SIG_DFL)
+        for worker in self._workers:
+            os.close(worker.heartbeat_fd)
+        self._workers = []
+        events.set_event_loop(None)
+        runners.run(self._worker_serve(index, heartbeat_fd))
+
+    async def _worker_serve(self, index, heartbeat_fd):
+        loop = events.get_running_loop()
+        stop = loop.create_future()
+
+        def on_stop():
+            if not stop.done():
+                stop.set_result(None)
+
+        loop.add_signal_handler(signal.SIGTERM, on_stop)
+        loop.add_signal_handler(signal.SIGINT, on_stop)
+
+        if self._worker_init is not None:
+            res = self._worker_init(index)
+            if res is not None:
+                await res
+
+        servers = []
+        for sock in self._server._sockets:
+            if self._reuse_port:
+                sock = _reuse_port_socket(sock)
+            servers.append(await loop.create_server(
+                self._protocol_factory, sock=sock, backlog=self._backlog,
+                ssl=self._ssl,
+                ssl_handshake_timeout=self._ssl_handshake_timeout))
+
+        os.set_blocking(heartbeat_fd, False)
+        interval = self._health_check_interval
+
+        def heartbeat():
+            try:
+                os.write(heartbeat_fd, b'.')
+            except BlockingIOError:
+                pass
+            except OSError:
+                # The supervisor is gone
+                on_stop()
+                return
+            loop.call_later(interval, heartbeat)
+
+        heartbeat()
+        await stop
+
+        # Stop accepting connections, and wait until the current ones
+        # are closed.  Server.wait_closed() does not wait for them once
+        # the server is closed: register waiters before.
+        waiters = []
+        for server in servers:
+            waiter = loop.create_future()
+            server._waiters.append(waiter)
+            waiters.append(waiter)
+            server.close()
+        try:
+            await tasks.wait_for(tasks.gather(*waiters),
+                                 self._shutdown_timeout)
+        except exceptions.TimeoutError:
+            pass
+
+
+def _reuse_port_socket(listening_sock):
+    # Bind a new socket to the address of the supervisor's socket, which
+    # has the SO_REUSEPORT option, but does not listen itself.
+    sock = socket.socket(listening_sock.family, listening_sock.type,
+                         listening_sock.proto)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, True)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, True)
+        if sock.family == socket.AF_INET6:
+            sock.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, True)
+        sock.bind(listening_sock.getsockname())
+    except BaseException:
+        sock.close()
+        raise
+    listening_sock.close()
+    return sock
@@ -243,3 +243,29 @@ def _put(self, item):
 
     def _get(self):
         return self._queue.pop()
+
+
+_PyQueue = Queue
+_PyPriorityQueue = PriorityQueue
+_PyLifoQueue = LifoQueue
+
+try:
+    import _asyncio
+except ImportError:
+    pass
+else:
+    # The C base classes implement the methods putting and getting items;
+    # get() and put() only create a future when they have to wait.
+    class Queue(_asyncio._Queue, _PyQueue):
+        __doc__ = _PyQueue.__doc__
+
+    class PriorityQueue(_asyncio._PriorityQueue, Queue):
+        __doc__ = _PyPriorityQueue.__doc__
+
+    class LifoQueue(_asyncio._LifoQueue, Queue):
+        __doc__ = _PyLifoQueue.__doc__
+
+    # _CQueue, _CPriorityQueue and _CLifoQueue are needed for tests.
+    _CQueue = Queue
+    _CPriorityQueue = PriorityQueue
+    _CLifoQueue = LifoQueue
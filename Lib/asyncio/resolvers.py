@@ -0,0 +1,92 @@
+"""Caching resolver for the event loop's getaddrinfo()."""
+
+__all__ = 'CachingResolver',
+
+import collections
+import functools
+import socket
+
+from . import events
+from . import tasks
+
+
+class CachingResolver:
+    """Resolve host names with socket.getaddrinfo() in the default executor
+    and cache the results.
+
+    Successful lookups are cached for *ttl* seconds, and failed lookups
+    (socket.gaierror) for *negative_ttl* seconds.  Concurrent lookups of
+    the same address share the same call to socket.getaddrinfo().  At most
+    *maxsize* results are kept, the least recently used ones are dropped
+    first.
+
+    socket.getaddrinfo() does not report the time to live of the DNS
+    records: *ttl* should not exceed the lowest TTL of the names looked up.
+    """
+
+    def __init__(self, *, ttl=60.0, negative_ttl=5.0, maxsize=1024):
+        if ttl < 0 or negative_ttl < 0:
+            raise ValueError('ttl and negative_ttl must be non-negative')
+        if maxsize <= 0:
+            raise ValueError('maxsize must be greater than zero')
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._maxsize = maxsize
+        # Map (host, port, family, type, proto, flags) to an
+        # (expiration time, addresses or socket.gaierror) tuple.
+        self._cache = collections.OrderedDict()
+        # Map the same keys to the futures of the lookups in progress.
+        self._pending = {}
+
+    def __repr__(self):
+        return (f'<{self.__class__.__name__} ttl={self._ttl} '
+                f'negative_ttl={self._negative_ttl} '
+                f'cached={len(self._cache)} pending={len(self._pending)}>')
+
+    def clear(self):
+        """Remove all the cached results."""
+        self._cache.clear()
+
+    async def getaddrinfo(self, host, port, *,
+                          family=0, type=0, proto=0, flags=0):
+        """Asynchronous version of socket.getaddrinfo(), using the cache."""
+        loop = events.get_running_loop()
+        key = (host, port, family, type, proto, flags)
+        entry = self._cache.get(key)
+        if entry is not None:
+            expires, result = entry
+            if loop.time() < expires:
+                self._cache.move_to_end(key)
+                if isinstance(result, socket.gaierror):
+                    raise socket.gaierror(*result.args)
+                return list(result)
+            del self._cache[key]
+
+        fut = self._pending.get(key)
+        if fut is None or fut.get_loop() is not loop:
+            fut = loop.run_in_executor(None, socket.getaddrinfo,
+                                       host, port, family, type, proto, flags)
+            self._pending[key] = fut
+            fut.add_done_callback(functools.partial(self._lookup_done, key))
+        # A cancelled caller must not cancel the lookup of the others.
+        return list(await tasks.shield(fut))
+
+    def _lookup_done(self, key, fut):
+        if self._pending.get(key) is fut:
+            del self._pending[key]
+        if fut.cancelled():
+            return
+        exc = fut.exception()
+        if exc is None:
+            result = fut.result()
+            ttl = self._ttl
+        elif isinstance(exc, socket.gaierror):
+            result = exc
+            ttl = self._negative_ttl
+        else:
+            return
+        if ttl > 0:
+            self._cache[key] = (fut.get_loop().time() + ttl, result)
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
@@ -9,6 +9,8 @@
 import collections
 import errno
 import functools
+import itertools
+import os
 import selectors
 import socket
 import warnings
@@ -29,6 +31,22 @@
 from .log import logger
 
 
+_HAS_SENDMSG = hasattr(socket.socket, 'sendmsg')
+
+if _HAS_SENDMSG:
+    try:
+        # Maximum number of buffers passed to a single sendmsg() call
+        SC_IOV_MAX = os.sysconf('SC_IOV_MAX')
+    except (OSError, ValueError):
+        # Fallback to send()
+        _HAS_SENDMSG = False
+    else:
+        if SC_IOV_MAX <= 0:
+            # The limit is indeterminate: use the minimum required by POSIX
+            # (_XOPEN_IOV_MAX)
+            SC_IOV_MAX = 16
+
+
 def _test_selector_event(selector, fd, event):
     # Test if the selector is monitoring 'event' events
     # for the file descriptor 'fd'.
@@ -373,6 +391,9 @@ async def sock_recv(self, sock, n):
         return await fut
 
     def _sock_read_done(self, fd, fut, handle=None):
+        # Unregister at once rather than keeping the registration for the
+        # next read: the socket may be closed right after, and epoll can't
+        # forget a closed file descriptor whose file description is shared.
         if handle is None or not handle.cancelled():
             self.remove_reader(fd)
 
@@ -754,11 +775,30 @@ def _add_reader(self, fd, callback, *args):
         self._loop._add_reader(fd, callback, *args)
 
 
+def _buffer_view(data):
+    """Return a byte view of data which can be queued for writing.
+
+    Views of bytes objects are referenced rather than copied.  Other
+    buffers are copied because the caller may modify them once write()
+    returns, even through a read-only view.
+    """
+    if isinstance(data, bytes):
+        return data
+    view = memoryview(data)
+    if isinstance(view.obj, bytes) and view.c_contiguous:
+        return view.cast('B')
+    return memoryview(view.tobytes())
+
+
 class _SelectorSocketTransport(_SelectorTransport):
 
     _start_tls_compatible = True
     _sendfile_compatible = constants._SendfileMode.TRY_NATIVE
 
+    # Queue of bytes and byte memoryviews: written data is not joined
+    # into a single buffer, sendmsg() writes several of them at once.
+    _buffer_factory = collections.deque
+
     def __init__(self, loop, sock, protocol, waiter=None,
                  extra=None, server=None):
 
@@ -767,6 +807,11 @@ def __init__(self, loop, sock, protocol, waiter=None,
         self._eof = False
         self._paused = False
         self._empty_waiter = None
+        self._buffer_size = 0
+        if _HAS_SENDMSG:
+            self._send_buffers = self._sendmsg
+        else:
+            self._send_buffers = self._send_first
 
         # Disable the Nagle algorithm -- small writes will be
         # sent without waiting for the TCP ACK.  This generally
@@ -924,23 +969,101 @@ def write(self, data):
                 self._fatal_error(exc, 'Fatal write error on socket transport')
                 return
             else:
-                data = data[n:]
+                data = memoryview(data).cast('B')[n:]
                 if not data:
                     return
             # Not all was written; register write handler.
             self._loop._add_writer(self._sock_fd, self._write_ready)
 
         # Add it to the buffer.
-        self._buffer.extend(data)
+        data = _buffer_view(data)
+        self._buffer.append(data)
+        self._buffer_size += len(data)
+        self._maybe_pause_protocol()
+
+    def writelines(self, list_of_data):
+        """Write an iterable of bytes-like objects to the transport.
+
+        The buffers are not concatenated: they are written together with
+        socket.sendmsg() where available.
+        """
+        if self._eof:
+            raise RuntimeError('Cannot call writelines() after write_eof()')
+        if self._empty_waiter is not None:
+            raise RuntimeError('unable to writelines; sendfile is in progress')
+        views = []
+        size = 0
+        for data in list_of_data:
+            if not isinstance(data, (bytes, bytearray, memoryview)):
+                raise TypeError(f'data argument must be a bytes-like object, '
+                                f'not {type(data).__name__!r}')
+            if data:
+                data = _buffer_view(data)
+                views.append(data)
+                size += len(data)
+        if not size:
+            return
+
+        if self._conn_lost:
+            if self._conn_lost >= constants.LOG_THRESHOLD_FOR_CONNLOST_WRITES:
+                logger.warning('socket.send() raised exception.')
+            self._conn_lost += 1
+            return
+
+        if not self._buffer:
+            # Optimization: try to send now.
+            try:
+                n = self._send_buffers(views)
+            except (BlockingIOError, InterruptedError):
+                n = 0
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as exc:
+                self._fatal_error(exc, 'Fatal write error on socket transport')
+                return
+            if n == size:
+                return
+            # Not all was written; register write handler.
+            self._loop._add_writer(self._sock_fd, self._write_ready)
+        else:
+            n = 0
+
+        # Add the leftover to the buffer.
+        self._buffer.extend(views)
+        self._buffer_size += size
+        self._adjust_leftover_buffer(n)
         self._maybe_pause_protocol()
 
+    def get_write_buffer_size(self):
+        return self._buffer_size
+
+    def _adjust_leftover_buffer(self, nbytes):
+        self._buffer_size -= nbytes
+        buffer = self._buffer
+        while nbytes:
+            b = buffer.popleft()
+            b_len = len(b)
+            if b_len <= nbytes:
+                nbytes -= b_len
+            else:
+                buffer.appendleft(memoryview(b)[nbytes:])
+                break
+
+    def _sendmsg(self, buffers):
+        if len(buffers) > SC_IOV_MAX:
+            buffers = itertools.islice(buffers, SC_IOV_MAX)
+        return self._sock.sendmsg(buffers)
+
+    def _send_first(self, buffers):
+        return self._sock.send(buffers[0])
+
     def _write_ready(self):
         assert self._buffer, 'Data should not be empty'
 
         if self._conn_lost:
             return
         try:
-            n = self._sock.send(self._buffer)
+            n = self._send_buffers(self._buffer)
         except (BlockingIOError, InterruptedError):
             pass
         except (SystemExit, KeyboardInterrupt):
@@ -948,12 +1071,12 @@ def _write_ready(self):
         except BaseException as exc:
             self._loop._remove_writer(self._sock_fd)
             self._buffer.clear()
+            self._buffer_size = 0
             self._fatal_error(exc, 'Fatal write error on socket transport')
             if self._empty_waiter is not None:
                 self._empty_waiter.set_exception(exc)
         else:
-            if n:
-                del self._buffer[:n]
+            self._adjust_leftover_buffer(n)
             self._maybe_resume_protocol()  # May append to buffer.
             if not self._buffer:
                 self._loop._remove_writer(self._sock_fd)
@@ -974,6 +1097,11 @@ def write_eof(self):
     def can_write_eof(self):
         return True
 
+    def _force_close(self, exc):
+        super()._force_close(exc)
+        if not self._buffer:
+            self._buffer_size = 0
+
     def _call_connection_lost(self, exc):
         super()._call_connection_lost(exc)
         if self._empty_waiter is not None:
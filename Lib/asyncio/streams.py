@@ -20,6 +20,17 @@
 
 
 _DEFAULT_LIMIT = 2 ** 16  # 64 KiB
+_RECV_BUFFER_SIZE = 2 ** 18  # 256 KiB, like the transports' max_size
+
+# readinto() lets the protocol receive data directly into buffers of at
+# least this size rather than copying it through the internal buffer.
+_MIN_DIRECT_READ_SIZE = 2 ** 16  # 64 KiB
+
+# Receive buffers lent by StreamReaderProtocol.get_buffer().  A buffer is
+# given back by buffer_updated(), once its content has been copied to the
+# StreamReader, so all streams share a few buffers.
+_free_recv_buffers = []
+_MAX_FREE_RECV_BUFFERS = 8
 
 
 async def open_connection(host=None, port=None, *,
@@ -181,7 +192,7 @@ def _get_close_waiter(self, stream):
         raise NotImplementedError
 
 
-class StreamReaderProtocol(FlowControlMixin, protocols.Protocol):
+class StreamReaderProtocol(FlowControlMixin, protocols.BufferedProtocol):
     """Helper class to adapt between Protocol and StreamReader.
 
     (This is a helper class instead of making StreamReader itself a
@@ -210,6 +221,12 @@ def __init__(self, stream_reader, client_connected_cb=None, loop=None):
         self._client_connected_cb = client_connected_cb
         self._over_ssl = False
         self._closed = self._loop.create_future()
+        self._recv_buffer = None
+        self._direct_read = False
+        # Subclasses overriding data_received() still get the received data
+        # through it, as bytes.
+        self._override_data_received = (
+            type(self).data_received is not StreamReaderProtocol.data_received)
 
     @property
     def _stream_reader(self):
@@ -266,6 +283,42 @@ def data_received(self, data):
         if reader is not None:
             reader.feed_data(data)
 
+    def get_buffer(self, sizehint):
+        reader = self._stream_reader
+        if reader is not None and not self._override_data_received:
+            buf = reader._get_direct_buffer()
+            if buf is not None:
+                self._direct_read = True
+                return buf
+        self._direct_read = False
+        buf = self._recv_buffer
+        if buf is None:
+            try:
+                buf = _free_recv_buffers.pop()
+            except IndexError:
+                buf = bytearray(_RECV_BUFFER_SIZE)
+            self._recv_buffer = buf
+        return buf
+
+    def buffer_updated(self, nbytes):
+        reader = self._stream_reader
+        if self._direct_read:
+            self._direct_read = False
+            if reader is not None:
+                reader._direct_buffer_updated(nbytes)
+            return
+        buf = self._recv_buffer
+        self._recv_buffer = None
+        try:
+            if self._override_data_received:
+                self.data_received(bytes(buf[:nbytes]))
+            elif reader is not None:
+                with memoryview(buf) as view:
+                    reader.feed_data(view[:nbytes])
+        finally:
+            if len(_free_recv_buffers) < _MAX_FREE_RECV_BUFFERS:
+                _free_recv_buffers.append(buf)
+
     def eof_received(self):
         reader = self._stream_reader
         if reader is not None:
@@ -394,6 +447,8 @@ def __init__(self, limit=_DEFAULT_LIMIT, loop=None):
         self._exception = None
         self._transport = None
         self._paused = False
+        self._direct_buffer = None  # Buffer of a waiting readinto() call
+        self._direct_nbytes = 0
         if self._loop.get_debug():
             self._source_traceback = format_helpers.extract_stack(
                 sys._getframe(1))
@@ -475,10 +530,28 @@ def feed_data(self, data):
             else:
                 self._paused = True
 
-    async def _wait_for_data(self, func_name):
+    def _get_direct_buffer(self):
+        """Return the buffer passed to a waiting readinto() call, or None.
+
+        The protocol may receive data directly into this buffer instead of
+        calling feed_data().
+        """
+        if self._buffer:
+            return None
+        return self._direct_buffer
+
+    def _direct_buffer_updated(self, nbytes):
+        self._direct_buffer = None
+        self._direct_nbytes = nbytes
+        self._wakeup_waiter()
+
+    async def _wait_for_data(self, func_name, direct_buffer=None):
         """Wait until feed_data() or feed_eof() is called.
 
         If stream was paused, automatically resume it.
+
+        If direct_buffer is given, the protocol may receive data directly
+        into it: return the number of bytes written there.
         """
         # StreamReader uses a future to link the protocol feed_data() method
         # to a read coroutine. Running two read coroutines at the same time
@@ -498,10 +571,20 @@ async def _wait_for_data(self, func_name):
             self._transport.resume_reading()
 
         self._waiter = self._loop.create_future()
+        self._direct_buffer = direct_buffer
+        self._direct_nbytes = 0
         try:
             await self._waiter
+        except BaseException:
+            if self._direct_nbytes:
+                # Don't lose the data if the read is cancelled.
+                self._buffer[:0] = direct_buffer[:self._direct_nbytes]
+                self._direct_nbytes = 0
+            raise
         finally:
             self._waiter = None
+            self._direct_buffer = None
+        return self._direct_nbytes
 
     async def readline(self):
         """Read chunk of data from the stream until newline (b'\n') is found.
@@ -675,6 +758,48 @@ async def read(self, n=-1):
         self._maybe_resume_transport()
         return data
 
+    async def readinto(self, buf):
+        """Read up to len(buf) bytes from the stream into buf.
+
+        Return the number of bytes read, which is at least one unless buf
+        is empty or the EOF was received and the internal buffer is empty,
+        in which case 0 is returned.
+
+        buf must be a writable bytes-like object.  When the internal buffer
+        is empty and buf is large, data is received directly into buf
+        without going through the internal buffer.
+
+        If stream was paused, this function will automatically resume it if
+        needed.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+        with memoryview(buf) as view:
+            if view.readonly:
+                raise TypeError('readinto() argument must be a writable '
+                                'bytes-like object')
+            view = view.cast('B')
+            n = len(view)
+            if not n:
+                return 0
+
+            if not self._buffer and not self._eof:
+                if n >= _MIN_DIRECT_READ_SIZE:
+                    nbytes = await self._wait_for_data('readinto', view)
+                    if nbytes:
+                        return nbytes
+                else:
+                    await self._wait_for_data('readinto')
+
+            nbytes = min(n, len(self._buffer))
+            with memoryview(self._buffer) as data:
+                view[:nbytes] = data[:nbytes]
+            del self._buffer[:nbytes]
+
+        self._maybe_resume_transport()
+        return nbytes
+
     async def readexactly(self, n):
         """Read exactly `n` bytes.
 
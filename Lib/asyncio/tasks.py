@@ -3,12 +3,13 @@
 __all__ = (
     'Task', 'create_task',
     'FIRST_COMPLETED', 'FIRST_EXCEPTION', 'ALL_COMPLETED',
-    'wait', 'wait_for', 'as_completed', 'sleep',
+    'wait', 'wait_for', 'as_completed', 'imap', 'sleep',
     'gather', 'shield', 'ensure_future', 'run_coroutine_threadsafe',
     'current_task', 'all_tasks',
     '_register_task', '_unregister_task', '_enter_task', '_leave_task',
 )
 
+import collections
 import concurrent.futures
 import contextvars
 import functools
@@ -582,6 +583,92 @@ async def _wait_for_one():
         yield _wait_for_one()
 
 
+def imap(func, iterable, /, *, limit, ordered=True):
+    """Return an asynchronous iterator over the results of func(item)
+    for the items of iterable, running at most limit of them concurrently.
+
+        async for result in imap(fetch, urls, limit=10):
+            # Use result.
+
+    iterable can be an iterable or an asynchronous iterable.  It is consumed
+    lazily: a new item is only taken after a result was consumed, so no more
+    than limit tasks exist at any time.
+
+    If ordered is true, the results are yielded in the order of the items,
+    otherwise as soon as they are available.
+
+    If a call raises an exception, the iteration raises it, after cancelling
+    the tasks which are still running.  They are also cancelled if the
+    iteration is closed early or if the task consuming it is cancelled.
+    """
+    if limit < 1:
+        raise ValueError('limit must be at least 1')
+    return _imap(func, iterable, limit, ordered)
+
+
+async def _imap(func, iterable, limit, ordered):
+    loop = events.get_running_loop()
+    if hasattr(type(iterable), '__aiter__'):
+        aiterator = iterable.__aiter__()
+    else:
+        aiterator = None
+        iterator = iter(iterable)
+    exhausted = False
+    # Tasks whose results were not yielded yet, in the order of the items
+    # if ordered is true.
+    running = collections.deque() if ordered else set()
+    # Completed tasks, in the order of completion.
+    done = collections.deque()
+    waiter = None
+
+    def _on_completion(task):
+        if not ordered:
+            done.append(task)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    try:
+        while True:
+            while not exhausted and len(running) < limit:
+                try:
+                    if aiterator is not None:
+                        item = await aiterator.__anext__()
+                    else:
+                        item = next(iterator)
+                except (StopIteration, StopAsyncIteration):
+                    exhausted = True
+                    break
+                task = ensure_future(func(item), loop=loop)
+                task.add_done_callback(_on_completion)
+                if ordered:
+                    running.append(task)
+                else:
+                    running.add(task)
+            if not running:
+                return
+
+            if ordered:
+                while not running[0].done():
+                    waiter = loop.create_future()
+                    await waiter
+                task = running.popleft()
+            else:
+                while not done:
+                    waiter = loop.create_future()
+                    await waiter
+                task = done.popleft()
+                running.remove(task)
+            waiter = None
+            yield task.result()  # May raise task.exception().
+    finally:
+        for task in running:
+            task.remove_done_callback(_on_completion)
+            task.cancel()
+        if running:
+            # Wait for the tasks and retrieve their exceptions.
+            await gather(*running, return_exceptions=True)
+
+
 @types.coroutine
 def __sleep0():
     """Skip one event loop run cycle.
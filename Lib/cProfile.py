@@ -41,7 +41,14 @@ def print_stats(self, sort=-1):
         import pstats
         pstats.Stats(self).strip_dirs().sort_stats(sort).print_stats()
 
-    def dump_stats(self, file):
+    def dump_stats(self, file, binary=False):
+        if binary:
+            # serialized in C, without building the stats dictionary
+            self.disable()
+            data = self.getstats_binary()
+            with open(file, 'wb') as f:
+                f.write(data)
+            return
         import marshal
         with open(file, 'wb') as f:
             self.create_stats()
@@ -31,7 +31,11 @@
 from dataclasses import dataclass
 from typing import Dict
 
-__all__ = ["Stats", "SortKey", "FunctionProfile", "StatsProfile"]
+__all__ = ["Stats", "SortKey", "FunctionProfile", "StatsProfile",
+           "merge_stats"]
+
+# start of the profile files written in the binary format of cProfile
+_BINARY_MAGIC = b"PYSTATS\0"
 
 @_simple_enum(StrEnum)
 class SortKey:
@@ -140,7 +144,12 @@ def load_stats(self, arg):
             return
         elif isinstance(arg, str):
             with open(arg, 'rb') as f:
-                self.stats = marshal.load(f)
+                data = f.read()
+            if data.startswith(_BINARY_MAGIC):
+                import _lsprof
+                self.stats = _lsprof.stats_from_binary(data)
+            else:
+                self.stats = marshal.loads(data)
             try:
                 file_stats = os.stat(arg)
                 arg = time.ctime(file_stats.st_mtime) + "    " + arg
@@ -192,10 +201,105 @@ def add(self, *arg_list):
                 self.stats[func] = add_func_stats(old_func_stat, stat)
         return self
 
-    def dump_stats(self, filename):
-        """Write the profile data to a file we know how to load back."""
+    def dump_stats(self, filename, binary=False):
+        """Write the profile data to a file we know how to load back.
+
+        If binary is true, the file is written in the compact binary
+        format of cProfile instead of with marshal.
+        """
+        if binary:
+            import _lsprof
+            data = _lsprof.stats_to_binary(self.stats)
+        else:
+            data = marshal.dumps(self.stats)
         with open(filename, 'wb') as f:
-            marshal.dump(self.stats, f)
+            f.write(data)
+
+    def dump_callgrind(self, filename):
+        """Write the profile data to a file in the callgrind format.
+
+        The file can be read by call graph viewers like KCachegrind.
+        Times are written in nanoseconds.
+        """
+        self.calc_callees()
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write("# callgrind format\n"
+                    "version: 1\n"
+                    "creator: pstats\n"
+                    "positions: line\n"
+                    "events: ns\n")
+            for func, (cc, nc, tt, ct, callers) in self.stats.items():
+                f.write(f"\nfl={func[0]}\n"
+                        f"fn={func_frame_name(func)}\n"
+                        f"{func[1]} {round(tt * 1e9)}\n")
+                for callee, stats in self.all_callees[func].items():
+                    if isinstance(stats, tuple):
+                        # format used by cProfile
+                        calls, cost = stats[0], stats[3]
+                    else:
+                        # format used by profile
+                        calls, cost = stats, 0
+                    f.write(f"cfl={callee[0]}\n"
+                            f"cfn={func_frame_name(callee)}\n"
+                            f"calls={calls} {callee[1]}\n"
+                            f"{func[1]} {round(cost * 1e9)}\n")
+
+    def collapsed_stacks(self, max_depth=64):
+        """Return the profile data in the collapsed stacks format.
+
+        The result maps each stack, written as the names of its frames
+        separated by semicolons from the outermost to the innermost one,
+        to the time spent in it in microseconds.  It can be rendered as
+        a flame graph by flamegraph.pl and compatible tools.
+
+        Deterministic profiles only record the callers of each function,
+        so the stacks are an approximation: the time spent in a function
+        is split between its callers in proportion to the time spent in
+        the calls from each of them, up to max_depth frames.  Recursive
+        calls end a stack.
+        """
+        stacks = {}
+        for func, (cc, nc, tt, ct, callers) in self.stats.items():
+            # the inline time is split with the inline time of the calls
+            self._collapse_callers(stacks, [func], tt, 2, max_depth)
+        result = {}
+        for stack, weight in stacks.items():
+            weight = round(weight * 1e6)
+            if weight:
+                frames = ';'.join(map(func_frame_name, reversed(stack)))
+                result[frames] = result.get(frames, 0) + weight
+        return result
+
+    def _collapse_callers(self, stacks, stack, weight, field, max_depth):
+        func = stack[-1]
+        shares = {}
+        if len(stack) < max_depth and func in self.stats:
+            for caller, stats in self.stats[func][4].items():
+                if caller in stack:
+                    continue
+                share = stats[field] if isinstance(stats, tuple) else stats
+                if share > 0:
+                    shares[caller] = share
+        total = sum(shares.values())
+        if not total:
+            key = tuple(stack)
+            stacks[key] = stacks.get(key, 0) + weight
+            return
+        for caller, share in shares.items():
+            part = weight * share / total
+            # drop the parts rounded to 0 microseconds
+            if part >= 5e-7:
+                stack.append(caller)
+                # the outer callers are weighted by cumulative time
+                self._collapse_callers(stacks, stack, part, 3, max_depth)
+                stack.pop()
+
+    def dump_collapsed(self, filename, max_depth=64):
+        """Write the profile data into file in the collapsed stacks
+        format, one stack per line.  See collapsed_stacks()."""
+        with open(filename, 'w', encoding='utf-8') as f:
+            for frames, weight in self.collapsed_stacks(max_depth).items():
+                f.write(f"{frames} {weight}\n")
 
     # list the tuple indices and directions for sorting,
     # along with some printable description
@@ -562,6 +666,14 @@ def func_std_string(func_name): # match what old profile produced
     else:
         return "%s:%d(%s)" % func_name
 
+def func_frame_name(func):
+    """Return the name of a function in call graphs and collapsed stacks."""
+    filename, line, name = func
+    if (filename, line) != ('~', 0):
+        name = f"{name} ({filename}:{line})"
+    # semicolons separate the frames of a collapsed stack
+    return name.replace(';', ':')
+
 #**************************************************************************
 # The following functions combine statistics for pairs functions.
 # The bulk of the processing involves correctly handling "call" lists,
@@ -592,6 +704,29 @@ def add_callers(target, source):
             new_callers[func] = caller
     return new_callers
 
+def merge_stats(*filenames, stream=None):
+    """Load and merge profile files into a new Stats object.
+
+    The files can be written with marshal or in the binary format of
+    cProfile.  The statistics are merged in C, which is much faster than
+    Stats.add() for large numbers of files.  The reports are printed to
+    stream, or to sys.stdout if it is None.
+    """
+    import _lsprof
+    profiles = []
+    for filename in filenames:
+        with open(filename, 'rb') as f:
+            data = f.read()
+        if not data.startswith(_BINARY_MAGIC):
+            data = _lsprof.stats_to_binary(marshal.loads(data))
+        profiles.append(data)
+    stats = Stats(stream=stream)
+    stats.stats = _lsprof.stats_from_binary(
+        _lsprof.merge_binary_stats(profiles))
+    stats.files = list(filenames)
+    stats.get_top_level_stats()
+    return stats
+
 def count_calls(callers):
     """Sum the caller statistics to get total number of calls received."""
     nc = 0
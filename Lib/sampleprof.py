@@ -0,0 +1,268 @@
+#! /usr/bin/env python3
+
+"""Statistical profiler sampling the Python stacks of all threads.
+   Compatible with the 'profile' and 'cProfile' modules.
+"""
+
+__all__ = ["run", "runctx", "Profile"]
+
+import _lsprof
+import threading
+import time
+import profile as _pyprofile
+from cProfile import label
+
+# ____________________________________________________________
+# Simple interface
+
+def run(statement, filename=None, sort=-1):
+    return _pyprofile._Utils(Profile).run(statement, filename, sort)
+
+def runctx(statement, globals, locals, filename=None, sort=-1):
+    return _pyprofile._Utils(Profile).runctx(statement, globals, locals,
+                                             filename, sort)
+
+run.__doc__ = _pyprofile.run.__doc__
+runctx.__doc__ = _pyprofile.runctx.__doc__
+
+# ____________________________________________________________
+
+class Profile(_lsprof.Sampler):
+    """Profile(interval=0.001)
+
+    Builds a profiler which samples the Python stack of every thread
+    every interval seconds, from a background thread, while it is
+    enabled.  Unlike cProfile, the profiled code is not instrumented:
+    the overhead only depends on the sampling interval.
+    """
+
+    # Stacks are aggregated in the base class.  This subclass runs the
+    # sampling thread and converts the stacks to pstats and collapsed
+    # stacks formats.
+
+    def __init__(self, interval=0.001):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self._thread = None
+        self._stop = None
+
+    def enable(self):
+        """Start sampling the stacks of the other threads."""
+        if self._thread is not None:
+            return
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample_loop,
+                                        args=(self._stop,),
+                                        name="sampleprof", daemon=True)
+        self._thread.start()
+
+    def disable(self):
+        """Stop sampling."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+        self._stop = None
+
+    def _sample_loop(self, stop):
+        sample = self.sample
+        interval = self.interval
+        clock = time.perf_counter
+        last = clock()
+        while not stop.wait(interval):
+            # The sampling thread may wait for the GIL much longer than
+            # interval: credit each sample with the actual elapsed time.
+            now = clock()
+            sample(now - last)
+            last = now
+
+    def print_stats(self, sort=-1):
+        import pstats
+        pstats.Stats(self).strip_dirs().sort_stats(sort).print_stats()
+
+    def dump_stats(self, file):
+        import marshal
+        with open(file, 'wb') as f:
+            self.create_stats()
+            marshal.dump(self.stats, f)
+
+    def create_stats(self):
+        self.disable()
+        self.snapshot_stats()
+
+    def snapshot_stats(self):
+        # Sampling cannot count calls: ncalls is the number of samples
+        # in which a function was on the stack.
+        self.stats = {}
+        for stack, samples, totaltime in self.getstats():
+            funcs = [label(code) for code in stack]
+            seen = set()
+            for func in funcs:
+                if func in seen:
+                    continue
+                seen.add(func)
+                cc, nc, tt, ct, callers = self.stats.get(func,
+                                                         (0, 0, 0, 0, {}))
+                if func == funcs[-1]:
+                    tt += totaltime
+                self.stats[func] = (cc + samples, nc + samples, tt,
+                                    ct + totaltime, callers)
+            seen.clear()
+            for i in range(1, len(funcs)):
+                edge = funcs[i - 1], funcs[i]
+                if edge in seen:
+                    continue
+                seen.add(edge)
+                caller, func = edge
+                callers = self.stats[func][4]
+                nc, cc, tt, ct = callers.get(caller, (0, 0, 0, 0))
+                if i == len(funcs) - 1:
+                    tt += totaltime
+                callers[caller] = nc + samples, cc + samples, tt, ct + totaltime
+
+    def collapsed_stacks(self):
+        """Return the recorded stacks in the collapsed stacks format.
+
+        The result maps each stack, written as the names of its frames
+        separated by semicolons from the outermost to the innermost one,
+        to the number of samples.  It can be rendered as a flame graph
+        by flamegraph.pl and compatible tools.
+        """
+        stacks = {}
+        for stack, samples, totaltime in self.getstats():
+            frames = ';'.join(_frame_name(code) for code in stack)
+            stacks[frames] = stacks.get(frames, 0) + samples
+        return stacks
+
+    def dump_collapsed(self, file):
+        """Write the recorded stacks into file in the collapsed stacks
+        format, one stack per line."""
+        self.disable()
+        with open(file, 'w', encoding='utf-8') as f:
+            for frames, samples in self.collapsed_stacks().items():
+                f.write(f"{frames} {samples}\n")
+
+    # The following two methods can be called by clients to use
+    # a profiler to profile a statement, given as a string.
+
+    def run(self, cmd):
+        import __main__
+        dict = __main__.__dict__
+        return self.runctx(cmd, dict, dict)
+
+    def runctx(self, cmd, globals, locals):
+        self.enable()
+        try:
+            exec(cmd, globals, locals)
+        finally:
+            self.disable()
+        return self
+
+    # This method is more useful to profile a single function call.
+    def runcall(self, func, /, *args, **kw):
+        self.enable()
+        try:
+            return func(*args, **kw)
+        finally:
+            self.disable()
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
+
+# ____________________________________________________________
+
+def _frame_name(code):
+    name = f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})"
+    # semicolons separate the frames of a collapsed stack
+    return name.replace(';', ':')
+
+# ____________________________________________________________
+
+def main():
+    import os
+    import sys
+    import runpy
+    import pstats
+    from optparse import OptionParser
+    usage = ("sampleprof.py [-o output_file_path] [-s sort] [-i interval] "
+             "[--collapsed] [-m module | scriptfile] [arg] ...")
+    parser = OptionParser(usage=usage)
+    parser.allow_interspersed_args = False
+    parser.add_option('-o', '--outfile', dest="outfile",
+        help="Save stats to <outfile>", default=None)
+    parser.add_option('-s', '--sort', dest="sort",
+        help="Sort order when printing to stdout, based on pstats.Stats class",
+        default=-1,
+        choices=sorted(pstats.Stats.sort_arg_dict_default))
+    parser.add_option('-i', '--interval', dest="interval", type="float",
+        help="Sampling interval in seconds (default: 0.001)", default=0.001)
+    parser.add_option('--collapsed', dest="collapsed", action="store_true",
+        help="Output collapsed stacks for flame graphs instead of stats",
+        default=False)
+    parser.add_option('-m', dest="module", action="store_true",
+        help="Profile a library module", default=False)
+
+    if not sys.argv[1:]:
+        parser.print_usage()
+        sys.exit(2)
+
+    (options, args) = parser.parse_args()
+    sys.argv[:] = args
+
+    # The script that we're profiling may chdir, so capture the absolute path
+    # to the output file at startup.
+    if options.outfile is not None:
+        options.outfile = os.path.abspath(options.outfile)
+
+    if len(args) > 0:
+        if options.module:
+            code = "run_module(modname, run_name='__main__')"
+            globs = {
+                'run_module': runpy.run_module,
+                'modname': args[0]
+            }
+        else:
+            progname = args[0]
+            sys.path.insert(0, os.path.dirname(progname))
+            with open(progname, 'rb') as fp:
+                code = compile(fp.read(), progname, 'exec')
+            globs = {
+                '__file__': progname,
+                '__name__': '__main__',
+                '__package__': None,
+                '__cached__': None,
+            }
+        prof = Profile(options.interval)
+        try:
+            try:
+                prof.runctx(code, globs, None)
+            except SystemExit:
+                pass
+            if options.collapsed:
+                if options.outfile is not None:
+                    prof.dump_collapsed(options.outfile)
+                else:
+                    for frames, samples in prof.collapsed_stacks().items():
+                        print(frames, samples)
+            elif options.outfile is not None:
+                prof.dump_stats(options.outfile)
+            else:
+                prof.print_stats(options.sort)
+        except BrokenPipeError as exc:
+            # Prevent "Exception ignored" during interpreter shutdown.
+            sys.stdout = None
+            sys.exit(exc.errno)
+    else:
+        parser.print_usage()
+    return parser
+
+# When invoked as main program, invoke the profiler on a script
+if __name__ == '__main__':
+    main()
@@ -61,6 +61,7 @@ def test_set_invalid(self):
             'faulthandler',
             'tracemalloc',
             'import_time',
+            'startup_timing',
             'show_ref_count',
             'dump_refs',
             'malloc_stats',
@@ -11,6 +11,7 @@
 import pickle
 import operator
 import struct
+import math
 import sys
 
 import array
@@ -1190,6 +1191,22 @@ def test_unicode(self):
 
         self.assertRaises(TypeError, a.fromunicode)
 
+    def test_reductions(self):
+        a = array.array('u', 'abc')
+        self.assertRaises(TypeError, a.sum)
+        self.assertRaises(TypeError, a.min)
+        self.assertRaises(TypeError, a.max)
+        self.assertRaises(TypeError, a.dot, a)
+        self.assertRaises(TypeError, a.mean)
+        self.assertRaises(TypeError, a.add, a)
+        self.assertRaises(TypeError, a.mul, a)
+        self.assertRaises(TypeError, a.scale, 'a')
+        self.assertRaises(TypeError, a.sub, a)
+        self.assertRaises(TypeError, a.truediv, a)
+        self.assertRaises(TypeError, a.eq, a)
+        self.assertRaises(TypeError, a.lt, a)
+        self.assertEqual(a, array.array('u', 'abc'))
+
     def test_issue17223(self):
         # this used to crash
         if sizeof_wchar == 4:
@@ -1300,7 +1317,120 @@ def test_frombytearray(self):
         b = array.array(self.typecode, a)
         self.assertEqual(a, b)
 
+    def test_sum(self):
+        a = array.array(self.typecode, self.example)
+        self.assertEqual(a.sum(), sum(a))
+        self.assertEqual(type(a.sum()), type(sum(a)))
+        self.assertEqual(array.array(self.typecode).sum(), 0)
+        self.assertRaises(TypeError, a.sum, 0)
+
+    def test_min_max(self):
+        a = array.array(self.typecode, self.example)
+        self.assertEqual(a.min(), min(a))
+        self.assertEqual(a.max(), max(a))
+        b = array.array(self.typecode)
+        self.assertRaises(ValueError, b.min)
+        self.assertRaises(ValueError, b.max)
+
+    def test_dot(self):
+        a = array.array(self.typecode, self.example)
+        b = array.array(self.typecode, reversed(self.example))
+        self.assertEqual(a.dot(b), sum(x * y for x, y in zip(a, b)))
+        self.assertEqual(a.dot(a), sum(x * x for x in a))
+        self.assertEqual(array.array(self.typecode).dot(
+            array.array(self.typecode)), 0)
+        self.assertRaises(ValueError, a.dot, b[1:])
+        self.assertRaises(TypeError, a.dot, list(b))
+        other = 'd' if self.typecode != 'd' else 'f'
+        self.assertRaises(TypeError, a.dot, array.array(other, b))
+
+    def test_mean(self):
+        a = array.array(self.typecode, self.example)
+        self.assertEqual(a.mean(), sum(a) / len(a))
+        self.assertIs(type(a.mean()), float)
+        self.assertRaises(ValueError, array.array(self.typecode).mean)
+
+    def test_add_mul(self):
+        a = array.array(self.typecode, self.example)
+        # small values, 0 where example has its largest value
+        b = array.array(self.typecode,
+                        [i % 3 for i in range(len(a) - 1)] + [0])
+        c = array.array(self.typecode, a)
+        self.assertIsNone(c.add(b))
+        self.assertEqual(c, array.array(self.typecode,
+                                        [x + y for x, y in zip(a, b)]))
+        c = array.array(self.typecode, a)
+        self.assertIsNone(c.mul(b))
+        self.assertEqual(c, array.array(self.typecode,
+                                        [x * y for x, y in zip(a, b)]))
+        # the array can be its own operand
+        c = array.array(self.typecode, b)
+        c.mul(c)
+        self.assertEqual(c, array.array(self.typecode, [x * x for x in b]))
+        for method in c.add, c.mul:
+            self.assertRaises(ValueError, method, b[1:])
+            self.assertRaises(TypeError, method, list(b))
+            other = 'd' if self.typecode != 'd' else 'f'
+            self.assertRaises(TypeError, method, array.array(other, b))
+        empty = array.array(self.typecode)
+        empty.add(empty)
+        empty.mul(empty)
+        self.assertEqual(empty, array.array(self.typecode))
+
+    def test_sub(self):
+        a = array.array(self.typecode, self.example)
+        # an array minus itself is 0, and adding back what was subtracted
+        # restores the array
+        c = array.array(self.typecode, a)
+        self.assertIsNone(c.sub(c))
+        self.assertEqual(c, array.array(self.typecode, [0] * len(a)))
+        b = array.array(self.typecode, [min(x, 0) for x in a])
+        c = array.array(self.typecode, a)
+        c.sub(b)
+        self.assertEqual(c, array.array(self.typecode,
+                                        [x - y for x, y in zip(a, b)]))
+        c.add(b)
+        self.assertEqual(c, a)
+        self.assertRaises(ValueError, c.sub, b[1:])
+        self.assertRaises(TypeError, c.sub, list(b))
+        other = 'd' if self.typecode != 'd' else 'f'
+        self.assertRaises(TypeError, c.sub, array.array(other, b))
+
+    def test_compare_items(self):
+        a = array.array(self.typecode, self.example)
+        b = array.array(self.typecode, self.smallerexample)
+        ops = {'eq': operator.eq, 'ne': operator.ne, 'lt': operator.lt,
+               'le': operator.le, 'gt': operator.gt, 'ge': operator.ge}
+        for name, op in ops.items():
+            for x, y in (a, b), (b, a), (a, a):
+                with self.subTest(name, x=x, y=y):
+                    mask = getattr(x, name)(y)
+                    self.assertEqual(mask, array.array(
+                        'b', [op(i, j) for i, j in zip(x, y)]))
+            method = getattr(a, name)
+            self.assertRaises(ValueError, method, b[1:])
+            self.assertRaises(TypeError, method, list(b))
+            other = 'd' if self.typecode != 'd' else 'f'
+            self.assertRaises(TypeError, method, array.array(other, b))
+        empty = array.array(self.typecode)
+        self.assertEqual(empty.lt(empty), array.array('b'))
+        self.assertEqual(a, array.array(self.typecode, self.example))
+
+    def test_scale(self):
+        a = array.array(self.typecode, self.example[:-1])
+        for k in 0, 1, 2:
+            c = array.array(self.typecode, a)
+            self.assertIsNone(c.scale(k))
+            self.assertEqual(c, array.array(self.typecode, [x * k for x in a]))
+        self.assertRaises(TypeError, a.scale)
+        self.assertRaises(TypeError, a.scale, 'x')
+
 class IntegerNumberTest(NumberTest):
+    def test_truediv(self):
+        a = array.array(self.typecode, self.example)
+        self.assertRaises(TypeError, a.truediv, a)
+        self.assertEqual(a, array.array(self.typecode, self.example))
+
     def test_type_error(self):
         a = array.array(self.typecode)
         a.append(42)
@@ -1334,6 +1464,51 @@ def test_overflow(self):
         self.check_overflow(lower, upper)
         self.check_overflow(Intable(lower), Intable(upper))
 
+    def test_sum_dot_extremes(self):
+        # sums and products of the extreme values are exact
+        a = array.array(self.typecode)
+        lower = -1 * int(pow(2, a.itemsize * 8 - 1))
+        upper = int(pow(2, a.itemsize * 8 - 1)) - 1
+        a = array.array(self.typecode, [upper, upper, lower, upper] * 3)
+        b = array.array(self.typecode, [upper, lower, lower, 1] * 3)
+        self.assertEqual(a.sum(), sum(a))
+        self.assertEqual(a.dot(b), sum(x * y for x, y in zip(a, b)))
+        self.assertEqual(a.min(), lower)
+        self.assertEqual(a.max(), upper)
+
+    def test_inplace_overflow(self):
+        a = array.array(self.typecode)
+        lower = -1 * int(pow(2, a.itemsize * 8 - 1))
+        upper = int(pow(2, a.itemsize * 8 - 1)) - 1
+        a = array.array(self.typecode, [1, upper, -1, lower])
+        b = array.array(self.typecode, [1, 1, -1, -1])
+        c = array.array(self.typecode, [-1, upper // 2, 2, 1])
+        self.assertRaises(OverflowError, a.add, b)
+        self.assertRaises(OverflowError, a.mul, c)
+        self.assertRaises(OverflowError, a.scale, 2)
+        self.assertRaises(OverflowError, a.scale, -1)
+        self.assertRaises(OverflowError, a.scale, upper + 1)
+        self.assertRaises(OverflowError, a.sub,
+                          array.array(self.typecode, [0, -1, 0, 0]))
+        self.assertRaises(OverflowError, a.sub,
+                          array.array(self.typecode, [0, 0, 0, 1]))
+        self.assertRaises(OverflowError, a.sub,
+                          array.array(self.typecode, [lower, 0, 0, 0]))
+        a[3] = 0
+        a.scale(-1)
+        a.add(b)
+        self.assertEqual(list(a), [0, 1 - upper, 0, -1])
+        a = array.array(self.typecode, [upper, lower, upper // 2, 3])
+        a.mul(array.array(self.typecode, [-1, 1, 2, upper // 3]))
+        self.assertEqual(list(a), [-upper, lower, upper // 2 * 2,
+                                   upper // 3 * 3])
+        a.mul(array.array(self.typecode, [1, 1, -1, -1]))
+        self.assertEqual(list(a), [-upper, lower, -(upper // 2 * 2),
+                                   -(upper // 3 * 3)])
+        a = array.array(self.typecode, [1, upper, -1, lower])
+        a.sub(array.array(self.typecode, [1, upper, lower, -1]))
+        self.assertEqual(list(a), [0, 0, upper, lower + 1])
+
 class UnsignedNumberTest(IntegerNumberTest):
     example = [0, 1, 17, 23, 42, 0xff]
     smallerexample = [0, 1, 17, 23, 42, 0xfe]
@@ -1347,6 +1522,39 @@ def test_overflow(self):
         self.check_overflow(lower, upper)
         self.check_overflow(Intable(lower), Intable(upper))
 
+    def test_sum_dot_extremes(self):
+        # sums and products of the extreme values are exact
+        a = array.array(self.typecode)
+        upper = int(pow(2, a.itemsize * 8)) - 1
+        a = array.array(self.typecode, [upper, 1, upper, 0] * 3)
+        b = array.array(self.typecode, [upper, upper, 2, 1] * 3)
+        self.assertEqual(a.sum(), sum(a))
+        self.assertEqual(a.dot(b), sum(x * y for x, y in zip(a, b)))
+        self.assertEqual(a.min(), 0)
+        self.assertEqual(a.max(), upper)
+
+    def test_inplace_overflow(self):
+        a = array.array(self.typecode)
+        upper = int(pow(2, a.itemsize * 8)) - 1
+        a = array.array(self.typecode, [0, upper, 1, upper // 2])
+        self.assertRaises(OverflowError, a.add,
+                          array.array(self.typecode, [0, 1, 0, 0]))
+        self.assertRaises(OverflowError, a.mul,
+                          array.array(self.typecode, [1, 1, 1, 3]))
+        self.assertRaises(OverflowError, a.scale, 2)
+        self.assertRaises(OverflowError, a.scale, -1)
+        self.assertRaises(OverflowError, a.sub,
+                          array.array(self.typecode, [1, 0, 0, 0]))
+        self.assertEqual(a, array.array(self.typecode,
+                                        [0, upper, 1, upper // 2]))
+        a.sub(array.array(self.typecode, [0, upper, 1, 0]))
+        self.assertEqual(list(a), [0, 0, 0, upper // 2])
+        a.add(array.array(self.typecode, [0, upper, 1, 0]))
+        a.mul(array.array(self.typecode, [upper, 1, upper, 2]))
+        self.assertEqual(list(a), [0, upper, upper, upper // 2 * 2])
+        a.add(array.array(self.typecode, [upper, 0, 0, 1]))
+        self.assertEqual(list(a), [upper, upper, upper, upper])
+
     def test_bytes_extend(self):
         s = bytes(self.example)
 
@@ -1424,6 +1632,54 @@ def test_nan(self):
         self.assertIs(a < b, False)
         self.assertIs(a <= b, False)
 
+    def test_nan_reductions(self):
+        nan = float('nan')
+        for values in [nan, 1.0, -1.0], [1.0, nan, -1.0], [1.0, -1.0, nan]:
+            a = array.array(self.typecode, values)
+            self.assertEqual(repr(a.min()), repr(min(a)))
+            self.assertEqual(repr(a.max()), repr(max(a)))
+            self.assertTrue(math.isnan(a.sum()))
+            self.assertTrue(math.isnan(a.dot(a)))
+            self.assertTrue(math.isnan(a.mean()))
+
+    def test_float_inplace(self):
+        a = array.array(self.typecode, [1.5, -2.0, 0.25])
+        a.scale(2)
+        self.assertEqual(a, array.array(self.typecode, [3.0, -4.0, 0.5]))
+        a.scale(0.5)
+        a.add(array.array(self.typecode, [1.0, 1.0, 1.0]))
+        self.assertEqual(a, array.array(self.typecode, [2.5, -1.0, 1.25]))
+        a.mul(array.array(self.typecode, [2.0, float('inf'), -4.0]))
+        self.assertEqual(a, array.array(self.typecode, [5.0, -math.inf, -5.0]))
+        self.assertEqual(a.mean(), -math.inf)
+
+    def test_float_sub_truediv(self):
+        a = array.array(self.typecode, [1.5, -2.0, 0.25])
+        a.sub(array.array(self.typecode, [0.5, -2.0, 1.0]))
+        self.assertEqual(a, array.array(self.typecode, [1.0, 0.0, -0.75]))
+        a.truediv(array.array(self.typecode, [4.0, -1.0, 0.25]))
+        self.assertEqual(a, array.array(self.typecode, [0.25, -0.0, -3.0]))
+        self.assertEqual(math.copysign(1.0, a[1]), -1.0)
+        for zero in 0.0, -0.0:
+            b = array.array(self.typecode, [1.0, zero, 1.0])
+            self.assertRaises(ZeroDivisionError, a.truediv, b)
+            # the array is unchanged on error
+            self.assertEqual(a, array.array(self.typecode,
+                                            [0.25, -0.0, -3.0]))
+        a.truediv(array.array(self.typecode, [math.inf, 1.0, -1.0]))
+        self.assertEqual(a, array.array(self.typecode, [0.0, -0.0, 3.0]))
+        self.assertRaises(ValueError, a.truediv, a[1:])
+        self.assertRaises(TypeError, a.truediv, list(a))
+
+    def test_nan_compare_items(self):
+        nan = float('nan')
+        a = array.array(self.typecode, [nan, 1.0, nan])
+        b = array.array(self.typecode, [nan, nan, 2.0])
+        self.assertEqual(a.eq(a), array.array('b', [0, 1, 0]))
+        self.assertEqual(a.ne(a), array.array('b', [1, 0, 1]))
+        for name in 'lt', 'le', 'gt', 'ge':
+            self.assertEqual(getattr(a, name)(b), array.array('b', [0] * 3))
+
     def test_byteswap(self):
         a = array.array(self.typecode, self.example)
         self.assertRaises(TypeError, a.byteswap, 42)
@@ -3,11 +3,13 @@
 import concurrent.futures
 import errno
 import math
+import random
 import socket
 import sys
 import threading
 import time
 import unittest
+import weakref
 from unittest import mock
 
 import asyncio
@@ -377,6 +379,144 @@ def test_set_debug(self):
         self.loop.set_debug(False)
         self.assertFalse(self.loop.get_debug())
 
+    def test_metrics(self):
+        def slow():
+            time.sleep(0.01)
+
+        def fast():
+            pass
+
+        self.loop._process_events = mock.Mock()
+        metrics = self.loop.get_metrics()
+        self.assertEqual(metrics['iterations'], 0)
+        self.assertEqual(metrics['slowest_callbacks'], [])
+
+        self.loop.call_soon(fast)
+        self.loop.call_soon(slow)
+        self.loop.call_soon(fast).cancel()
+        self.loop.call_later(3600, fast)
+        self.loop._run_once()
+        self.loop.call_soon(fast)
+        self.loop._run_once()
+
+        metrics = self.loop.get_metrics()
+        self.assertEqual(metrics['iterations'], 2)
+        self.assertEqual(metrics['callbacks'], 4)
+        self.assertEqual(metrics['max_ready'], 3)
+        self.assertEqual(metrics['ready'], 0)
+        self.assertEqual(metrics['scheduled'], 1)
+        self.assertEqual(metrics['timers'], 0)
+        self.assertGreaterEqual(metrics['callback_time'], 0.01)
+        self.assertGreaterEqual(metrics['select_time'], 0)
+        self.assertGreaterEqual(metrics['event_processing_time'], 0)
+        dt, description = metrics['slowest_callbacks'][0]
+        self.assertGreaterEqual(dt, 0.01)
+        self.assertIn('slow()', description)
+
+        self.loop.reset_metrics()
+        metrics = self.loop.get_metrics()
+        self.assertEqual(metrics['iterations'], 0)
+        self.assertEqual(metrics['callbacks'], 0)
+        self.assertEqual(metrics['callback_time'], 0)
+        self.assertEqual(metrics['event_processing_time'], 0)
+        self.assertEqual(metrics['slowest_callbacks'], [])
+        self.assertEqual(metrics['scheduled'], 1)
+
+    def test_metrics_slowest_callbacks(self):
+        self.loop._process_events = mock.Mock()
+        durations = [0.002, 0.004, 0.003, 0.005, 0.001]
+        with mock.patch.object(base_events._LoopMetrics, 'max_slowest', 3):
+            self.loop.reset_metrics()
+            for duration in durations:
+                self.loop.call_soon(time.sleep, duration)
+            self.loop._run_once()
+        slowest = self.loop.get_metrics()['slowest_callbacks']
+        self.assertEqual(len(slowest), 3)
+        self.assertEqual([dt for dt, _ in slowest],
+                         sorted((dt for dt, _ in slowest), reverse=True))
+        self.assertGreaterEqual(slowest[-1][0], 0.003)
+        self.assertIn('sleep', slowest[0][1])
+
+    def test_metrics_event_processing_time(self):
+        def process_events(event_list):
+            time.sleep(0.01)
+
+        def fast():
+            pass
+
+        self.loop._process_events = process_events
+        self.loop.call_soon(fast)
+        self.loop._run_once()
+        metrics = self.loop.get_metrics()
+        self.assertGreaterEqual(metrics['event_processing_time'], 0.01)
+        self.assertLess(metrics['callback_time'], 0.01)
+        self.assertEqual(metrics['slowest_callbacks'], [])
+
+    def test_metrics_timer_lag(self):
+        self.loop._process_events = mock.Mock()
+        when = self.loop.time()
+        self.loop.call_at(when - 0.5, lambda: None)
+        self.loop.call_at(when - 0.2, lambda: None)
+        self.loop._run_once()
+        metrics = self.loop.get_metrics()
+        self.assertEqual(metrics['timers'], 2)
+        self.assertEqual(metrics['scheduled'], 0)
+        self.assertGreaterEqual(metrics['max_timer_lag'], 0.5)
+        self.assertGreaterEqual(metrics['timer_lag_total'], 0.7)
+
+    def test_timer_wheel(self):
+        def cb():
+            pass
+
+        self.assertFalse(self.loop.get_timer_wheel())
+        self.loop.set_timer_wheel(True)
+        self.assertTrue(self.loop.get_timer_wheel())
+        wheel = self.loop._timer_wheel
+
+        h1 = self.loop.call_later(10.0, cb)
+        h2 = self.loop.call_later(3600.0, cb)
+        h3 = self.loop.call_later(-1, cb)
+        self.assertEqual(self.loop._scheduled, [h3])
+        self.assertEqual(len(wheel), 2)
+        self.assertEqual(self.loop.get_metrics()['scheduled'], 3)
+        self.assertTrue(h1._scheduled)
+
+        # cancelled timers are removed from the wheel immediately
+        h1.cancel()
+        self.assertFalse(h1._scheduled)
+        self.assertEqual(len(wheel), 1)
+        self.assertEqual(self.loop._timer_cancelled_count, 0)
+        self.assertEqual(self.loop.get_metrics()['scheduled'], 2)
+
+        # disabling the wheel moves its timers to the heap
+        self.loop.set_timer_wheel(False)
+        self.assertFalse(self.loop.get_timer_wheel())
+        self.assertEqual(self.loop._scheduled, [h3, h2])
+        self.assertEqual(len(wheel), 0)
+        h2.cancel()
+
+    def test_timer_wheel_run(self):
+        calls = []
+
+        def cb(arg):
+            calls.append(arg)
+            if len(calls) == 4:
+                self.loop.stop()
+
+        self.loop._process_events = mock.Mock()
+        self.loop.set_timer_wheel(True)
+        self.loop.call_later(0.1, cb, 'c')
+        self.loop.call_later(0.03, cb, 'b')
+        self.loop.call_later(0.5, cb, 'cancelled').cancel()
+        self.loop.call_later(0.0, cb, 'a')
+        when = self.loop.time() + 0.15
+        self.loop.call_at(when, cb, 'd')
+        self.loop.run_forever()
+        self.assertEqual(calls, ['a', 'b', 'c', 'd'])
+        self.assertGreaterEqual(
+            self.loop.time() + self.loop._clock_resolution, when)
+        self.assertEqual(len(self.loop._timer_wheel), 0)
+
     def test__run_once_schedule_handle(self):
         handle = None
         processed = False
@@ -994,6 +1134,148 @@ def test_asyncgen_finalization_by_gc_in_other_thread(self):
             self.assertTrue(status['finalized'])
 
 
+class BaseTimerWheelTests:
+
+    def setUp(self):
+        super().setUp()
+        self.loop = mock.Mock()
+
+    def timer(self, when):
+        return asyncio.TimerHandle(when, lambda: None, (), self.loop)
+
+    def test_add_remove(self):
+        wheel = self.TimerWheel(100.0)
+        self.assertEqual(len(wheel), 0)
+        self.assertIsNone(wheel.next_time())
+
+        # due in the next tick
+        self.assertFalse(wheel.add(self.timer(100.0)))
+        self.assertFalse(wheel.add(self.timer(99.0)))
+        # unusual due times are left to the heap
+        self.assertFalse(wheel.add(self.timer(math.inf)))
+        self.assertFalse(wheel.add(self.timer(math.nan)))
+
+        t1 = self.timer(100.05)
+        t2 = self.timer(1000.0)
+        self.assertTrue(wheel.add(t1))
+        self.assertTrue(wheel.add(t2))
+        self.assertEqual(len(wheel), 2)
+        self.assertEqual(wheel.next_time(), 100.05)
+
+        self.assertTrue(wheel.remove(t1))
+        self.assertFalse(wheel.remove(t1))
+        self.assertFalse(wheel.remove(self.timer(200.0)))
+        self.assertEqual(len(wheel), 1)
+        self.assertLessEqual(wheel.next_time(), 1000.0)
+
+        self.assertEqual(wheel.pop_all(), [t2])
+        self.assertEqual(len(wheel), 0)
+        self.assertIsNone(wheel.next_time())
+
+    def test_advance(self):
+        wheel = self.TimerWheel(0.0)
+        heap = []
+        timers = [self.timer(when) for when in (0.01, 0.2, 5.0, 300.0)]
+        for timer in timers:
+            self.assertTrue(wheel.add(timer))
+
+        wheel.advance(0.005, heap)
+        self.assertEqual(heap, [])
+        wheel.advance(0.01, heap)
+        self.assertEqual(heap, timers[:1])
+        wheel.advance(10.0, heap)
+        self.assertEqual(sorted(heap), timers[:3])
+        self.assertEqual(len(wheel), 1)
+        wheel.advance(299.9, heap)
+        self.assertEqual(len(heap), 3)
+        wheel.advance(300.0, heap)
+        self.assertEqual(sorted(heap), timers)
+        self.assertEqual(len(wheel), 0)
+
+    def test_random(self):
+        # Compare the wheel to the due time of the timers it holds
+        rng = random.Random(5)
+        resolution = base_events._TIMER_WHEEL_RESOLUTION
+        now = rng.uniform(0, 1000)
+        wheel = self.TimerWheel(now)
+        heap = []
+        timers = set()
+        for i in range(3000):
+            op = rng.random()
+            if op < 0.5:
+                scale = rng.choice([0.001, 0.1, 10, 1000, 100000])
+                timer = self.timer(now + rng.uniform(-0.001, scale))
+                if wheel.add(timer):
+                    timers.add(timer)
+            elif op < 0.65 and timers:
+                timer = rng.choice(list(timers))
+                self.assertTrue(wheel.remove(timer))
+                timers.remove(timer)
+            else:
+                next_time = wheel.next_time()
+                if timers:
+                    self.assertLessEqual(
+                        next_time, min(timer._when for timer in timers))
+                else:
+                    self.assertIsNone(next_time)
+                if rng.random() < 0.5 and next_time is not None:
+                    now = max(now, next_time)
+                else:
+                    now += rng.choice([0.0001, 0.001, 0.05, 1, 100, 5000])
+                heap.clear()
+                wheel.advance(now, heap)
+                target = int(now / resolution) + 1
+                for timer in heap:
+                    self.assertLessEqual(int(timer._when / resolution),
+                                         target)
+                    timers.remove(timer)
+                for timer in timers:
+                    self.assertGreater(int(timer._when / resolution),
+                                       target)
+                self.assertEqual(len(wheel), len(timers))
+
+
+class PyTimerWheelTests(BaseTimerWheelTests, unittest.TestCase):
+    TimerWheel = base_events._PyTimerWheel
+
+
+@unittest.skipUnless(hasattr(base_events, '_CTimerWheel'),
+                     'requires the C _asyncio module')
+class CTimerWheelTests(BaseTimerWheelTests, unittest.TestCase):
+    try:
+        TimerWheel = base_events._CTimerWheel
+    except AttributeError:
+        TimerWheel = None
+
+    def test_python_timer_handle(self):
+        # Only C timer handles can be linked in the C timer wheel
+        wheel = self.TimerWheel(0.0)
+        timer = asyncio.events._PyTimerHandle(10.0, lambda: None, (),
+                                              self.loop)
+        self.assertFalse(wheel.add(timer))
+        self.assertFalse(wheel.remove(timer))
+
+    def test_add_twice(self):
+        wheel = self.TimerWheel(0.0)
+        timer = self.timer(10.0)
+        self.assertTrue(wheel.add(timer))
+        with self.assertRaises(ValueError):
+            wheel.add(timer)
+        with self.assertRaises(ValueError):
+            self.TimerWheel(0.0).add(timer)
+        self.assertEqual(len(wheel), 1)
+
+    def test_refcount(self):
+        wheel = self.TimerWheel(0.0)
+        timer = self.timer(10.0)
+        wr = weakref.ref(timer)
+        wheel.add(timer)
+        del timer
+        self.assertIsNotNone(wr())
+        wheel.remove(wr())
+        self.assertIsNone(wr())
+
+
 class MyProto(asyncio.Protocol):
     done = None
 
@@ -2105,7 +2105,7 @@ def noop(*args, **kwargs):
     pass
 
 
-class HandleTests(test_utils.TestCase):
+class BaseHandleTests:
 
     def setUp(self):
         super().setUp()
@@ -2117,7 +2117,7 @@ def callback(*args):
             return args
 
         args = ()
-        h = asyncio.Handle(callback, args, self.loop)
+        h = self.Handle(callback, args, self.loop)
         self.assertIs(h._callback, callback)
         self.assertIs(h._args, args)
         self.assertFalse(h.cancelled())
@@ -2132,7 +2132,7 @@ def callback():
         self.loop = mock.Mock()
         self.loop.call_exception_handler = mock.Mock()
 
-        h = asyncio.Handle(callback, (), self.loop)
+        h = self.Handle(callback, (), self.loop)
         h._run()
 
         self.loop.call_exception_handler.assert_called_with({
@@ -2144,14 +2144,14 @@ def callback():
 
     def test_handle_weakref(self):
         wd = weakref.WeakValueDictionary()
-        h = asyncio.Handle(lambda: None, (), self.loop)
+        h = self.Handle(lambda: None, (), self.loop)
         wd['h'] = h  # Would fail without __weakref__ slot.
 
     def test_handle_repr(self):
         self.loop.get_debug.return_value = False
 
         # simple function
-        h = asyncio.Handle(noop, (1, 2), self.loop)
+        h = self.Handle(noop, (1, 2), self.loop)
         filename, lineno = test_utils.get_function_source(noop)
         self.assertEqual(repr(h),
                         '<Handle noop(1, 2) at %s:%s>'
@@ -2165,33 +2165,33 @@ def test_handle_repr(self):
         # decorated function
         with self.assertWarns(DeprecationWarning):
             cb = asyncio.coroutine(noop)
-        h = asyncio.Handle(cb, (), self.loop)
+        h = self.Handle(cb, (), self.loop)
         self.assertEqual(repr(h),
                         '<Handle noop() at %s:%s>'
                         % (filename, lineno))
 
         # partial function
         cb = functools.partial(noop, 1, 2)
-        h = asyncio.Handle(cb, (3,), self.loop)
+        h = self.Handle(cb, (3,), self.loop)
         regex = (r'^<Handle noop\(1, 2\)\(3\) at %s:%s>$'
                  % (re.escape(filename), lineno))
         self.assertRegex(repr(h), regex)
 
         # partial function with keyword args
         cb = functools.partial(noop, x=1)
-        h = asyncio.Handle(cb, (2, 3), self.loop)
+        h = self.Handle(cb, (2, 3), self.loop)
         regex = (r'^<Handle noop\(x=1\)\(2, 3\) at %s:%s>$'
                  % (re.escape(filename), lineno))
         self.assertRegex(repr(h), regex)
 
         # partial method
         if sys.version_info >= (3, 4):
-            method = HandleTests.test_handle_repr
+            method = BaseHandleTests.test_handle_repr
             cb = functools.partialmethod(method)
             filename, lineno = test_utils.get_function_source(method)
-            h = asyncio.Handle(cb, (), self.loop)
+            h = self.Handle(cb, (), self.loop)
 
-            cb_regex = r'<function HandleTests.test_handle_repr .*>'
+            cb_regex = r'<function BaseHandleTests.test_handle_repr .*>'
             cb_regex = (r'functools.partialmethod\(%s, , \)\(\)' % cb_regex)
             regex = (r'^<Handle %s at %s:%s>$'
                      % (cb_regex, re.escape(filename), lineno))
@@ -2203,7 +2203,7 @@ def test_handle_repr_debug(self):
         # simple function
         create_filename = __file__
         create_lineno = sys._getframe().f_lineno + 1
-        h = asyncio.Handle(noop, (1, 2), self.loop)
+        h = self.Handle(noop, (1, 2), self.loop)
         filename, lineno = test_utils.get_function_source(noop)
         self.assertEqual(repr(h),
                         '<Handle noop(1, 2) at %s:%s created at %s:%s>'
@@ -2286,7 +2286,7 @@ def test_coroutine_like_object_debug_formatting(self):
         self.assertEqual(coroutines._format_coroutine(coro), 'AAA()')
 
 
-class TimerTests(unittest.TestCase):
+class BaseTimerTests:
 
     def setUp(self):
         super().setUp()
@@ -2294,13 +2294,13 @@ def setUp(self):
 
     def test_hash(self):
         when = time.monotonic()
-        h = asyncio.TimerHandle(when, lambda: False, (),
+        h = self.TimerHandle(when, lambda: False, (),
                                 mock.Mock())
         self.assertEqual(hash(h), hash(when))
 
     def test_when(self):
         when = time.monotonic()
-        h = asyncio.TimerHandle(when, lambda: False, (),
+        h = self.TimerHandle(when, lambda: False, (),
                                 mock.Mock())
         self.assertEqual(when, h.when())
 
@@ -2310,7 +2310,7 @@ def callback(*args):
 
         args = (1, 2, 3)
         when = time.monotonic()
-        h = asyncio.TimerHandle(when, callback, args, mock.Mock())
+        h = self.TimerHandle(when, callback, args, mock.Mock())
         self.assertIs(h._callback, callback)
         self.assertIs(h._args, args)
         self.assertFalse(h.cancelled())
@@ -2323,14 +2323,14 @@ def callback(*args):
 
         # when cannot be None
         self.assertRaises(AssertionError,
-                          asyncio.TimerHandle, None, callback, args,
+                          self.TimerHandle, None, callback, args,
                           self.loop)
 
     def test_timer_repr(self):
         self.loop.get_debug.return_value = False
 
         # simple function
-        h = asyncio.TimerHandle(123, noop, (), self.loop)
+        h = self.TimerHandle(123, noop, (), self.loop)
         src = test_utils.get_function_source(noop)
         self.assertEqual(repr(h),
                         '<TimerHandle when=123 noop() at %s:%s>' % src)
@@ -2346,7 +2346,7 @@ def test_timer_repr_debug(self):
         # simple function
         create_filename = __file__
         create_lineno = sys._getframe().f_lineno + 1
-        h = asyncio.TimerHandle(123, noop, (), self.loop)
+        h = self.TimerHandle(123, noop, (), self.loop)
         filename, lineno = test_utils.get_function_source(noop)
         self.assertEqual(repr(h),
                         '<TimerHandle when=123 noop() '
@@ -2367,8 +2367,8 @@ def callback(*args):
 
         when = time.monotonic()
 
-        h1 = asyncio.TimerHandle(when, callback, (), self.loop)
-        h2 = asyncio.TimerHandle(when, callback, (), self.loop)
+        h1 = self.TimerHandle(when, callback, (), self.loop)
+        h2 = self.TimerHandle(when, callback, (), self.loop)
         # TODO: Use assertLess etc.
         self.assertFalse(h1 < h2)
         self.assertFalse(h2 < h1)
@@ -2384,8 +2384,8 @@ def callback(*args):
         h2.cancel()
         self.assertFalse(h1 == h2)
 
-        h1 = asyncio.TimerHandle(when, callback, (), self.loop)
-        h2 = asyncio.TimerHandle(when + 10.0, callback, (), self.loop)
+        h1 = self.TimerHandle(when, callback, (), self.loop)
+        h2 = self.TimerHandle(when + 10.0, callback, (), self.loop)
         self.assertTrue(h1 < h2)
         self.assertFalse(h2 < h1)
         self.assertTrue(h1 <= h2)
@@ -2397,7 +2397,7 @@ def callback(*args):
         self.assertFalse(h1 == h2)
         self.assertTrue(h1 != h2)
 
-        h3 = asyncio.Handle(callback, (), self.loop)
+        h3 = self.Handle(callback, (), self.loop)
         self.assertIs(NotImplemented, h1.__eq__(h3))
         self.assertIs(NotImplemented, h1.__ne__(h3))
 
@@ -2424,6 +2424,107 @@ def callback(*args):
         self.assertTrue(h1 >= SMALLEST)
 
 
+class PyHandleTests(BaseHandleTests, test_utils.TestCase):
+    Handle = events._PyHandle
+
+
+@unittest.skipUnless(hasattr(events, '_CHandle'),
+                     'requires the C _asyncio module')
+class CHandleTests(BaseHandleTests, test_utils.TestCase):
+    try:
+        Handle = events._CHandle
+    except AttributeError:
+        Handle = None
+
+    def test_handle_subclass(self):
+        calls = []
+
+        class MyHandle(self.Handle):
+            def _repr_info(self):
+                return super()._repr_info() + ['extra']
+
+            def cancel(self):
+                calls.append('cancel')
+                super().cancel()
+
+        self.loop.get_debug.return_value = False
+        h = MyHandle(noop, (), self.loop)
+        self.assertTrue(repr(h).endswith(' extra>'), repr(h))
+        h.cancel()
+        self.assertTrue(h.cancelled())
+        self.assertEqual(calls, ['cancel'])
+
+    def test_subclass_gc(self):
+        class MyHandle(self.Handle):
+            pass
+
+        class MyTimerHandle(events._CTimerHandle):
+            pass
+
+        self.loop.get_debug.return_value = False
+        when = time.monotonic()
+        handles = []
+        for i in range(100):
+            h = MyHandle(noop, (), self.loop)
+            th = MyTimerHandle(when, noop, (), self.loop)
+            # reference cycles only collected by the GC
+            h.cycle = h
+            th.cycle = th
+            handles.append(weakref.ref(h))
+            handles.append(weakref.ref(th))
+        del h, th
+        support.gc_collect()
+        self.assertTrue(all(ref() is None for ref in handles))
+        # the classes are still alive and usable
+        self.assertIsInstance(MyHandle(noop, (), self.loop), self.Handle)
+        self.assertIsInstance(MyTimerHandle(when, noop, (), self.loop),
+                              events._CTimerHandle)
+
+    def test_callback_cancels_handle(self):
+        def callback(*args):
+            h.cancel()
+            return args
+
+        self.loop.get_debug.return_value = False
+        h = self.Handle(callback, (object(),), self.loop)
+        h._run()
+        self.assertTrue(h.cancelled())
+        self.assertIsNone(h._callback)
+        self.assertFalse(self.loop.call_exception_handler.called)
+
+    def test_keyboard_interrupt(self):
+        def callback():
+            raise KeyboardInterrupt
+
+        h = self.Handle(callback, (), self.loop)
+        with self.assertRaises(KeyboardInterrupt):
+            h._run()
+        self.assertFalse(self.loop.call_exception_handler.called)
+
+
+class PyTimerTests(BaseTimerTests, unittest.TestCase):
+    Handle = events._PyHandle
+    TimerHandle = events._PyTimerHandle
+
+
+@unittest.skipUnless(hasattr(events, '_CTimerHandle'),
+                     'requires the C _asyncio module')
+class CTimerTests(BaseTimerTests, unittest.TestCase):
+    try:
+        Handle = events._CHandle
+        TimerHandle = events._CTimerHandle
+    except AttributeError:
+        Handle = TimerHandle = None
+
+    def test_timer_comparison_with_python_handle(self):
+        when = time.monotonic()
+        h1 = self.TimerHandle(when, noop, (), self.loop)
+        h2 = events._PyTimerHandle(when, noop, (), self.loop)
+        self.assertIs(NotImplemented, h1.__lt__(h2))
+        self.assertIs(NotImplemented, h2.__lt__(h1))
+        self.assertFalse(h1 == h2)
+
+
 class AbstractEventLoopTests(unittest.TestCase):
 
     def test_not_implemented(self):
@@ -2451,6 +2552,10 @@ def test_not_implemented(self):
             NotImplementedError, loop.call_soon, None)
         self.assertRaises(
             NotImplementedError, loop.time)
+        self.assertRaises(
+            NotImplementedError, loop.get_timer_wheel)
+        self.assertRaises(
+            NotImplementedError, loop.set_timer_wheel, True)
         self.assertRaises(
             NotImplementedError, loop.call_soon_threadsafe, None)
         self.assertRaises(
@@ -2479,6 +2584,14 @@ def test_not_implemented(self):
             NotImplementedError, loop.get_debug)
         self.assertRaises(
             NotImplementedError, loop.set_debug, f)
+        self.assertRaises(
+            NotImplementedError, loop.set_resolver, f)
+        self.assertRaises(
+            NotImplementedError, loop.get_resolver)
+        self.assertRaises(
+            NotImplementedError, loop.get_metrics)
+        self.assertRaises(
+            NotImplementedError, loop.reset_metrics)
 
     def test_not_implemented_async(self):
 
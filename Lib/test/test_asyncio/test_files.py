@@ -0,0 +1,207 @@
+"""Tests for asyncio/files.py"""
+
+import asyncio
+import io
+import os
+import threading
+import unittest
+
+from asyncio import files
+from unittest import mock
+from test.support import os_helper
+from test.test_asyncio import utils as test_utils
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+class RecvProto(asyncio.Protocol):
+
+    def __init__(self, loop):
+        self.data = bytearray()
+        self.done = loop.create_future()
+
+    def data_received(self, data):
+        self.data.extend(data)
+
+    def connection_lost(self, exc):
+        self.done.set_result(None)
+
+
+class AsyncFileTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.loop.shutdown_default_executor())
+        super().tearDown()
+
+    def run_loop(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def count_batches(self):
+        batches = []
+        orig_run_batch = files._run_batch
+
+        def run_batch(f, ops):
+            batches.append(len(ops))
+            return orig_run_batch(f, ops)
+        patcher = mock.patch('asyncio.files._run_batch', run_batch)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return batches
+
+    def test_read_write(self):
+        async def main():
+            async with await asyncio.open_file(os_helper.TESTFN, 'w+b') as f:
+                self.assertIsInstance(f.file, io.BufferedRandom)
+                self.assertEqual(f.name, os_helper.TESTFN)
+                self.assertEqual(f.mode, 'rb+')
+                self.assertEqual(f.fileno(), f.file.fileno())
+                self.assertEqual(await f.write(b'hello world'), 11)
+                self.assertEqual(await f.tell(), 11)
+                self.assertEqual(await f.seek(6), 6)
+                self.assertEqual(await f.read(), b'world')
+                await f.seek(0)
+                buf = bytearray(5)
+                self.assertEqual(await f.readinto(buf), 5)
+                self.assertEqual(buf, b'hello')
+                self.assertEqual(await f.truncate(5), 5)
+                await f.fsync()
+            self.assertTrue(f.closed)
+
+        self.run_loop(main())
+        with open(os_helper.TESTFN, 'rb') as fp:
+            self.assertEqual(fp.read(), b'hello')
+
+    def test_text(self):
+        with open(os_helper.TESTFN, 'w', encoding='utf-8') as fp:
+            fp.write('line 1\nline 2\nline 3\n')
+
+        async def main():
+            f = await asyncio.open_file(os_helper.TESTFN, encoding='utf-8')
+            lines = [line async for line in f]
+            await f.seek(0)
+            self.assertEqual(await f.readline(), 'line 1\n')
+            self.assertEqual(await f.readlines(), ['line 2\n', 'line 3\n'])
+            await f.close()
+            return lines
+
+        self.assertEqual(self.run_loop(main()),
+                         ['line 1\n', 'line 2\n', 'line 3\n'])
+
+    def test_file_executor(self):
+        names = []
+
+        def opener(path, flags):
+            names.append(threading.current_thread().name)
+            return os.open(path, flags)
+
+        async def main():
+            f = await asyncio.open_file(os_helper.TESTFN, 'wb', opener=opener)
+            await f.close()
+
+        self.run_loop(main())
+        self.assertTrue(names[0].startswith('asyncio_file'), names)
+        self.assertIsNone(self.loop._default_executor)
+
+    def test_batch(self):
+        async def main():
+            f = await asyncio.open_file(os_helper.TESTFN, 'wb')
+            batches = self.count_batches()
+            # The first write starts at once, the next ones wait for it
+            # and run together.
+            futs = [f.write(b'%d ' % i) for i in range(10)]
+            self.assertEqual(await asyncio.gather(*futs), [2] * 10)
+            await f.close()
+            return batches
+
+        self.assertEqual(self.run_loop(main()), [1, 9, 1])
+        with open(os_helper.TESTFN, 'rb') as fp:
+            self.assertEqual(fp.read(), b'0 1 2 3 4 5 6 7 8 9 ')
+
+    def test_fsync_merged(self):
+        async def main():
+            f = await asyncio.open_file(os_helper.TESTFN, 'wb')
+            await f.write(b'x')
+            with mock.patch('os.fsync', wraps=os.fsync) as fsync:
+                await asyncio.gather(f.tell(), f.fsync(), f.fsync(),
+                                     f.write(b'y'), f.fsync(), f.tell(),
+                                     f.fsync())
+            await f.close()
+            return fsync.call_count
+
+        # the first tell() runs alone, the next operations run together:
+        # only the write between them requires a second fsync
+        self.assertEqual(self.run_loop(main()), 2)
+
+    def test_cancel(self):
+        async def main():
+            f = await asyncio.open_file(os_helper.TESTFN, 'wb')
+            f.write(b'a')
+            fut = f.write(b'b')
+            fut.cancel()
+            await f.write(b'c')
+            await f.close()
+
+        self.run_loop(main())
+        with open(os_helper.TESTFN, 'rb') as fp:
+            self.assertEqual(fp.read(), b'ac')
+
+    def test_error(self):
+        async def main():
+            f = await asyncio.open_file(os_helper.TESTFN, 'wb')
+            futs = [f.write(b'a'), f.read(), f.write(b'b')]
+            results = await asyncio.gather(*futs, return_exceptions=True)
+            await f.close()
+            with self.assertRaises(ValueError):
+                await f.write(b'c')
+            return results
+
+        results = self.run_loop(main())
+        self.assertEqual(results[0], 1)
+        self.assertIsInstance(results[1], io.UnsupportedOperation)
+        self.assertEqual(results[2], 1)
+        with self.assertRaises(FileNotFoundError):
+            self.run_loop(asyncio.open_file(os_helper.TESTFN + '.missing'))
+
+    def test_executor_shutdown(self):
+        f = self.run_loop(asyncio.open_file(os_helper.TESTFN, 'wb'))
+        self.addCleanup(f.file.close)
+        self.run_loop(self.loop.shutdown_default_executor())
+        fut = f.write(b'data')
+        self.assertIsInstance(fut.exception(), RuntimeError)
+        with self.assertRaises(RuntimeError):
+            self.run_loop(asyncio.open_file(os_helper.TESTFN, 'wb'))
+
+    def test_sendfile(self):
+        data = b'0123456789' * 10_000
+
+        async def main():
+            proto = RecvProto(self.loop)
+            server = await self.loop.create_server(lambda: proto,
+                                                   '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            transport, _ = await self.loop.create_connection(
+                asyncio.Protocol, '127.0.0.1', port)
+            f = await asyncio.open_file(os_helper.TESTFN, 'w+b')
+            # the pending writes are flushed before sending the file
+            f.write(data)
+            self.assertEqual(await f.sendfile(transport, 10), len(data) - 10)
+            transport.close()
+            await proto.done
+            await f.close()
+            server.close()
+            await server.wait_closed()
+            return proto.data
+
+        self.assertEqual(self.run_loop(main()), data[10:])
+
+
+if __name__ == '__main__':
+    unittest.main()
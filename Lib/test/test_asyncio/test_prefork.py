@@ -0,0 +1,178 @@
+"""Tests for asyncio/prefork.py"""
+
+import asyncio
+import os
+import signal
+import socket
+import sys
+import time
+import unittest
+
+from test import support
+from test.support import import_helper
+from test.support import os_helper
+from test.test_asyncio import utils as test_utils
+
+if sys.platform == 'win32':
+    raise unittest.SkipTest('UNIX only')
+
+# Skip tests if the platform lacks a working multiprocessing
+import_helper.import_module('multiprocessing.synchronize')
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+class PidProtocol(asyncio.Protocol):
+    # Reply with the pid of the worker process
+
+    def connection_made(self, transport):
+        transport.write(str(os.getpid()).encode())
+        transport.close()
+
+
+class PreforkServerTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+
+    def new_server(self, **kwargs):
+        kwargs.setdefault('workers', 2)
+        kwargs.setdefault('health_check_interval', 0.05)
+        kwargs.setdefault('shutdown_timeout', support.SHORT_TIMEOUT)
+        server = asyncio.PreforkServer(PidProtocol, '127.0.0.1', 0, **kwargs)
+        self.loop.run_until_complete(server.start())
+        serve_task = self.loop.create_task(server.serve_forever())
+
+        def stop():
+            if not serve_task.done():
+                server.stop()
+                self.loop.run_until_complete(serve_task)
+        self.addCleanup(stop)
+        return server, serve_task
+
+    async def get_pid(self, server):
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        data = await reader.read()
+        writer.close()
+        await writer.wait_closed()
+        return int(data)
+
+    async def wait_for_pids(self, server, predicate):
+        deadline = time.monotonic() + support.SHORT_TIMEOUT
+        while not predicate(server.pids):
+            if time.monotonic() > deadline:
+                self.fail(f'timeout waiting for the workers: {server.pids}')
+            await asyncio.sleep(0.01)
+
+    def test_serve(self):
+        server, serve_task = self.new_server()
+        pids = server.pids
+        self.assertEqual(len(pids), 2)
+        self.assertNotIn(os.getpid(), pids)
+        self.assertTrue(server.is_serving())
+
+        async def connect():
+            return {await self.get_pid(server) for i in range(10)}
+
+        self.assertLessEqual(self.loop.run_until_complete(connect()),
+                             set(pids))
+
+        server.stop()
+        self.loop.run_until_complete(serve_task)
+        self.assertFalse(server.is_serving())
+        self.assertEqual(server.pids, ())
+        self.assertEqual(server.sockets, ())
+        for pid in pids:
+            with self.assertRaises(ProcessLookupError):
+                os.kill(pid, 0)
+
+    @unittest.skipUnless(hasattr(socket, 'SO_REUSEPORT'),
+                         'requires SO_REUSEPORT')
+    def test_reuse_port(self):
+        server, serve_task = self.new_server(reuse_port=True)
+        sock = server.sockets[0]
+        self.assertTrue(sock.getsockopt(socket.SOL_SOCKET,
+                                        socket.SO_REUSEPORT))
+        pids = set(server.pids)
+
+        async def connect():
+            return {await self.get_pid(server) for i in range(10)}
+
+        self.assertLessEqual(self.loop.run_until_complete(connect()), pids)
+
+    def test_restart(self):
+        server, serve_task = self.new_server()
+        old_pids = set(server.pids)
+        server.restart()
+        self.loop.run_until_complete(server.wait_restarted())
+        new_pids = set(server.pids)
+        self.assertEqual(len(new_pids), 2)
+        self.assertFalse(old_pids & new_pids)
+        pid = self.loop.run_until_complete(self.get_pid(server))
+        self.assertIn(pid, new_pids)
+
+    def test_respawn(self):
+        server, serve_task = self.new_server()
+        pid1, pid2 = server.pids
+        os.kill(pid1, signal.SIGKILL)
+        # SIGTERM stops a worker gracefully
+        os.kill(pid2, signal.SIGTERM)
+        with self.assertLogs('asyncio', 'WARNING') as cm:
+            self.loop.run_until_complete(self.wait_for_pids(
+                server,
+                lambda pids: len(pids) == 2 and not {pid1, pid2} & set(pids)))
+        output = '\n'.join(cm.output)
+        self.assertIn('exited unexpectedly with code -9', output)
+        self.assertIn('exited unexpectedly with code 0', output)
+        self.loop.run_until_complete(self.get_pid(server))
+
+    def test_health_check(self):
+        marker = os_helper.TESTFN
+        self.addCleanup(os_helper.unlink, marker)
+
+        def worker_init(index):
+            if index == 0 and not os.path.exists(marker):
+                open(marker, 'wb').close()
+                # Block the event loop of the first worker
+                asyncio.get_running_loop().call_later(
+                    0.1, time.sleep, support.LONG_TIMEOUT)
+
+        server, serve_task = self.new_server(workers=1,
+                                             worker_init=worker_init,
+                                             health_check_timeout=0.5)
+        pid, = server.pids
+        with self.assertLogs('asyncio', 'WARNING') as cm:
+            self.loop.run_until_complete(self.wait_for_pids(
+                server, lambda pids: pids and pid not in pids))
+        self.assertIn('sent no heartbeat', cm.output[0])
+        self.loop.run_until_complete(self.get_pid(server))
+
+    def test_worker_init_error(self):
+        def worker_init(index):
+            raise ZeroDivisionError
+
+        server = asyncio.PreforkServer(PidProtocol, '127.0.0.1', 0,
+                                       workers=2, worker_init=worker_init)
+        with support.captured_stderr():
+            with self.assertRaisesRegex(RuntimeError, 'exited with code 1'):
+                self.loop.run_until_complete(server.start())
+        self.assertEqual(server.pids, ())
+        self.assertEqual(server.sockets, ())
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            asyncio.PreforkServer(PidProtocol, workers=0)
+        with self.assertRaises(ValueError):
+            asyncio.PreforkServer(PidProtocol, health_check_interval=0)
+        with self.assertRaises(ValueError):
+            asyncio.PreforkServer(PidProtocol, health_check_interval=2,
+                                  health_check_timeout=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,9 @@
 from unittest import mock
 
 import asyncio
+from asyncio import queues
+from test import support
+from test.support import warnings_helper
 from test.test_asyncio import utils as test_utils
 
 
@@ -13,6 +16,10 @@ def tearDownModule():
 
 class _QueueTestBase(test_utils.TestCase):
 
+    Queue = asyncio.Queue
+    LifoQueue = asyncio.LifoQueue
+    PriorityQueue = asyncio.PriorityQueue
+
     def setUp(self):
         super().setUp()
         self.loop = self.new_test_loop()
@@ -35,13 +42,13 @@ def gen():
 
         loop = self.new_test_loop(gen)
 
-        q = asyncio.Queue()
+        q = self.Queue()
         self.assertTrue(fn(q).startswith('<Queue'), fn(q))
         id_is_present = hex(id(q)) in fn(q)
         self.assertEqual(expect_id, id_is_present)
 
         async def add_getter():
-            q = asyncio.Queue()
+            q = self.Queue()
             # Start a task that waits to get.
             loop.create_task(q.get())
             # Let it start waiting.
@@ -53,7 +60,7 @@ async def add_getter():
         loop.run_until_complete(add_getter())
 
         async def add_putter():
-            q = asyncio.Queue(maxsize=1)
+            q = self.Queue(maxsize=1)
             q.put_nowait(1)
             # Start a task that waits to put.
             loop.create_task(q.put(2))
@@ -64,7 +71,7 @@ async def add_putter():
             q.get_nowait()
 
         loop.run_until_complete(add_putter())
-        q = asyncio.Queue()
+        q = self.Queue()
         q.put_nowait(1)
         self.assertTrue('_queue=[1]' in fn(q))
 
@@ -75,7 +82,7 @@ def test_str(self):
         self._test_repr_or_str(str, False)
 
     def test_empty(self):
-        q = asyncio.Queue()
+        q = self.Queue()
         self.assertTrue(q.empty())
         q.put_nowait(1)
         self.assertFalse(q.empty())
@@ -83,15 +90,15 @@ def test_empty(self):
         self.assertTrue(q.empty())
 
     def test_full(self):
-        q = asyncio.Queue()
+        q = self.Queue()
         self.assertFalse(q.full())
 
-        q = asyncio.Queue(maxsize=1)
+        q = self.Queue(maxsize=1)
         q.put_nowait(1)
         self.assertTrue(q.full())
 
     def test_order(self):
-        q = asyncio.Queue()
+        q = self.Queue()
         for i in [1, 3, 2]:
             q.put_nowait(i)
 
@@ -109,7 +116,7 @@ def gen():
 
         loop = self.new_test_loop(gen)
 
-        q = asyncio.Queue(maxsize=2)
+        q = self.Queue(maxsize=2)
         self.assertEqual(2, q.maxsize)
         have_been_put = []
 
@@ -143,7 +150,7 @@ async def test():
 class QueueGetTests(_QueueTestBase):
 
     def test_blocking_get(self):
-        q = asyncio.Queue()
+        q = self.Queue()
         q.put_nowait(1)
 
         async def queue_get():
@@ -153,7 +160,7 @@ async def queue_get():
         self.assertEqual(1, res)
 
     def test_get_with_putters(self):
-        q = asyncio.Queue(1)
+        q = self.Queue(1)
         q.put_nowait(1)
 
         waiter = self.loop.create_future()
@@ -173,7 +180,7 @@ def gen():
 
         loop = self.new_test_loop(gen)
 
-        q = asyncio.Queue()
+        q = self.Queue()
         started = asyncio.Event()
         finished = False
 
@@ -198,12 +205,12 @@ async def queue_put():
         self.assertAlmostEqual(0.01, loop.time())
 
     def test_nonblocking_get(self):
-        q = asyncio.Queue()
+        q = self.Queue()
         q.put_nowait(1)
         self.assertEqual(1, q.get_nowait())
 
     def test_nonblocking_get_exception(self):
-        q = asyncio.Queue()
+        q = self.Queue()
         self.assertRaises(asyncio.QueueEmpty, q.get_nowait)
 
     def test_get_cancelled(self):
@@ -217,7 +224,7 @@ def gen():
 
         loop = self.new_test_loop(gen)
 
-        q = asyncio.Queue()
+        q = self.Queue()
 
         async def queue_get():
             return await asyncio.wait_for(q.get(), 0.051)
@@ -232,7 +239,7 @@ async def test():
         self.assertAlmostEqual(0.06, loop.time())
 
     def test_get_cancelled_race(self):
-        q = asyncio.Queue()
+        q = self.Queue()
 
         t1 = self.loop.create_task(q.get())
         t2 = self.loop.create_task(q.get())
@@ -246,7 +253,7 @@ def test_get_cancelled_race(self):
         self.assertEqual(t2.result(), 'a')
 
     def test_get_with_waiting_putters(self):
-        q = asyncio.Queue(maxsize=1)
+        q = self.Queue(maxsize=1)
         self.loop.create_task(q.put('a'))
         self.loop.create_task(q.put('b'))
         test_utils.run_briefly(self.loop)
@@ -269,7 +276,7 @@ async def producer(queue, num_items):
         producer_num_items = 5
 
         async def create_queue():
-            queue = asyncio.Queue(queue_size)
+            queue = self.Queue(queue_size)
             queue._get_loop()
             return queue
 
@@ -293,7 +300,7 @@ async def consumer(queue):
             except asyncio.TimeoutError:
                 pass
 
-        queue = asyncio.Queue(maxsize=5)
+        queue = self.Queue(maxsize=5)
         self.loop.run_until_complete(self.loop.create_task(consumer(queue)))
         self.assertEqual(len(queue._getters), 0)
 
@@ -301,7 +308,7 @@ async def consumer(queue):
 class QueuePutTests(_QueueTestBase):
 
     def test_blocking_put(self):
-        q = asyncio.Queue()
+        q = self.Queue()
 
         async def queue_put():
             # No maxsize, won't block.
@@ -318,7 +325,7 @@ def gen():
 
         loop = self.new_test_loop(gen)
 
-        q = asyncio.Queue(maxsize=1)
+        q = self.Queue(maxsize=1)
         started = asyncio.Event()
         finished = False
 
@@ -341,7 +348,7 @@ async def queue_get():
         self.assertAlmostEqual(0.01, loop.time())
 
     def test_nonblocking_put(self):
-        q = asyncio.Queue()
+        q = self.Queue()
         q.put_nowait(1)
         self.assertEqual(1, q.get_nowait())
 
@@ -352,7 +359,7 @@ def gen():
 
         loop = self.new_test_loop(gen)
 
-        q = asyncio.Queue()
+        q = self.Queue()
 
         reader = loop.create_task(q.get())
 
@@ -381,7 +388,7 @@ def gen():
         loop = self.new_test_loop(gen)
         loop.set_debug(True)
 
-        q = asyncio.Queue()
+        q = self.Queue()
 
         reader1 = loop.create_task(q.get())
         reader2 = loop.create_task(q.get())
@@ -411,7 +418,7 @@ def gen():
 
         loop = self.new_test_loop(gen)
 
-        q = asyncio.Queue(1)
+        q = self.Queue(1)
 
         q.put_nowait(1)
 
@@ -435,18 +442,18 @@ def gen():
         self.assertEqual(q.qsize(), 0)
 
     def test_nonblocking_put_exception(self):
-        q = asyncio.Queue(maxsize=1, )
+        q = self.Queue(maxsize=1, )
         q.put_nowait(1)
         self.assertRaises(asyncio.QueueFull, q.put_nowait, 2)
 
     def test_float_maxsize(self):
-        q = asyncio.Queue(maxsize=1.3, )
+        q = self.Queue(maxsize=1.3, )
         q.put_nowait(1)
         q.put_nowait(2)
         self.assertTrue(q.full())
         self.assertRaises(asyncio.QueueFull, q.put_nowait, 3)
 
-        q = asyncio.Queue(maxsize=1.3, )
+        q = self.Queue(maxsize=1.3, )
 
         async def queue_put():
             await q.put(1)
@@ -455,7 +462,7 @@ async def queue_put():
         self.loop.run_until_complete(queue_put())
 
     def test_put_cancelled(self):
-        q = asyncio.Queue()
+        q = self.Queue()
 
         async def queue_put():
             await q.put(1)
@@ -470,7 +477,7 @@ async def test():
         self.assertTrue(t.result())
 
     def test_put_cancelled_race(self):
-        q = asyncio.Queue(maxsize=1)
+        q = self.Queue(maxsize=1)
 
         put_a = self.loop.create_task(q.put('a'))
         put_b = self.loop.create_task(q.put('b'))
@@ -490,7 +497,7 @@ def test_put_cancelled_race(self):
         self.loop.run_until_complete(put_b)
 
     def test_put_with_waiting_getters(self):
-        q = asyncio.Queue()
+        q = self.Queue()
         t = self.loop.create_task(q.get())
         test_utils.run_briefly(self.loop)
         self.loop.run_until_complete(q.put('a'))
@@ -501,7 +508,7 @@ def test_why_are_putters_waiting(self):
         asyncio.set_event_loop(self.loop)
 
         async def create_queue():
-            q = asyncio.Queue(2)
+            q = self.Queue(2)
             q._get_loop()
             return q
 
@@ -533,7 +540,7 @@ def a_generator():
         loop = self.new_test_loop(a_generator)
 
         # Full queue.
-        queue = asyncio.Queue(maxsize=1)
+        queue = self.Queue(maxsize=1)
         queue.put_nowait(1)
 
         # Task waiting for space to put an item in the queue.
@@ -556,7 +563,7 @@ def gen():
         loop = self.new_test_loop(gen)
 
         # Full Queue.
-        queue = asyncio.Queue(1)
+        queue = self.Queue(1)
         queue.put_nowait(1)
 
         # Task waiting for space to put a item in the queue.
@@ -579,7 +586,7 @@ def gen():
 class LifoQueueTests(_QueueTestBase):
 
     def test_order(self):
-        q = asyncio.LifoQueue()
+        q = self.LifoQueue()
         for i in [1, 3, 2]:
             q.put_nowait(i)
 
@@ -590,7 +597,7 @@ def test_order(self):
 class PriorityQueueTests(_QueueTestBase):
 
     def test_order(self):
-        q = asyncio.PriorityQueue()
+        q = self.PriorityQueue()
         for i in [1, 3, 2]:
             q.put_nowait(i)
 
@@ -673,5 +680,228 @@ class PriorityQueueJoinTests(_QueueJoinTestMixin, _QueueTestBase):
     q_class = asyncio.PriorityQueue
 
 
+class _PyQueuesMixin:
+    Queue = queues._PyQueue
+    LifoQueue = queues._PyLifoQueue
+    PriorityQueue = queues._PyPriorityQueue
+
+
+# The tests above use the C implementation when it is available, run them
+# with the Python implementation too.
+requires_c_queues = unittest.skipUnless(hasattr(queues, '_CQueue'),
+                                        'requires the C _asyncio module')
+
+
+@requires_c_queues
+class PyQueueBasicTests(_PyQueuesMixin, QueueBasicTests):
+    pass
+
+
+@requires_c_queues
+class PyQueueGetTests(_PyQueuesMixin, QueueGetTests):
+    pass
+
+
+@requires_c_queues
+class PyQueuePutTests(_PyQueuesMixin, QueuePutTests):
+    pass
+
+
+@requires_c_queues
+class PyLifoQueueTests(_PyQueuesMixin, LifoQueueTests):
+    pass
+
+
+@requires_c_queues
+class PyPriorityQueueTests(_PyQueuesMixin, PriorityQueueTests):
+    pass
+
+
+@requires_c_queues
+class CQueueTests(_QueueTestBase):
+
+    def test_get_is_coroutine(self):
+        q = self.Queue()
+        for coro in (q.get(), q.put(1)):
+            self.assertTrue(asyncio.iscoroutine(coro))
+            coro.close()
+        for coro in (q.get(), q.put(1)):
+            self.assertEqual(coro.__qualname__,
+                             'Queue.put' if coro.__name__ == 'put'
+                             else 'Queue.get')
+            coro.close()
+        self.assertEqual(q.qsize(), 0)
+
+    def test_never_awaited(self):
+        q = self.Queue()
+        for name in 'get', 'put':
+            with self.subTest(name=name):
+                coro = q.get() if name == 'get' else q.put(1)
+                msg = f"coroutine 'Queue.{name}' was never awaited"
+                with self.assertWarnsRegex(RuntimeWarning, msg):
+                    del coro
+                    support.gc_collect()
+        # no warning once the awaitable was started or closed
+        coro = q.put(1)
+        with self.assertRaises(StopIteration):
+            coro.send(None)
+        coro2 = q.get()
+        coro2.close()
+        with warnings_helper.check_no_warnings(self):
+            del coro, coro2
+            support.gc_collect()
+
+    def test_patch_after_first_use(self):
+        async def test():
+            q = self.Queue()
+            await q.put(1)
+            self.assertEqual(await q.get(), 1)
+            # patching the class after the queue was used
+            with mock.patch.object(self.Queue, 'full', return_value=True):
+                self.assertRaises(asyncio.QueueFull, q.put_nowait, 2)
+                put = asyncio.create_task(q.put(2))
+                await asyncio.sleep(0)
+                self.assertFalse(put.done())
+                put.cancel()
+            q.put_nowait(2)
+            self.assertEqual(q.get_nowait(), 2)
+            # patching the queue
+            with mock.patch.object(q, '_get', return_value='patched'):
+                q.put_nowait(3)
+                self.assertEqual(await q.get(), 'patched')
+            self.assertEqual(q.get_nowait(), 3)
+
+        self.loop.run_until_complete(test())
+
+    def test_no_waiter_when_ready(self):
+        q = self.Queue()
+        coro = q.put(1)
+        with self.assertRaises(StopIteration) as cm:
+            coro.send(None)
+        self.assertIsNone(cm.exception.value)
+        coro = q.get()
+        with self.assertRaises(StopIteration) as cm:
+            coro.send(None)
+        self.assertEqual(cm.exception.value, 1)
+        with self.assertRaisesRegex(RuntimeError, 'cannot reuse'):
+            coro.send(None)
+
+    def test_close_waiting_get(self):
+        async def test():
+            q = self.Queue()
+            coro = q.get()
+            waiter = coro.send(None)
+            self.assertIsInstance(waiter, asyncio.Future)
+            self.assertEqual(list(q._getters), [waiter])
+            coro.close()
+            self.assertTrue(waiter.cancelled())
+            self.assertFalse(q._getters)
+
+            coro = q.get()
+            waiter = coro.send(None)
+            with self.assertRaises(ZeroDivisionError):
+                coro.throw(ZeroDivisionError)
+            self.assertTrue(waiter.cancelled())
+            self.assertFalse(q._getters)
+
+        self.loop.run_until_complete(test())
+
+    def test_dealloc_waiting_put(self):
+        async def test():
+            q = self.Queue(1)
+            q.put_nowait(0)
+            coro = q.put(1)
+            waiter = coro.send(None)
+            self.assertEqual(list(q._putters), [waiter])
+            del coro
+            support.gc_collect()
+            self.assertTrue(waiter.cancelled())
+            self.assertFalse(q._putters)
+
+        self.loop.run_until_complete(test())
+
+    def test_woken_up_waiter_passes_on(self):
+        async def test():
+            q = self.Queue()
+            coro1 = q.get()
+            coro1.send(None)
+            coro2 = q.get()
+            waiter2 = coro2.send(None)
+            q.put_nowait('a')
+            # coro1 was woken up but is closed: coro2 must get the item
+            coro1.close()
+            self.assertTrue(waiter2.done())
+            with self.assertRaises(StopIteration) as cm:
+                coro2.send(None)
+            self.assertEqual(cm.exception.value, 'a')
+
+        self.loop.run_until_complete(test())
+
+    def test_subclass(self):
+        class Queue(self.Queue):
+            def _init(self, maxsize):
+                self._queue = []
+
+            def _put(self, item):
+                self._queue.append(item * 2)
+
+            def _get(self):
+                return self._queue.pop()
+
+        class BoundedQueue(self.Queue):
+            def full(self):
+                return self.qsize() >= 2
+
+        async def test():
+            q = Queue()
+            await q.put(1)
+            await q.put(2)
+            q.put_nowait(3)
+            self.assertEqual(await q.get(), 6)
+            self.assertEqual(q.get_nowait(), 4)
+            self.assertEqual(await q.get(), 2)
+
+            q = BoundedQueue()
+            await q.put(1)
+            await q.put(2)
+            self.assertRaises(asyncio.QueueFull, q.put_nowait, 3)
+            put = asyncio.create_task(q.put(3))
+            await asyncio.sleep(0)
+            self.assertFalse(put.done())
+            self.assertEqual(await q.get(), 1)
+            await put
+            self.assertEqual(list(q._queue), [2, 3])
+
+        self.loop.run_until_complete(test())
+
+    def test_maxsize(self):
+        q = self.Queue()
+        for maxsize, full in ((1, True), (2, False), (2**100, False),
+                              (-1, False), (0.5, True), (True, True)):
+            with self.subTest(maxsize=maxsize):
+                q._maxsize = maxsize
+                self.assertEqual(q.maxsize, maxsize)
+                q.put_nowait(0)
+                self.assertIs(q.full(), full)
+                q.get_nowait()
+        with self.assertRaises(AttributeError):
+            del q._maxsize
+
+
+@requires_c_queues
+class PyQueueJoinTests(_QueueJoinTestMixin, _QueueTestBase):
+    q_class = queues._PyQueue
+
+
+@requires_c_queues
+class PyLifoQueueJoinTests(_QueueJoinTestMixin, _QueueTestBase):
+    q_class = queues._PyLifoQueue
+
+
+@requires_c_queues
+class PyPriorityQueueJoinTests(_QueueJoinTestMixin, _QueueTestBase):
+    q_class = queues._PyPriorityQueue
+
+
 if __name__ == '__main__':
     unittest.main()
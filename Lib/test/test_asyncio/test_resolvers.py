@@ -0,0 +1,199 @@
+"""Tests for asyncio/resolvers.py"""
+
+import asyncio
+import socket
+import threading
+import unittest
+
+from unittest import mock
+from test import support
+from test.test_asyncio import utils as test_utils
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+ADDRINFO = [(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, '',
+             ('192.0.2.1', 80))]
+
+
+class CachingResolverTests(test_utils.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+        self.calls = []
+        patcher = mock.patch('socket.getaddrinfo', self.getaddrinfo)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.loop.shutdown_default_executor())
+        super().tearDown()
+
+    def getaddrinfo(self, host, port, family=0, type=0, proto=0, flags=0):
+        self.calls.append((host, port, family, type, proto, flags))
+        if host == 'unknown':
+            raise socket.gaierror(socket.EAI_NONAME, 'Name or service not known')
+        if host == 'broken':
+            raise OSError('broken')
+        return list(ADDRINFO)
+
+    def resolve(self, resolver, host, port=80, **kwargs):
+        return self.loop.run_until_complete(
+            resolver.getaddrinfo(host, port, **kwargs))
+
+    def test_cache(self):
+        resolver = asyncio.CachingResolver()
+        infos = self.resolve(resolver, 'example.com')
+        self.assertEqual(infos, ADDRINFO)
+        # the caller gets a copy of the cached list
+        infos.clear()
+        self.assertEqual(self.resolve(resolver, 'example.com'), ADDRINFO)
+        self.assertEqual(self.calls, [('example.com', 80, 0, 0, 0, 0)])
+
+        self.resolve(resolver, 'example.com', type=socket.SOCK_STREAM)
+        self.resolve(resolver, 'example.com', 443)
+        self.assertEqual(len(self.calls), 3)
+
+        resolver.clear()
+        self.resolve(resolver, 'example.com')
+        self.assertEqual(len(self.calls), 4)
+
+    def test_ttl(self):
+        resolver = asyncio.CachingResolver(ttl=10)
+        self.resolve(resolver, 'example.com')
+        now = self.loop.time()
+        with mock.patch.object(self.loop, 'time', return_value=now + 9):
+            self.resolve(resolver, 'example.com')
+        self.assertEqual(len(self.calls), 1)
+        with mock.patch.object(self.loop, 'time', return_value=now + 11):
+            self.resolve(resolver, 'example.com')
+        self.assertEqual(len(self.calls), 2)
+
+        resolver = asyncio.CachingResolver(ttl=0)
+        self.resolve(resolver, 'example.com')
+        self.resolve(resolver, 'example.com')
+        self.assertEqual(len(self.calls), 4)
+
+    def test_negative_cache(self):
+        resolver = asyncio.CachingResolver(negative_ttl=10)
+        for i in range(2):
+            with self.assertRaises(socket.gaierror) as cm:
+                self.resolve(resolver, 'unknown')
+            self.assertEqual(cm.exception.errno, socket.EAI_NONAME)
+        self.assertEqual(len(self.calls), 1)
+        now = self.loop.time()
+        with mock.patch.object(self.loop, 'time', return_value=now + 11):
+            with self.assertRaises(socket.gaierror):
+                self.resolve(resolver, 'unknown')
+        self.assertEqual(len(self.calls), 2)
+
+        # other errors are not cached
+        for i in range(2):
+            with self.assertRaises(OSError):
+                self.resolve(resolver, 'broken')
+        self.assertEqual(len(self.calls), 4)
+
+        resolver = asyncio.CachingResolver(negative_ttl=0)
+        for i in range(2):
+            with self.assertRaises(socket.gaierror):
+                self.resolve(resolver, 'unknown')
+        self.assertEqual(len(self.calls), 6)
+
+    def test_maxsize(self):
+        resolver = asyncio.CachingResolver(maxsize=2)
+        self.resolve(resolver, 'a')
+        self.resolve(resolver, 'b')
+        self.resolve(resolver, 'a')
+        self.resolve(resolver, 'c')
+        self.assertEqual(len(self.calls), 3)
+        # 'b' was the least recently used result
+        self.resolve(resolver, 'a')
+        self.assertEqual(len(self.calls), 3)
+        self.resolve(resolver, 'b')
+        self.assertEqual(len(self.calls), 4)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            asyncio.CachingResolver(ttl=-1)
+        with self.assertRaises(ValueError):
+            asyncio.CachingResolver(negative_ttl=-1)
+        with self.assertRaises(ValueError):
+            asyncio.CachingResolver(maxsize=0)
+
+    def test_coalesce(self):
+        resolver = asyncio.CachingResolver()
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking_getaddrinfo(*args):
+            started.set()
+            release.wait(support.SHORT_TIMEOUT)
+            return self.getaddrinfo(*args)
+
+        async def main():
+            with mock.patch('socket.getaddrinfo', blocking_getaddrinfo):
+                lookups = [asyncio.create_task(
+                               resolver.getaddrinfo('example.com', 80))
+                           for i in range(3)]
+                await self.loop.run_in_executor(None, started.wait)
+                await asyncio.sleep(0)
+                self.assertIn('pending=1', repr(resolver))
+                # a cancelled lookup does not cancel the others
+                lookups[0].cancel()
+                await asyncio.sleep(0)
+                release.set()
+                return await asyncio.gather(*lookups[1:])
+
+        self.assertEqual(self.loop.run_until_complete(main()),
+                         [ADDRINFO, ADDRINFO])
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(self.resolve(resolver, 'example.com'), ADDRINFO)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_loop_resolver(self):
+        resolver = asyncio.CachingResolver()
+        self.assertIsNone(self.loop.get_resolver())
+        with self.assertRaises(TypeError):
+            self.loop.set_resolver(object())
+        self.loop.set_resolver(resolver)
+        self.assertIs(self.loop.get_resolver(), resolver)
+        for i in range(2):
+            self.assertEqual(self.loop.run_until_complete(
+                self.loop.getaddrinfo('example.com', 80)), ADDRINFO)
+        self.assertEqual(len(self.calls), 1)
+        self.loop.set_resolver(None)
+        self.assertIsNone(self.loop.get_resolver())
+        self.loop.run_until_complete(self.loop.getaddrinfo('example.com', 80))
+        self.assertEqual(len(self.calls), 2)
+
+    def test_open_connection(self):
+        with test_utils.run_test_server() as httpd:
+            host, port = httpd.address
+            resolver = mock.Mock(spec=['getaddrinfo'])
+            resolver.getaddrinfo = mock.AsyncMock(return_value=[
+                (socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, '',
+                 (host, port))])
+            self.loop.set_resolver(resolver)
+
+            async def main():
+                reader, writer = await asyncio.open_connection(
+                    'server.example', port)
+                writer.write(b'GET / HTTP/1.0\r\n\r\n')
+                data = await reader.read()
+                writer.close()
+                await writer.wait_closed()
+                return data
+
+            data = self.loop.run_until_complete(main())
+            self.assertTrue(data.endswith(b'\r\n\r\nTest message'))
+            resolver.getaddrinfo.assert_awaited_once_with(
+                'server.example', port, family=0, type=socket.SOCK_STREAM,
+                proto=0, flags=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 """Tests for selector_events.py"""
 
+import collections
 import selectors
 import socket
 import unittest
@@ -10,10 +11,12 @@
     ssl = None
 
 import asyncio
+from asyncio import selector_events
 from asyncio.selector_events import BaseSelectorEventLoop
 from asyncio.selector_events import _SelectorTransport
 from asyncio.selector_events import _SelectorSocketTransport
 from asyncio.selector_events import _SelectorDatagramTransport
+from test.support.script_helper import assert_python_ok
 from test.test_asyncio import utils as test_utils
 
 
@@ -39,6 +42,10 @@ def list_to_buffer(l=()):
     return bytearray().join(l)
 
 
+def list_to_deque(l=()):
+    return collections.deque(memoryview(data) for data in l)
+
+
 def close_transport(transport):
     # Don't call transport.close() because the event loop and the selector
     # are mocked
@@ -509,9 +516,10 @@ def setUp(self):
         self.sock = mock.Mock(socket.socket)
         self.sock_fd = self.sock.fileno.return_value = 7
 
-    def socket_transport(self, waiter=None):
-        transport = _SelectorSocketTransport(self.loop, self.sock,
-                                             self.protocol, waiter=waiter)
+    def socket_transport(self, waiter=None, sendmsg=False):
+        with mock.patch('asyncio.selector_events._HAS_SENDMSG', sendmsg):
+            transport = _SelectorSocketTransport(self.loop, self.sock,
+                                                 self.protocol, waiter=waiter)
         self.addCleanup(close_transport, transport)
         return transport
 
@@ -680,17 +688,17 @@ def test_write_memoryview(self):
 
     def test_write_no_data(self):
         transport = self.socket_transport()
-        transport._buffer.extend(b'data')
+        transport._buffer.append(memoryview(b'data'))
         transport.write(b'')
         self.assertFalse(self.sock.send.called)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data']), transport._buffer)
 
     def test_write_buffer(self):
         transport = self.socket_transport()
-        transport._buffer.extend(b'data1')
+        transport._buffer.append(memoryview(b'data1'))
         transport.write(b'data2')
         self.assertFalse(self.sock.send.called)
-        self.assertEqual(list_to_buffer([b'data1', b'data2']),
+        self.assertEqual(list_to_deque([b'data1', b'data2']),
                          transport._buffer)
 
     def test_write_partial(self):
@@ -701,7 +709,7 @@ def test_write_partial(self):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_deque([b'ta']), transport._buffer)
 
     def test_write_partial_bytearray(self):
         data = bytearray(b'data')
@@ -711,7 +719,7 @@ def test_write_partial_bytearray(self):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_deque([b'ta']), transport._buffer)
         self.assertEqual(data, bytearray(b'data'))  # Hasn't been mutated.
 
     def test_write_partial_memoryview(self):
@@ -722,7 +730,7 @@ def test_write_partial_memoryview(self):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_deque([b'ta']), transport._buffer)
 
     def test_write_partial_none(self):
         data = b'data'
@@ -733,7 +741,7 @@ def test_write_partial_none(self):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data']), transport._buffer)
 
     def test_write_tryagain(self):
         self.sock.send.side_effect = BlockingIOError
@@ -743,7 +751,7 @@ def test_write_tryagain(self):
         transport.write(data)
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data']), transport._buffer)
 
     @mock.patch('asyncio.selector_events.logger')
     def test_write_exception(self, m_log):
@@ -784,7 +792,7 @@ def test_write_ready(self):
         self.sock.send.return_value = len(data)
 
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._buffer.append(memoryview(data))
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.assertTrue(self.sock.send.called)
@@ -796,7 +804,7 @@ def test_write_ready_closing(self):
 
         transport = self.socket_transport()
         transport._closing = True
-        transport._buffer.extend(data)
+        transport._buffer.append(memoryview(data))
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.assertTrue(self.sock.send.called)
@@ -814,45 +822,191 @@ def test_write_ready_partial(self):
         self.sock.send.return_value = 2
 
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._buffer.append(memoryview(data))
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'ta']), transport._buffer)
+        self.assertEqual(list_to_deque([b'ta']), transport._buffer)
 
     def test_write_ready_partial_none(self):
         data = b'data'
         self.sock.send.return_value = 0
 
         transport = self.socket_transport()
-        transport._buffer.extend(data)
+        transport._buffer.append(memoryview(data))
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data']), transport._buffer)
 
     def test_write_ready_tryagain(self):
         self.sock.send.side_effect = BlockingIOError
 
         transport = self.socket_transport()
-        transport._buffer = list_to_buffer([b'data1', b'data2'])
+        transport._buffer = list_to_deque([b'data1', b'data2'])
         self.loop._add_writer(7, transport._write_ready)
         transport._write_ready()
 
         self.loop.assert_writer(7, transport._write_ready)
-        self.assertEqual(list_to_buffer([b'data1data2']), transport._buffer)
+        self.assertEqual(list_to_deque([b'data1', b'data2']),
+                         transport._buffer)
 
     def test_write_ready_exception(self):
         err = self.sock.send.side_effect = OSError()
 
         transport = self.socket_transport()
         transport._fatal_error = mock.Mock()
-        transport._buffer.extend(b'data')
+        transport._buffer.append(memoryview(b'data'))
         transport._write_ready()
         transport._fatal_error.assert_called_with(
                                    err,
                                    'Fatal write error on socket transport')
 
+    def test_write_partial_zero_copy(self):
+        data = b'data' * 1000
+        self.sock.send.return_value = 2
+
+        transport = self.socket_transport()
+        transport.write(data)
+        buf = transport._buffer[0]
+        self.assertIs(buf.obj, data)
+        self.assertEqual(transport.get_write_buffer_size(), len(data) - 2)
+
+    def test_write_buffer_bytearray_copied(self):
+        data = bytearray(b'data')
+        self.sock.send.side_effect = BlockingIOError
+
+        transport = self.socket_transport()
+        transport.write(b'x')
+        transport.write(data)
+        data[:] = b'xxxx'
+        self.assertEqual(list_to_deque([b'x', b'data']), transport._buffer)
+        self.assertEqual(transport.get_write_buffer_size(), 5)
+
+    def test_write_buffer_readonly_view_copied(self):
+        data = bytearray(b'data')
+        self.sock.send.side_effect = BlockingIOError
+
+        transport = self.socket_transport()
+        transport.write(b'x')
+        transport.write(memoryview(data).toreadonly())
+        transport.write(memoryview(b'tail')[1:])
+        data[:] = b'xxxx'
+        self.assertEqual(list_to_deque([b'x', b'data', b'ail']),
+                         transport._buffer)
+        self.assertIsInstance(transport._buffer[2].obj, bytes)
+
+    def test_write_memoryview_itemsize(self):
+        data = memoryview(b'\0' * 8).cast('i')
+        self.sock.send.return_value = 2
+
+        transport = self.socket_transport()
+        transport.write(data)
+        self.assertEqual(transport.get_write_buffer_size(), 6)
+
+    def mock_sendmsg(self, *results):
+        # sendmsg() consumes the buffer iterator before returning
+        sent = []
+        results = iter(results)
+        def sendmsg(buffers):
+            sent.append([bytes(b) for b in buffers])
+            return next(results)
+        self.sock.sendmsg.side_effect = sendmsg
+        return sent
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_write_sendmsg(self):
+        sent = self.mock_sendmsg(7, 8)
+
+        transport = self.socket_transport(sendmsg=True)
+        transport._buffer = list_to_deque([b'data1', b'data2', b'data3'])
+        self.loop._add_writer(7, transport._write_ready)
+        transport._write_ready()
+        self.assertEqual(sent, [[b'data1', b'data2', b'data3']])
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(list_to_deque([b'ta2', b'data3']), transport._buffer)
+
+        transport._write_ready()
+        self.assertEqual(sent[1], [b'ta2', b'data3'])
+        self.assertFalse(self.loop.writers)
+        self.assertFalse(transport._buffer)
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_write_sendmsg_iov_max(self):
+        sent = self.mock_sendmsg(0)
+        transport = self.socket_transport(sendmsg=True)
+        count = selector_events.SC_IOV_MAX + 10
+        transport._buffer = list_to_deque([b'x'] * count)
+        transport._write_ready()
+        self.assertEqual(len(sent[0]), selector_events.SC_IOV_MAX)
+        self.assertEqual(len(transport._buffer), count)
+
+    def test_iov_max_indeterminate(self):
+        # sysconf() returns -1 when the limit is indeterminate
+        code = ('import os, socket\n'
+                'os.sysconf = lambda name: -1\n'
+                'from asyncio import selector_events\n'
+                'print(selector_events.SC_IOV_MAX'
+                ' if selector_events._HAS_SENDMSG else 16)\n')
+        rc, out, err = assert_python_ok('-c', code)
+        self.assertEqual(out.strip(), b'16')
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_write_sendmsg_exception(self):
+        err = self.sock.sendmsg.side_effect = OSError()
+
+        transport = self.socket_transport(sendmsg=True)
+        transport._fatal_error = mock.Mock()
+        transport._buffer.append(memoryview(b'data'))
+        transport._write_ready()
+        transport._fatal_error.assert_called_with(
+                                   err,
+                                   'Fatal write error on socket transport')
+        self.assertFalse(transport._buffer)
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_sendmsg(self):
+        sent = self.mock_sendmsg(6)
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.writelines([b'head', b'', bytearray(b'body'),
+                              memoryview(b'tail')])
+        self.assertFalse(self.sock.send.called)
+        self.assertEqual(sent, [[b'head', b'body', b'tail']])
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(list_to_deque([b'dy', b'tail']), transport._buffer)
+
+        # Buffers are queued while the socket is not writable
+        transport.writelines([b'more'])
+        self.assertEqual(self.sock.sendmsg.call_count, 1)
+        self.assertEqual(transport.get_write_buffer_size(), 10)
+
+    def test_writelines_send(self):
+        self.sock.send.return_value = 4
+
+        transport = self.socket_transport()
+        transport.writelines([b'head', b'body'])
+        self.sock.send.assert_called_with(b'head')
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(list_to_deque([b'body']), transport._buffer)
+
+    def test_writelines_empty(self):
+        transport = self.socket_transport()
+        transport.writelines([b'', bytearray()])
+        self.assertFalse(self.sock.send.called)
+        self.assertFalse(self.sock.sendmsg.called)
+        self.assertFalse(self.loop.writers)
+
+    def test_writelines_str(self):
+        transport = self.socket_transport()
+        self.assertRaises(TypeError, transport.writelines, [b'data', 'str'])
+        self.assertFalse(transport._buffer)
+
+    def test_writelines_after_eof(self):
+        transport = self.socket_transport()
+        transport.write_eof()
+        self.assertRaises(RuntimeError, transport.writelines, [b'data'])
+
     def test_write_eof(self):
         tr = self.socket_transport()
         self.assertTrue(tr.can_write_eof())
@@ -867,7 +1021,7 @@ def test_write_eof_buffer(self):
         self.sock.send.side_effect = BlockingIOError
         tr.write(b'data')
         tr.write_eof()
-        self.assertEqual(tr._buffer, list_to_buffer([b'data']))
+        self.assertEqual(tr._buffer, list_to_deque([b'data']))
         self.assertTrue(tr._eof)
         self.assertFalse(self.sock.shutdown.called)
         self.sock.send.side_effect = lambda _: 4
@@ -434,6 +434,23 @@ def test_cancel_sock_accept(self):
 
         client.close()
 
+    def test_sock_recv_unregisters(self):
+        # The socket must not stay registered once sock_recv() returns: it
+        # may be closed right away, and a closed file descriptor whose file
+        # description is shared can't be removed from epoll any more.
+        if isinstance(self.loop, proactor_events.BaseProactorEventLoop):
+            self.skipTest('the proactor event loop has no readers')
+        rsock, wsock = socket.socketpair()
+        rsock.setblocking(False)
+        self.addCleanup(wsock.close)
+        self.addCleanup(rsock.close)
+        fd = rsock.fileno()
+        self.loop.call_soon(wsock.send, b'data')
+        self.assertEqual(
+            self.loop.run_until_complete(self.loop.sock_recv(rsock, 100)),
+            b'data')
+        self.assertFalse(self.loop.remove_reader(fd))
+
     def test_create_connection_sock(self):
         with test_utils.run_test_server() as httpd:
             sock = None
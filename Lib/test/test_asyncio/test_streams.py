@@ -533,6 +533,182 @@ def test_readexactly_exception(self):
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readexactly(2))
 
+    def test_readinto(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+
+        buf = bytearray(10)
+        n = self.loop.run_until_complete(stream.readinto(buf))
+        self.assertEqual(n, 10)
+        self.assertEqual(buf, self.DATA[:10])
+        self.assertEqual(self.DATA[10:], stream._buffer)
+
+        buf = bytearray(20)
+        n = self.loop.run_until_complete(stream.readinto(memoryview(buf)[5:]))
+        self.assertEqual(n, 8)
+        self.assertEqual(buf[5:13], self.DATA[10:])
+        self.assertEqual(b'', stream._buffer)
+
+        n = self.loop.run_until_complete(stream.readinto(bytearray()))
+        self.assertEqual(n, 0)
+
+    def test_readinto_wait(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = bytearray(100)
+        read_task = self.loop.create_task(stream.readinto(buf))
+        test_utils.run_briefly(self.loop)
+        self.assertFalse(read_task.done())
+
+        stream.feed_data(self.DATA)
+        n = self.loop.run_until_complete(read_task)
+        self.assertEqual(buf[:n], self.DATA)
+
+    def test_readinto_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        read_task = self.loop.create_task(stream.readinto(bytearray(10)))
+        self.loop.call_soon(stream.feed_eof)
+        self.assertEqual(self.loop.run_until_complete(read_task), 0)
+
+    def test_readinto_exception(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.set_exception(ValueError())
+        self.assertRaises(ValueError, self.loop.run_until_complete,
+                          stream.readinto(bytearray(10)))
+
+    def test_readinto_readonly(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+        with self.assertRaises(TypeError):
+            self.loop.run_until_complete(stream.readinto(b'x' * 10))
+        self.assertEqual(self.DATA, stream._buffer)
+
+    def test_protocol_buffered(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.StreamReaderProtocol(stream, loop=self.loop)
+        self.assertIsInstance(protocol, asyncio.BufferedProtocol)
+
+        buf = protocol.get_buffer(-1)
+        self.assertGreater(len(buf), len(self.DATA))
+        buf[:len(self.DATA)] = self.DATA
+        protocol.buffer_updated(len(self.DATA))
+        # get_buffer() may reuse the same buffer
+        buf = protocol.get_buffer(-1)
+        buf[:5] = b'line4'
+        protocol.buffer_updated(5)
+        self.assertEqual(self.DATA + b'line4', stream._buffer)
+
+        # Transports which don't support buffered protocols still work
+        protocol.data_received(b'\n')
+        self.assertEqual(self.DATA + b'line4\n', stream._buffer)
+
+    def test_protocol_data_received_override(self):
+        # A subclass overriding data_received() gets the data through it
+        received = []
+
+        class MyProtocol(asyncio.StreamReaderProtocol):
+            def data_received(self, data):
+                received.append(data)
+                super().data_received(data.upper())
+
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = MyProtocol(stream, loop=self.loop)
+        buf = bytearray(asyncio.streams._MIN_DIRECT_READ_SIZE)
+        read_task = self.loop.create_task(stream.readinto(buf))
+        test_utils.run_briefly(self.loop)
+
+        # not received directly into the buffer of readinto()
+        view = protocol.get_buffer(-1)
+        self.assertIsNot(view, buf)
+        view[:4] = b'data'
+        protocol.buffer_updated(4)
+        self.assertEqual(received, [b'data'])
+        self.assertIs(type(received[0]), bytes)
+        self.assertEqual(self.loop.run_until_complete(read_task), 4)
+        self.assertEqual(buf[:4], b'DATA')
+
+        rsock, wsock = socket.socketpair()
+
+        async def main():
+            loop = asyncio.get_running_loop()
+            reader = asyncio.StreamReader(loop=loop)
+            transport, _ = await loop.connect_accepted_socket(
+                lambda: MyProtocol(reader, loop=loop), rsock)
+            with wsock:
+                wsock.sendall(b'more')
+            data = await reader.read()
+            transport.close()
+            return data
+
+        self.assertEqual(self.loop.run_until_complete(main()), b'MORE')
+        self.assertEqual(received[1:], [b'more'])
+
+    def test_readinto_direct(self):
+        # readinto() with a large buffer lets the protocol receive data
+        # directly into the buffer
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.StreamReaderProtocol(stream, loop=self.loop)
+        buf = bytearray(asyncio.streams._MIN_DIRECT_READ_SIZE)
+        read_task = self.loop.create_task(stream.readinto(buf))
+        test_utils.run_briefly(self.loop)
+
+        view = protocol.get_buffer(-1)
+        self.assertIs(view.obj, buf)
+        view[:4] = b'data'
+        protocol.buffer_updated(4)
+
+        # Following data goes to the internal buffer
+        view = protocol.get_buffer(-1)
+        self.assertIsNot(view, buf)
+        view[:4] = b'more'
+        protocol.buffer_updated(4)
+
+        self.assertEqual(self.loop.run_until_complete(read_task), 4)
+        self.assertEqual(buf[:4], b'data')
+        self.assertEqual(b'more', stream._buffer)
+
+    def test_readinto_direct_cancelled(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        protocol = asyncio.StreamReaderProtocol(stream, loop=self.loop)
+        buf = bytearray(asyncio.streams._MIN_DIRECT_READ_SIZE)
+        read_task = self.loop.create_task(stream.readinto(buf))
+        test_utils.run_briefly(self.loop)
+
+        view = protocol.get_buffer(-1)
+        view[:4] = b'data'
+        protocol.buffer_updated(4)
+        read_task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(read_task)
+
+        # The data received into buf is not lost
+        self.assertEqual(b'data', stream._buffer)
+        self.assertIsNone(stream._get_direct_buffer())
+
+    def test_readinto_connection(self):
+        data = b'x' * asyncio.streams._MIN_DIRECT_READ_SIZE + b'y' * 1000
+        rsock, wsock = socket.socketpair()
+        wsock.setblocking(False)
+
+        async def read_all(reader):
+            chunks = []
+            buf = bytearray(len(data))
+            while n := await reader.readinto(buf):
+                chunks.append(bytes(buf[:n]))
+            return b''.join(chunks)
+
+        async def write_all():
+            with wsock:
+                await self.loop.sock_sendall(wsock, data)
+
+        async def main():
+            reader, writer = await asyncio.open_connection(sock=rsock)
+            received, _ = await asyncio.gather(read_all(reader), write_all())
+            writer.close()
+            await writer.wait_closed()
+            return received
+
+        self.assertEqual(self.loop.run_until_complete(main()), data)
+
     def test_exception(self):
         stream = asyncio.StreamReader(loop=self.loop)
         self.assertIsNone(stream.exception())
@@ -3757,6 +3757,134 @@ def test_coro_is_deprecated_in_wait(self):
                 asyncio.wait([task, coroutine_function()]))
 
 
+class IMapTests(test_utils.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.set_event_loop(self.loop)
+        self.running = 0
+        self.max_running = 0
+        self.started = []
+
+    def tearDown(self):
+        self.loop.close()
+        self.loop = None
+        super().tearDown()
+
+    async def work(self, item):
+        # Complete the items in reverse order of their delay
+        self.started.append(item)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            for i in range(item):
+                await asyncio.sleep(0)
+            if item < 0:
+                raise ValueError(item)
+            return item * 10
+        finally:
+            self.running -= 1
+
+    def collect(self, aiterator):
+        async def main():
+            return [result async for result in aiterator]
+        return self.loop.run_until_complete(main())
+
+    def test_ordered(self):
+        items = [5, 1, 4, 2, 3, 0]
+        results = self.collect(asyncio.imap(self.work, items, limit=3))
+        self.assertEqual(results, [50, 10, 40, 20, 30, 0])
+        self.assertEqual(self.max_running, 3)
+
+    def test_unordered(self):
+        items = [5, 1, 4, 2, 3, 0]
+        results = self.collect(asyncio.imap(self.work, items, limit=3,
+                                            ordered=False))
+        self.assertEqual(sorted(results), [0, 10, 20, 30, 40, 50])
+        self.assertEqual(results[0], 10)
+        self.assertEqual(self.max_running, 3)
+
+    def test_lazy(self):
+        consumed = []
+
+        def items():
+            for i in range(100):
+                consumed.append(i)
+                yield 1
+
+        async def main():
+            results = asyncio.imap(self.work, items(), limit=4)
+            self.assertEqual(await anext(results), 10)
+            self.assertEqual(len(consumed), 4)
+            # a new item is taken when a result was consumed
+            self.assertEqual(await anext(results), 10)
+            self.assertEqual(len(consumed), 5)
+            await results.aclose()
+            self.assertEqual(self.running, 0)
+
+        self.loop.run_until_complete(main())
+
+    def test_async_iterable(self):
+        async def items():
+            for i in range(10):
+                await asyncio.sleep(0)
+                yield i
+
+        results = self.collect(asyncio.imap(self.work, items(), limit=2))
+        self.assertEqual(results, [i * 10 for i in range(10)])
+        self.assertEqual(self.max_running, 2)
+
+    def test_limit(self):
+        with self.assertRaises(ValueError):
+            asyncio.imap(self.work, [], limit=0)
+        self.assertEqual(self.collect(asyncio.imap(self.work, [], limit=1)),
+                         [])
+        results = self.collect(asyncio.imap(self.work, [3, 1, 2], limit=1,
+                                            ordered=False))
+        self.assertEqual(results, [30, 10, 20])
+        self.assertEqual(self.max_running, 1)
+
+    def test_exception(self):
+        for ordered in (True, False):
+            with self.subTest(ordered=ordered):
+                results = []
+
+                async def main():
+                    async for result in asyncio.imap(
+                            self.work, [1, -1, 100, 100], limit=3,
+                            ordered=ordered):
+                        results.append(result)
+
+                with self.assertRaises(ValueError):
+                    self.loop.run_until_complete(main())
+                # -1 fails before 1 completes
+                self.assertEqual(results, [10] if ordered else [])
+                self.assertEqual(self.running, 0)
+
+    def test_cancel(self):
+        async def main():
+            async for result in asyncio.imap(self.work, [100] * 5, limit=3):
+                pass
+
+        task = self.loop.create_task(main())
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(self.running, 3)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(task)
+        self.assertEqual(self.running, 0)
+        self.assertEqual(self.started, [100] * 3)
+
+    def test_awaitable(self):
+        def func(item):
+            fut = self.loop.create_future()
+            self.loop.call_soon(fut.set_result, item)
+            return fut
+
+        self.assertEqual(self.collect(asyncio.imap(func, range(5), limit=2)),
+                         list(range(5)))
+
+
 class CompatibilityTests(test_utils.TestCase):
     # Tests for checking a bridge between old-styled coroutines
     # and async/await syntax
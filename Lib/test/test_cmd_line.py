@@ -3,6 +3,7 @@
 # See test_cmd_line_script.py for testing of script execution
 
 import os
+import re
 import subprocess
 import sys
 import tempfile
@@ -114,6 +115,41 @@ def run_python(*args):
         else:
             self.assertEqual(err, b'')
 
+    def test_startup_timing(self):
+        def check(*args, **env_vars):
+            rc, out, err = assert_python_ok(*args, '-c', 'print("ok")',
+                                            **env_vars)
+            self.assertEqual(out.rstrip(), b'ok')
+            lines = err.decode().splitlines()
+            self.assertEqual(lines[0],
+                'startup time: self [us] | cumulative | phase')
+            phases = []
+            cumulative = 0
+            for line in lines[1:]:
+                match = re.fullmatch(
+                    r'startup time: +(\d+) \| +(\d+) \| (.+)', line)
+                self.assertIsNotNone(match, line)
+                self.assertGreaterEqual(int(match[2]), cumulative)
+                cumulative = int(match[2])
+                phases.append(match[3])
+            return phases
+
+        phases = check('-X', 'startup_timing')
+        self.assertEqual(phases, ['read config',
+                                  'runtime, types, sys and builtins',
+                                  'importlib bootstrap', 'path config',
+                                  'importlib external', 'faulthandler',
+                                  'encodings', 'signals and tracemalloc',
+                                  'sys streams', 'builtins.open and __main__',
+                                  'warnings', 'site', 'main'])
+        phases = check('-S', PYTHONSTARTUPTIMING='1')
+        self.assertNotIn('site', phases)
+        self.assertEqual(phases[-1], 'main')
+
+        # disabled by default
+        rc, out, err = assert_python_ok('-c', 'pass')
+        self.assertNotIn(b'startup time', err)
+
     def test_run_module(self):
         # Test expected operation of the '-m' switch
         # Switch needs an argument
@@ -6,6 +6,7 @@
 # rip off all interesting stuff from test_profile
 import cProfile
 from test.test_profile import ProfileTest, regenerate_expected_output
+from test.support.os_helper import TESTFN, unlink
 from test.support.script_helper import assert_python_failure
 from test import support
 
@@ -57,6 +58,91 @@ def test_profile_as_context_manager(self):
 
         # profile shouldn't be set once we leave the with-block.
         self.assertIs(sys.getprofile(), None)
+    def profile_calls(self):
+        def fib(n):
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+        def main():
+            for i in range(3):
+                fib(5)
+                sorted([3, 2, 1])
+        prof = self.profilerclass()
+        prof.runcall(main)
+        return prof
+
+    def test_getstats_binary(self):
+        import _lsprof
+        prof = self.profilerclass()
+        prof.enable()
+        data = prof.getstats_binary()
+        prof.disable()
+        self.assertTrue(data.startswith(b'PYSTATS\0'))
+
+        prof = self.profile_calls()
+        data = prof.getstats_binary()
+        prof.create_stats()
+        stats = _lsprof.stats_from_binary(data)
+        self.assertEqual(stats, prof.stats)
+        self.assertEqual(
+            _lsprof.stats_from_binary(_lsprof.stats_to_binary(stats)), stats)
+
+    def test_dump_stats_binary(self):
+        import pstats
+        prof = self.profile_calls()
+        self.addCleanup(unlink, TESTFN)
+        prof.dump_stats(TESTFN, binary=True)
+        stats = pstats.Stats(TESTFN)
+        prof.create_stats()
+        self.assertEqual(stats.stats, prof.stats)
+
+    def test_merge_binary_stats(self):
+        import _lsprof
+        data = self.profile_calls().getstats_binary()
+        stats = _lsprof.stats_from_binary(data)
+        merged = _lsprof.stats_from_binary(
+            _lsprof.merge_binary_stats([data, bytearray(data), data]))
+        self.assertEqual(merged.keys(), stats.keys())
+        for func, (cc, nc, tt, ct, callers) in stats.items():
+            self.assertEqual(merged[func][:2], (3 * cc, 3 * nc))
+            self.assertAlmostEqual(merged[func][2], 3 * tt)
+            self.assertAlmostEqual(merged[func][3], 3 * ct)
+            self.assertEqual(merged[func][4].keys(), callers.keys())
+        self.assertEqual(
+            _lsprof.stats_from_binary(_lsprof.merge_binary_stats([])), {})
+
+    def test_binary_stats_labels(self):
+        import _lsprof
+        stats = {
+            ('a.py', 1, 'f'): (1, 2, 0.5, 1.5, {('~', 0, '<g>'): 1}),
+            ('\udcff.py', -1, 'h;'): (0, 0, 0.0, 0.0, {}),
+        }
+        # the callers of the profile module are counts
+        self.assertEqual(
+            _lsprof.stats_from_binary(_lsprof.stats_to_binary(stats)),
+            {('a.py', 1, 'f'): (1, 2, 0.5, 1.5,
+                                {('~', 0, '<g>'): (1, 1, 0.0, 0.0)}),
+             ('\udcff.py', -1, 'h;'): (0, 0, 0.0, 0.0, {})})
+        for bad in [{'f': (1, 1, 0.0, 0.0, {})},
+                    {('a.py', '1', 'f'): (1, 1, 0.0, 0.0, {})},
+                    {('a.py', 1, 'f'): [1, 1, 0.0, 0.0, {}]},
+                    {('a.py', 1, 'f'): (1, 1, 0.0, 0.0)},
+                    {('a.py', 1, 'f'): (1, 1, 0.0, 0.0, {'g': 1})}]:
+            with self.subTest(stats=bad):
+                self.assertRaises(TypeError, _lsprof.stats_to_binary, bad)
+
+    def test_invalid_binary_stats(self):
+        import _lsprof
+        data = self.profile_calls().getstats_binary()
+        for bad in [b'', b'PYSTATS', b'PYSTATS\0', data[:-1], data + b'\0',
+                    b'XYSTATS\0' + data[8:], data[:8] + b'\2' + data[9:]]:
+            with self.subTest(data=bad):
+                self.assertRaises(ValueError, _lsprof.stats_from_binary, bad)
+                self.assertRaises(ValueError, _lsprof.merge_binary_stats,
+                                  [data, bad])
+        self.assertRaises(TypeError, _lsprof.merge_binary_stats, [data, 'x'])
+        # an index out of range
+        self.assertRaises(ValueError, _lsprof.stats_from_binary,
+                          b'PYSTATS\0\1\1\1f\1\1\0\1\0')
+
 
 class TestCommandLine(unittest.TestCase):
     def test_sort(self):
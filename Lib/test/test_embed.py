@@ -358,6 +358,7 @@ class InitConfigTests(EmbeddingTestsMixin, unittest.TestCase):
         'faulthandler': 0,
         'tracemalloc': 0,
         'import_time': 0,
+        'startup_timing': 0,
         'show_ref_count': 0,
         'dump_refs': 0,
         'malloc_stats': 0,
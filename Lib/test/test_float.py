@@ -8,9 +8,10 @@
 import unittest
 
 from test import support
+from test.support import import_helper
 from test.test_grammar import (VALID_UNDERSCORE_LITERALS,
                                INVALID_UNDERSCORE_LITERALS)
-from math import isinf, isnan, copysign, ldexp
+from math import isinf, isnan, copysign, ldexp, nextafter
 
 INF = float("inf")
 NAN = float("nan")
@@ -829,6 +830,54 @@ def test_short_repr(self):
             self.assertEqual(repr(float(s)), str(float(s)))
             self.assertEqual(repr(float(negs)), str(float(negs)))
 
+    def check_shortest(self, x):
+        # mode 0 of _Py_dg_dtoa() tries Grisu3, other modes outside 0-9
+        # are mode 0 without it
+        _testinternalcapi = import_helper.import_module('_testinternalcapi')
+        if not hasattr(_testinternalcapi, 'dg_dtoa'):
+            self.skipTest('requires _Py_dg_dtoa()')
+        self.assertEqual(float(repr(x)), x)
+        self.assertEqual(_testinternalcapi.dg_dtoa(x, 0, 0),
+                         _testinternalcapi.dg_dtoa(x, 10, 0), repr(x))
+
+    @support.requires_IEEE_754
+    def test_shortest_random(self):
+        rng = random.Random(20211019)
+        for _ in range(20000):
+            x, = struct.unpack('<d', rng.getrandbits(64).to_bytes(8, 'little'))
+            if not (isinf(x) or isnan(x)):
+                self.check_shortest(x)
+        for _ in range(5000):
+            self.check_shortest(rng.random())
+            self.check_shortest(float(rng.randrange(10**rng.randrange(1, 20))))
+            self.check_shortest(round(rng.uniform(-1e6, 1e6), 6))
+
+    @support.requires_IEEE_754
+    def test_shortest_boundaries(self):
+        for x, r in [
+            (5e-324, '5e-324'),
+            (2.2250738585072014e-308, '2.2250738585072014e-308'),
+            (2.225073858507201e-308, '2.225073858507201e-308'),
+            (1.7976931348623157e308, '1.7976931348623157e+308'),
+            (1e23, '1e+23'),
+            (float(9007199254740993), '9007199254740992.0'),
+            (float(9007199254740995), '9007199254740996.0'),
+        ]:
+            self.assertEqual(repr(x), r)
+            self.check_shortest(x)
+            self.check_shortest(-x)
+        # powers of two have a closer lower neighbour
+        for k in range(-1074, 1024):
+            x = ldexp(1.0, k)
+            self.check_shortest(x)
+            self.check_shortest(nextafter(x, 0.0))
+            self.check_shortest(nextafter(x, INF))
+        for k in range(-323, 309):
+            x = float(f'1e{k}')
+            self.check_shortest(x)
+            self.check_shortest(nextafter(x, 0.0))
+            self.check_shortest(nextafter(x, INF))
+
 @support.requires_IEEE_754
 class RoundTestCase(unittest.TestCase):
 
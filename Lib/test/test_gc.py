@@ -843,6 +843,59 @@ def test_get_objects_arguments(self):
         self.assertRaises(TypeError, gc.get_objects, "1")
         self.assertRaises(TypeError, gc.get_objects, 1.234)
 
+    def test_get_census(self):
+        if gc.isenabled():
+            self.addCleanup(gc.enable)
+            gc.disable()
+        gc.collect()
+        class A:
+            pass
+        objs = [A() for i in range(100)]
+        census = gc.get_census()
+        count, size = census[A]
+        self.assertEqual(count, 100)
+        self.assertGreaterEqual(size, sum(map(sys.getsizeof, objs)))
+        self.assertEqual(gc.get_census(generation=1).get(A), None)
+        self.assertEqual(gc.get_census(generation=0)[A], (count, size))
+
+        # The storage of common containers is included
+        big = [None] * 1000
+        self.assertGreaterEqual(gc.get_census()[list][1],
+                                sys.getsizeof(big))
+        del objs, big
+
+        self.assertRaises(ValueError, gc.get_census, 1000)
+        self.assertRaises(ValueError, gc.get_census, -1000)
+        self.assertRaises(TypeError, gc.get_census, "1")
+
+    def test_get_census_by_module(self):
+        tracemalloc = import_module('tracemalloc')
+        if tracemalloc.is_tracing():
+            self.skipTest("tracemalloc must be stopped before the test")
+        with self.assertRaises(RuntimeError):
+            gc.get_census(by_module=True)
+
+        class A:
+            pass
+        untraced = [A() for i in range(3)]
+        tracemalloc.start()
+        try:
+            traced = [A() for i in range(5)]
+            census = gc.get_census(by_module=True)
+            gen0 = gc.get_census(0, by_module=True)
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(census[A, __file__][0], 5)
+        self.assertEqual(census[A, None][0], 3)
+        self.assertEqual(census[A, __file__][1] + census[A, None][1],
+                         gc.get_census()[A][1])
+        for key in census:
+            self.assertIsInstance(key, tuple)
+            self.assertIsInstance(key[0], type)
+            self.assertIsInstance(key[1], (str, type(None)))
+        self.assertLessEqual(gen0.get((A, __file__), (0, 0))[0], 5)
+        del untraced, traced
+
     def test_resurrection_only_happens_once_per_object(self):
         class A:  # simple self-loop
             def __init__(self):
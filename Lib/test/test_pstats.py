@@ -1,12 +1,14 @@
 import unittest
 
 from test import support
+from test.support import os_helper
 from io import StringIO
 from pstats import SortKey
 from enum import StrEnum, _test_simple_enum
 
 import pstats
 import cProfile
+import sys
 
 class AddCallersTestCase(unittest.TestCase):
     """Tests for pstats.add_callers helper."""
@@ -115,9 +117,121 @@ def pass3(): pass
         self.assertIn('pass2', funcs_called)
         self.assertIn('pass3', funcs_called)
 
+    def test_dump_stats_binary(self):
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        self.stats.dump_stats(os_helper.TESTFN, binary=True)
+        with open(os_helper.TESTFN, 'rb') as f:
+            self.assertTrue(f.read().startswith(b'PYSTATS\0'))
+        stats = pstats.Stats(os_helper.TESTFN)
+        self.assertEqual(stats.stats, self.stats.stats)
+        self.assertEqual(stats.total_calls, self.stats.total_calls)
+
+    def test_merge_stats(self):
+        stats_file = support.findfile('pstats.pck')
+        binary_file = os_helper.TESTFN
+        self.addCleanup(os_helper.unlink, binary_file)
+        self.stats.dump_stats(binary_file, binary=True)
+
+        stream = StringIO()
+        merged = pstats.merge_stats(stats_file, binary_file, stats_file,
+                                    stream=stream)
+        expected = pstats.Stats(stats_file, stats_file, stats_file)
+        self.assertIs(merged.stream, stream)
+        self.assertEqual(merged.files, [stats_file, binary_file, stats_file])
+        self.assertEqual(merged.total_calls, expected.total_calls)
+        self.assertEqual(merged.prim_calls, expected.prim_calls)
+        self.assertAlmostEqual(merged.total_tt, expected.total_tt)
+        self.assertEqual(merged.stats.keys(), expected.stats.keys())
+        for func, (cc, nc, tt, ct, callers) in expected.stats.items():
+            self.assertEqual(merged.stats[func][:2], (cc, nc))
+            self.assertAlmostEqual(merged.stats[func][2], tt)
+            self.assertAlmostEqual(merged.stats[func][3], ct)
+            self.assertEqual(merged.stats[func][4].keys(), callers.keys())
+        merged.sort_stats('time').print_stats()
+        self.assertIn('function calls', stream.getvalue())
+        self.assertIs(pstats.merge_stats(stats_file).stream, sys.stdout)
+
     def test_SortKey_enum(self):
         self.assertEqual(SortKey.FILENAME, 'filename')
         self.assertNotEqual(SortKey.FILENAME, SortKey.CALLS)
 
+
+class CallGraphTestCase(unittest.TestCase):
+    main = ('m.py', 1, 'main')
+    a = ('m.py', 5, 'a')
+    b = ('m.py', 9, 'b')
+    builtin = ('~', 0, '<len>')
+
+    def setUp(self):
+        self.stats = pstats.Stats(stream=StringIO())
+        self.stats.stats = {
+            self.main: (1, 1, 1.0, 10.0, {}),
+            self.a: (2, 2, 3.0, 7.0, {self.main: (2, 2, 3.0, 7.0)}),
+            self.b: (2, 2, 6.0, 6.0, {self.main: (1, 1, 2.0, 2.0),
+                                      self.a: (1, 1, 4.0, 4.0)}),
+            self.builtin: (1, 1, 0.0, 0.0, {self.main: (1, 1, 0.0, 0.0)}),
+        }
+
+    def test_collapsed_stacks(self):
+        self.assertEqual(self.stats.collapsed_stacks(), {
+            'main (m.py:1)': 1000000,
+            'main (m.py:1);a (m.py:5)': 3000000,
+            'main (m.py:1);b (m.py:9)': 2000000,
+            'main (m.py:1);a (m.py:5);b (m.py:9)': 4000000,
+        })
+        self.assertEqual(self.stats.collapsed_stacks(max_depth=2), {
+            'main (m.py:1)': 1000000,
+            'main (m.py:1);a (m.py:5)': 3000000,
+            'main (m.py:1);b (m.py:9)': 2000000,
+            'a (m.py:5);b (m.py:9)': 4000000,
+        })
+
+    def test_collapsed_stacks_recursion(self):
+        f = ('m.py', 3, 'f')
+        self.stats.stats = {
+            self.main: (1, 1, 1.0, 4.0, {}),
+            f: (1, 3, 3.0, 3.0, {self.main: (1, 1, 1.0, 3.0),
+                                 f: (2, 0, 2.0, 2.0)}),
+        }
+        self.assertEqual(self.stats.collapsed_stacks(), {
+            'main (m.py:1)': 1000000,
+            'main (m.py:1);f (m.py:3)': 3000000,
+        })
+
+    def test_dump_collapsed(self):
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        self.stats.dump_collapsed(os_helper.TESTFN)
+        with open(os_helper.TESTFN, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(sorted(lines), [
+            'main (m.py:1) 1000000',
+            'main (m.py:1);a (m.py:5) 3000000',
+            'main (m.py:1);a (m.py:5);b (m.py:9) 4000000',
+            'main (m.py:1);b (m.py:9) 2000000',
+        ])
+
+    def test_dump_callgrind(self):
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        self.stats.dump_callgrind(os_helper.TESTFN)
+        with open(os_helper.TESTFN, encoding='utf-8') as f:
+            output = f.read()
+        self.assertTrue(output.startswith('# callgrind format\n'))
+        self.assertIn('events: ns\n', output)
+        self.assertIn('\nfl=m.py\n'
+                      'fn=main (m.py:1)\n'
+                      '1 1000000000\n'
+                      'cfl=m.py\n'
+                      'cfn=a (m.py:5)\n'
+                      'calls=2 5\n'
+                      '1 7000000000\n', output)
+        self.assertIn('\nfl=~\n'
+                      'fn=<len>\n'
+                      '0 0\n', output)
+        self.assertIn('cfl=m.py\n'
+                      'cfn=b (m.py:9)\n'
+                      'calls=1 9\n'
+                      '5 4000000000\n', output)
+
+
 if __name__ == "__main__":
     unittest.main()
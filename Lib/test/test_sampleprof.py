@@ -0,0 +1,162 @@
+"""Test suite for the sampleprof module."""
+
+import _lsprof
+import os
+import pstats
+import threading
+import time
+import unittest
+
+import sampleprof
+from cProfile import label
+from test.support import os_helper
+from test.support.script_helper import assert_python_ok
+
+
+def busy(duration):
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        pass
+
+def busy_caller(duration):
+    busy(duration)
+
+
+class SamplerTest(unittest.TestCase):
+
+    def test_sample_other_threads(self):
+        started = threading.Event()
+        finish = threading.Event()
+        def waiter():
+            started.set()
+            finish.wait()
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(finish.set)
+        started.wait()
+
+        sampler = _lsprof.Sampler()
+        for i in range(3):
+            sampler.sample(0.5)
+        finish.set()
+
+        stats = sampler.getstats()
+        waiters = [(stack, samples, totaltime)
+                   for stack, samples, totaltime in stats
+                   if waiter.__code__ in stack]
+        self.assertEqual(len(waiters), 1)
+        stack, samples, totaltime = waiters[0]
+        self.assertEqual(samples, 3)
+        self.assertEqual(totaltime, 1.5)
+        # outermost frame first
+        self.assertEqual(stack[0], threading.Thread._bootstrap.__code__)
+        self.assertLess(stack.index(waiter.__code__),
+                        stack.index(threading.Event.wait.__code__))
+
+        # the calling thread is never sampled
+        for stack, samples, totaltime in stats:
+            self.assertNotIn(self.test_sample_other_threads.__code__, stack)
+
+        sampler.clear()
+        self.assertEqual(sampler.getstats(), [])
+
+    def test_sample_invalid_elapsed(self):
+        sampler = _lsprof.Sampler()
+        self.assertRaises(TypeError, sampler.sample, "1")
+        self.assertRaises(TypeError, sampler.sample)
+
+
+class ProfileTest(unittest.TestCase):
+
+    def profile(self, duration=0.2):
+        prof = sampleprof.Profile(0.001)
+        self.addCleanup(prof.disable)
+        prof.runcall(busy_caller, duration)
+        return prof
+
+    def test_invalid_interval(self):
+        self.assertRaises(ValueError, sampleprof.Profile, 0)
+        self.assertRaises(ValueError, sampleprof.Profile, -1.0)
+
+    def test_enable_disable(self):
+        prof = sampleprof.Profile()
+        prof.enable()
+        prof.enable()
+        self.assertTrue(any(t.name == "sampleprof"
+                            for t in threading.enumerate()))
+        prof.disable()
+        prof.disable()
+        self.assertFalse(any(t.name == "sampleprof"
+                             for t in threading.enumerate()))
+
+    def test_stats(self):
+        prof = self.profile()
+        prof.create_stats()
+        busy_label = label(busy.__code__)
+        caller_label = label(busy_caller.__code__)
+        self.assertIn(busy_label, prof.stats)
+        cc, nc, tt, ct, callers = prof.stats[busy_label]
+        self.assertGreater(nc, 0)
+        self.assertEqual(cc, nc)
+        self.assertGreater(tt, 0)
+        self.assertGreaterEqual(ct, tt)
+        self.assertIn(caller_label, callers)
+        self.assertEqual(callers[caller_label][0], nc)
+
+        # busy_caller() only spends time in busy()
+        cc, nc, tt, ct, callers = prof.stats[caller_label]
+        self.assertEqual(tt, 0)
+        self.assertGreater(ct, 0)
+
+        # the result can be used by pstats
+        stats = pstats.Stats(prof)
+        self.assertIn(busy_label, stats.stats)
+
+    def test_dump_stats(self):
+        prof = self.profile(0.05)
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        prof.dump_stats(os_helper.TESTFN)
+        stats = pstats.Stats(os_helper.TESTFN)
+        self.assertIn(label(busy.__code__), stats.stats)
+
+    def test_collapsed_stacks(self):
+        prof = self.profile()
+        stacks = prof.collapsed_stacks()
+        name = sampleprof._frame_name(busy.__code__)
+        caller_name = sampleprof._frame_name(busy_caller.__code__)
+        busy_stacks = [frames for frames in stacks
+                       if frames.endswith(';' + name)]
+        self.assertTrue(busy_stacks)
+        for frames in busy_stacks:
+            self.assertTrue(frames.endswith(f'{caller_name};{name}'))
+            self.assertGreater(stacks[frames], 0)
+
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        prof.dump_collapsed(os_helper.TESTFN)
+        with open(os_helper.TESTFN, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), len(stacks))
+        for line in lines:
+            frames, samples = line.rsplit(' ', 1)
+            self.assertEqual(stacks[frames], int(samples))
+
+    def test_command_line(self):
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        with open(os_helper.TESTFN, 'w', encoding='utf-8') as f:
+            f.write('import time\n'
+                    'def spin():\n'
+                    '    deadline = time.perf_counter() + 0.2\n'
+                    '    while time.perf_counter() < deadline:\n'
+                    '        pass\n'
+                    'spin()\n')
+        rc, out, err = assert_python_ok('-m', 'sampleprof', '--collapsed',
+                                        os_helper.TESTFN)
+        self.assertIn(b'spin (', out)
+        rc, out, err = assert_python_ok('-m', 'sampleprof', '-s', 'tottime',
+                                        os_helper.TESTFN)
+        self.assertIn(b'(spin)', out)
+
+
+if __name__ == "__main__":
+    unittest.main()
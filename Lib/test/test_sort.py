@@ -362,6 +362,34 @@ def test_unsafe_float_compare(self):
         check_against_PyObject_RichCompareBool(self, [float(x) for
                                                       x in range(100)])
 
+    def test_radix_sort(self):
+        # Long lists of floats or small ints are radix sorted; check that the
+        # result is the same and that the sort is stable, including for
+        # -0.0 == 0.0 and with key functions and reverse=True.
+        n = 2000
+        special = [0.0, -0.0, float('inf'), float('-inf'), 5e-324, -5e-324]
+        lists = [[random.random() for _ in range(n)],
+                 [random.choice(special) for _ in range(n)],
+                 [random.uniform(-1e300, 1e300) for _ in range(n)],
+                 [float(random.randrange(-10, 10)) for _ in range(n)],
+                 [random.randrange(-2**30 + 1, 2**30) for _ in range(n)],
+                 [random.randrange(-10**4, 10**4) for _ in range(n)]]
+        for L in lists:
+            check_against_PyObject_RichCompareBool(self, L)
+            pairs = list(enumerate(L))
+            for reverse in False, True:
+                expected = sorted(pairs, key=lambda p: (p[1],), reverse=reverse)
+                self.assertEqual(
+                    sorted(pairs, key=lambda p: p[1], reverse=reverse),
+                    expected)
+
+        # NaNs and mostly sorted data are left to the merge sort
+        L = [random.random() for _ in range(n)] + [float('nan')]
+        check_against_PyObject_RichCompareBool(self, L)
+        L = sorted(random.random() for _ in range(n))
+        L[::500] = [0.5] * len(L[::500])
+        check_against_PyObject_RichCompareBool(self, L)
+
     def test_unsafe_tuple_compare(self):
         # This test was suggested by Tim Peters. It verifies that the tuple
         # comparison respects the current tuple compare semantics, which do not
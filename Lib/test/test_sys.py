@@ -204,6 +204,57 @@ def test_switchinterval(self):
         finally:
             sys.setswitchinterval(orig)
 
+    @threading_helper.reap_threads
+    def test_getgilstats(self):
+        import threading
+        import time
+        keys = {'acquisitions', 'switches', 'contentions', 'drop_requests',
+                'wait_time', 'max_wait_time', 'hold_time'}
+        before = sys.getgilstats()
+        self.assertEqual(set(before), keys)
+
+        def spin():
+            deadline = time.perf_counter() + 0.1
+            while time.perf_counter() < deadline:
+                pass
+
+        thread_stats = {}
+        def worker():
+            spin()
+            thread_stats.update(sys.getgilstats(threading.get_ident()))
+        orig = sys.getswitchinterval()
+        self.addCleanup(sys.setswitchinterval, orig)
+        sys.setswitchinterval(0.001)
+        thread = threading.Thread(target=worker)
+        thread.start()
+        spin()
+        thread.join()
+
+        # The worker had to wait for the GIL held by the main thread
+        # and ask it to drop it
+        self.assertEqual(set(thread_stats), keys)
+        self.assertGreater(thread_stats['acquisitions'], 0)
+        self.assertGreater(thread_stats['contentions'], 0)
+        self.assertGreater(thread_stats['drop_requests'], 0)
+        self.assertGreater(thread_stats['wait_time'], 0)
+        self.assertGreaterEqual(thread_stats['wait_time'],
+                                thread_stats['max_wait_time'])
+        self.assertGreater(thread_stats['hold_time'], 0)
+
+        after = sys.getgilstats()
+        for key in keys - {'max_wait_time'}:
+            self.assertGreaterEqual(after[key] - before[key],
+                                    thread_stats[key], key)
+        self.assertGreaterEqual(after['max_wait_time'],
+                                thread_stats['max_wait_time'])
+
+        main = sys.getgilstats(threading.get_ident())
+        self.assertGreater(main['acquisitions'], 0)
+        self.assertLessEqual(main['hold_time'], after['hold_time'])
+
+        self.assertRaises(ValueError, sys.getgilstats, thread.ident)
+        self.assertRaises(TypeError, sys.getgilstats, "1")
+
     def test_recursionlimit(self):
         self.assertRaises(TypeError, sys.getrecursionlimit, 42)
         oldlimit = sys.getrecursionlimit()
@@ -5,6 +5,7 @@
 import sys
 import difflib
 import gc
+import weakref
 from functools import wraps
 import asyncio
 
@@ -1116,6 +1117,198 @@ def g(frame, event, arg):
             sys.settrace(existing)
 
 
+class CodeMonitorTestCase(unittest.TestCase):
+    """Tests for sys.add_code_monitor() and sys.remove_code_monitor()."""
+
+    def monitor(self, func, events=('call', 'line', 'return')):
+        code = func.__code__
+        recorded = []
+        def callback(frame, event, arg):
+            if event in ('line', 'call'):
+                recorded.append((frame.f_lineno - code.co_firstlineno, event))
+            elif event == 'exception':
+                recorded.append((event, arg[0]))
+            else:
+                recorded.append((event, arg))
+        sys.add_code_monitor(code, callback, events)
+        self.addCleanup(sys.remove_code_monitor, code, callback)
+        return recorded
+
+    def test_events(self):
+        def callee():
+            return 3
+        def f(x):
+            y = callee()
+            return x + y
+        recorded = self.monitor(f)
+        self.assertEqual(f(1), 4)
+        # callee() is not monitored
+        self.assertEqual(recorded,
+                         [(0, 'call'), (1, 'line'), (2, 'line'),
+                          ('return', 4)])
+
+    def test_branch(self):
+        def f(x):
+            if x:
+                return 1
+            return 2
+        code = f.__code__
+        recorded = self.monitor(f, ['branch'])
+        f(True)
+        f(False)
+        self.assertEqual(len(recorded), 2)
+        (event1, (src1, dst1)), (event2, (src2, dst2)) = recorded
+        self.assertEqual(event1, 'branch')
+        self.assertEqual(src1, src2)
+        self.assertNotEqual(dst1, dst2)
+        lines = {offset: line for start, end, line in code.co_lines()
+                 for offset in range(start, end)}
+        self.assertEqual(lines[dst1], code.co_firstlineno + 2)
+        self.assertEqual(lines[dst2], code.co_firstlineno + 3)
+
+    def test_loop_lines(self):
+        def f():
+            for i in range(2):
+                pass
+        recorded = self.monitor(f, ['line'])
+        f()
+        self.assertEqual(recorded,
+                         [(1, 'line'), (2, 'line'), (1, 'line'), (2, 'line'),
+                          (1, 'line')])
+
+    def test_exception(self):
+        def f():
+            try:
+                1/0
+            except ZeroDivisionError:
+                pass
+        recorded = self.monitor(f, ['exception'])
+        f()
+        self.assertEqual(recorded, [('exception', ZeroDivisionError)])
+
+    def test_generator(self):
+        def gen():
+            yield 1
+            yield 2
+        recorded = self.monitor(gen, ['call', 'return'])
+        self.assertEqual(list(gen()), [1, 2])
+        self.assertEqual(recorded,
+                         [(0, 'call'), ('return', 1),
+                          (1, 'call'), ('return', 2),
+                          (2, 'call'), ('return', None)])
+
+    def test_callback_error(self):
+        def f():
+            return 1
+        for event in ('call', 'line', 'return'):
+            with self.subTest(event=event):
+                def callback(frame, ev, arg):
+                    if ev == event:
+                        raise ValueError
+                sys.add_code_monitor(f.__code__, callback, [event])
+                try:
+                    self.assertRaises(ValueError, f)
+                finally:
+                    sys.remove_code_monitor(f.__code__, callback)
+        self.assertEqual(f(), 1)
+
+    def test_with_settrace(self):
+        def f():
+            x = 1
+            return x
+        recorded = self.monitor(f, ['line'])
+        tracer = Tracer()
+        self.addCleanup(sys.settrace, sys.gettrace())
+        sys.settrace(tracer.trace)
+        f()
+        sys.settrace(None)
+        self.assertEqual(recorded, [(1, 'line'), (2, 'line')])
+        lines = [lineno - f.__code__.co_firstlineno
+                 for lineno, event in tracer.events
+                 if event == 'line']
+        self.assertEqual(lines[:2], [1, 2])
+
+    def test_replace_and_remove(self):
+        def f():
+            pass
+        code = f.__code__
+        recorded = []
+        def callback(frame, event, arg):
+            recorded.append(event)
+        sys.add_code_monitor(code, callback, ['call'])
+        sys.add_code_monitor(code, callback, ['return'])
+        f()
+        self.assertEqual(recorded, ['return'])
+        sys.remove_code_monitor(code, callback)
+        f()
+        self.assertEqual(recorded, ['return'])
+        self.assertRaises(ValueError, sys.remove_code_monitor, code, callback)
+
+    def test_no_reference_cycle(self):
+        # The code object only keeps a weak reference to the callback: a
+        # callback referencing the monitored function must not create an
+        # uncollectable reference cycle.
+        def make():
+            def f():
+                return 1
+            def callback(frame, event, arg):
+                f
+            sys.add_code_monitor(f.__code__, callback, ['call'])
+            return weakref.ref(f), weakref.ref(callback)
+        f_ref, callback_ref = make()
+        support.gc_collect()
+        self.assertIsNone(f_ref())
+        self.assertIsNone(callback_ref())
+
+    def test_callback_destroyed(self):
+        def f():
+            pass
+        code = f.__code__
+        recorded = []
+        def callback(frame, event, arg):
+            recorded.append(event)
+        sys.add_code_monitor(code, callback, ['call'])
+        f()
+        del callback
+        support.gc_collect()
+        f()
+        self.assertEqual(recorded, ['call'])
+
+    def test_bound_method(self):
+        def f():
+            pass
+        code = f.__code__
+        class Monitor:
+            def __init__(self):
+                self.events = []
+            def callback(self, frame, event, arg):
+                self.events.append(event)
+        monitor = Monitor()
+        # a new bound method object is created on each attribute access
+        sys.add_code_monitor(code, monitor.callback, ['call'])
+        f()
+        sys.remove_code_monitor(code, monitor.callback)
+        f()
+        self.assertEqual(monitor.events, ['call'])
+
+    def test_invalid_arguments(self):
+        def f():
+            pass
+        code = f.__code__
+        callback = lambda frame, event, arg: None
+        # callback must support weak references
+        self.assertRaises(TypeError, sys.add_code_monitor, code, len.__call__,
+                          ['call'])
+        self.assertRaises(TypeError, sys.add_code_monitor, f, callback, ['call'])
+        self.assertRaises(TypeError, sys.add_code_monitor, code, 1, ['call'])
+        self.assertRaises(TypeError, sys.add_code_monitor, code, callback, [1])
+        self.assertRaises(ValueError, sys.add_code_monitor, code, callback, [])
+        self.assertRaises(ValueError, sys.add_code_monitor, code, callback,
+                          ['opcode'])
+        self.assertRaises(ValueError, sys.add_code_monitor, code, callback,
+                          'line')
+
+
 # 'Jump' tests: assigning to frame.f_lineno within a trace function
 # moves the execution position - it's how debuggers implement a Jump
 # command (aka. "Set next statement").
@@ -8,6 +8,7 @@
 from test.support.import_helper import import_module
 from test.support.script_helper import assert_python_ok, assert_python_failure
 
+import contextlib
 import random
 import sys
 import _thread
@@ -1494,6 +1495,99 @@ def _callback_spy(self, *args, **kwargs):
         self.callback_args.append((args[:], kwargs.copy()))
         self.callback_event.set()
 
+
+@unittest.skipUnless(hasattr(threading, 'ThreadStats'),
+                     'requires per-thread CPU clocks')
+class ThreadStatsTests(BaseTestCase):
+
+    @contextlib.contextmanager
+    def busy_thread(self):
+        stop = threading.Event()
+        started = threading.Event()
+        def busy():
+            started.set()
+            while not stop.is_set():
+                pass
+        thread = threading.Thread(target=busy)
+        thread.start()
+        try:
+            started.wait()
+            yield thread
+        finally:
+            stop.set()
+            thread.join()
+
+    def test_stats(self):
+        stats = threading.current_thread().stats()
+        self.assertIsInstance(stats, threading.ThreadStats)
+        self.assertGreater(stats.cpu_time, 0.0)
+        if sys.platform == 'linux':
+            self.assertGreaterEqual(stats.voluntary_switches, 0)
+            self.assertGreaterEqual(stats.involuntary_switches, 0)
+
+        with self.busy_thread() as thread:
+            cpu_time = thread.stats().cpu_time
+            deadline = time.monotonic() + support.SHORT_TIMEOUT
+            while thread.stats().cpu_time <= cpu_time:
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.01)
+            if sys.platform == 'linux':
+                self.assertIsNotNone(thread.stats().voluntary_switches)
+
+    def test_stats_not_alive(self):
+        thread = threading.Thread(target=lambda: None)
+        self.assertRaises(RuntimeError, thread.stats)
+        thread.start()
+        thread.join()
+        self.assertRaises(RuntimeError, thread.stats)
+
+    def test_get_thread_stats(self):
+        self.assertRaises(ValueError, _thread._get_thread_stats, 0)
+        stats = _thread._get_thread_stats(threading.get_ident())
+        self.assertEqual(len(stats), 3)
+
+    def test_enumerate_stats(self):
+        with self.busy_thread() as thread:
+            stats = threading.enumerate_stats()
+        self.assertIn(thread, stats)
+        self.assertIn(threading.current_thread(), stats)
+        self.assertIsInstance(stats[thread], threading.ThreadStats)
+
+    def test_sampler(self):
+        self.assertRaises(ValueError, threading.ThreadStatsSampler, 0)
+        self.assertRaises(ValueError, threading.ThreadStatsSampler, 1, 0)
+
+        sampler = threading.ThreadStatsSampler(size=3)
+        self.assertEqual(sampler.samples(), [])
+        self.assertEqual(sampler.cpu_usage(), {})
+        with self.busy_thread() as thread:
+            for i in range(5):
+                timestamp, stats = sampler.sample()
+                self.assertIn(thread, stats)
+                time.sleep(0.01)
+        samples = sampler.samples()
+        self.assertEqual(len(samples), 3)
+        self.assertEqual(samples[-1], (timestamp, stats))
+        usage = sampler.cpu_usage()
+        self.assertIn(thread, usage)
+        self.assertGreater(usage[thread], 0.0)
+
+    def test_sampler_thread(self):
+        with threading.ThreadStatsSampler(interval=0.01) as sampler:
+            self.assertRaises(RuntimeError, sampler.start)
+            deadline = time.monotonic() + support.SHORT_TIMEOUT
+            while len(sampler.samples()) < 3:
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.01)
+            names = {thread.name for thread in sampler.samples()[-1][1]}
+            self.assertIn(threading.current_thread().name, names)
+            self.assertNotIn('ThreadStatsSampler', names)
+        count = len(sampler.samples())
+        time.sleep(0.05)
+        self.assertEqual(len(sampler.samples()), count)
+        sampler.stop()
+
+
 class LockTests(lock_tests.LockTests):
     locktype = staticmethod(threading.Lock)
 
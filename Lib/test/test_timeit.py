@@ -2,10 +2,13 @@
 import unittest
 import sys
 import io
+import json
+import math
 from textwrap import dedent
 
 from test.support import captured_stdout
 from test.support import captured_stderr
+from test.support import os_helper
 
 # timeit's default number of iterations.
 DEFAULT_NUMBER = 1000000
@@ -396,6 +399,182 @@ def callback(a, b):
                     '500 0.488\n')
         self.assertEqual(s.getvalue(), expected)
 
+    def test_stats(self):
+        timer = FakeTimer(seconds_per_increment=0.5)
+        t = timeit.Timer(stmt=self.fake_stmt, setup=self.fake_setup,
+                         timer=timer)
+        stats = t.stats(repeat=3, number=4, warmups=2)
+        self.assertEqual(timer.setup_calls, 5)
+        self.assertEqual(timer.count, 20)
+        self.assertEqual(stats.number, 4)
+        self.assertEqual(stats.times, [0.5] * 3)
+        self.assertEqual(stats.warmups, [0.5] * 2)
+        self.assertEqual(stats.outliers, [])
+        self.assertEqual(stats.mean, 0.5)
+        self.assertEqual(stats.stdev, 0.0)
+        self.assertEqual(stats.confidence_interval(), (0.5, 0.5))
+
+    def test_stats_autorange(self):
+        timer = FakeTimer(seconds_per_increment=1/1024)
+        t = timeit.Timer(stmt=self.fake_stmt, setup=self.fake_setup,
+                         timer=timer)
+        stats = t.stats(repeat=2, warmups=0)
+        self.assertEqual(stats.number, 500)
+        self.assertEqual(stats.times, [1/1024] * 2)
+        self.assertEqual(stats.warmups, [])
+
+    def test_stats_processes(self):
+        stats = timeit.Timer("x = 1", "y = 2").stats(repeat=3, number=100,
+                                                     warmups=1, processes=2)
+        self.assertEqual(stats.number, 100)
+        self.assertEqual(len(stats.warmups), 2)
+        self.assertEqual(len(stats.times) + len(stats.outliers), 6)
+        self.assertGreater(stats.mean, 0)
+
+        t = timeit.Timer("x = 1", timer=FakeTimer())
+        self.assertRaises(ValueError, t.stats, number=1, processes=1)
+        t = timeit.Timer("x = 1", globals={})
+        self.assertRaises(ValueError, t.stats, number=1, processes=1)
+        t = timeit.Timer(lambda: None)
+        self.assertRaises(ValueError, t.stats, number=1, processes=1)
+        t = timeit.Timer("1/0")
+        with self.assertRaises(RuntimeError) as cm:
+            t.stats(number=1, processes=1)
+        self.assertIn('ZeroDivisionError', str(cm.exception))
+
+    def run_main_stats(self, switches):
+        return self.run_main(seconds_per_increment=0.0025,
+                             switches=['--processes', '0', '-n100',
+                                       *switches])
+
+    def test_main_stats(self):
+        s = self.run_main_stats(['-r3'])
+        self.assertEqual(s, dedent("""\
+            3 values, 100 loops each, 1 warmup: 2.5 msec +- 0 msec per loop (mean +- std. dev.)
+            95% confidence interval: 2.5 msec .. 2.5 msec; median: 2.5 msec; min: 2.5 msec; max: 2.5 msec
+            """))
+
+    def test_main_stats_verbose(self):
+        s = self.run_main_stats(['-r2', '--warmups', '2', '-v'])
+        self.assertEqual(s, dedent("""\
+            2 values, 100 loops each, 2 warmups: 2.5 msec +- 0 msec per loop (mean +- std. dev.)
+            95% confidence interval: 2.5 msec .. 2.5 msec; median: 2.5 msec; min: 2.5 msec; max: 2.5 msec
+            times: 2.5 msec, 2.5 msec
+            warmups: 2.5 msec, 2.5 msec
+            """))
+
+    def test_main_stats_output_and_compare(self):
+        base = os_helper.TESTFN + '.base.json'
+        changed = os_helper.TESTFN + '.changed.json'
+        self.addCleanup(os_helper.unlink, base)
+        self.addCleanup(os_helper.unlink, changed)
+        self.run_main_stats(['-o', base])
+        with open(base, encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data['stmt'], self.fake_stmt)
+        self.assertEqual(data['number'], 100)
+        self.assertEqual(data['times'], [0.0025] * DEFAULT_REPEAT)
+        with open(changed, 'w', encoding='utf-8') as f:
+            json.dump({'number': 100, 'times': [0.005, 0.0051, 0.0049]}, f)
+
+        with captured_stdout() as s:
+            self.assertIsNone(timeit.main(['--compare', base, changed]))
+        self.assertEqual(s.getvalue(), dedent(f"""\
+            {base}: 2.5 msec +- 0 msec
+            {changed}: 5 msec +- 0.1 msec
+            {changed} is 2.00x slower than {base}: significant (p-value: 0.001)
+            """))
+        with captured_stdout() as s:
+            self.assertEqual(timeit.main(['--compare', base]), 2)
+
+    def test_main_stats_exception(self):
+        with captured_stderr() as error_stringio:
+            self.run_main(switches=['--processes', '0', '-n1', '1/0'])
+        self.assert_exc_string(error_stringio.getvalue(), 'ZeroDivisionError')
+
+
+class TestTimerStats(unittest.TestCase):
+
+    def test_statistics(self):
+        stats = timeit.TimerStats([1.0, 2.0, 3.0, 6.0], 10, [9.0], [100.0])
+        self.assertEqual(stats.number, 10)
+        self.assertEqual(stats.warmups, [9.0])
+        self.assertEqual(stats.outliers, [100.0])
+        self.assertEqual(stats.mean, 3.0)
+        self.assertAlmostEqual(stats.stdev, math.sqrt(14 / 3))
+        self.assertEqual(stats.median, 2.5)
+        self.assertEqual(stats.min, 1.0)
+        self.assertEqual(stats.max, 6.0)
+        self.assertIn('mean=3.0', repr(stats))
+        self.assertRaises(ValueError, timeit.TimerStats, [], 1)
+
+    def test_confidence_interval(self):
+        stats = timeit.TimerStats([1.0, 2.0, 3.0], 1)
+        low, high = stats.confidence_interval()
+        # t(0.975, 2) = 4.302653
+        self.assertAlmostEqual(low, 2.0 - 4.302653 / math.sqrt(3), 5)
+        self.assertAlmostEqual(high, 2.0 + 4.302653 / math.sqrt(3), 5)
+        low, high = stats.confidence_interval(0.5)
+        self.assertAlmostEqual(high - 2.0, 0.8164966 / math.sqrt(3), 5)
+        stats = timeit.TimerStats([1.0], 1)
+        self.assertEqual(stats.confidence_interval(),
+                         (-math.inf, math.inf))
+
+    def test_t_distribution(self):
+        # closed forms of the distribution for 1 and 2 degrees of freedom
+        for t in (0.0, 0.1, 1.0, 2.5, 10.0, 100.0):
+            self.assertAlmostEqual(timeit._t_pvalue(t, 1),
+                                   1 - 2 / math.pi * math.atan(t))
+            self.assertAlmostEqual(timeit._t_pvalue(-t, 2),
+                                   1 - t / math.sqrt(2 + t * t))
+        self.assertAlmostEqual(timeit._t_pvalue(2.0, 10), 0.0733880, 6)
+        self.assertEqual(timeit._t_pvalue(math.inf, 3), 0.0)
+        self.assertAlmostEqual(timeit._t_quantile(0.95, 1), 12.7062047, 5)
+        self.assertAlmostEqual(timeit._t_quantile(0.95, 10), 2.2281389, 5)
+        self.assertAlmostEqual(timeit._t_quantile(0.99, 30), 2.7499957, 5)
+
+    def test_welch_ttest(self):
+        t, p = timeit._welch_ttest([1.0, 1.1, 0.9, 1.0], [2.0, 2.1, 1.9, 2.0])
+        self.assertGreater(t, 0)
+        self.assertLess(p, 1e-4)
+        t, p = timeit._welch_ttest([1.0, 2.0, 3.0], [1.5, 2.5, 2.0])
+        self.assertGreater(p, 0.5)
+        self.assertEqual(timeit._welch_ttest([1.0, 1.0], [1.0, 1.0]),
+                         (0.0, 1.0))
+        self.assertEqual(timeit._welch_ttest([1.0, 1.0], [2.0, 2.0]),
+                         (math.inf, 0.0))
+
+    def test_outliers(self):
+        times = [1.0, 1.1, 0.9, 1.05, 0.95, 5.0, 1.0]
+        self.assertEqual(timeit._split_outliers(times),
+                         ([1.0, 1.1, 0.9, 1.05, 0.95, 1.0], [5.0]))
+        self.assertEqual(timeit._split_outliers([1.0, 5.0]),
+                         ([1.0, 5.0], []))
+
+    def test_compare(self):
+        base = timeit.TimerStats([1.0, 1.1, 0.9, 1.0], 1)
+        ratio, pvalue = base.compare(timeit.TimerStats([2.0, 2.1, 1.9], 1))
+        self.assertAlmostEqual(ratio, 2.0)
+        self.assertLess(pvalue, 0.001)
+        ratio, pvalue = base.compare(timeit.TimerStats([1.0, 0.8, 1.2], 1))
+        self.assertAlmostEqual(ratio, 1.0)
+        self.assertAlmostEqual(pvalue, 1.0)
+        same = timeit.TimerStats([1.0, 1.0], 1)
+        self.assertEqual(same.compare(same), (1.0, 1.0))
+        self.assertEqual(same.compare(timeit.TimerStats([2.0, 2.0], 1)),
+                         (2.0, 0.0))
+
+    def test_dict(self):
+        stats = timeit.TimerStats([1.0, 2.0], 5, [3.0], [4.0])
+        data = json.loads(json.dumps(stats.as_dict()))
+        self.assertEqual(data, {'number': 5, 'times': [1.0, 2.0],
+                                'warmups': [3.0], 'outliers': [4.0]})
+        copy = timeit.TimerStats.from_dict(data)
+        self.assertEqual(copy.times, stats.times)
+        self.assertEqual(copy.number, stats.number)
+        self.assertEqual(copy.warmups, stats.warmups)
+        self.assertEqual(copy.outliers, stats.outliers)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,150 @@
+"""Tests for the benchsuite script in the Tools directory."""
+
+import contextlib
+import io
+import json
+import math
+import os
+import sys
+import unittest
+
+from test.support import os_helper
+from test.test_tools import skip_if_missing, imports_under_tool
+
+skip_if_missing('benchsuite')
+
+with imports_under_tool('benchsuite'):
+    import benchmarks
+    import benchsuite
+
+
+def make_results(values):
+    return {
+        'version': benchsuite.FORMAT_VERSION,
+        'metadata': {},
+        'benchmarks': {name: {'group': 'core', 'loops': 1, 'warmups': [],
+                              'values': bench_values}
+                       for name, bench_values in values.items()},
+    }
+
+
+class StatisticsTests(unittest.TestCase):
+
+    def test_summarize(self):
+        mean, stdev, ci = benchsuite.summarize([1.0, 2.0, 3.0])
+        self.assertEqual(mean, 2.0)
+        self.assertEqual(stdev, 1.0)
+        self.assertAlmostEqual(ci, 4.3026527 / math.sqrt(3), 5)
+
+    def test_format_time(self):
+        self.assertEqual(benchsuite.format_time(1.5), '1.5 sec')
+        self.assertEqual(benchsuite.format_time(0.0123), '12.3 ms')
+        self.assertEqual(benchsuite.format_time(4.5e-6), '4.5 us')
+        self.assertEqual(benchsuite.format_time(2e-8), '20 ns')
+        self.assertEqual(benchsuite.format_time(1e-7, 1e-3), '0.0001 ms')
+
+
+class CompareTests(unittest.TestCase):
+
+    def test_compare(self):
+        base = make_results({
+            'same': [1.0, 1.1, 0.9, 1.0],
+            'slower': [1.0, 1.01, 0.99, 1.0],
+            'faster': [1.0, 1.01, 0.99, 1.0],
+            'tiny': [1.0, 1.0001, 0.9999, 1.0],
+            'removed': [1.0, 1.0],
+        })
+        changed = make_results({
+            'same': [1.0, 0.9, 1.1, 1.05],
+            'slower': [1.5, 1.51, 1.49, 1.5],
+            'faster': [0.5, 0.51, 0.49, 0.5],
+            'tiny': [1.001, 1.0011, 1.0009, 1.001],
+            'added': [1.0, 1.0],
+        })
+        comparison = {c[0]: c for c in
+                      benchsuite.compare_results(base, changed)}
+        self.assertEqual(set(comparison),
+                         {'same', 'slower', 'faster', 'tiny'})
+        self.assertFalse(comparison['same'][5])
+        self.assertTrue(comparison['slower'][5])
+        self.assertAlmostEqual(comparison['slower'][3], 1.5)
+        self.assertTrue(comparison['faster'][5])
+        self.assertAlmostEqual(comparison['faster'][3], 0.5)
+        # significant, but smaller than min_change
+        self.assertLess(comparison['tiny'][4], 0.05)
+        self.assertFalse(comparison['tiny'][5])
+
+        out = io.StringIO()
+        slower = benchsuite.show_comparison(
+            list(comparison.values()), out=out)
+        self.assertEqual(slower, 1)
+        output = out.getvalue()
+        self.assertIn('1.50x slower', output)
+        self.assertIn('2.00x faster', output)
+        self.assertIn('1 significantly slower, 1 significantly faster, '
+                      '2 not significant', output)
+
+
+class RunTests(unittest.TestCase):
+
+    def test_select_benchmarks(self):
+        names = benchsuite.select_benchmarks('')
+        self.assertIn('call_function', names)
+        groups = set(benchsuite.list_benchmarks().values())
+        self.assertEqual(groups, set(benchmarks.GROUPS))
+        names = benchsuite.select_benchmarks('json,json_dumps,re_sub')
+        self.assertEqual(names, ['json_dumps', 'json_loads', 're_sub'])
+        with self.assertRaises(ValueError):
+            benchsuite.select_benchmarks('no_such_benchmark')
+
+    def test_benchmarks(self):
+        # every benchmark runs and returns a duration
+        for name, func in benchmarks.BENCHMARKS.items():
+            if func.group == 'startup':
+                continue
+            with self.subTest(name=name):
+                elapsed = func(1)
+                self.assertIsInstance(elapsed, float)
+                self.assertGreaterEqual(elapsed, 0)
+
+    def test_run_and_compare(self):
+        filename = os_helper.TESTFN + '.json'
+        self.addCleanup(os_helper.unlink, filename)
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            rc = benchsuite.main(['run', '-b', 'call_function,str_join',
+                                  '--processes', '2', '--values', '2',
+                                  '--warmups', '1', '--loops', '10',
+                                  '-o', filename])
+        self.assertEqual(rc, 0)
+        self.assertIn('[2/2] str_join: ', out.getvalue())
+        results = benchsuite.load_results(filename)
+        self.assertEqual(list(results['benchmarks']),
+                         ['call_function', 'str_join'])
+        bench = results['benchmarks']['call_function']
+        self.assertEqual(bench['group'], 'core')
+        self.assertEqual(bench['loops'], 10)
+        self.assertEqual(len(bench['warmups']), 2)
+        self.assertEqual(len(bench['values']), 4)
+        self.assertEqual(results['metadata']['debug_build'],
+                         hasattr(sys, 'gettotalrefcount'))
+
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            benchsuite.main(['compare', filename, filename])
+        self.assertIn('0 significantly slower', out.getvalue())
+
+    def test_calibrate(self):
+        result = benchsuite.worker_calibrate('call_function', 0.001)
+        self.assertGreater(result['loops'], 1)
+
+    def test_load_results_version(self):
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+        with open(os_helper.TESTFN, 'w', encoding='utf-8') as f:
+            json.dump({'version': 0}, f)
+        with self.assertRaises(ValueError):
+            benchsuite.load_results(os_helper.TESTFN)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,5 @@
 import contextlib
+import math
 import os
 import sys
 import tracemalloc
@@ -333,6 +334,57 @@ def test_snapshot_save_attr(self):
         snapshot2 = tracemalloc.Snapshot.load(os_helper.TESTFN)
         self.assertEqual(snapshot2.test_attr, "new")
 
+    def test_snapshot_load_without_sampling_interval(self):
+        # snapshot dumped before sampling_interval was added
+        raw_traces = [(0, 10, (('a.py', 2),), 1)]
+        snapshot = tracemalloc.Snapshot(raw_traces, 1)
+        del snapshot.sampling_interval
+        snapshot.dump(os_helper.TESTFN)
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+
+        snapshot2 = tracemalloc.Snapshot.load(os_helper.TESTFN)
+        self.assertEqual(snapshot2.sampling_interval, 0)
+        self.assertEqual(snapshot2.statistics('lineno'), [
+            tracemalloc.Statistic(traceback_lineno('a.py', 2), 10, 1)])
+        self.assertEqual(snapshot2.compare_to(snapshot2, 'lineno')[0].size, 10)
+
+    def test_sampling(self):
+        tracemalloc.stop()
+        self.assertEqual(tracemalloc.get_sampling_interval(), 0)
+        with self.assertRaises(ValueError):
+            tracemalloc.start(sampling_interval=-1)
+
+        sampling_interval = 64 * 1024
+        tracemalloc.start(1, sampling_interval=sampling_interval)
+        self.assertEqual(tracemalloc.get_sampling_interval(),
+                         sampling_interval)
+
+        obj_size = 10_000
+        data = [allocate_bytes(obj_size)[0] for i in range(1000)]
+        total_size = obj_size * len(data)
+        snapshot = tracemalloc.take_snapshot()
+        self.assertEqual(snapshot.sampling_interval, sampling_interval)
+
+        # only keep the bytes objects allocated by allocate_bytes()
+        code = allocate_bytes.__code__
+        lineno = code.co_firstlineno + 4
+        snapshot = snapshot.filter_traces(
+            [tracemalloc.Filter(True, code.co_filename, lineno)])
+        self.assertEqual(snapshot.sampling_interval, sampling_interval)
+        self.assertLess(len(snapshot.traces), len(data) // 2)
+
+        # statistics are estimates of all memory blocks: the relative
+        # standard deviation is about 8% here
+        stats = snapshot.statistics('lineno')
+        self.assertEqual(len(stats), 1)
+        self.assertAlmostEqual(stats[0].size, total_size,
+                               delta=total_size // 2)
+        self.assertAlmostEqual(stats[0].count, len(data),
+                               delta=len(data) // 2)
+
+        tracemalloc.stop()
+        self.assertEqual(tracemalloc.get_sampling_interval(), 0)
+
     def fork_child(self):
         if not tracemalloc.is_tracing():
             return 2
@@ -385,6 +437,34 @@ def test_create_snapshot(self):
             self.assertEqual(trace.traceback[0].filename, 'a.py')
             self.assertEqual(trace.traceback[0].lineno, 2)
 
+    def test_snapshot_sampling(self):
+        raw_traces = [
+            (0, 1000, (('a.py', 2),), 1),
+            (0, 1000, (('a.py', 2),), 1),
+            (0, 3000, (('b.py', 1),), 1),
+        ]
+        snapshot = tracemalloc.Snapshot(raw_traces, 1, sampling_interval=1000)
+
+        def estimate(size, count):
+            probability = 1 - math.exp(-size / 1000)
+            return round(size * count / probability), round(count / probability)
+
+        tb_a_2 = traceback_lineno('a.py', 2)
+        tb_b_1 = traceback_lineno('b.py', 1)
+        self.assertEqual(snapshot.statistics('lineno'), [
+            tracemalloc.Statistic(tb_a_2, *estimate(1000, 2)),
+            tracemalloc.Statistic(tb_b_1, *estimate(3000, 1)),
+        ])
+        self.assertEqual(snapshot.statistics('filename', cumulative=True),
+                         snapshot.statistics('filename'))
+
+        # filters keep the sampling interval
+        snapshot2 = snapshot.filter_traces([tracemalloc.Filter(True, 'b.py')])
+        self.assertEqual(snapshot2.sampling_interval, 1000)
+        self.assertEqual(snapshot2.statistics('lineno'), [
+            tracemalloc.Statistic(tb_b_1, *estimate(3000, 1)),
+        ])
+
     def test_filter_traces(self):
         snapshot, snapshot2 = create_snapshots()
         filter1 = tracemalloc.Filter(False, "b.py")
@@ -1725,6 +1725,24 @@ def test_utf8_decode_valid_sequences(self):
         for seq, res in sequences:
             self.assertEqual(seq.decode('utf-8'), res)
 
+    def test_utf8_decode_long_non_ascii(self):
+        # Non-ASCII data is decoded directly to a string of the final kind;
+        # check with the non-ASCII characters at every offset of a word.
+        for char in '\xe9', '\u0100', '\u20ac', '\U0001f600':
+            for prefix in range(17):
+                for suffix in range(17):
+                    s = 'a' * prefix + char + 'b' * 30 + char + 'c' * suffix
+                    encoded = s.encode('utf-8')
+                    decoded = encoded.decode('utf-8')
+                    self.assertEqual(decoded, s)
+                    self.assertEqual(decoded.encode('utf-8'), encoded)
+                    # truncated and invalid data still behave the same
+                    self.assertRaises(UnicodeDecodeError,
+                                      encoded[:-suffix - 1].decode, 'utf-8')
+                    self.assertEqual(
+                        (encoded + b'\xff' * suffix).decode('utf-8', 'ignore'),
+                        s)
+
 
     def test_utf8_decode_invalid_sequences(self):
         # continuation bytes in a sequence of 2, 3, or 4 bytes
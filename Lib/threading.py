@@ -41,6 +41,13 @@
     __all__.append('get_native_id')
 except AttributeError:
     _HAVE_THREAD_NATIVE_ID = False
+try:
+    _get_thread_stats = _thread._get_thread_stats
+    ThreadStats = _thread._ThreadStats
+    _HAVE_THREAD_STATS = True
+    __all__.extend(['ThreadStats', 'enumerate_stats', 'ThreadStatsSampler'])
+except AttributeError:
+    _HAVE_THREAD_STATS = False
 ThreadError = _thread.error
 try:
     _CRLock = _thread.RLock
@@ -1143,6 +1150,26 @@ def native_id(self):
             assert self._initialized, "Thread.__init__() not called"
             return self._native_id
 
+    if _HAVE_THREAD_STATS:
+        def stats(self):
+            """Return the CPU time and context switches of this thread so far.
+
+            The result is a ThreadStats object with the cpu_time (in seconds),
+            voluntary_switches and involuntary_switches attributes.  The
+            numbers of context switches are None if they are not available.
+            Raise RuntimeError if the thread is not alive.
+
+            """
+            assert self._initialized, "Thread.__init__() not called"
+            if self.is_alive():
+                native_id = self._native_id if _HAVE_THREAD_NATIVE_ID else None
+                try:
+                    return _get_thread_stats(self._ident, native_id)
+                except ValueError:
+                    # the thread state was just deleted
+                    pass
+            raise RuntimeError("thread is not alive")
+
     def is_alive(self):
         """Return whether the thread is alive.
 
@@ -1463,6 +1490,115 @@ def enumerate():
     with _active_limbo_lock:
         return list(_active.values()) + list(_limbo.values())
 
+if _HAVE_THREAD_STATS:
+    def enumerate_stats():
+        """Return a dict mapping all Thread objects currently alive to their
+        statistics, as returned by Thread.stats().
+
+        Threads which terminate while the statistics are collected are left
+        out.
+
+        """
+        stats = {}
+        for thread in enumerate():
+            try:
+                stats[thread] = thread.stats()
+            except RuntimeError:
+                pass
+        return stats
+
+    class ThreadStatsSampler:
+        """Sample the statistics of all threads periodically.
+
+        Once started, a daemon thread calls sample() every interval seconds.
+        The last size samples are kept in a ring buffer.
+
+        """
+
+        def __init__(self, interval=1.0, size=60):
+            if interval <= 0:
+                raise ValueError("interval must be positive")
+            if size < 1:
+                raise ValueError("size must be at least 1")
+            self.interval = interval
+            self._samples = _deque(maxlen=size)
+            self._lock = Lock()
+            self._thread = None
+            self._stopped = None
+
+        def start(self):
+            """Start sampling in a daemon thread."""
+            if self._thread is not None:
+                raise RuntimeError("sampler already started")
+            self._stopped = Event()
+            self._thread = Thread(target=self._run, args=(self._stopped,),
+                                  name="ThreadStatsSampler", daemon=True)
+            self._thread.start()
+
+        def stop(self):
+            """Stop the sampling thread and wait until it exits."""
+            if self._thread is None:
+                return
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+
+        def __enter__(self):
+            self.start()
+            return self
+
+        def __exit__(self, *exc_info):
+            self.stop()
+
+        def _run(self, stopped):
+            while True:
+                self.sample()
+                if stopped.wait(self.interval):
+                    break
+
+        def sample(self):
+            """Take a sample now and add it to the ring buffer.
+
+            A sample is a (time, stats) tuple, where time is a
+            time.monotonic() timestamp and stats the result of
+            enumerate_stats(), without the sampling thread.
+
+            """
+            stats = enumerate_stats()
+            stats.pop(self._thread, None)
+            sample = (_time(), stats)
+            with self._lock:
+                self._samples.append(sample)
+            return sample
+
+        def samples(self):
+            """Return the samples of the ring buffer, oldest first."""
+            with self._lock:
+                return list(self._samples)
+
+        def cpu_usage(self):
+            """Return a dict mapping the threads of the last sample to the
+            fraction of a CPU they used since the oldest sample they appear
+            in.  Threads which appear in a single sample are left out.
+
+            """
+            samples = self.samples()
+            if not samples:
+                return {}
+            first = {}
+            for timestamp, stats in samples[:-1]:
+                for thread, thread_stats in stats.items():
+                    if thread not in first:
+                        first[thread] = (timestamp, thread_stats.cpu_time)
+            end, last = samples[-1]
+            usage = {}
+            for thread, thread_stats in last.items():
+                if thread in first:
+                    start, cpu_time = first[thread]
+                    usage[thread] = ((thread_stats.cpu_time - cpu_time)
+                                     / (end - start))
+            return usage
+
 
 _threading_atexits = []
 _SHUTTING_DOWN = False
@@ -10,6 +10,8 @@
 
 Command line usage:
     python timeit.py [-n N] [-r N] [-s S] [-p] [-h] [--] [statement]
+    python timeit.py --stats [--processes N] [--warmups N] [-o FILE] ...
+    python timeit.py --compare FILE1 FILE2
 
 Options:
   -n/--number N: how many times to execute 'statement' (default: see below)
@@ -20,6 +22,11 @@
   -v/--verbose: print raw timing results; repeat for more digits precision
   -u/--unit: set the output time unit (nsec, usec, msec, or sec)
   -h/--help: print this usage message and exit
+  --stats: statistical mode, see below
+  --processes N: number of worker processes in statistical mode (default 4)
+  --warmups N: number of ignored timings per process (default 1)
+  -o/--output FILE: write the statistical results to FILE as JSON
+  --compare: compare the results of two runs written with -o
   --: separate options from statement, use when statement starts with -
   statement: statement to be timed (default 'pass')
 
@@ -32,6 +39,13 @@
 increasing numbers from the sequence 1, 2, 5, 10, 20, 50, ... until the
 total time is at least 0.2 seconds.
 
+In statistical mode, enabled by --stats or by any of the options after
+it, the statement is timed in several fresh worker processes.  Each
+worker first runs ignored warmup timings, then -r timings.  The mean,
+standard deviation and 95% confidence interval of the time per loop
+are reported, after removing the outliers.  With --compare, Welch's
+t-test tells whether the difference between two runs is significant.
+
 Note: there is a certain baseline overhead associated with executing a
 pass statement.  It differs between versions.  The code here doesn't try
 to hide it, but you should be aware of it.  The baseline overhead can be
@@ -40,6 +54,7 @@
 Classes:
 
     Timer
+    TimerStats
 
 Functions:
 
@@ -54,12 +69,14 @@
 import time
 import itertools
 
-__all__ = ["Timer", "timeit", "repeat", "default_timer"]
+__all__ = ["Timer", "TimerStats", "timeit", "repeat", "default_timer"]
 
 dummy_src_name = "<timeit-src>"
 default_number = 1000000
 default_repeat = 5
 default_timer = time.perf_counter
+default_processes = 4
+default_warmups = 1
 
 _globals = globals
 
@@ -103,6 +120,12 @@ def __init__(self, stmt="pass", setup="pass", timer=default_timer,
                  globals=None):
         """Constructor.  See class doc string."""
         self.timer = timer
+        # Statements which can be run by worker processes, see stats()
+        if (isinstance(stmt, str) and isinstance(setup, str)
+                and globals is None):
+            self._sources = (stmt, setup)
+        else:
+            self._sources = None
         local_ns = {}
         global_ns = _globals() if globals is None else globals
         init = ''
@@ -228,6 +251,222 @@ def autorange(self, callback=None):
                     return (number, time_taken)
             i *= 10
 
+    def stats(self, repeat=default_repeat, number=0, warmups=default_warmups,
+              processes=0, remove_outliers=True):
+        """Time the main statement and return a TimerStats object.
+
+        Calls timeit() warmups times, ignoring the results, then repeat
+        times.  If number is 0, it is determined by autorange() first.
+        If processes is non-zero, the timings are run in that many
+        fresh worker processes, one after the other, each running the
+        warmups and the repeat timings: this requires the statements to
+        be strings and globals not to be given.  Timings more than 1.5
+        interquartile ranges away from the quartiles are considered
+        outliers, and removed from the statistics if remove_outliers
+        is true.
+        """
+        if number == 0:
+            number, _ = self.autorange()
+        if processes:
+            if self._sources is None:
+                raise ValueError("worker processes can only run string "
+                                 "statements without globals")
+            if self.timer is default_timer:
+                timer_args = []
+            elif self.timer is time.process_time:
+                timer_args = ["-p"]
+            else:
+                raise ValueError("worker processes can only use the "
+                                 "default timer or time.process_time")
+            stmt, setup = self._sources
+            cmd = [sys.executable, "-m", "timeit", "--worker",
+                   "-n", str(number), "-r", str(repeat),
+                   "--warmups", str(warmups), "-s", setup,
+                   *timer_args, "--", stmt]
+            results = [_run_worker(cmd) for _ in range(processes)]
+        else:
+            results = [([self.timeit(number) for _ in range(warmups)],
+                        self.repeat(repeat, number))]
+        warmup_times = []
+        times = []
+        for process_warmups, process_times in results:
+            warmup_times.extend(dt / number for dt in process_warmups)
+            times.extend(dt / number for dt in process_times)
+        outliers = []
+        if remove_outliers:
+            times, outliers = _split_outliers(times)
+        return TimerStats(times, number, warmup_times, outliers)
+
+
+def _run_worker(cmd):
+    import json, subprocess
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          text=True)
+    if proc.returncode:
+        raise RuntimeError("timeit worker process failed:\n" + proc.stderr)
+    result = json.loads(proc.stdout)
+    return result["warmups"], result["times"]
+
+def _split_outliers(times):
+    """Split times into the values within Tukey's fences and outliers."""
+    if len(times) < 4:
+        return list(times), []
+    import statistics
+    q1, _, q3 = statistics.quantiles(times, n=4)
+    low = q1 - 1.5 * (q3 - q1)
+    high = q3 + 1.5 * (q3 - q1)
+    kept = [t for t in times if low <= t <= high]
+    outliers = [t for t in times if not low <= t <= high]
+    return kept, outliers
+
+def _betainc(a, b, x):
+    """Regularized incomplete beta function I_x(a, b)."""
+    import math
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    if x > (a + 1.0) / (a + b + 2.0):
+        return 1.0 - _betainc(b, a, 1.0 - x)
+    # Continued fraction evaluated with the modified Lentz's method
+    tiny = 1e-300
+    c = 1.0
+    d = 1.0 - (a + b) * x / (a + 1.0)
+    d = 1.0 / (d if abs(d) >= tiny else tiny)
+    h = d
+    for m in range(1, 300):
+        for num in (m * (b - m) * x / ((a + 2*m - 1.0) * (a + 2*m)),
+                    -(a + m) * (a + b + m) * x / ((a + 2*m) * (a + 2*m + 1.0))):
+            d = 1.0 + num * d
+            d = 1.0 / (d if abs(d) >= tiny else tiny)
+            c = 1.0 + num / c
+            if abs(c) < tiny:
+                c = tiny
+            h *= d * c
+        if abs(d * c - 1.0) < 1e-15:
+            break
+    lbeta = (math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+             + a * math.log(x) + b * math.log1p(-x))
+    return math.exp(lbeta) * h / a
+
+def _t_pvalue(t, df):
+    """Two-sided p-value of a Student's t statistic."""
+    if t in (float("inf"), float("-inf")):
+        return 0.0
+    return _betainc(df / 2.0, 0.5, df / (df + t * t))
+
+def _t_quantile(confidence, df):
+    """Half width of the confidence interval of Student's t distribution."""
+    lo, hi = 0.0, 1.0
+    while _t_pvalue(hi, df) > 1.0 - confidence:
+        hi *= 2.0
+    for _ in range(100):
+        mid = (lo + hi) / 2.0
+        if _t_pvalue(mid, df) > 1.0 - confidence:
+            lo = mid
+        else:
+            hi = mid
+    return hi
+
+def _welch_ttest(times1, times2):
+    """Return the t statistic and the two-sided p-value of Welch's t-test
+    that the means of two samples are equal."""
+    import math, statistics
+    n1 = len(times1)
+    n2 = len(times2)
+    mean1 = statistics.fmean(times1)
+    mean2 = statistics.fmean(times2)
+    se1 = statistics.variance(times1, mean1) / n1
+    se2 = statistics.variance(times2, mean2) / n2
+    if se1 + se2 == 0.0:
+        if mean1 == mean2:
+            return 0.0, 1.0
+        return math.copysign(math.inf, mean2 - mean1), 0.0
+    t = (mean2 - mean1) / math.sqrt(se1 + se2)
+    df = (se1 + se2) ** 2 / (se1 ** 2 / (n1 - 1) + se2 ** 2 / (n2 - 1))
+    return t, _t_pvalue(t, df)
+
+
+class TimerStats:
+    """Statistics of the timings of a statement, see Timer.stats().
+
+    times is the list of the times per loop in seconds used for the
+    statistics, number the number of loops of each timing, warmups the
+    times per loop of the ignored warmup timings and outliers the
+    times per loop which were removed from times.
+    """
+
+    def __init__(self, times, number, warmups=(), outliers=()):
+        if not times:
+            raise ValueError("times must not be empty")
+        self.times = list(times)
+        self.number = number
+        self.warmups = list(warmups)
+        self.outliers = list(outliers)
+
+    def __repr__(self):
+        return (f"<{self.__class__.__name__} mean={self.mean!r} "
+                f"stdev={self.stdev!r} times={len(self.times)} "
+                f"number={self.number}>")
+
+    @property
+    def mean(self):
+        import statistics
+        return statistics.fmean(self.times)
+
+    @property
+    def stdev(self):
+        import statistics
+        if len(self.times) < 2:
+            return 0.0
+        return statistics.stdev(self.times)
+
+    @property
+    def median(self):
+        import statistics
+        return statistics.median(self.times)
+
+    @property
+    def min(self):
+        return min(self.times)
+
+    @property
+    def max(self):
+        return max(self.times)
+
+    def confidence_interval(self, confidence=0.95):
+        """Return the (low, high) confidence interval of the mean."""
+        mean = self.mean
+        n = len(self.times)
+        if n < 2:
+            return (float("-inf"), float("inf"))
+        width = _t_quantile(confidence, n - 1) * self.stdev / n ** 0.5
+        return (mean - width, mean + width)
+
+    def compare(self, other):
+        """Compare with the statistics of another run.
+
+        Return (ratio, pvalue): the ratio of the mean of other to the
+        mean of self, and the p-value of Welch's t-test that the means
+        are equal.  The difference is usually considered significant if
+        the p-value is lower than 0.05.
+        """
+        ratio = other.mean / self.mean
+        if len(self.times) < 2 or len(other.times) < 2:
+            return ratio, 1.0
+        return ratio, _welch_ttest(self.times, other.times)[1]
+
+    def as_dict(self):
+        """Return the timings as a dictionary serializable as JSON."""
+        return {"number": self.number, "times": self.times,
+                "warmups": self.warmups, "outliers": self.outliers}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create statistics from the result of as_dict()."""
+        return cls(data["times"], data["number"], data.get("warmups", ()),
+                   data.get("outliers", ()))
+
 def timeit(stmt="pass", setup="pass", timer=default_timer,
            number=default_number, globals=None):
     """Convenience function to create Timer object and call timeit method."""
@@ -259,10 +498,12 @@ def main(args=None, *, _wrap_timer=None):
         args = sys.argv[1:]
     import getopt
     try:
-        opts, args = getopt.getopt(args, "n:u:s:r:tcpvh",
+        opts, args = getopt.getopt(args, "n:u:s:r:o:tcpvh",
                                    ["number=", "setup=", "repeat=",
                                     "time", "clock", "process",
-                                    "verbose", "unit=", "help"])
+                                    "verbose", "unit=", "help",
+                                    "stats", "processes=", "warmups=",
+                                    "output=", "compare", "worker"])
     except getopt.error as err:
         print(err)
         print("use -h/--help for command line help")
@@ -277,6 +518,12 @@ def main(args=None, *, _wrap_timer=None):
     time_unit = None
     units = {"nsec": 1e-9, "usec": 1e-6, "msec": 1e-3, "sec": 1.0}
     precision = 3
+    stats = False
+    processes = default_processes
+    warmups = default_warmups
+    output = None
+    compare = False
+    worker = False
     for o, a in opts:
         if o in ("-n", "--number"):
             number = int(a)
@@ -302,8 +549,45 @@ def main(args=None, *, _wrap_timer=None):
         if o in ("-h", "--help"):
             print(__doc__, end=' ')
             return 0
+        if o == "--stats":
+            stats = True
+        if o == "--processes":
+            processes = max(int(a), 0)
+            stats = True
+        if o == "--warmups":
+            warmups = max(int(a), 0)
+            stats = True
+        if o in ("-o", "--output"):
+            output = a
+            stats = True
+        if o == "--compare":
+            compare = True
+        if o == "--worker":
+            worker = True
     setup = "\n".join(setup) or "pass"
 
+    def format_time(dt, ref=None):
+        unit = time_unit
+        if ref is None:
+            ref = dt
+
+        if unit is not None:
+            scale = units[unit]
+        else:
+            scales = [(scale, unit) for unit, scale in units.items()]
+            scales.sort(reverse=True)
+            for scale, unit in scales:
+                if ref >= scale:
+                    break
+
+        return "%.*g %s" % (precision, dt / scale, unit)
+
+    if compare:
+        if len(args) != 2:
+            print("--compare requires two result files")
+            return 2
+        return _main_compare(args, format_time)
+
     # Include the current directory, so that local imports work (sys.path
     # contains the directory of this script, rather than the current
     # directory)
@@ -313,6 +597,8 @@ def main(args=None, *, _wrap_timer=None):
         timer = _wrap_timer(timer)
 
     t = Timer(stmt, setup, timer)
+    if worker:
+        return _main_worker(t, repeat, number, warmups)
     if number == 0:
         # determine number so that 0.2 <= total time < 2.0
         callback = None
@@ -331,26 +617,35 @@ def callback(number, time_taken):
         if verbose:
             print()
 
+    if stats:
+        try:
+            result = t.stats(repeat, number, warmups, processes)
+        except RuntimeError as exc:
+            if processes:
+                # A worker process failed: exc contains its traceback
+                print(exc, file=sys.stderr)
+            else:
+                t.print_exc()
+            return 1
+        except:
+            t.print_exc()
+            return 1
+        _print_stats(result, format_time, processes, repeat, warmups,
+                     verbose)
+        if output is not None:
+            import json
+            data = {"stmt": stmt, "setup": setup, "python": sys.version,
+                    **result.as_dict()}
+            with open(output, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=1)
+        return None
+
     try:
         raw_timings = t.repeat(repeat, number)
     except:
         t.print_exc()
         return 1
 
-    def format_time(dt):
-        unit = time_unit
-
-        if unit is not None:
-            scale = units[unit]
-        else:
-            scales = [(scale, unit) for unit, scale in units.items()]
-            scales.sort(reverse=True)
-            for scale, unit in scales:
-                if dt >= scale:
-                    break
-
-        return "%.*g %s" % (precision, dt / scale, unit)
-
     if verbose:
         print("raw times: %s" % ", ".join(map(format_time, raw_timings)))
         print()
@@ -372,5 +667,61 @@ def format_time(dt):
                                UserWarning, '', 0)
     return None
 
+def _main_worker(t, repeat, number, warmups):
+    import json
+    try:
+        result = {"warmups": [t.timeit(number) for _ in range(warmups)],
+                  "times": t.repeat(repeat, number)}
+    except:
+        t.print_exc()
+        return 1
+    print(json.dumps(result))
+    return None
+
+def _print_stats(result, format_time, processes, repeat, warmups, verbose):
+    mean = result.mean
+    low, high = result.confidence_interval()
+    if processes:
+        values = "%d processes x %d values" % (processes, repeat)
+    else:
+        values = "%d values" % repeat
+    print("%s, %d loop%s each, %d warmup%s: %s +- %s per loop (mean +- std. "
+          "dev.)" % (values, result.number, 's' if result.number != 1 else '',
+                     warmups, 's' if warmups != 1 else '',
+                     format_time(mean), format_time(result.stdev, mean)))
+    print("95%% confidence interval: %s .. %s; median: %s; min: %s; max: %s"
+          % (format_time(low, mean), format_time(high, mean),
+             format_time(result.median, mean), format_time(result.min, mean),
+             format_time(result.max, mean)))
+    if result.outliers:
+        print("%d outlier%s removed: %s"
+              % (len(result.outliers), 's' if len(result.outliers) != 1 else '',
+                 ", ".join(format_time(dt, mean) for dt in result.outliers)))
+    if verbose:
+        print("times: %s" % ", ".join(format_time(dt, mean)
+                                      for dt in result.times))
+        print("warmups: %s" % ", ".join(format_time(dt, mean)
+                                        for dt in result.warmups))
+
+def _main_compare(filenames, format_time):
+    import json
+    results = []
+    for filename in filenames:
+        with open(filename, encoding="utf-8") as f:
+            results.append(TimerStats.from_dict(json.load(f)))
+    base, changed = results
+    for filename, result in zip(filenames, results):
+        print("%s: %s +- %s" % (filename, format_time(result.mean),
+                                format_time(result.stdev, result.mean)))
+    ratio, pvalue = base.compare(changed)
+    if ratio >= 1.0:
+        change = "%.2fx slower" % ratio
+    else:
+        change = "%.2fx faster" % (1.0 / ratio)
+    print("%s is %s than %s: %s (p-value: %.3f)"
+          % (filenames[1], change, filenames[0],
+             "significant" if pvalue < 0.05 else "not significant", pvalue))
+    return None
+
 if __name__ == "__main__":
     sys.exit(main())
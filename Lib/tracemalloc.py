@@ -2,6 +2,7 @@
 from functools import total_ordering
 import fnmatch
 import linecache
+import math
 import os.path
 import pickle
 
@@ -117,6 +118,16 @@ def _sort_key(self):
                 self.traceback)
 
 
+def _unsample(size, sampling_interval):
+    # A memory block of size bytes is sampled with probability
+    # 1 - exp(-size / sampling_interval): return the estimated number of bytes
+    # and of memory blocks that a sampled memory block stands for.
+    if not size:
+        return 0, 1
+    probability = -math.expm1(-size / sampling_interval)
+    return size / probability, 1 / probability
+
+
 def _compare_grouped_stats(old_group, new_group):
     statistics = []
     for traceback, stat in new_group.items():
@@ -417,11 +428,15 @@ class Snapshot:
     Snapshot of traces of memory blocks allocated by Python.
     """
 
-    def __init__(self, traces, traceback_limit):
+    # Default of snapshots dumped before sampling_interval was added
+    sampling_interval = 0
+
+    def __init__(self, traces, traceback_limit, sampling_interval=0):
         # traces is a tuple of trace tuples: see _Traces constructor for
         # the exact format
         self.traces = _Traces(traces)
         self.traceback_limit = traceback_limit
+        self.sampling_interval = sampling_interval
 
     def dump(self, filename):
         """
@@ -472,7 +487,8 @@ def filter_traces(self, filters):
                                                 trace)]
         else:
             new_traces = self.traces._traces.copy()
-        return Snapshot(new_traces, self.traceback_limit)
+        return Snapshot(new_traces, self.traceback_limit,
+                        self.sampling_interval)
 
     def _group_by(self, key_type, cumulative):
         if key_type not in ('traceback', 'filename', 'lineno'):
@@ -483,9 +499,13 @@ def _group_by(self, key_type, cumulative):
 
         stats = {}
         tracebacks = {}
+        sampling_interval = self.sampling_interval
+        count = 1
         if not cumulative:
             for trace in self.traces._traces:
                 domain, size, trace_traceback, total_nframe = trace
+                if sampling_interval:
+                    size, count = _unsample(size, sampling_interval)
                 try:
                     traceback = tracebacks[trace_traceback]
                 except KeyError:
@@ -500,13 +520,15 @@ def _group_by(self, key_type, cumulative):
                 try:
                     stat = stats[traceback]
                     stat.size += size
-                    stat.count += 1
+                    stat.count += count
                 except KeyError:
-                    stats[traceback] = Statistic(traceback, size, 1)
+                    stats[traceback] = Statistic(traceback, size, count)
         else:
             # cumulative statistics
             for trace in self.traces._traces:
                 domain, size, trace_traceback, total_nframe = trace
+                if sampling_interval:
+                    size, count = _unsample(size, sampling_interval)
                 for frame in trace_traceback:
                     try:
                         traceback = tracebacks[frame]
@@ -520,9 +542,13 @@ def _group_by(self, key_type, cumulative):
                     try:
                         stat = stats[traceback]
                         stat.size += size
-                        stat.count += 1
+                        stat.count += count
                     except KeyError:
-                        stats[traceback] = Statistic(traceback, size, 1)
+                        stats[traceback] = Statistic(traceback, size, count)
+        if sampling_interval:
+            for stat in stats.values():
+                stat.size = round(stat.size)
+                stat.count = round(stat.count)
         return stats
 
     def statistics(self, key_type, cumulative=False):
@@ -557,4 +583,4 @@ def take_snapshot():
                            "allocations to take a snapshot")
     traces = _get_traces()
     traceback_limit = get_traceback_limit()
-    return Snapshot(traces, traceback_limit)
+    return Snapshot(traces, traceback_limit, get_sampling_interval())
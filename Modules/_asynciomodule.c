@@ -1,5 +1,7 @@
 #include "Python.h"
+#include "pycore_long.h"          // _PyLong_GetZero()
 #include "pycore_pyerrors.h"      // _PyErr_ClearExcState()
+#include "structmember.h"         // PyMemberDef
 #include <stddef.h>               // offsetof()
 
 
@@ -12,10 +14,15 @@ module _asyncio
 /* identifiers used from some functions */
 _Py_IDENTIFIER(__asyncio_running_event_loop__);
 _Py_IDENTIFIER(_asyncio_future_blocking);
+_Py_IDENTIFIER(_repr_info);
+_Py_IDENTIFIER(_timer_handle_cancelled);
 _Py_IDENTIFIER(add_done_callback);
+_Py_IDENTIFIER(call_exception_handler);
 _Py_IDENTIFIER(call_soon);
 _Py_IDENTIFIER(cancel);
+_Py_IDENTIFIER(get_debug);
 _Py_IDENTIFIER(get_event_loop);
+_Py_IDENTIFIER(run);
 _Py_IDENTIFIER(throw);
 
 
@@ -24,12 +31,19 @@ static PyObject *asyncio_mod;
 static PyObject *traceback_extract_stack;
 static PyObject *asyncio_get_event_loop_policy;
 static PyObject *asyncio_future_repr_info_func;
+static PyObject *asyncio_format_callback_source_func;
+static PyObject *asyncio_extract_stack_func;
 static PyObject *asyncio_iscoroutine_func;
 static PyObject *asyncio_task_get_stack_func;
 static PyObject *asyncio_task_print_stack_func;
 static PyObject *asyncio_task_repr_info_func;
 static PyObject *asyncio_InvalidStateError;
 static PyObject *asyncio_CancelledError;
+static PyObject *heapq_heappush_func;
+static PyObject *heapq_heappop_func;
+static PyObject *collections_deque;
+static PyObject *asyncio_QueueEmpty;
+static PyObject *asyncio_QueueFull;
 static PyObject *context_kwname;
 static int module_initialized;
 
@@ -101,10 +115,98 @@ typedef struct {
 #endif
 } PyRunningLoopHolder;
 
+#define HandleObj_HEAD(prefix)                                              \
+    PyObject_HEAD                                                           \
+    PyObject *prefix##_callback;                                            \
+    PyObject *prefix##_args;                                                \
+    PyObject *prefix##_loop;                                                \
+    PyObject *prefix##_context;                                             \
+    PyObject *prefix##_source_tb;                                           \
+    PyObject *prefix##_repr;                                                \
+    PyObject *prefix##_weakreflist;                                         \
+    char prefix##_cancelled;
+
+typedef struct {
+    HandleObj_HEAD(h)
+} HandleObj;
+
+typedef struct TimerHandleObj {
+    HandleObj_HEAD(h)
+    PyObject *th_when;
+    char th_scheduled;
+    /* Timer wheel holding the handle (borrowed reference), or NULL */
+    PyObject *th_wheel;
+    /* Links of the list of the timer wheel slot holding the handle:
+       th_wheel_pprev is the address of the pointer to the handle. */
+    struct TimerHandleObj *th_wheel_next;
+    struct TimerHandleObj **th_wheel_pprev;
+    double th_wheel_when;
+} TimerHandleObj;
+
+/* Duration in seconds of a tick of the timer wheel */
+#define TIMER_WHEEL_RESOLUTION 0.001
+/* Number of slots of a level of the timer wheel */
+#define TIMER_WHEEL_BITS 6
+#define TIMER_WHEEL_SIZE (1 << TIMER_WHEEL_BITS)
+#define TIMER_WHEEL_MASK (TIMER_WHEEL_SIZE - 1)
+/* Number of levels of the timer wheel */
+#define TIMER_WHEEL_LEVELS 4
+/* Timers due later than this number of ticks are kept in the heap */
+#define TIMER_WHEEL_MAX_TICK ((double)(1LL << 62))
+
+typedef struct {
+    PyObject_HEAD
+    /* Timers due at or before this tick are no longer in the wheel */
+    long long tw_tick;
+    Py_ssize_t tw_count;
+    /* Cached result of timer_wheel_next_event(), tw_next_tick is -1 if
+       it must be computed again. */
+    long long tw_next_tick;
+    double tw_next_time;
+    TimerHandleObj *tw_slots[TIMER_WHEEL_LEVELS][TIMER_WHEEL_SIZE];
+} TimerWheelObj;
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *q_maxsize;
+    /* q_maxsize as an integer: 0 if the queue is unbounded, -1 if it must
+       be compared to the size of the queue as an object. */
+    Py_ssize_t q_limit;
+    PyObject *q_queue;
+    PyObject *q_getters;
+    PyObject *q_putters;
+    PyObject *q_finished;
+    Py_ssize_t q_unfinished_tasks;
+    /* How items are stored, QUEUE_KIND_UNKNOWN if not known yet */
+    int q_kind;
+    /* Version tags of the type and of the __dict__ of the queue when q_kind
+       was computed: q_kind must be computed again if one of them changed */
+    unsigned int q_kind_type_version;
+    uint64_t q_kind_dict_version;
+} QueueObj;
+
+typedef struct {
+    PyObject_HEAD
+    /* Queue of the operation, NULL once it is done */
+    QueueObj *qa_queue;
+    /* Item to put, NULL for get() */
+    PyObject *qa_item;
+    /* Future which the operation waits for, or NULL */
+    PyObject *qa_waiter;
+    char qa_put;
+} QueueAwaitableObj;
+
 
 static PyTypeObject FutureType;
 static PyTypeObject TaskType;
 static PyTypeObject PyRunningLoopHolder_Type;
+static PyTypeObject HandleType;
+static PyTypeObject TimerHandleType;
+static PyTypeObject TimerWheelType;
+static PyTypeObject QueueType;
+static PyTypeObject LifoQueueType;
+static PyTypeObject PriorityQueueType;
+static PyTypeObject QueueAwaitableType;
 
 
 #define Future_CheckExact(obj) Py_IS_TYPE(obj, &FutureType)
@@ -112,6 +214,7 @@ static PyTypeObject PyRunningLoopHolder_Type;
 
 #define Future_Check(obj) PyObject_TypeCheck(obj, &FutureType)
 #define Task_Check(obj) PyObject_TypeCheck(obj, &TaskType)
+#define TimerHandle_Check(obj) PyObject_TypeCheck(obj, &TimerHandleType)
 
 #include "clinic/_asynciomodule.c.h"
 
@@ -1671,12 +1774,16 @@ FutureIter_send(futureiterobject *self, PyObject *unused)
     return FutureIter_iternext(self);
 }
 
-static PyObject *
-FutureIter_throw(futureiterobject *self, PyObject *args)
+/* Parse the arguments of the throw() method of a generator-like object
+   into a normalized exception: return 0 and set *ptype, *pval and *ptb to
+   new references, or return -1 with an exception set. */
+static int
+parse_throw_args(PyObject *args,
+                 PyObject **ptype, PyObject **pval, PyObject **ptb)
 {
     PyObject *type, *val = NULL, *tb = NULL;
     if (!PyArg_ParseTuple(args, "O|OO", &type, &val, &tb))
-        return NULL;
+        return -1;
 
     if (val == Py_None) {
         val = NULL;
@@ -1685,7 +1792,7 @@ FutureIter_throw(futureiterobject *self, PyObject *args)
         tb = NULL;
     } else if (tb != NULL && !PyTraceBack_Check(tb)) {
         PyErr_SetString(PyExc_TypeError, "throw() third argument must be a traceback");
-        return NULL;
+        return -1;
     }
 
     Py_INCREF(type);
@@ -1714,16 +1821,30 @@ FutureIter_throw(futureiterobject *self, PyObject *args)
         goto fail;
     }
 
-    Py_CLEAR(self->future);
-
-    PyErr_Restore(type, val, tb);
-
-    return NULL;
+    *ptype = type;
+    *pval = val;
+    *ptb = tb;
+    return 0;
 
   fail:
     Py_DECREF(type);
     Py_XDECREF(val);
     Py_XDECREF(tb);
+    return -1;
+}
+
+static PyObject *
+FutureIter_throw(futureiterobject *self, PyObject *args)
+{
+    PyObject *type, *val, *tb;
+    if (parse_throw_args(args, &type, &val, &tb) < 0) {
+        return NULL;
+    }
+
+    Py_CLEAR(self->future);
+
+    PyErr_Restore(type, val, tb);
+
     return NULL;
 }
 
@@ -3019,145 +3140,2642 @@ task_wakeup(TaskObj *task, PyObject *o)
 }
 
 
-/*********************** Functions **************************/
+/*********************** Handle **************************/
 
 
 /*[clinic input]
-_asyncio._get_running_loop
+class _asyncio.Handle "HandleObj *" "&HandleType"
+class _asyncio.TimerHandle "TimerHandleObj *" "&TimerHandleType"
+class _asyncio.TimerWheel "TimerWheelObj *" "&TimerWheelType"
+[clinic start generated code]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=4b4777680e5ff1db]*/
 
-Return the running event loop or None.
 
-This is a low-level function intended to be used by event loops.
-This function is thread-specific.
+static int
+handle_init(HandleObj *self, PyObject *callback, PyObject *args,
+            PyObject *loop, PyObject *context)
+{
+    if (context == Py_None) {
+        context = PyContext_CopyCurrent();
+        if (context == NULL) {
+            return -1;
+        }
+    }
+    else {
+        Py_INCREF(context);
+    }
+    Py_XSETREF(self->h_context, context);
 
-[clinic start generated code]*/
+    Py_INCREF(loop);
+    Py_XSETREF(self->h_loop, loop);
+    Py_INCREF(callback);
+    Py_XSETREF(self->h_callback, callback);
+    Py_INCREF(args);
+    Py_XSETREF(self->h_args, args);
+    self->h_cancelled = 0;
+    Py_CLEAR(self->h_repr);
+    Py_CLEAR(self->h_source_tb);
+
+    PyObject *res = _PyObject_CallMethodIdNoArgs(loop, &PyId_get_debug);
+    if (res == NULL) {
+        return -1;
+    }
+    int is_true = PyObject_IsTrue(res);
+    Py_DECREF(res);
+    if (is_true < 0) {
+        return -1;
+    }
+    if (is_true && !_Py_IsFinalizing()) {
+        /* Equivalent to format_helpers.extract_stack(sys._getframe(1)) in
+           the Python implementation: the innermost Python frame is the
+           caller of Handle(). */
+        PyObject *frame = (PyObject *)PyEval_GetFrame();
+        if (frame == NULL) {
+            frame = Py_None;
+        }
+        self->h_source_tb = PyObject_CallOneArg(asyncio_extract_stack_func,
+                                                frame);
+        if (self->h_source_tb == NULL) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+static int
+HandleObj_clear(HandleObj *self)
+{
+    Py_CLEAR(self->h_callback);
+    Py_CLEAR(self->h_args);
+    Py_CLEAR(self->h_loop);
+    Py_CLEAR(self->h_context);
+    Py_CLEAR(self->h_source_tb);
+    Py_CLEAR(self->h_repr);
+    return 0;
+}
+
+static int
+HandleObj_traverse(HandleObj *self, visitproc visit, void *arg)
+{
+    Py_VISIT(self->h_callback);
+    Py_VISIT(self->h_args);
+    Py_VISIT(self->h_loop);
+    Py_VISIT(self->h_context);
+    Py_VISIT(self->h_source_tb);
+    Py_VISIT(self->h_repr);
+    return 0;
+}
+
+static void
+HandleObj_dealloc(HandleObj *self)
+{
+    PyObject_GC_UnTrack(self);
+    if (self->h_weakreflist != NULL) {
+        PyObject_ClearWeakRefs((PyObject *)self);
+    }
+    (void)HandleObj_clear(self);
+    Py_TYPE(self)->tp_free(self);
+}
 
 static PyObject *
-_asyncio__get_running_loop_impl(PyObject *module)
-/*[clinic end generated code: output=b4390af721411a0a input=0a21627e25a4bd43]*/
+handle_call_exception_handler(HandleObj *self)
 {
-    PyObject *loop;
-    if (get_running_loop(&loop)) {
-        return NULL;
+    PyObject *et, *ev, *tb;
+    PyObject *cb = NULL, *message = NULL, *context = NULL, *res = NULL;
+
+    PyErr_Fetch(&et, &ev, &tb);
+    PyErr_NormalizeException(&et, &ev, &tb);
+    if (tb != NULL) {
+        PyException_SetTraceback(ev, tb);
     }
-    if (loop == NULL) {
-        /* There's no currently running event loop */
-        Py_RETURN_NONE;
+
+    cb = PyObject_CallFunctionObjArgs(
+        asyncio_format_callback_source_func,
+        self->h_callback ? self->h_callback : Py_None,
+        self->h_args ? self->h_args : Py_None, NULL);
+    if (cb == NULL) {
+        goto finally;
     }
-    return loop;
+    message = PyUnicode_FromFormat("Exception in callback %S", cb);
+    if (message == NULL) {
+        goto finally;
+    }
+    context = Py_BuildValue("{sOsOsO}",
+                            "message", message,
+                            "exception", ev,
+                            "handle", (PyObject *)self);
+    if (context == NULL) {
+        goto finally;
+    }
+    if (self->h_source_tb != NULL) {
+        int is_true = PyObject_IsTrue(self->h_source_tb);
+        if (is_true < 0) {
+            goto finally;
+        }
+        if (is_true && PyDict_SetItemString(context, "source_traceback",
+                                            self->h_source_tb) < 0) {
+            goto finally;
+        }
+    }
+    res = _PyObject_CallMethodIdOneArg(self->h_loop,
+                                       &PyId_call_exception_handler,
+                                       context);
+
+finally:
+    Py_XDECREF(et);
+    Py_XDECREF(ev);
+    Py_XDECREF(tb);
+    Py_XDECREF(cb);
+    Py_XDECREF(message);
+    Py_XDECREF(context);
+    return res;
 }
 
-/*[clinic input]
-_asyncio._set_running_loop
-    loop: 'O'
-    /
+static PyObject *
+handle_call(PyObject *context, PyObject *callback, PyObject *args)
+{
+    PyObject *res;
 
-Set the running event loop.
+    if (!PyTuple_Check(args)) {
+        args = PySequence_Tuple(args);
+        if (args == NULL) {
+            return NULL;
+        }
+    }
+    else {
+        Py_INCREF(args);
+    }
 
-This is a low-level function intended to be used by event loops.
-This function is thread-specific.
-[clinic start generated code]*/
+    if (PyContext_CheckExact(context)) {
+        if (PyContext_Enter(context) < 0) {
+            Py_DECREF(args);
+            return NULL;
+        }
+        res = PyObject_Vectorcall(callback, &PyTuple_GET_ITEM(args, 0),
+                                  PyTuple_GET_SIZE(args), NULL);
+        if (PyContext_Exit(context) < 0) {
+            Py_CLEAR(res);
+        }
+    }
+    else {
+        /* context.run(callback, *args) */
+        PyObject *run = _PyObject_GetAttrId(context, &PyId_run);
+        PyObject *run_args = NULL;
+        res = NULL;
+        if (run != NULL) {
+            run_args = PyTuple_New(PyTuple_GET_SIZE(args) + 1);
+        }
+        if (run_args != NULL) {
+            Py_INCREF(callback);
+            PyTuple_SET_ITEM(run_args, 0, callback);
+            for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(args); i++) {
+                PyObject *item = PyTuple_GET_ITEM(args, i);
+                Py_INCREF(item);
+                PyTuple_SET_ITEM(run_args, i + 1, item);
+            }
+            res = PyObject_Call(run, run_args, NULL);
+        }
+        Py_XDECREF(run);
+        Py_XDECREF(run_args);
+    }
+    Py_DECREF(args);
+    return res;
+}
 
 static PyObject *
-_asyncio__set_running_loop(PyObject *module, PyObject *loop)
-/*[clinic end generated code: output=ae56bf7a28ca189a input=4c9720233d606604]*/
+handle_repr_info(HandleObj *self)
 {
-    if (set_running_loop(loop)) {
+    PyObject *info = PyList_New(0);
+    if (info == NULL) {
         return NULL;
     }
-    Py_RETURN_NONE;
-}
 
-/*[clinic input]
-_asyncio.get_event_loop
+    PyObject *item = PyUnicode_FromString(_PyType_Name(Py_TYPE(self)));
+    if (item == NULL || PyList_Append(info, item) < 0) {
+        goto error;
+    }
+    Py_DECREF(item);
 
-Return an asyncio event loop.
+    if (self->h_cancelled) {
+        item = PyUnicode_FromString("cancelled");
+        if (item == NULL || PyList_Append(info, item) < 0) {
+            goto error;
+        }
+        Py_DECREF(item);
+    }
 
-When called from a coroutine or a callback (e.g. scheduled with
-call_soon or similar API), this function will always return the
-running event loop.
+    if (self->h_callback != NULL && self->h_callback != Py_None) {
+        item = PyObject_CallFunctionObjArgs(
+            asyncio_format_callback_source_func, self->h_callback,
+            self->h_args ? self->h_args : Py_None, NULL);
+        if (item == NULL || PyList_Append(info, item) < 0) {
+            goto error;
+        }
+        Py_DECREF(item);
+    }
 
-If there is no running event loop set, the function will return
-the result of `get_event_loop_policy().get_event_loop()` call.
-[clinic start generated code]*/
+    if (self->h_source_tb != NULL) {
+        int is_true = PyObject_IsTrue(self->h_source_tb);
+        if (is_true < 0) {
+            item = NULL;
+            goto error;
+        }
+        if (is_true) {
+            PyObject *frame = NULL, *filename = NULL, *lineno = NULL;
+            item = NULL;
+            frame = PySequence_GetItem(self->h_source_tb, -1);
+            if (frame != NULL) {
+                filename = PySequence_GetItem(frame, 0);
+            }
+            if (filename != NULL) {
+                lineno = PySequence_GetItem(frame, 1);
+            }
+            if (lineno != NULL) {
+                item = PyUnicode_FromFormat("created at %S:%S",
+                                            filename, lineno);
+            }
+            Py_XDECREF(frame);
+            Py_XDECREF(filename);
+            Py_XDECREF(lineno);
+            if (item == NULL || PyList_Append(info, item) < 0) {
+                goto error;
+            }
+            Py_DECREF(item);
+        }
+    }
+    return info;
+
+error:
+    Py_XDECREF(item);
+    Py_DECREF(info);
+    return NULL;
+}
 
 static PyObject *
-_asyncio_get_event_loop_impl(PyObject *module)
-/*[clinic end generated code: output=2a2d8b2f824c648b input=9364bf2916c8655d]*/
+HandleObj_repr(HandleObj *self)
 {
-    return get_event_loop(1);
-}
+    if (self->h_repr != NULL && self->h_repr != Py_None) {
+        Py_INCREF(self->h_repr);
+        return self->h_repr;
+    }
 
-/*[clinic input]
-_asyncio._get_event_loop
-    stacklevel: int = 3
-[clinic start generated code]*/
+    PyObject *info = _PyObject_CallMethodIdNoArgs((PyObject *)self,
+                                                  &PyId__repr_info);
+    if (info == NULL) {
+        return NULL;
+    }
+    PyObject *sep = PyUnicode_FromString(" ");
+    if (sep == NULL) {
+        Py_DECREF(info);
+        return NULL;
+    }
+    PyObject *joined = PyUnicode_Join(sep, info);
+    Py_DECREF(sep);
+    Py_DECREF(info);
+    if (joined == NULL) {
+        return NULL;
+    }
+    PyObject *repr = PyUnicode_FromFormat("<%U>", joined);
+    Py_DECREF(joined);
+    return repr;
+}
 
 static PyObject *
-_asyncio__get_event_loop_impl(PyObject *module, int stacklevel)
-/*[clinic end generated code: output=9c1d6d3c802e67c9 input=d17aebbd686f711d]*/
+handle_cancel(HandleObj *self)
 {
-    return get_event_loop(stacklevel-1);
+    if (self->h_cancelled) {
+        Py_RETURN_NONE;
+    }
+    self->h_cancelled = 1;
+
+    PyObject *res = _PyObject_CallMethodIdNoArgs(self->h_loop,
+                                                 &PyId_get_debug);
+    if (res == NULL) {
+        return NULL;
+    }
+    int is_true = PyObject_IsTrue(res);
+    Py_DECREF(res);
+    if (is_true < 0) {
+        return NULL;
+    }
+    if (is_true) {
+        /* Keep a representation in debug mode to keep callback and
+           parameters. For example, to log the warning
+           "Executing <Handle...> took 2.5 second" */
+        PyObject *repr = PyObject_Repr((PyObject *)self);
+        if (repr == NULL) {
+            return NULL;
+        }
+        Py_XSETREF(self->h_repr, repr);
+    }
+
+    Py_INCREF(Py_None);
+    Py_XSETREF(self->h_callback, Py_None);
+    Py_INCREF(Py_None);
+    Py_XSETREF(self->h_args, Py_None);
+    Py_RETURN_NONE;
 }
 
 /*[clinic input]
-_asyncio.get_running_loop
+_asyncio.Handle.__init__
 
-Return the running event loop.  Raise a RuntimeError if there is none.
+    callback: object
+    args as callback_args: object
+    loop: object
+    context: object = None
 
-This function is thread-specific.
+Object returned by callback registration methods.
 [clinic start generated code]*/
 
-static PyObject *
-_asyncio_get_running_loop_impl(PyObject *module)
-/*[clinic end generated code: output=c247b5f9e529530e input=2a3bf02ba39f173d]*/
+static int
+_asyncio_Handle___init___impl(HandleObj *self, PyObject *callback,
+                              PyObject *callback_args, PyObject *loop,
+                              PyObject *context)
+/*[clinic end generated code: output=a6fd445f3dd461ba input=2f5e00dd6750c23d]*/
 {
-    PyObject *loop;
-    if (get_running_loop(&loop)) {
-        return NULL;
-    }
-    if (loop == NULL) {
-        /* There's no currently running event loop */
-        PyErr_SetString(
-            PyExc_RuntimeError, "no running event loop");
-    }
-    return loop;
+    return handle_init(self, callback, callback_args, loop, context);
 }
 
 /*[clinic input]
-_asyncio._register_task
-
-    task: object
+_asyncio.Handle.cancel
 
-Register a new task in asyncio as executed by loop.
+Cancel the callback.
 
-Returns None.
+If the callback has already been cancelled or executed,
+this method has no effect.
 [clinic start generated code]*/
 
 static PyObject *
-_asyncio__register_task_impl(PyObject *module, PyObject *task)
-/*[clinic end generated code: output=8672dadd69a7d4e2 input=21075aaea14dfbad]*/
+_asyncio_Handle_cancel_impl(HandleObj *self)
+/*[clinic end generated code: output=ddb39234782aab82 input=d566c1b7ea52b060]*/
 {
-    if (register_task(task) < 0) {
-        return NULL;
-    }
-    Py_RETURN_NONE;
+    return handle_cancel(self);
 }
 
-
 /*[clinic input]
-_asyncio._unregister_task
-
-    task: object
-
-Unregister a task.
+_asyncio.Handle.cancelled
 
-Returns None.
+Return True if the callback was cancelled.
 [clinic start generated code]*/
 
 static PyObject *
-_asyncio__unregister_task_impl(PyObject *module, PyObject *task)
-/*[clinic end generated code: output=6e5585706d568a46 input=28fb98c3975f7bdc]*/
+_asyncio_Handle_cancelled_impl(HandleObj *self)
+/*[clinic end generated code: output=0f4ad57f569e9f24 input=95c3f2f4a4c1b9d7]*/
+{
+    return PyBool_FromLong(self->h_cancelled);
+}
+
+/*[clinic input]
+_asyncio.Handle._run
+
+Run the callback in its context.
+
+Exceptions other than SystemExit and KeyboardInterrupt are passed
+to the exception handler of the event loop.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_Handle__run_impl(HandleObj *self)
+/*[clinic end generated code: output=1b186b710881500a input=4d479a9cb914186d]*/
+{
+    PyObject *context = self->h_context ? self->h_context : Py_None;
+    PyObject *callback = self->h_callback ? self->h_callback : Py_None;
+    PyObject *args = self->h_args ? self->h_args : Py_None;
+
+    /* The callback may cancel its own handle, keep references. */
+    Py_INCREF(context);
+    Py_INCREF(callback);
+    Py_INCREF(args);
+    PyObject *res = handle_call(context, callback, args);
+    Py_DECREF(context);
+    Py_DECREF(callback);
+    Py_DECREF(args);
+
+    if (res != NULL) {
+        Py_DECREF(res);
+        Py_RETURN_NONE;
+    }
+    if (PyErr_ExceptionMatches(PyExc_SystemExit) ||
+        PyErr_ExceptionMatches(PyExc_KeyboardInterrupt))
+    {
+        return NULL;
+    }
+    res = handle_call_exception_handler(self);
+    if (res == NULL) {
+        return NULL;
+    }
+    Py_DECREF(res);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_asyncio.Handle._repr_info
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_Handle__repr_info_impl(HandleObj *self)
+/*[clinic end generated code: output=7838b12075048d03 input=dba1c0a083077d57]*/
+{
+    return handle_repr_info(self);
+}
+
+#define HANDLE_COMMON_MEMBERS(type)                                         \
+    {"_callback", T_OBJECT, offsetof(type, h_callback), READONLY},          \
+    {"_args", T_OBJECT, offsetof(type, h_args), READONLY},                  \
+    {"_loop", T_OBJECT, offsetof(type, h_loop), READONLY},                  \
+    {"_context", T_OBJECT, offsetof(type, h_context), READONLY},            \
+    {"_source_traceback", T_OBJECT, offsetof(type, h_source_tb), READONLY}, \
+    {"_repr", T_OBJECT, offsetof(type, h_repr), READONLY},                  \
+    {"_cancelled", T_BOOL, offsetof(type, h_cancelled), READONLY},
+
+static PyMemberDef HandleType_members[] = {
+    HANDLE_COMMON_MEMBERS(HandleObj)
+    {NULL} /* Sentinel */
+};
+
+static PyMethodDef HandleType_methods[] = {
+    _ASYNCIO_HANDLE_CANCEL_METHODDEF
+    _ASYNCIO_HANDLE_CANCELLED_METHODDEF
+    _ASYNCIO_HANDLE__RUN_METHODDEF
+    _ASYNCIO_HANDLE__REPR_INFO_METHODDEF
+    {NULL, NULL}        /* Sentinel */
+};
+
+static PyTypeObject HandleType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "_asyncio.Handle",
+    sizeof(HandleObj),                     /* tp_basicsize */
+    .tp_dealloc = (destructor)HandleObj_dealloc,
+    .tp_repr = (reprfunc)HandleObj_repr,
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_BASETYPE,
+    .tp_doc = _asyncio_Handle___init____doc__,
+    .tp_traverse = (traverseproc)HandleObj_traverse,
+    .tp_clear = (inquiry)HandleObj_clear,
+    .tp_weaklistoffset = offsetof(HandleObj, h_weakreflist),
+    .tp_methods = HandleType_methods,
+    .tp_members = HandleType_members,
+    .tp_init = (initproc)_asyncio_Handle___init__,
+    .tp_new = PyType_GenericNew,
+};
+
+
+/* ----- TimerHandle */
+
+static int
+TimerHandleObj_clear(TimerHandleObj *self)
+{
+    Py_CLEAR(self->th_when);
+    return HandleObj_clear((HandleObj *)self);
+}
+
+static int
+TimerHandleObj_traverse(TimerHandleObj *self, visitproc visit, void *arg)
+{
+    Py_VISIT(self->th_when);
+    return HandleObj_traverse((HandleObj *)self, visit, arg);
+}
+
+static void
+TimerHandleObj_dealloc(TimerHandleObj *self)
+{
+    PyObject_GC_UnTrack(self);
+    if (self->h_weakreflist != NULL) {
+        PyObject_ClearWeakRefs((PyObject *)self);
+    }
+    (void)TimerHandleObj_clear(self);
+    Py_TYPE(self)->tp_free(self);
+}
+
+static Py_hash_t
+TimerHandleObj_hash(TimerHandleObj *self)
+{
+    return PyObject_Hash(self->th_when ? self->th_when : Py_None);
+}
+
+static int
+timer_handle_eq(TimerHandleObj *self, TimerHandleObj *other)
+{
+    int r;
+
+    if (self->h_cancelled != other->h_cancelled) {
+        return 0;
+    }
+    r = PyObject_RichCompareBool(self->th_when, other->th_when, Py_EQ);
+    if (r <= 0) {
+        return r;
+    }
+    r = PyObject_RichCompareBool(
+        self->h_callback ? self->h_callback : Py_None,
+        other->h_callback ? other->h_callback : Py_None, Py_EQ);
+    if (r <= 0) {
+        return r;
+    }
+    return PyObject_RichCompareBool(
+        self->h_args ? self->h_args : Py_None,
+        other->h_args ? other->h_args : Py_None, Py_EQ);
+}
+
+static PyObject *
+TimerHandleObj_richcompare(TimerHandleObj *self, PyObject *other, int op)
+{
+    if (!TimerHandle_Check(other)) {
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+    TimerHandleObj *o = (TimerHandleObj *)other;
+    PyObject *when = self->th_when;
+    PyObject *other_when = o->th_when;
+    int r;
+
+    switch (op) {
+    case Py_LT:
+    case Py_GT:
+        /* Fast path for the comparisons done by heapq */
+        if (PyFloat_CheckExact(when) && PyFloat_CheckExact(other_when)) {
+            double a = PyFloat_AS_DOUBLE(when);
+            double b = PyFloat_AS_DOUBLE(other_when);
+            return PyBool_FromLong(op == Py_LT ? a < b : a > b);
+        }
+        return PyObject_RichCompare(when, other_when, op);
+    case Py_LE:
+    case Py_GE:
+        r = PyObject_RichCompareBool(when, other_when,
+                                     op == Py_LE ? Py_LT : Py_GT);
+        if (r == 0) {
+            r = timer_handle_eq(self, o);
+        }
+        break;
+    case Py_EQ:
+        r = timer_handle_eq(self, o);
+        break;
+    case Py_NE:
+        r = timer_handle_eq(self, o);
+        if (r >= 0) {
+            r = !r;
+        }
+        break;
+    default:
+        Py_RETURN_NOTIMPLEMENTED;
+    }
+    if (r < 0) {
+        return NULL;
+    }
+    return PyBool_FromLong(r);
+}
+
+/*[clinic input]
+_asyncio.TimerHandle.__init__
+
+    when: object
+    callback: object
+    args as callback_args: object
+    loop: object
+    context: object = None
+
+Object returned by timed callback registration methods.
+[clinic start generated code]*/
+
+static int
+_asyncio_TimerHandle___init___impl(TimerHandleObj *self, PyObject *when,
+                                   PyObject *callback,
+                                   PyObject *callback_args, PyObject *loop,
+                                   PyObject *context)
+/*[clinic end generated code: output=15759937528ba819 input=7354f2bd261e1296]*/
+{
+    if (when == Py_None) {
+        PyErr_SetString(PyExc_AssertionError, "when cannot be None");
+        return -1;
+    }
+    if (handle_init((HandleObj *)self, callback, callback_args, loop,
+                    context) < 0) {
+        return -1;
+    }
+    Py_INCREF(when);
+    Py_XSETREF(self->th_when, when);
+    self->th_scheduled = 0;
+    return 0;
+}
+
+/*[clinic input]
+_asyncio.TimerHandle.cancel
+
+Cancel the callback.
+
+If the callback has already been cancelled or executed,
+this method has no effect.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_TimerHandle_cancel_impl(TimerHandleObj *self)
+/*[clinic end generated code: output=315df6426e6662ff input=3c1ee8aec02a48a2]*/
+{
+    if (!self->h_cancelled) {
+        PyObject *res = _PyObject_CallMethodIdOneArg(
+            self->h_loop, &PyId__timer_handle_cancelled, (PyObject *)self);
+        if (res == NULL) {
+            return NULL;
+        }
+        Py_DECREF(res);
+    }
+    return handle_cancel((HandleObj *)self);
+}
+
+/*[clinic input]
+_asyncio.TimerHandle.when
+
+Return a scheduled callback time.
+
+The time is an absolute timestamp, using the same time
+reference as loop.time().
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_TimerHandle_when_impl(TimerHandleObj *self)
+/*[clinic end generated code: output=cab0e5577e51b3af input=de801fd191075931]*/
+{
+    PyObject *when = self->th_when ? self->th_when : Py_None;
+    Py_INCREF(when);
+    return when;
+}
+
+/*[clinic input]
+_asyncio.TimerHandle._repr_info
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_TimerHandle__repr_info_impl(TimerHandleObj *self)
+/*[clinic end generated code: output=40e332eea82788b7 input=0ea1c37005c8bd50]*/
+{
+    PyObject *info = handle_repr_info((HandleObj *)self);
+    if (info == NULL) {
+        return NULL;
+    }
+    PyObject *item = PyUnicode_FromFormat(
+        "when=%S", self->th_when ? self->th_when : Py_None);
+    if (item == NULL ||
+        PyList_Insert(info, self->h_cancelled ? 2 : 1, item) < 0)
+    {
+        Py_XDECREF(item);
+        Py_DECREF(info);
+        return NULL;
+    }
+    Py_DECREF(item);
+    return info;
+}
+
+static PyMemberDef TimerHandleType_members[] = {
+    HANDLE_COMMON_MEMBERS(TimerHandleObj)
+    {"_when", T_OBJECT, offsetof(TimerHandleObj, th_when), READONLY},
+    {"_scheduled", T_BOOL, offsetof(TimerHandleObj, th_scheduled), 0},
+    {NULL} /* Sentinel */
+};
+
+static PyMethodDef TimerHandleType_methods[] = {
+    _ASYNCIO_TIMERHANDLE_CANCEL_METHODDEF
+    _ASYNCIO_TIMERHANDLE_WHEN_METHODDEF
+    _ASYNCIO_TIMERHANDLE__REPR_INFO_METHODDEF
+    {NULL, NULL}        /* Sentinel */
+};
+
+static PyTypeObject TimerHandleType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "_asyncio.TimerHandle",
+    sizeof(TimerHandleObj),                /* tp_basicsize */
+    .tp_base = &HandleType,
+    .tp_dealloc = (destructor)TimerHandleObj_dealloc,
+    .tp_hash = (hashfunc)TimerHandleObj_hash,
+    .tp_richcompare = (richcmpfunc)TimerHandleObj_richcompare,
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_BASETYPE,
+    .tp_doc = _asyncio_TimerHandle___init____doc__,
+    .tp_traverse = (traverseproc)TimerHandleObj_traverse,
+    .tp_clear = (inquiry)TimerHandleObj_clear,
+    .tp_methods = TimerHandleType_methods,
+    .tp_members = TimerHandleType_members,
+    .tp_init = (initproc)_asyncio_TimerHandle___init__,
+    .tp_new = PyType_GenericNew,
+};
+
+
+/* ----- TimerWheel */
+
+/* Link timer to the slot of the wheel where it is due, without touching its
+   reference count.  Return 0 if the timer is due in the next tick: it is not
+   added to the wheel then. */
+static int
+timer_wheel_insert(TimerWheelObj *self, TimerHandleObj *timer)
+{
+    double when = timer->th_wheel_when;
+    double ticks = when / TIMER_WHEEL_RESOLUTION;
+    if (!(ticks > -TIMER_WHEEL_MAX_TICK && ticks < TIMER_WHEEL_MAX_TICK)) {
+        return 0;
+    }
+    long long tick = (long long)ticks;
+    long long delta = tick - self->tw_tick;
+    if (delta <= 0) {
+        return 0;
+    }
+    int level = 0;
+    while (delta >= TIMER_WHEEL_SIZE && level < TIMER_WHEEL_LEVELS - 1) {
+        delta >>= TIMER_WHEEL_BITS;
+        level++;
+    }
+    int shift = TIMER_WHEEL_BITS * level;
+    int index = (int)((tick >> shift) & TIMER_WHEEL_MASK);
+    TimerHandleObj **slot = &self->tw_slots[level][index];
+
+    timer->th_wheel = (PyObject *)self;
+    timer->th_wheel_next = *slot;
+    if (*slot != NULL) {
+        (*slot)->th_wheel_pprev = &timer->th_wheel_next;
+    }
+    timer->th_wheel_pprev = slot;
+    *slot = timer;
+    self->tw_count++;
+
+    if (self->tw_next_tick >= 0) {
+        /* Invalidate the cached next event if the slot is emptied first */
+        long long base = self->tw_tick >> shift;
+        long long k = (index - base) & TIMER_WHEEL_MASK;
+        if (k == 0) {
+            k = TIMER_WHEEL_SIZE;
+        }
+        if (((base + k) << shift) <= self->tw_next_tick) {
+            self->tw_next_tick = -1;
+        }
+    }
+    return 1;
+}
+
+/* Unlink timer from the wheel, without touching its reference count. */
+static void
+timer_wheel_unlink(TimerWheelObj *self, TimerHandleObj *timer)
+{
+    *timer->th_wheel_pprev = timer->th_wheel_next;
+    if (timer->th_wheel_next != NULL) {
+        timer->th_wheel_next->th_wheel_pprev = timer->th_wheel_pprev;
+    }
+    timer->th_wheel = NULL;
+    timer->th_wheel_next = NULL;
+    timer->th_wheel_pprev = NULL;
+    self->tw_count--;
+}
+
+/* Compute the tick when the next slot of the wheel is emptied, and the time
+   when advance() must be called to do it.  The time is the earliest due time
+   of the timers of the slot for the first level.  For the other levels, whose
+   timers are moved to lower levels, it is the start of the tick preceding the
+   slot tick.  Return 0 if the wheel is empty. */
+static int
+timer_wheel_next_event(TimerWheelObj *self)
+{
+    if (self->tw_count == 0) {
+        self->tw_next_tick = -1;
+        return 0;
+    }
+    if (self->tw_next_tick >= 0) {
+        return 1;
+    }
+    long long best = -1;
+    for (int level = 0; level < TIMER_WHEEL_LEVELS; level++) {
+        int shift = TIMER_WHEEL_BITS * level;
+        long long base = self->tw_tick >> shift;
+        for (int k = 1; k <= TIMER_WHEEL_SIZE; k++) {
+            TimerHandleObj *timer =
+                self->tw_slots[level][(base + k) & TIMER_WHEEL_MASK];
+            if (timer == NULL) {
+                continue;
+            }
+            long long tick = (base + k) << shift;
+            if (best < 0 || tick < best) {
+                best = tick;
+                if (level == 0) {
+                    double when = timer->th_wheel_when;
+                    for (; timer != NULL; timer = timer->th_wheel_next) {
+                        if (timer->th_wheel_when < when) {
+                            when = timer->th_wheel_when;
+                        }
+                    }
+                    self->tw_next_time = when;
+                }
+                else {
+                    self->tw_next_time = (tick - 1) * TIMER_WHEEL_RESOLUTION;
+                }
+            }
+            break;
+        }
+    }
+    self->tw_next_tick = best;
+    return 1;
+}
+
+static void
+timer_wheel_clear_timers(TimerWheelObj *self)
+{
+    for (int level = 0; level < TIMER_WHEEL_LEVELS; level++) {
+        for (int index = 0; index < TIMER_WHEEL_SIZE; index++) {
+            TimerHandleObj *timer;
+            while ((timer = self->tw_slots[level][index]) != NULL) {
+                timer_wheel_unlink(self, timer);
+                Py_DECREF(timer);
+            }
+        }
+    }
+    self->tw_next_tick = -1;
+}
+
+static int
+TimerWheelObj_clear(TimerWheelObj *self)
+{
+    timer_wheel_clear_timers(self);
+    return 0;
+}
+
+static int
+TimerWheelObj_traverse(TimerWheelObj *self, visitproc visit, void *arg)
+{
+    for (int level = 0; level < TIMER_WHEEL_LEVELS; level++) {
+        for (int index = 0; index < TIMER_WHEEL_SIZE; index++) {
+            TimerHandleObj *timer = self->tw_slots[level][index];
+            for (; timer != NULL; timer = timer->th_wheel_next) {
+                Py_VISIT(timer);
+            }
+        }
+    }
+    return 0;
+}
+
+static void
+TimerWheelObj_dealloc(TimerWheelObj *self)
+{
+    PyObject_GC_UnTrack(self);
+    (void)TimerWheelObj_clear(self);
+    Py_TYPE(self)->tp_free(self);
+}
+
+static Py_ssize_t
+TimerWheelObj_length(TimerWheelObj *self)
+{
+    return self->tw_count;
+}
+
+/*[clinic input]
+_asyncio.TimerWheel.__init__
+
+    now: double
+
+Hierarchical timer wheel holding the timers due after the next tick.
+
+A slot of the level N spans 64 ** N ticks of 1 millisecond.  Adding
+and removing a timer is O(1).  As time advances, the timers of a slot
+of a higher level are moved to lower levels, and the timers due in the
+next tick are pushed to the heap of the event loop, which runs them at
+their exact time.
+[clinic start generated code]*/
+
+static int
+_asyncio_TimerWheel___init___impl(TimerWheelObj *self, double now)
+/*[clinic end generated code: output=067edaed241208d4 input=6fe87d6472506e69]*/
+{
+    timer_wheel_clear_timers(self);
+    self->tw_tick = (long long)(now / TIMER_WHEEL_RESOLUTION) + 1;
+    return 0;
+}
+
+/*[clinic input]
+_asyncio.TimerWheel.add
+
+    timer: object
+    /
+
+Add a TimerHandle to the wheel.
+
+Return False if the timer is due in the next tick, the caller must
+then push it to the heap itself.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_TimerWheel_add(TimerWheelObj *self, PyObject *timer)
+/*[clinic end generated code: output=3698d3a8e31d53e3 input=04084395f03158d6]*/
+{
+    if (!TimerHandle_Check(timer)) {
+        /* Only C timer handles have the links of the wheel */
+        Py_RETURN_FALSE;
+    }
+    TimerHandleObj *th = (TimerHandleObj *)timer;
+    if (th->th_wheel != NULL) {
+        PyErr_SetString(PyExc_ValueError, "timer is already in a wheel");
+        return NULL;
+    }
+    PyObject *when = th->th_when;
+    if (when == NULL || !(PyFloat_Check(when) || PyLong_Check(when))) {
+        Py_RETURN_FALSE;
+    }
+    th->th_wheel_when = PyFloat_AsDouble(when);
+    if (th->th_wheel_when == -1.0 && PyErr_Occurred()) {
+        /* int too large to convert to float */
+        PyErr_Clear();
+        Py_RETURN_FALSE;
+    }
+    if (!timer_wheel_insert(self, th)) {
+        Py_RETURN_FALSE;
+    }
+    Py_INCREF(timer);
+    Py_RETURN_TRUE;
+}
+
+/*[clinic input]
+_asyncio.TimerWheel.remove
+
+    timer: object
+    /
+
+Remove a TimerHandle, return False if it is not in the wheel.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_TimerWheel_remove(TimerWheelObj *self, PyObject *timer)
+/*[clinic end generated code: output=62c3e63da1c90ba5 input=7acbad031f547d72]*/
+{
+    if (!TimerHandle_Check(timer) ||
+        ((TimerHandleObj *)timer)->th_wheel != (PyObject *)self)
+    {
+        Py_RETURN_FALSE;
+    }
+    timer_wheel_unlink(self, (TimerHandleObj *)timer);
+    Py_DECREF(timer);
+    Py_RETURN_TRUE;
+}
+
+/*[clinic input]
+_asyncio.TimerWheel.pop_all
+
+Remove all timers from the wheel and return them.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_TimerWheel_pop_all_impl(TimerWheelObj *self)
+/*[clinic end generated code: output=b4ade3b57ed64d53 input=b48f3c566918478c]*/
+{
+    PyObject *timers = PyList_New(self->tw_count);
+    if (timers == NULL) {
+        return NULL;
+    }
+    Py_ssize_t i = 0;
+    for (int level = 0; level < TIMER_WHEEL_LEVELS; level++) {
+        for (int index = 0; index < TIMER_WHEEL_SIZE; index++) {
+            TimerHandleObj *timer;
+            while ((timer = self->tw_slots[level][index]) != NULL) {
+                timer_wheel_unlink(self, timer);
+                /* Steal the reference of the wheel */
+                PyList_SET_ITEM(timers, i, (PyObject *)timer);
+                i++;
+            }
+        }
+    }
+    self->tw_next_tick = -1;
+    return timers;
+}
+
+/*[clinic input]
+_asyncio.TimerWheel.next_time
+
+Return when advance() should be called, or None if empty.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_TimerWheel_next_time_impl(TimerWheelObj *self)
+/*[clinic end generated code: output=15e4eed1aa430d6b input=e1686cc7adf2fb06]*/
+{
+    if (!timer_wheel_next_event(self)) {
+        Py_RETURN_NONE;
+    }
+    return PyFloat_FromDouble(self->tw_next_time);
+}
+
+/*[clinic input]
+_asyncio.TimerWheel.advance
+
+    now: double
+    heap: object
+    /
+
+Push the timers due before the end of the next tick to heap.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_TimerWheel_advance_impl(TimerWheelObj *self, double now,
+                                 PyObject *heap)
+/*[clinic end generated code: output=33a40f5f45f020cd input=ec45727f9d5f20f8]*/
+{
+    long long target = (long long)(now / TIMER_WHEEL_RESOLUTION) + 1;
+    if (target <= self->tw_tick) {
+        Py_RETURN_NONE;
+    }
+    for (;;) {
+        if (!timer_wheel_next_event(self) || self->tw_next_tick > target) {
+            self->tw_tick = target;
+            Py_RETURN_NONE;
+        }
+        long long tick = self->tw_tick = self->tw_next_tick;
+        self->tw_next_tick = -1;
+        for (int level = TIMER_WHEEL_LEVELS - 1; level >= 0; level--) {
+            int shift = TIMER_WHEEL_BITS * level;
+            if (tick & ((1LL << shift) - 1)) {
+                continue;
+            }
+            /* Detach the list of the slot: a timer beyond the range of
+               the wheel goes back to the same slot of the last level. */
+            TimerHandleObj **slot =
+                &self->tw_slots[level][(tick >> shift) & TIMER_WHEEL_MASK];
+            TimerHandleObj *timers = *slot;
+            if (timers == NULL) {
+                continue;
+            }
+            *slot = NULL;
+            timers->th_wheel_pprev = &timers;
+            TimerHandleObj *timer;
+            while ((timer = timers) != NULL) {
+                timer_wheel_unlink(self, timer);
+                if (level > 0 && timer_wheel_insert(self, timer)) {
+                    continue;
+                }
+                PyObject *res = PyObject_CallFunctionObjArgs(
+                    heapq_heappush_func, heap, (PyObject *)timer, NULL);
+                Py_DECREF(timer);
+                if (res == NULL) {
+                    /* Give the remaining timers back to the slot */
+                    if (timers != NULL) {
+                        TimerHandleObj *last = timers;
+                        while (last->th_wheel_next != NULL) {
+                            last = last->th_wheel_next;
+                        }
+                        last->th_wheel_next = *slot;
+                        if (*slot != NULL) {
+                            (*slot)->th_wheel_pprev = &last->th_wheel_next;
+                        }
+                        timers->th_wheel_pprev = slot;
+                        *slot = timers;
+                    }
+                    return NULL;
+                }
+                Py_DECREF(res);
+            }
+        }
+    }
+}
+
+static PySequenceMethods TimerWheelType_as_sequence = {
+    .sq_length = (lenfunc)TimerWheelObj_length,
+};
+
+static PyMethodDef TimerWheelType_methods[] = {
+    _ASYNCIO_TIMERWHEEL_ADD_METHODDEF
+    _ASYNCIO_TIMERWHEEL_REMOVE_METHODDEF
+    _ASYNCIO_TIMERWHEEL_POP_ALL_METHODDEF
+    _ASYNCIO_TIMERWHEEL_NEXT_TIME_METHODDEF
+    _ASYNCIO_TIMERWHEEL_ADVANCE_METHODDEF
+    {NULL, NULL}        /* Sentinel */
+};
+
+static PyTypeObject TimerWheelType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "_asyncio.TimerWheel",
+    sizeof(TimerWheelObj),                 /* tp_basicsize */
+    .tp_dealloc = (destructor)TimerWheelObj_dealloc,
+    .tp_as_sequence = &TimerWheelType_as_sequence,
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
+    .tp_doc = _asyncio_TimerWheel___init____doc__,
+    .tp_traverse = (traverseproc)TimerWheelObj_traverse,
+    .tp_clear = (inquiry)TimerWheelObj_clear,
+    .tp_methods = TimerWheelType_methods,
+    .tp_init = (initproc)_asyncio_TimerWheel___init__,
+    .tp_new = PyType_GenericNew,
+};
+
+
+/*********************** Queue **************************/
+
+
+/*[clinic input]
+class _asyncio._Queue "QueueObj *" "&QueueType"
+class _asyncio._LifoQueue "QueueObj *" "&LifoQueueType"
+class _asyncio._PriorityQueue "QueueObj *" "&PriorityQueueType"
+[clinic start generated code]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=b242d0f339217957]*/
+
+enum {
+    QUEUE_KIND_UNKNOWN,
+    /* Items are stored in a deque, a list or a heap, by the _put() and _get()
+       methods of QueueType, LifoQueueType or PriorityQueueType. */
+    QUEUE_KIND_FIFO,
+    QUEUE_KIND_LIFO,
+    QUEUE_KIND_HEAP,
+    /* A subclass overrides methods used by put() and get(): call them. */
+    QUEUE_KIND_CUSTOM,
+    /* Used by put_nowait() and get_nowait() of a custom queue: call the
+       methods that they call in the Python implementation. */
+    QUEUE_KIND_GENERIC
+};
+
+static int
+queue_missing_attribute(QueueObj *self, const char *name)
+{
+    PyErr_Format(PyExc_AttributeError,
+                 "'%.100s' object has no attribute '%s'",
+                 Py_TYPE(self)->tp_name, name);
+    return -1;
+}
+
+static int
+queue_raise(PyObject **exc, const char *name)
+{
+    if (*exc == NULL) {
+        /* queues.py imports this module: get its exceptions lazily */
+        PyObject *module = PyImport_ImportModule("asyncio.queues");
+        if (module == NULL) {
+            return -1;
+        }
+        *exc = PyObject_GetAttrString(module, name);
+        Py_DECREF(module);
+        if (*exc == NULL) {
+            return -1;
+        }
+    }
+    PyErr_SetNone(*exc);
+    return -1;
+}
+
+/* Return 1 if the attribute *name* of the queue is the one defined by
+   *base*: it is overridden neither by the type of the queue nor by its
+   __dict__ (dict, which can be NULL). */
+static int
+queue_inherits(QueueObj *self, PyObject *dict, PyTypeObject *base,
+               _Py_Identifier *name)
+{
+    PyObject *str = _PyUnicode_FromId(name);
+    if (str == NULL) {
+        return -1;
+    }
+    if (dict != NULL) {
+        if (PyDict_GetItemWithError(dict, str) != NULL) {
+            return 0;
+        }
+        if (PyErr_Occurred()) {
+            return -1;
+        }
+    }
+    PyObject *attr = _PyType_Lookup(Py_TYPE(self), str);
+    if (attr == NULL) {
+        return 0;
+    }
+    PyObject *base_attr = PyDict_GetItemWithError(base->tp_dict, str);
+    if (base_attr == NULL && PyErr_Occurred()) {
+        return -1;
+    }
+    return attr == base_attr;
+}
+
+static int
+queue_kind(QueueObj *self)
+{
+    _Py_IDENTIFIER(_get);
+    _Py_IDENTIFIER(_put);
+    _Py_IDENTIFIER(qsize);
+    _Py_IDENTIFIER(empty);
+    _Py_IDENTIFIER(full);
+    _Py_IDENTIFIER(get_nowait);
+    _Py_IDENTIFIER(put_nowait);
+    _Py_Identifier *methods[] = {&PyId_qsize, &PyId_empty, &PyId_full,
+                                 &PyId_get_nowait, &PyId_put_nowait};
+
+    /* The methods can be replaced on the type or on the queue after the
+       first call, for example by unittest.mock.patch.object(). */
+    PyTypeObject *type = Py_TYPE(self);
+    PyObject **dictptr = _PyObject_GetDictPtr((PyObject *)self);
+    PyObject *dict = dictptr != NULL ? *dictptr : NULL;
+    uint64_t dict_version = 0;
+    if (dict != NULL && PyDict_Check(dict)) {
+        dict_version = ((PyDictObject *)dict)->ma_version_tag;
+    }
+    else {
+        dict = NULL;
+    }
+    if (self->q_kind != QUEUE_KIND_UNKNOWN
+        && PyType_HasFeature(type, Py_TPFLAGS_VALID_VERSION_TAG)
+        && type->tp_version_tag == self->q_kind_type_version
+        && dict_version == self->q_kind_dict_version)
+    {
+        return self->q_kind;
+    }
+
+    int kind = QUEUE_KIND_FIFO;
+    PyTypeObject *base = &QueueType;
+    PyObject *storage_type = collections_deque;
+    if (PyObject_TypeCheck(self, &LifoQueueType)) {
+        kind = QUEUE_KIND_LIFO;
+        base = &LifoQueueType;
+        storage_type = (PyObject *)&PyList_Type;
+    }
+    else if (PyObject_TypeCheck(self, &PriorityQueueType)) {
+        kind = QUEUE_KIND_HEAP;
+        base = &PriorityQueueType;
+        storage_type = (PyObject *)&PyList_Type;
+    }
+
+    if (self->q_queue == NULL ||
+        (PyObject *)Py_TYPE(self->q_queue) != storage_type)
+    {
+        kind = QUEUE_KIND_CUSTOM;
+    }
+    else {
+        int r = queue_inherits(self, dict, base, &PyId__get);
+        if (r > 0) {
+            r = queue_inherits(self, dict, base, &PyId__put);
+        }
+        for (size_t i = 0; r > 0 && i < Py_ARRAY_LENGTH(methods); i++) {
+            r = queue_inherits(self, dict, &QueueType, methods[i]);
+        }
+        if (r < 0) {
+            return -1;
+        }
+        if (r == 0) {
+            kind = QUEUE_KIND_CUSTOM;
+        }
+    }
+    /* _PyType_Lookup() assigned a version tag to the type if it could:
+       without one, the kind is computed at each call. */
+    self->q_kind = kind;
+    self->q_kind_type_version = type->tp_version_tag;
+    self->q_kind_dict_version = dict_version;
+    return kind;
+}
+
+static PyObject *
+queue_get_item(QueueObj *self, int kind)
+{
+    _Py_IDENTIFIER(popleft);
+    _Py_IDENTIFIER(pop);
+    _Py_IDENTIFIER(_get);
+
+    if (kind < QUEUE_KIND_CUSTOM && self->q_queue == NULL) {
+        queue_missing_attribute(self, "_queue");
+        return NULL;
+    }
+    switch (kind) {
+    case QUEUE_KIND_FIFO:
+        return _PyObject_CallMethodIdNoArgs(self->q_queue, &PyId_popleft);
+    case QUEUE_KIND_LIFO:
+        if (PyList_CheckExact(self->q_queue) &&
+            PyList_GET_SIZE(self->q_queue) > 0)
+        {
+            Py_ssize_t n = PyList_GET_SIZE(self->q_queue);
+            PyObject *item = PyList_GET_ITEM(self->q_queue, n - 1);
+            Py_INCREF(item);
+            if (PyList_SetSlice(self->q_queue, n - 1, n, NULL) < 0) {
+                Py_DECREF(item);
+                return NULL;
+            }
+            return item;
+        }
+        return _PyObject_CallMethodIdNoArgs(self->q_queue, &PyId_pop);
+    case QUEUE_KIND_HEAP:
+        return PyObject_CallOneArg(heapq_heappop_func, self->q_queue);
+    default:
+        return _PyObject_CallMethodIdNoArgs((PyObject *)self, &PyId__get);
+    }
+}
+
+static int
+queue_put_item(QueueObj *self, int kind, PyObject *item)
+{
+    _Py_IDENTIFIER(append);
+    _Py_IDENTIFIER(_put);
+    PyObject *res;
+
+    if (kind < QUEUE_KIND_CUSTOM && self->q_queue == NULL) {
+        return queue_missing_attribute(self, "_queue");
+    }
+    switch (kind) {
+    case QUEUE_KIND_FIFO:
+        res = _PyObject_CallMethodIdOneArg(self->q_queue, &PyId_append, item);
+        break;
+    case QUEUE_KIND_LIFO:
+        if (PyList_CheckExact(self->q_queue)) {
+            return PyList_Append(self->q_queue, item);
+        }
+        res = _PyObject_CallMethodIdOneArg(self->q_queue, &PyId_append, item);
+        break;
+    case QUEUE_KIND_HEAP:
+        res = PyObject_CallFunctionObjArgs(heapq_heappush_func,
+                                           self->q_queue, item, NULL);
+        break;
+    default:
+        res = _PyObject_CallMethodIdOneArg((PyObject *)self, &PyId__put, item);
+        break;
+    }
+    if (res == NULL) {
+        return -1;
+    }
+    Py_DECREF(res);
+    return 0;
+}
+
+/* Return 1 if the queue is empty, 0 if not, -1 on error */
+static int
+queue_is_empty(QueueObj *self, int kind)
+{
+    _Py_IDENTIFIER(empty);
+
+    if (kind >= QUEUE_KIND_CUSTOM) {
+        PyObject *res = _PyObject_CallMethodIdNoArgs((PyObject *)self,
+                                                     &PyId_empty);
+        if (res == NULL) {
+            return -1;
+        }
+        int r = PyObject_IsTrue(res);
+        Py_DECREF(res);
+        return r;
+    }
+    return PyObject_Not(self->q_queue);
+}
+
+/* Implementation of full() */
+static int
+queue_full(QueueObj *self, int kind)
+{
+    _Py_IDENTIFIER(qsize);
+
+    if (self->q_limit == 0) {
+        return 0;
+    }
+    if (kind < QUEUE_KIND_CUSTOM) {
+        if (self->q_queue == NULL) {
+            return queue_missing_attribute(self, "_queue");
+        }
+        if (self->q_limit > 0) {
+            Py_ssize_t size = PyObject_Size(self->q_queue);
+            if (size < 0) {
+                return -1;
+            }
+            return size >= self->q_limit;
+        }
+    }
+
+    /* Compare objects, as the Python implementation does */
+    PyObject *zero = _PyLong_GetZero();
+    int r = PyObject_RichCompareBool(self->q_maxsize, zero, Py_LE);
+    if (r != 0) {
+        return r < 0 ? -1 : 0;
+    }
+    PyObject *size;
+    if (kind >= QUEUE_KIND_CUSTOM) {
+        size = _PyObject_CallMethodIdNoArgs((PyObject *)self, &PyId_qsize);
+    }
+    else {
+        Py_ssize_t n = PyObject_Size(self->q_queue);
+        size = n < 0 ? NULL : PyLong_FromSsize_t(n);
+    }
+    if (size == NULL) {
+        return -1;
+    }
+    r = PyObject_RichCompareBool(size, self->q_maxsize, Py_GE);
+    Py_DECREF(size);
+    return r;
+}
+
+/* Return 1 if the queue is full, 0 if not, -1 on error */
+static int
+queue_is_full(QueueObj *self, int kind)
+{
+    _Py_IDENTIFIER(full);
+
+    if (kind >= QUEUE_KIND_CUSTOM) {
+        PyObject *res = _PyObject_CallMethodIdNoArgs((PyObject *)self,
+                                                     &PyId_full);
+        if (res == NULL) {
+            return -1;
+        }
+        int r = PyObject_IsTrue(res);
+        Py_DECREF(res);
+        return r;
+    }
+    return queue_full(self, kind);
+}
+
+static int
+queue_future_done(PyObject *fut)
+{
+    _Py_IDENTIFIER(done);
+
+    if (Future_CheckExact(fut)) {
+        return ((FutureObj *)fut)->fut_state != STATE_PENDING;
+    }
+    PyObject *res = _PyObject_CallMethodIdNoArgs(fut, &PyId_done);
+    if (res == NULL) {
+        return -1;
+    }
+    int r = PyObject_IsTrue(res);
+    Py_DECREF(res);
+    return r;
+}
+
+static int
+queue_future_cancelled(PyObject *fut)
+{
+    _Py_IDENTIFIER(cancelled);
+
+    if (Future_CheckExact(fut)) {
+        return ((FutureObj *)fut)->fut_state == STATE_CANCELLED;
+    }
+    PyObject *res = _PyObject_CallMethodIdNoArgs(fut, &PyId_cancelled);
+    if (res == NULL) {
+        return -1;
+    }
+    int r = PyObject_IsTrue(res);
+    Py_DECREF(res);
+    return r;
+}
+
+/* Wake up the next waiter (if any) that isn't cancelled */
+static int
+queue_wakeup_next(PyObject *waiters)
+{
+    _Py_IDENTIFIER(popleft);
+    _Py_IDENTIFIER(set_result);
+
+    for (;;) {
+        int r = PyObject_IsTrue(waiters);
+        if (r <= 0) {
+            return r;
+        }
+        PyObject *waiter = _PyObject_CallMethodIdNoArgs(waiters,
+                                                        &PyId_popleft);
+        if (waiter == NULL) {
+            return -1;
+        }
+        r = queue_future_done(waiter);
+        if (r == 0) {
+            PyObject *res;
+            if (Future_CheckExact(waiter)) {
+                res = future_set_result((FutureObj *)waiter, Py_None);
+            }
+            else {
+                res = _PyObject_CallMethodIdOneArg(waiter, &PyId_set_result,
+                                                   Py_None);
+            }
+            Py_DECREF(waiter);
+            if (res == NULL) {
+                return -1;
+            }
+            Py_DECREF(res);
+            return 0;
+        }
+        Py_DECREF(waiter);
+        if (r < 0) {
+            return -1;
+        }
+    }
+}
+
+static PyObject *
+queue_put_nowait(QueueObj *self, int kind, PyObject *item)
+{
+    _Py_IDENTIFIER(put_nowait);
+    _Py_IDENTIFIER(clear);
+
+    if (kind == QUEUE_KIND_CUSTOM) {
+        return _PyObject_CallMethodIdOneArg((PyObject *)self,
+                                            &PyId_put_nowait, item);
+    }
+    if (self->q_getters == NULL) {
+        queue_missing_attribute(self, "_getters");
+        return NULL;
+    }
+    if (self->q_finished == NULL) {
+        queue_missing_attribute(self, "_finished");
+        return NULL;
+    }
+    int r = queue_is_full(self, kind);
+    if (r != 0) {
+        if (r > 0) {
+            queue_raise(&asyncio_QueueFull, "QueueFull");
+        }
+        return NULL;
+    }
+    if (queue_put_item(self, kind, item) < 0) {
+        return NULL;
+    }
+    self->q_unfinished_tasks++;
+    if (self->q_unfinished_tasks == 1) {
+        PyObject *res = _PyObject_CallMethodIdNoArgs(self->q_finished,
+                                                     &PyId_clear);
+        if (res == NULL) {
+            return NULL;
+        }
+        Py_DECREF(res);
+    }
+    if (queue_wakeup_next(self->q_getters) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+queue_get_nowait(QueueObj *self, int kind)
+{
+    _Py_IDENTIFIER(get_nowait);
+
+    if (kind == QUEUE_KIND_CUSTOM) {
+        return _PyObject_CallMethodIdNoArgs((PyObject *)self,
+                                            &PyId_get_nowait);
+    }
+    if (self->q_putters == NULL) {
+        queue_missing_attribute(self, "_putters");
+        return NULL;
+    }
+    int r = queue_is_empty(self, kind);
+    if (r != 0) {
+        if (r > 0) {
+            queue_raise(&asyncio_QueueEmpty, "QueueEmpty");
+        }
+        return NULL;
+    }
+    PyObject *item = queue_get_item(self, kind);
+    if (item == NULL) {
+        return NULL;
+    }
+    if (queue_wakeup_next(self->q_putters) < 0) {
+        Py_DECREF(item);
+        return NULL;
+    }
+    return item;
+}
+
+static PyObject *
+queue_awaitable_new(QueueObj *queue, PyObject *item)
+{
+    QueueAwaitableObj *op = PyObject_GC_New(QueueAwaitableObj,
+                                            &QueueAwaitableType);
+    if (op == NULL) {
+        return NULL;
+    }
+    Py_INCREF(queue);
+    op->qa_queue = queue;
+    Py_XINCREF(item);
+    op->qa_item = item;
+    op->qa_waiter = NULL;
+    op->qa_put = (item != NULL);
+    PyObject_GC_Track(op);
+    return (PyObject *)op;
+}
+
+static int
+QueueObj_clear(QueueObj *self)
+{
+    Py_CLEAR(self->q_maxsize);
+    Py_CLEAR(self->q_queue);
+    Py_CLEAR(self->q_getters);
+    Py_CLEAR(self->q_putters);
+    Py_CLEAR(self->q_finished);
+    return 0;
+}
+
+static int
+QueueObj_traverse(QueueObj *self, visitproc visit, void *arg)
+{
+    Py_VISIT(self->q_maxsize);
+    Py_VISIT(self->q_queue);
+    Py_VISIT(self->q_getters);
+    Py_VISIT(self->q_putters);
+    Py_VISIT(self->q_finished);
+    return 0;
+}
+
+static void
+QueueObj_dealloc(QueueObj *self)
+{
+    PyObject_GC_UnTrack(self);
+    (void)QueueObj_clear(self);
+    Py_TYPE(self)->tp_free(self);
+}
+
+/*[clinic input]
+_asyncio._Queue.qsize
+
+Number of items in the queue.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__Queue_qsize_impl(QueueObj *self)
+/*[clinic end generated code: output=b5cdaaaf06026809 input=edcebebb91f1d60a]*/
+{
+    if (self->q_queue == NULL) {
+        queue_missing_attribute(self, "_queue");
+        return NULL;
+    }
+    Py_ssize_t size = PyObject_Size(self->q_queue);
+    if (size < 0) {
+        return NULL;
+    }
+    return PyLong_FromSsize_t(size);
+}
+
+/*[clinic input]
+_asyncio._Queue.empty
+
+Return True if the queue is empty, False otherwise.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__Queue_empty_impl(QueueObj *self)
+/*[clinic end generated code: output=c61f1ee78057ed7a input=467473b0d9850312]*/
+{
+    if (self->q_queue == NULL) {
+        queue_missing_attribute(self, "_queue");
+        return NULL;
+    }
+    int r = PyObject_Not(self->q_queue);
+    if (r < 0) {
+        return NULL;
+    }
+    return PyBool_FromLong(r);
+}
+
+/*[clinic input]
+_asyncio._Queue.full
+
+Return True if there are maxsize items in the queue.
+
+Note: if the Queue was initialized with maxsize=0 (the default),
+then full() is never True.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__Queue_full_impl(QueueObj *self)
+/*[clinic end generated code: output=6e05a5962447b453 input=5a1a88541f657608]*/
+{
+    int kind = queue_kind(self);
+    if (kind < 0) {
+        return NULL;
+    }
+    int r = queue_full(self, kind);
+    if (r < 0) {
+        return NULL;
+    }
+    return PyBool_FromLong(r);
+}
+
+/*[clinic input]
+_asyncio._Queue.put
+
+    item: object
+    /
+
+Put an item into the queue.
+
+Put an item into the queue. If the queue is full, wait until a free
+slot is available before adding item.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__Queue_put(QueueObj *self, PyObject *item)
+/*[clinic end generated code: output=51a61d7551350adb input=298361fb4aea965a]*/
+{
+    return queue_awaitable_new(self, item);
+}
+
+/*[clinic input]
+_asyncio._Queue.put_nowait
+
+    item: object
+    /
+
+Put an item into the queue without blocking.
+
+If no free slot is immediately available, raise QueueFull.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__Queue_put_nowait(QueueObj *self, PyObject *item)
+/*[clinic end generated code: output=1ccad37af88b19b8 input=7015ef1026ffb36f]*/
+{
+    int kind = queue_kind(self);
+    if (kind < 0) {
+        return NULL;
+    }
+    if (kind == QUEUE_KIND_CUSTOM) {
+        kind = QUEUE_KIND_GENERIC;
+    }
+    return queue_put_nowait(self, kind, item);
+}
+
+/*[clinic input]
+_asyncio._Queue.get
+
+Remove and return an item from the queue.
+
+If queue is empty, wait until an item is available.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__Queue_get_impl(QueueObj *self)
+/*[clinic end generated code: output=9c5aac9f85e3d364 input=2c3a08ab0249056c]*/
+{
+    return queue_awaitable_new(self, NULL);
+}
+
+/*[clinic input]
+_asyncio._Queue.get_nowait
+
+Remove and return an item from the queue.
+
+Return an item if one is immediately available, else raise QueueEmpty.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__Queue_get_nowait_impl(QueueObj *self)
+/*[clinic end generated code: output=c4884ff372e1b9d0 input=4876c8021f7f0921]*/
+{
+    int kind = queue_kind(self);
+    if (kind < 0) {
+        return NULL;
+    }
+    if (kind == QUEUE_KIND_CUSTOM) {
+        kind = QUEUE_KIND_GENERIC;
+    }
+    return queue_get_nowait(self, kind);
+}
+
+/*[clinic input]
+_asyncio._Queue.task_done
+
+Indicate that a formerly enqueued task is complete.
+
+Used by queue consumers. For each get() used to fetch a task,
+a subsequent call to task_done() tells the queue that the processing
+on the task is complete.
+
+If a join() is currently blocking, it will resume when all items have
+been processed (meaning that a task_done() call was received for every
+item that had been put() into the queue).
+
+Raises ValueError if called more times than there were items placed in
+the queue.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__Queue_task_done_impl(QueueObj *self)
+/*[clinic end generated code: output=b191b17b0ce83a48 input=3fcb4077e243dae4]*/
+{
+    _Py_IDENTIFIER(set);
+
+    if (self->q_unfinished_tasks <= 0) {
+        PyErr_SetString(PyExc_ValueError, "task_done() called too many times");
+        return NULL;
+    }
+    self->q_unfinished_tasks--;
+    if (self->q_unfinished_tasks == 0) {
+        if (self->q_finished == NULL) {
+            queue_missing_attribute(self, "_finished");
+            return NULL;
+        }
+        return _PyObject_CallMethodIdNoArgs(self->q_finished, &PyId_set);
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+queue_init_storage(QueueObj *self, PyObject *storage)
+{
+    if (storage == NULL) {
+        return NULL;
+    }
+    Py_XSETREF(self->q_queue, storage);
+    self->q_kind = QUEUE_KIND_UNKNOWN;
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_asyncio._Queue._init
+
+    maxsize: object
+    /
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__Queue__init(QueueObj *self, PyObject *maxsize)
+/*[clinic end generated code: output=bd0f45c09c1e3824 input=d9c15783e3b4b2a1]*/
+{
+    return queue_init_storage(self, PyObject_CallNoArgs(collections_deque));
+}
+
+/*[clinic input]
+_asyncio._Queue._get
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__Queue__get_impl(QueueObj *self)
+/*[clinic end generated code: output=3e67fe875bec39a5 input=4ef59b0389c58119]*/
+{
+    return queue_get_item(self, QUEUE_KIND_FIFO);
+}
+
+/*[clinic input]
+_asyncio._Queue._put
+
+    item: object
+    /
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__Queue__put(QueueObj *self, PyObject *item)
+/*[clinic end generated code: output=caa58b1405905908 input=db7a233ca63373fd]*/
+{
+    if (queue_put_item(self, QUEUE_KIND_FIFO, item) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_asyncio._LifoQueue._init
+
+    maxsize: object
+    /
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__LifoQueue__init(QueueObj *self, PyObject *maxsize)
+/*[clinic end generated code: output=4953ca757cf80a68 input=69ec2734966e2231]*/
+{
+    return queue_init_storage(self, PyList_New(0));
+}
+
+/*[clinic input]
+_asyncio._LifoQueue._get
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__LifoQueue__get_impl(QueueObj *self)
+/*[clinic end generated code: output=49be19dc12ced3b2 input=98ccceefafdf63d1]*/
+{
+    return queue_get_item(self, QUEUE_KIND_LIFO);
+}
+
+/*[clinic input]
+_asyncio._LifoQueue._put
+
+    item: object
+    /
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__LifoQueue__put(QueueObj *self, PyObject *item)
+/*[clinic end generated code: output=61a8f427dfc328d0 input=3576754993d262de]*/
+{
+    if (queue_put_item(self, QUEUE_KIND_LIFO, item) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_asyncio._PriorityQueue._init
+
+    maxsize: object
+    /
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__PriorityQueue__init(QueueObj *self, PyObject *maxsize)
+/*[clinic end generated code: output=336da087bc9b6f8d input=04a0fac7b8fc9c89]*/
+{
+    return queue_init_storage(self, PyList_New(0));
+}
+
+/*[clinic input]
+_asyncio._PriorityQueue._get
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__PriorityQueue__get_impl(QueueObj *self)
+/*[clinic end generated code: output=2b4115fc6f96123b input=64b0cfdce5ee3abd]*/
+{
+    return queue_get_item(self, QUEUE_KIND_HEAP);
+}
+
+/*[clinic input]
+_asyncio._PriorityQueue._put
+
+    item: object
+    /
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__PriorityQueue__put(QueueObj *self, PyObject *item)
+/*[clinic end generated code: output=b59e67607e62088d input=c43b78b8d2c14506]*/
+{
+    if (queue_put_item(self, QUEUE_KIND_HEAP, item) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+QueueObj_get_maxsize(QueueObj *self, void *Py_UNUSED(ignored))
+{
+    if (self->q_maxsize == NULL) {
+        queue_missing_attribute(self, "_maxsize");
+        return NULL;
+    }
+    Py_INCREF(self->q_maxsize);
+    return self->q_maxsize;
+}
+
+static int
+QueueObj_set_maxsize(QueueObj *self, PyObject *val, void *Py_UNUSED(ignored))
+{
+    if (val == NULL) {
+        PyErr_SetString(PyExc_AttributeError, "cannot delete attribute");
+        return -1;
+    }
+    Py_ssize_t limit = -1;
+    if (PyLong_CheckExact(val)) {
+        int overflow;
+        long long n = PyLong_AsLongLongAndOverflow(val, &overflow);
+        if (n == -1 && PyErr_Occurred()) {
+            return -1;
+        }
+        if (overflow > 0) {
+            limit = PY_SSIZE_T_MAX;
+        }
+        else if (overflow < 0 || n <= 0) {
+            limit = 0;
+        }
+        else {
+            limit = n > PY_SSIZE_T_MAX ? PY_SSIZE_T_MAX : (Py_ssize_t)n;
+        }
+    }
+    Py_INCREF(val);
+    Py_XSETREF(self->q_maxsize, val);
+    /* 0 means unbounded, -1 that maxsize is not an int: full() compares
+       objects */
+    self->q_limit = limit;
+    return 0;
+}
+
+static PyObject *
+QueueObj_get_queue(QueueObj *self, void *Py_UNUSED(ignored))
+{
+    if (self->q_queue == NULL) {
+        queue_missing_attribute(self, "_queue");
+        return NULL;
+    }
+    Py_INCREF(self->q_queue);
+    return self->q_queue;
+}
+
+static int
+QueueObj_set_queue(QueueObj *self, PyObject *val, void *Py_UNUSED(ignored))
+{
+    if (val == NULL) {
+        PyErr_SetString(PyExc_AttributeError, "cannot delete attribute");
+        return -1;
+    }
+    Py_INCREF(val);
+    Py_XSETREF(self->q_queue, val);
+    self->q_kind = QUEUE_KIND_UNKNOWN;
+    return 0;
+}
+
+static PyGetSetDef QueueType_getsetlist[] = {
+    {"_maxsize", (getter)QueueObj_get_maxsize,
+                 (setter)QueueObj_set_maxsize, NULL},
+    {"_queue", (getter)QueueObj_get_queue,
+               (setter)QueueObj_set_queue, NULL},
+    {NULL} /* Sentinel */
+};
+
+static PyMemberDef QueueType_members[] = {
+    {"_getters", T_OBJECT_EX, offsetof(QueueObj, q_getters), 0},
+    {"_putters", T_OBJECT_EX, offsetof(QueueObj, q_putters), 0},
+    {"_finished", T_OBJECT_EX, offsetof(QueueObj, q_finished), 0},
+    {"_unfinished_tasks", T_PYSSIZET,
+     offsetof(QueueObj, q_unfinished_tasks), 0},
+    {NULL} /* Sentinel */
+};
+
+static PyMethodDef QueueType_methods[] = {
+    _ASYNCIO__QUEUE_QSIZE_METHODDEF
+    _ASYNCIO__QUEUE_EMPTY_METHODDEF
+    _ASYNCIO__QUEUE_FULL_METHODDEF
+    _ASYNCIO__QUEUE_PUT_METHODDEF
+    _ASYNCIO__QUEUE_PUT_NOWAIT_METHODDEF
+    _ASYNCIO__QUEUE_GET_METHODDEF
+    _ASYNCIO__QUEUE_GET_NOWAIT_METHODDEF
+    _ASYNCIO__QUEUE_TASK_DONE_METHODDEF
+    _ASYNCIO__QUEUE__INIT_METHODDEF
+    _ASYNCIO__QUEUE__GET_METHODDEF
+    _ASYNCIO__QUEUE__PUT_METHODDEF
+    {NULL, NULL}        /* Sentinel */
+};
+
+static PyMethodDef LifoQueueType_methods[] = {
+    _ASYNCIO__LIFOQUEUE__INIT_METHODDEF
+    _ASYNCIO__LIFOQUEUE__GET_METHODDEF
+    _ASYNCIO__LIFOQUEUE__PUT_METHODDEF
+    {NULL, NULL}        /* Sentinel */
+};
+
+static PyMethodDef PriorityQueueType_methods[] = {
+    _ASYNCIO__PRIORITYQUEUE__INIT_METHODDEF
+    _ASYNCIO__PRIORITYQUEUE__GET_METHODDEF
+    _ASYNCIO__PRIORITYQUEUE__PUT_METHODDEF
+    {NULL, NULL}        /* Sentinel */
+};
+
+static PyTypeObject QueueType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "_asyncio._Queue",
+    .tp_basicsize = sizeof(QueueObj),
+    .tp_dealloc = (destructor)QueueObj_dealloc,
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_BASETYPE,
+    .tp_doc = "Base class of asyncio.Queue implemented in C.",
+    .tp_traverse = (traverseproc)QueueObj_traverse,
+    .tp_clear = (inquiry)QueueObj_clear,
+    .tp_methods = QueueType_methods,
+    .tp_members = QueueType_members,
+    .tp_getset = QueueType_getsetlist,
+    .tp_new = PyType_GenericNew,
+};
+
+static PyTypeObject LifoQueueType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "_asyncio._LifoQueue",
+    .tp_basicsize = sizeof(QueueObj),
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_BASETYPE,
+    .tp_doc = "Base class of asyncio.LifoQueue implemented in C.",
+    .tp_traverse = (traverseproc)QueueObj_traverse,
+    .tp_clear = (inquiry)QueueObj_clear,
+    .tp_methods = LifoQueueType_methods,
+    .tp_base = &QueueType,
+};
+
+static PyTypeObject PriorityQueueType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "_asyncio._PriorityQueue",
+    .tp_basicsize = sizeof(QueueObj),
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_BASETYPE,
+    .tp_doc = "Base class of asyncio.PriorityQueue implemented in C.",
+    .tp_traverse = (traverseproc)QueueObj_traverse,
+    .tp_clear = (inquiry)QueueObj_clear,
+    .tp_methods = PriorityQueueType_methods,
+    .tp_base = &QueueType,
+};
+
+
+/*********************** QueueAwaitable **************************/
+
+/* The coroutine returned by Queue.get() and Queue.put(): it completes
+   without creating a future when an item or a free slot is available. */
+
+static int
+QueueAwaitable_clear(QueueAwaitableObj *self)
+{
+    Py_CLEAR(self->qa_queue);
+    Py_CLEAR(self->qa_item);
+    Py_CLEAR(self->qa_waiter);
+    return 0;
+}
+
+static int
+QueueAwaitable_traverse(QueueAwaitableObj *self, visitproc visit, void *arg)
+{
+    Py_VISIT(self->qa_queue);
+    Py_VISIT(self->qa_item);
+    Py_VISIT(self->qa_waiter);
+    return 0;
+}
+
+static void
+QueueAwaitable_dealloc(QueueAwaitableObj *self)
+{
+    if (PyObject_CallFinalizerFromDealloc((PyObject *)self) < 0) {
+        // resurrected.
+        return;
+    }
+    PyObject_GC_UnTrack(self);
+    (void)QueueAwaitable_clear(self);
+    PyObject_GC_Del(self);
+}
+
+static PyObject *
+QueueAwaitable_await(QueueAwaitableObj *self)
+{
+    Py_INCREF(self);
+    return (PyObject *)self;
+}
+
+static PyObject *
+queue_awaitable_waiters(QueueAwaitableObj *self)
+{
+    PyObject *waiters = self->qa_put ? self->qa_queue->q_putters
+                                     : self->qa_queue->q_getters;
+    if (waiters == NULL) {
+        queue_missing_attribute(self->qa_queue,
+                                self->qa_put ? "_putters" : "_getters");
+    }
+    return waiters;
+}
+
+/* Return 1 if the operation has to wait, 0 if not, -1 on error */
+static int
+queue_awaitable_must_wait(QueueAwaitableObj *self, int kind)
+{
+    if (self->qa_put) {
+        return queue_is_full(self->qa_queue, kind);
+    }
+    return queue_is_empty(self->qa_queue, kind);
+}
+
+/* Cleanup after the waiter failed or the awaitable was closed, called with
+   an exception set, which is kept. */
+static void
+queue_awaitable_abort(QueueAwaitableObj *self)
+{
+    _Py_IDENTIFIER(remove);
+    PyObject *et, *ev, *tb;
+    PyObject *waiter = self->qa_waiter;
+    PyObject *waiters, *res;
+
+    assert(PyErr_Occurred());
+    assert(waiter != NULL);
+    self->qa_waiter = NULL;
+    PyErr_Fetch(&et, &ev, &tb);
+
+    /* Just in case the waiter is not done yet. */
+    if (Future_CheckExact(waiter)) {
+        res = future_cancel((FutureObj *)waiter, NULL);
+    }
+    else {
+        res = _PyObject_CallMethodIdNoArgs(waiter, &PyId_cancel);
+    }
+    if (res == NULL) {
+        goto error;
+    }
+    Py_DECREF(res);
+
+    waiters = queue_awaitable_waiters(self);
+    if (waiters == NULL) {
+        goto error;
+    }
+    /* The waiter could be removed from the waiters by a previous
+       put_nowait() or get_nowait() call. */
+    res = _PyObject_CallMethodIdOneArg(waiters, &PyId_remove, waiter);
+    if (res == NULL) {
+        if (!PyErr_ExceptionMatches(PyExc_ValueError)) {
+            goto error;
+        }
+        PyErr_Clear();
+    }
+    else {
+        Py_DECREF(res);
+    }
+
+    int kind = queue_kind(self->qa_queue);
+    if (kind < 0) {
+        goto error;
+    }
+    int r = queue_awaitable_must_wait(self, kind);
+    if (r == 0) {
+        r = queue_future_cancelled(waiter);
+        if (r == 0) {
+            /* We were woken up, but can't take the call: wake up the next
+               in line. */
+            r = queue_wakeup_next(waiters);
+        }
+    }
+    if (r < 0) {
+        goto error;
+    }
+    Py_DECREF(waiter);
+    PyErr_Restore(et, ev, tb);
+    return;
+
+error:
+    Py_DECREF(waiter);
+    _PyErr_ChainExceptions(et, ev, tb);
+}
+
+/* Drop the references of a completed awaitable */
+static void
+queue_awaitable_finish(QueueAwaitableObj *self)
+{
+    Py_CLEAR(self->qa_queue);
+    Py_CLEAR(self->qa_item);
+    Py_CLEAR(self->qa_waiter);
+}
+
+static PySendResult
+QueueAwaitable_am_send(QueueAwaitableObj *self, PyObject *arg,
+                       PyObject **result)
+{
+    _Py_IDENTIFIER(_get_loop);
+    _Py_IDENTIFIER(create_future);
+    _Py_IDENTIFIER(result);
+    _Py_IDENTIFIER(append);
+    QueueObj *queue = self->qa_queue;
+    PyObject *res;
+
+    *result = NULL;
+    if (queue == NULL) {
+        PyErr_Format(PyExc_RuntimeError,
+                     "cannot reuse already awaited Queue.%s()",
+                     self->qa_put ? "put" : "get");
+        return PYGEN_ERROR;
+    }
+
+    if (self->qa_waiter != NULL) {
+        int r = queue_future_done(self->qa_waiter);
+        if (r == 0) {
+            PyErr_SetString(PyExc_RuntimeError,
+                            "await wasn't used with future");
+        }
+        if (r <= 0) {
+            queue_awaitable_abort(self);
+            goto error;
+        }
+        if (Future_CheckExact(self->qa_waiter)) {
+            res = _asyncio_Future_result_impl((FutureObj *)self->qa_waiter);
+        }
+        else {
+            res = _PyObject_CallMethodIdNoArgs(self->qa_waiter, &PyId_result);
+        }
+        if (res == NULL) {
+            queue_awaitable_abort(self);
+            goto error;
+        }
+        Py_DECREF(res);
+        Py_CLEAR(self->qa_waiter);
+    }
+
+    int kind = queue_kind(queue);
+    if (kind < 0) {
+        goto error;
+    }
+    int r = queue_awaitable_must_wait(self, kind);
+    if (r < 0) {
+        goto error;
+    }
+    if (r == 0) {
+        if (self->qa_put) {
+            res = queue_put_nowait(queue, kind, self->qa_item);
+        }
+        else {
+            res = queue_get_nowait(queue, kind);
+        }
+        if (res == NULL) {
+            goto error;
+        }
+        queue_awaitable_finish(self);
+        *result = res;
+        return PYGEN_RETURN;
+    }
+
+    PyObject *waiters = queue_awaitable_waiters(self);
+    if (waiters == NULL) {
+        goto error;
+    }
+    PyObject *loop = _PyObject_CallMethodIdNoArgs((PyObject *)queue,
+                                                  &PyId__get_loop);
+    if (loop == NULL) {
+        goto error;
+    }
+    PyObject *waiter = _PyObject_CallMethodIdNoArgs(loop, &PyId_create_future);
+    Py_DECREF(loop);
+    if (waiter == NULL) {
+        goto error;
+    }
+    res = _PyObject_CallMethodIdOneArg(waiters, &PyId_append, waiter);
+    if (res == NULL) {
+        Py_DECREF(waiter);
+        goto error;
+    }
+    Py_DECREF(res);
+    self->qa_waiter = waiter;
+
+    if (Future_Check(waiter)) {
+        ((FutureObj *)waiter)->fut_blocking = 1;
+    }
+    else if (_PyObject_SetAttrId(waiter, &PyId__asyncio_future_blocking,
+                                 Py_True) < 0) {
+        queue_awaitable_abort(self);
+        goto error;
+    }
+    Py_INCREF(waiter);
+    *result = waiter;
+    return PYGEN_NEXT;
+
+error:
+    queue_awaitable_finish(self);
+    return PYGEN_ERROR;
+}
+
+static PyObject *
+queue_awaitable_send_result(PySendResult res, PyObject *result)
+{
+    if (res == PYGEN_RETURN) {
+        _PyGen_SetStopIterationValue(result);
+        Py_DECREF(result);
+        return NULL;
+    }
+    return result;
+}
+
+static PyObject *
+QueueAwaitable_iternext(QueueAwaitableObj *self)
+{
+    PyObject *result;
+    PySendResult res = QueueAwaitable_am_send(self, Py_None, &result);
+    if (res == PYGEN_RETURN && result == Py_None) {
+        /* Like a generator, return None with no StopIteration */
+        Py_DECREF(result);
+        return NULL;
+    }
+    return queue_awaitable_send_result(res, result);
+}
+
+static PyObject *
+QueueAwaitable_send(QueueAwaitableObj *self, PyObject *arg)
+{
+    PyObject *result;
+    PySendResult res = QueueAwaitable_am_send(self, arg, &result);
+    if (res == PYGEN_RETURN) {
+        if (result == Py_None) {
+            PyErr_SetNone(PyExc_StopIteration);
+            Py_DECREF(result);
+            return NULL;
+        }
+    }
+    return queue_awaitable_send_result(res, result);
+}
+
+static PyObject *
+QueueAwaitable_throw(QueueAwaitableObj *self, PyObject *args)
+{
+    PyObject *type, *val, *tb;
+
+    if (parse_throw_args(args, &type, &val, &tb) < 0) {
+        return NULL;
+    }
+    PyErr_Restore(type, val, tb);
+    if (self->qa_waiter != NULL) {
+        queue_awaitable_abort(self);
+    }
+    queue_awaitable_finish(self);
+    return NULL;
+}
+
+static PyObject *
+QueueAwaitable_close(QueueAwaitableObj *self, PyObject *arg)
+{
+    if (self->qa_waiter != NULL) {
+        PyErr_SetNone(PyExc_GeneratorExit);
+        queue_awaitable_abort(self);
+        if (!PyErr_ExceptionMatches(PyExc_GeneratorExit)) {
+            queue_awaitable_finish(self);
+            return NULL;
+        }
+        PyErr_Clear();
+    }
+    queue_awaitable_finish(self);
+    Py_RETURN_NONE;
+}
+
+static void
+QueueAwaitable_finalize(QueueAwaitableObj *self)
+{
+    PyObject *error_type, *error_value, *error_traceback;
+
+    if (self->qa_queue == NULL) {
+        return;
+    }
+
+    /* Save the current exception, if any. */
+    PyErr_Fetch(&error_type, &error_value, &error_traceback);
+
+    if (self->qa_waiter == NULL) {
+        /* Never started, like a coroutine which was never awaited */
+        if (PyErr_WarnFormat(PyExc_RuntimeWarning, 1,
+                             "coroutine '%s' was never awaited",
+                             self->qa_put ? "Queue.put" : "Queue.get") < 0)
+        {
+            PyErr_WriteUnraisable((PyObject *)self);
+        }
+    }
+    else {
+        PyObject *res = QueueAwaitable_close(self, NULL);
+        if (res == NULL) {
+            PyErr_WriteUnraisable((PyObject *)self);
+        }
+        else {
+            Py_DECREF(res);
+        }
+    }
+
+    /* Restore the saved exception. */
+    PyErr_Restore(error_type, error_value, error_traceback);
+}
+
+static PyObject *
+QueueAwaitable_get_name(QueueAwaitableObj *self, void *Py_UNUSED(ignored))
+{
+    return PyUnicode_FromString(self->qa_put ? "put" : "get");
+}
+
+static PyObject *
+QueueAwaitable_get_qualname(QueueAwaitableObj *self,
+                            void *Py_UNUSED(ignored))
+{
+    return PyUnicode_FromString(self->qa_put ? "Queue.put" : "Queue.get");
+}
+
+static PyAsyncMethods QueueAwaitableType_as_async = {
+    (unaryfunc)QueueAwaitable_await,            /* am_await */
+    0,                                          /* am_aiter */
+    0,                                          /* am_anext */
+    (sendfunc)QueueAwaitable_am_send,           /* am_send  */
+};
+
+static PyMethodDef QueueAwaitableType_methods[] = {
+    {"send",  (PyCFunction)QueueAwaitable_send, METH_O, NULL},
+    {"throw", (PyCFunction)QueueAwaitable_throw, METH_VARARGS, NULL},
+    {"close", (PyCFunction)QueueAwaitable_close, METH_NOARGS, NULL},
+    {NULL, NULL}        /* Sentinel */
+};
+
+static PyGetSetDef QueueAwaitableType_getsetlist[] = {
+    {"__name__", (getter)QueueAwaitable_get_name, NULL, NULL},
+    {"__qualname__", (getter)QueueAwaitable_get_qualname, NULL, NULL},
+    {NULL} /* Sentinel */
+};
+
+static PyTypeObject QueueAwaitableType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "_asyncio._QueueAwaitable",
+    .tp_basicsize = sizeof(QueueAwaitableObj),
+    .tp_dealloc = (destructor)QueueAwaitable_dealloc,
+    .tp_as_async = &QueueAwaitableType_as_async,
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC |
+        Py_TPFLAGS_HAVE_AM_SEND,
+    .tp_traverse = (traverseproc)QueueAwaitable_traverse,
+    .tp_clear = (inquiry)QueueAwaitable_clear,
+    .tp_iter = PyObject_SelfIter,
+    .tp_iternext = (iternextfunc)QueueAwaitable_iternext,
+    .tp_methods = QueueAwaitableType_methods,
+    .tp_getset = QueueAwaitableType_getsetlist,
+    .tp_finalize = (destructor)QueueAwaitable_finalize,
+};
+
+
+/*********************** Functions **************************/
+
+
+/*[clinic input]
+_asyncio._get_running_loop
+
+Return the running event loop or None.
+
+This is a low-level function intended to be used by event loops.
+This function is thread-specific.
+
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__get_running_loop_impl(PyObject *module)
+/*[clinic end generated code: output=b4390af721411a0a input=0a21627e25a4bd43]*/
+{
+    PyObject *loop;
+    if (get_running_loop(&loop)) {
+        return NULL;
+    }
+    if (loop == NULL) {
+        /* There's no currently running event loop */
+        Py_RETURN_NONE;
+    }
+    return loop;
+}
+
+/*[clinic input]
+_asyncio._set_running_loop
+    loop: 'O'
+    /
+
+Set the running event loop.
+
+This is a low-level function intended to be used by event loops.
+This function is thread-specific.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__set_running_loop(PyObject *module, PyObject *loop)
+/*[clinic end generated code: output=ae56bf7a28ca189a input=4c9720233d606604]*/
+{
+    if (set_running_loop(loop)) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+_asyncio.get_event_loop
+
+Return an asyncio event loop.
+
+When called from a coroutine or a callback (e.g. scheduled with
+call_soon or similar API), this function will always return the
+running event loop.
+
+If there is no running event loop set, the function will return
+the result of `get_event_loop_policy().get_event_loop()` call.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_get_event_loop_impl(PyObject *module)
+/*[clinic end generated code: output=2a2d8b2f824c648b input=9364bf2916c8655d]*/
+{
+    return get_event_loop(1);
+}
+
+/*[clinic input]
+_asyncio._get_event_loop
+    stacklevel: int = 3
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__get_event_loop_impl(PyObject *module, int stacklevel)
+/*[clinic end generated code: output=9c1d6d3c802e67c9 input=d17aebbd686f711d]*/
+{
+    return get_event_loop(stacklevel-1);
+}
+
+/*[clinic input]
+_asyncio.get_running_loop
+
+Return the running event loop.  Raise a RuntimeError if there is none.
+
+This function is thread-specific.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio_get_running_loop_impl(PyObject *module)
+/*[clinic end generated code: output=c247b5f9e529530e input=2a3bf02ba39f173d]*/
+{
+    PyObject *loop;
+    if (get_running_loop(&loop)) {
+        return NULL;
+    }
+    if (loop == NULL) {
+        /* There's no currently running event loop */
+        PyErr_SetString(
+            PyExc_RuntimeError, "no running event loop");
+    }
+    return loop;
+}
+
+/*[clinic input]
+_asyncio._register_task
+
+    task: object
+
+Register a new task in asyncio as executed by loop.
+
+Returns None.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__register_task_impl(PyObject *module, PyObject *task)
+/*[clinic end generated code: output=8672dadd69a7d4e2 input=21075aaea14dfbad]*/
+{
+    if (register_task(task) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+
+/*[clinic input]
+_asyncio._unregister_task
+
+    task: object
+
+Unregister a task.
+
+Returns None.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__unregister_task_impl(PyObject *module, PyObject *task)
+/*[clinic end generated code: output=6e5585706d568a46 input=28fb98c3975f7bdc]*/
 {
     if (unregister_task(task) < 0) {
         return NULL;
@@ -3284,6 +5902,8 @@ module_free(void *m)
     Py_CLEAR(asyncio_mod);
     Py_CLEAR(traceback_extract_stack);
     Py_CLEAR(asyncio_future_repr_info_func);
+    Py_CLEAR(asyncio_format_callback_source_func);
+    Py_CLEAR(asyncio_extract_stack_func);
     Py_CLEAR(asyncio_get_event_loop_policy);
     Py_CLEAR(asyncio_iscoroutine_func);
     Py_CLEAR(asyncio_task_get_stack_func);
@@ -3291,6 +5911,11 @@ module_free(void *m)
     Py_CLEAR(asyncio_task_repr_info_func);
     Py_CLEAR(asyncio_InvalidStateError);
     Py_CLEAR(asyncio_CancelledError);
+    Py_CLEAR(heapq_heappush_func);
+    Py_CLEAR(heapq_heappop_func);
+    Py_CLEAR(collections_deque);
+    Py_CLEAR(asyncio_QueueEmpty);
+    Py_CLEAR(asyncio_QueueFull);
 
     Py_CLEAR(all_tasks);
     Py_CLEAR(current_tasks);
@@ -3354,6 +5979,11 @@ module_init(void)
     WITH_MOD("asyncio.base_futures")
     GET_MOD_ATTR(asyncio_future_repr_info_func, "_future_repr_info")
 
+    WITH_MOD("asyncio.format_helpers")
+    GET_MOD_ATTR(asyncio_format_callback_source_func,
+                 "_format_callback_source")
+    GET_MOD_ATTR(asyncio_extract_stack_func, "extract_stack")
+
     WITH_MOD("asyncio.exceptions")
     GET_MOD_ATTR(asyncio_InvalidStateError, "InvalidStateError")
     GET_MOD_ATTR(asyncio_CancelledError, "CancelledError")
@@ -3369,6 +5999,13 @@ module_init(void)
     WITH_MOD("traceback")
     GET_MOD_ATTR(traceback_extract_stack, "extract_stack")
 
+    WITH_MOD("heapq")
+    GET_MOD_ATTR(heapq_heappush_func, "heappush")
+    GET_MOD_ATTR(heapq_heappop_func, "heappop")
+
+    WITH_MOD("collections")
+    GET_MOD_ATTR(collections_deque, "deque")
+
     PyObject *weak_set;
     WITH_MOD("weakref")
     GET_MOD_ATTR(weak_set, "WeakSet");
@@ -3433,13 +6070,17 @@ PyInit__asyncio(void)
     if (PyType_Ready(&PyRunningLoopHolder_Type) < 0) {
         return NULL;
     }
+    if (PyType_Ready(&QueueAwaitableType) < 0) {
+        return NULL;
+    }
 
     PyObject *m = PyModule_Create(&_asynciomodule);
     if (m == NULL) {
         return NULL;
     }
 
-    /* FutureType and TaskType are made ready by PyModule_AddType() calls below. */
+    /* FutureType, TaskType, HandleType, TimerHandleType, TimerWheelType and
+       the queue types are made ready by PyModule_AddType() calls below. */
     if (PyModule_AddType(m, &FutureType) < 0) {
         Py_DECREF(m);
         return NULL;
@@ -3450,6 +6091,36 @@ PyInit__asyncio(void)
         return NULL;
     }
 
+    if (PyModule_AddType(m, &HandleType) < 0) {
+        Py_DECREF(m);
+        return NULL;
+    }
+
+    if (PyModule_AddType(m, &TimerHandleType) < 0) {
+        Py_DECREF(m);
+        return NULL;
+    }
+
+    if (PyModule_AddType(m, &TimerWheelType) < 0) {
+        Py_DECREF(m);
+        return NULL;
+    }
+
+    if (PyModule_AddType(m, &QueueType) < 0) {
+        Py_DECREF(m);
+        return NULL;
+    }
+
+    if (PyModule_AddType(m, &LifoQueueType) < 0) {
+        Py_DECREF(m);
+        return NULL;
+    }
+
+    if (PyModule_AddType(m, &PriorityQueueType) < 0) {
+        Py_DECREF(m);
+        return NULL;
+    }
+
     Py_INCREF(all_tasks);
     if (PyModule_AddObject(m, "_all_tasks", all_tasks) < 0) {
         Py_DECREF(all_tasks);
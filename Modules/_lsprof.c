@@ -1,4 +1,5 @@
 #include "Python.h"
+#include "frameobject.h"          // PyFrameObject.f_back
 #include "rotatingtree.h"
 
 /************************************************************/
@@ -60,6 +61,7 @@ class _lsprof.Profiler "ProfilerObject *" "&ProfilerType"
 
 typedef struct {
     PyTypeObject *profiler_type;
+    PyTypeObject *sampler_type;
     PyTypeObject *stats_entry_type;
     PyTypeObject *stats_subentry_type;
 } _lsprof_state;
@@ -569,6 +571,17 @@ static int statsForEntry(rotating_node_t *node, void *arg)
     return err;
 }
 
+/* Return the factor converting the times of the profiler to seconds */
+static double
+profiler_time_factor(ProfilerObject *pObj)
+{
+    if (!pObj->externalTimer || pObj->externalTimerUnit == 0.0) {
+        _PyTime_t onesec = _PyTime_FromSeconds(1);
+        return (double)1 / onesec;
+    }
+    return pObj->externalTimerUnit;
+}
+
 /*[clinic input]
 _lsprof.Profiler.getstats
 
@@ -608,13 +621,7 @@ _lsprof_Profiler_getstats_impl(ProfilerObject *self, PyTypeObject *cls)
     if (pending_exception(self)) {
         return NULL;
     }
-    if (!self->externalTimer || self->externalTimerUnit == 0.0) {
-        _PyTime_t onesec = _PyTime_FromSeconds(1);
-        collect.factor = (double)1 / onesec;
-    }
-    else {
-        collect.factor = self->externalTimerUnit;
-    }
+    collect.factor = profiler_time_factor(self);
 
     collect.list = PyList_New(0);
     if (collect.list == NULL)
@@ -627,6 +634,877 @@ _lsprof_Profiler_getstats_impl(ProfilerObject *self, PyTypeObject *cls)
     return collect.list;
 }
 
+/*** Binary statistics ***/
+
+/* Profile statistics can be serialized in a compact binary format holding
+   the same information as the stats dictionary of pstats.Stats, whose
+   keys are (filename, lineno, funcname) labels.  After the "PYSTATS\0"
+   magic number, integers are LEB128 varints (zigzag encoded if they are
+   signed) and doubles are 8 bytes in little endian order:
+
+   version
+   nstrings, then nstrings times: size, UTF-8 data
+   nfuncs, then nfuncs times: filename, lineno, funcname, where filename
+       and funcname are indexes in the strings
+   nrecords, then nrecords times: func, cc, nc, tt, ct, ncallers, then
+       ncallers times: caller, nc, cc, tt, ct
+
+   The statistics are accumulated into a StatsBuilder, which merges the
+   functions with the same label, so that merging profiles only sums
+   numbers instead of building dictionaries of tuples. */
+
+#define STATS_MAGIC "PYSTATS"   /* the terminating NUL is part of it */
+#define STATS_MAGIC_SIZE 8
+#define STATS_VERSION 1
+
+typedef struct {
+    long long cc;
+    long long nc;
+    double tt;
+    double ct;
+    int known;      /* the statistics include a record for the function */
+} StatsRecord;
+
+typedef struct {
+    uint32_t func;
+    uint32_t caller;
+    long long nc;
+    long long cc;
+    double tt;
+    double ct;
+} StatsEdge;
+
+typedef struct {
+    PyObject *indexes;      /* dict: label -> function index */
+    PyObject *labels;       /* list of the labels, by function index */
+    StatsRecord *records;   /* by function index */
+    Py_ssize_t records_size;
+    PyObject *edge_indexes; /* dict: func << 32 | caller -> edge index */
+    StatsEdge *edges;
+    Py_ssize_t nedges;
+    Py_ssize_t edges_size;
+} StatsBuilder;
+
+static int
+stats_builder_init(StatsBuilder *builder)
+{
+    memset(builder, 0, sizeof(*builder));
+    builder->indexes = PyDict_New();
+    builder->labels = PyList_New(0);
+    builder->edge_indexes = PyDict_New();
+    if (builder->indexes == NULL || builder->labels == NULL
+        || builder->edge_indexes == NULL) {
+        return -1;
+    }
+    return 0;
+}
+
+static void
+stats_builder_fini(StatsBuilder *builder)
+{
+    Py_XDECREF(builder->indexes);
+    Py_XDECREF(builder->labels);
+    Py_XDECREF(builder->edge_indexes);
+    PyMem_Free(builder->records);
+    PyMem_Free(builder->edges);
+}
+
+/* Make room for at least one more item in the array *items */
+static int
+stats_grow(void **items, Py_ssize_t *size, size_t itemsize)
+{
+    Py_ssize_t new_size = *size ? *size * 2 : 64;
+    if ((size_t)new_size > PY_SSIZE_T_MAX / itemsize) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    void *new_items = PyMem_Realloc(*items, new_size * itemsize);
+    if (new_items == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    *items = new_items;
+    *size = new_size;
+    return 0;
+}
+
+/* Return the index of the function with the given label, adding it if it
+   is new, or -1 on error. */
+static Py_ssize_t
+stats_builder_func(StatsBuilder *builder, PyObject *label)
+{
+    PyObject *index = PyDict_GetItemWithError(builder->indexes, label);
+    if (index != NULL) {
+        return PyLong_AsSsize_t(index);
+    }
+    if (PyErr_Occurred()) {
+        return -1;
+    }
+    Py_ssize_t func = PyList_GET_SIZE(builder->labels);
+    if ((size_t)func >= UINT32_MAX) {
+        PyErr_SetString(PyExc_OverflowError,
+                        "too many functions in profile statistics");
+        return -1;
+    }
+    if (func >= builder->records_size
+        && stats_grow((void **)&builder->records, &builder->records_size,
+                      sizeof(StatsRecord)) < 0) {
+        return -1;
+    }
+    memset(&builder->records[func], 0, sizeof(StatsRecord));
+
+    index = PyLong_FromSsize_t(func);
+    if (index == NULL) {
+        return -1;
+    }
+    int err = PyDict_SetItem(builder->indexes, label, index);
+    Py_DECREF(index);
+    if (err < 0 || PyList_Append(builder->labels, label) < 0) {
+        return -1;
+    }
+    return func;
+}
+
+static void
+stats_builder_add_record(StatsBuilder *builder, Py_ssize_t func,
+                         long long cc, long long nc, double tt, double ct)
+{
+    StatsRecord *record = &builder->records[func];
+    record->known = 1;
+    record->cc += cc;
+    record->nc += nc;
+    record->tt += tt;
+    record->ct += ct;
+}
+
+/* Add the statistics of the calls of func from caller */
+static int
+stats_builder_add_edge(StatsBuilder *builder, Py_ssize_t func,
+                       Py_ssize_t caller, long long nc, long long cc,
+                       double tt, double ct)
+{
+    StatsEdge *edge;
+    PyObject *key = PyLong_FromUnsignedLongLong(
+        ((unsigned long long)func << 32) | (unsigned long long)caller);
+    if (key == NULL) {
+        return -1;
+    }
+    PyObject *index = PyDict_GetItemWithError(builder->edge_indexes, key);
+    if (index != NULL) {
+        edge = &builder->edges[PyLong_AsSsize_t(index)];
+    }
+    else {
+        if (PyErr_Occurred()) {
+            goto error;
+        }
+        if (builder->nedges >= builder->edges_size
+            && stats_grow((void **)&builder->edges, &builder->edges_size,
+                          sizeof(StatsEdge)) < 0) {
+            goto error;
+        }
+        index = PyLong_FromSsize_t(builder->nedges);
+        if (index == NULL) {
+            goto error;
+        }
+        int err = PyDict_SetItem(builder->edge_indexes, key, index);
+        Py_DECREF(index);
+        if (err < 0) {
+            goto error;
+        }
+        edge = &builder->edges[builder->nedges++];
+        memset(edge, 0, sizeof(StatsEdge));
+        edge->func = (uint32_t)func;
+        edge->caller = (uint32_t)caller;
+    }
+    Py_DECREF(key);
+    edge->nc += nc;
+    edge->cc += cc;
+    edge->tt += tt;
+    edge->ct += ct;
+    return 0;
+
+error:
+    Py_DECREF(key);
+    return -1;
+}
+
+/* Return the index of the function of a profiler entry, labelled like
+   cProfile.label() does, or -1 on error. */
+static Py_ssize_t
+stats_builder_entry(StatsBuilder *builder, ProfilerEntry *entry)
+{
+    PyObject *label;
+    if (PyCode_Check(entry->userObj)) {
+        PyCodeObject *code = (PyCodeObject *)entry->userObj;
+        label = Py_BuildValue("(OiO)", code->co_filename,
+                              code->co_firstlineno, code->co_name);
+    }
+    else {
+        /* built-in functions ('~' sorts at the end) */
+        label = Py_BuildValue("(siO)", "~", 0, entry->userObj);
+    }
+    if (label == NULL) {
+        return -1;
+    }
+    Py_ssize_t func = stats_builder_func(builder, label);
+    Py_DECREF(label);
+    return func;
+}
+
+typedef struct {
+    StatsBuilder *builder;
+    double factor;
+    Py_ssize_t caller;
+} binarycollector_t;
+
+static int binaryStatsForSubEntry(rotating_node_t *node, void *arg)
+{
+    ProfilerSubEntry *sentry = (ProfilerSubEntry*) node;
+    binarycollector_t *collect = (binarycollector_t*) arg;
+    ProfilerEntry *entry = (ProfilerEntry*) sentry->header.key;
+    if (entry->callcount == 0)
+        return 0;   /* skip, like getstats() */
+
+    Py_ssize_t func = stats_builder_entry(collect->builder, entry);
+    if (func < 0)
+        return -1;
+    return stats_builder_add_edge(
+        collect->builder, func, collect->caller,
+        sentry->callcount,
+        sentry->callcount - sentry->recursivecallcount,
+        collect->factor * sentry->it,
+        collect->factor * sentry->tt);
+}
+
+static int binaryStatsForEntry(rotating_node_t *node, void *arg)
+{
+    ProfilerEntry *entry = (ProfilerEntry*) node;
+    binarycollector_t *collect = (binarycollector_t*) arg;
+    if (entry->callcount == 0)
+        return 0;   /* skip */
+
+    Py_ssize_t func = stats_builder_entry(collect->builder, entry);
+    if (func < 0)
+        return -1;
+    stats_builder_add_record(collect->builder, func,
+                             entry->callcount - entry->recursivecallcount,
+                             entry->callcount,
+                             collect->factor * entry->it,
+                             collect->factor * entry->tt);
+    collect->caller = func;
+    return RotatingTree_Enum(entry->calls, binaryStatsForSubEntry, collect);
+}
+
+/* Check that label is a (filename, lineno, funcname) tuple */
+static int
+stats_check_label(PyObject *label)
+{
+    if (!PyTuple_Check(label) || PyTuple_GET_SIZE(label) != 3
+        || !PyUnicode_Check(PyTuple_GET_ITEM(label, 0))
+        || !PyLong_Check(PyTuple_GET_ITEM(label, 1))
+        || !PyUnicode_Check(PyTuple_GET_ITEM(label, 2))) {
+        PyErr_Format(PyExc_TypeError,
+                     "function label must be a (filename, lineno, funcname) "
+                     "tuple, not %R", label);
+        return -1;
+    }
+    return 0;
+}
+
+/* Add the callers of a function from a pstats dictionary */
+static int
+stats_builder_add_callers(StatsBuilder *builder, Py_ssize_t func,
+                          PyObject *callers)
+{
+    Py_ssize_t pos = 0;
+    PyObject *label, *value;
+    while (PyDict_Next(callers, &pos, &label, &value)) {
+        long long nc, cc;
+        double tt = 0.0, ct = 0.0;
+        if (stats_check_label(label) < 0) {
+            return -1;
+        }
+        if (PyLong_Check(value)) {
+            /* format used by profile: only the number of calls */
+            nc = cc = PyLong_AsLongLong(value);
+            if (nc == -1 && PyErr_Occurred()) {
+                return -1;
+            }
+        }
+        else if (!PyTuple_Check(value)
+                 || !PyArg_ParseTuple(value, "LLdd;invalid caller statistics",
+                                      &nc, &cc, &tt, &ct)) {
+            if (!PyErr_Occurred()) {
+                PyErr_Format(PyExc_TypeError,
+                             "caller statistics must be a tuple, not %.200s",
+                             Py_TYPE(value)->tp_name);
+            }
+            return -1;
+        }
+        Py_ssize_t caller = stats_builder_func(builder, label);
+        if (caller < 0
+            || stats_builder_add_edge(builder, func, caller,
+                                      nc, cc, tt, ct) < 0) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+/* Add the statistics of a pstats dictionary */
+static int
+stats_builder_add_dict(StatsBuilder *builder, PyObject *stats)
+{
+    Py_ssize_t pos = 0;
+    PyObject *label, *value;
+    while (PyDict_Next(stats, &pos, &label, &value)) {
+        long long cc, nc;
+        double tt, ct;
+        PyObject *callers;
+        if (stats_check_label(label) < 0) {
+            return -1;
+        }
+        if (!PyTuple_Check(value)) {
+            PyErr_Format(PyExc_TypeError,
+                         "function statistics must be a tuple, not %.200s",
+                         Py_TYPE(value)->tp_name);
+            return -1;
+        }
+        if (!PyArg_ParseTuple(value, "LLddO!;invalid function statistics",
+                              &cc, &nc, &tt, &ct, &PyDict_Type, &callers)) {
+            return -1;
+        }
+        Py_ssize_t func = stats_builder_func(builder, label);
+        if (func < 0) {
+            return -1;
+        }
+        stats_builder_add_record(builder, func, cc, nc, tt, ct);
+        if (stats_builder_add_callers(builder, func, callers) < 0) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+typedef struct {
+    const unsigned char *p;
+    const unsigned char *end;
+} StatsReader;
+
+static int
+invalid_binary_stats(const char *reason)
+{
+    PyErr_Format(PyExc_ValueError, "invalid binary profile statistics: %s",
+                 reason);
+    return -1;
+}
+
+static int
+read_varint(StatsReader *reader, uint64_t *value)
+{
+    uint64_t x = 0;
+    for (int shift = 0; shift < 64; shift += 7) {
+        if (reader->p == reader->end) {
+            return invalid_binary_stats("truncated data");
+        }
+        unsigned char byte = *reader->p++;
+        x |= (uint64_t)(byte & 0x7f) << shift;
+        if (!(byte & 0x80)) {
+            *value = x;
+            return 0;
+        }
+    }
+    return invalid_binary_stats("integer too large");
+}
+
+static int
+read_signed(StatsReader *reader, long long *value)
+{
+    uint64_t x;
+    if (read_varint(reader, &x) < 0) {
+        return -1;
+    }
+    *value = (long long)((x >> 1) ^ (0 - (x & 1)));
+    return 0;
+}
+
+/* Read an index in a table of count items */
+static int
+read_index(StatsReader *reader, size_t count, size_t *index)
+{
+    uint64_t x;
+    if (read_varint(reader, &x) < 0) {
+        return -1;
+    }
+    if (x >= count) {
+        return invalid_binary_stats("index out of range");
+    }
+    *index = (size_t)x;
+    return 0;
+}
+
+/* Read the number of items of a section: each item takes at least one
+   byte, which bounds the memory allocated for corrupted data. */
+static int
+read_count(StatsReader *reader, size_t *count)
+{
+    return read_index(reader, (size_t)(reader->end - reader->p) + 1, count);
+}
+
+static int
+read_double(StatsReader *reader, double *value)
+{
+    if (reader->end - reader->p < 8) {
+        return invalid_binary_stats("truncated data");
+    }
+    uint64_t bits = 0;
+    for (int i = 0; i < 8; i++) {
+        bits |= (uint64_t)reader->p[i] << (8 * i);
+    }
+    /* Python requires IEEE 754 doubles */
+    memcpy(value, &bits, sizeof(*value));
+    reader->p += 8;
+    return 0;
+}
+
+#define VARINT_MAX_SIZE 10
+
+static inline unsigned char *
+write_varint(unsigned char *p, uint64_t x)
+{
+    while (x >= 0x80) {
+        *p++ = (unsigned char)(x | 0x80);
+        x >>= 7;
+    }
+    *p++ = (unsigned char)x;
+    return p;
+}
+
+static inline unsigned char *
+write_signed(unsigned char *p, long long x)
+{
+    uint64_t u = (uint64_t)x << 1;
+    return write_varint(p, x < 0 ? ~u : u);
+}
+
+static inline unsigned char *
+write_double(unsigned char *p, double x)
+{
+    uint64_t bits;
+    memcpy(&bits, &x, sizeof(bits));
+    for (int i = 0; i < 8; i++) {
+        *p++ = (unsigned char)(bits >> (8 * i));
+    }
+    return p;
+}
+
+/* Add the statistics serialized in the binary format */
+static int
+stats_builder_add_binary(StatsBuilder *builder, const unsigned char *data,
+                         Py_ssize_t size)
+{
+    StatsReader reader = {data, data + size};
+    PyObject *strings = NULL;
+    Py_ssize_t *funcs = NULL;
+    size_t nstrings, nfuncs, nrecords;
+    uint64_t version;
+    int res = -1;
+
+    if (size < STATS_MAGIC_SIZE
+        || memcmp(data, STATS_MAGIC, STATS_MAGIC_SIZE) != 0) {
+        return invalid_binary_stats("bad magic number");
+    }
+    reader.p += STATS_MAGIC_SIZE;
+    if (read_varint(&reader, &version) < 0) {
+        return -1;
+    }
+    if (version != STATS_VERSION) {
+        PyErr_Format(PyExc_ValueError,
+                     "unsupported binary profile statistics version %llu",
+                     (unsigned long long)version);
+        return -1;
+    }
+
+    if (read_count(&reader, &nstrings) < 0) {
+        goto done;
+    }
+    strings = PyList_New(nstrings);
+    if (strings == NULL) {
+        goto done;
+    }
+    for (size_t i = 0; i < nstrings; i++) {
+        size_t len;
+        if (read_count(&reader, &len) < 0) {
+            goto done;
+        }
+        if (len > (size_t)(reader.end - reader.p)) {
+            invalid_binary_stats("truncated data");
+            goto done;
+        }
+        PyObject *str = PyUnicode_DecodeUTF8((const char *)reader.p, len,
+                                             "surrogatepass");
+        if (str == NULL) {
+            goto done;
+        }
+        PyList_SET_ITEM(strings, i, str);
+        reader.p += len;
+    }
+
+    if (read_count(&reader, &nfuncs) < 0) {
+        goto done;
+    }
+    funcs = PyMem_New(Py_ssize_t, nfuncs + 1);
+    if (funcs == NULL) {
+        PyErr_NoMemory();
+        goto done;
+    }
+    for (size_t i = 0; i < nfuncs; i++) {
+        size_t filename, name;
+        long long lineno;
+        if (read_index(&reader, nstrings, &filename) < 0
+            || read_signed(&reader, &lineno) < 0
+            || read_index(&reader, nstrings, &name) < 0) {
+            goto done;
+        }
+        PyObject *label = Py_BuildValue("(OLO)",
+                                        PyList_GET_ITEM(strings, filename),
+                                        lineno,
+                                        PyList_GET_ITEM(strings, name));
+        if (label == NULL) {
+            goto done;
+        }
+        funcs[i] = stats_builder_func(builder, label);
+        Py_DECREF(label);
+        if (funcs[i] < 0) {
+            goto done;
+        }
+    }
+
+    if (read_count(&reader, &nrecords) < 0) {
+        goto done;
+    }
+    for (size_t i = 0; i < nrecords; i++) {
+        size_t func, ncallers;
+        long long cc, nc;
+        double tt, ct;
+        if (read_index(&reader, nfuncs, &func) < 0
+            || read_signed(&reader, &cc) < 0
+            || read_signed(&reader, &nc) < 0
+            || read_double(&reader, &tt) < 0
+            || read_double(&reader, &ct) < 0
+            || read_count(&reader, &ncallers) < 0) {
+            goto done;
+        }
+        stats_builder_add_record(builder, funcs[func], cc, nc, tt, ct);
+        for (size_t j = 0; j < ncallers; j++) {
+            size_t caller;
+            if (read_index(&reader, nfuncs, &caller) < 0
+                || read_signed(&reader, &nc) < 0
+                || read_signed(&reader, &cc) < 0
+                || read_double(&reader, &tt) < 0
+                || read_double(&reader, &ct) < 0) {
+                goto done;
+            }
+            if (stats_builder_add_edge(builder, funcs[func], funcs[caller],
+                                       nc, cc, tt, ct) < 0) {
+                goto done;
+            }
+        }
+    }
+    if (reader.p != reader.end) {
+        invalid_binary_stats("trailing data");
+        goto done;
+    }
+    res = 0;
+
+done:
+    Py_XDECREF(strings);
+    PyMem_Free(funcs);
+    return res;
+}
+
+static int
+compare_edges(const void *a, const void *b)
+{
+    const StatsEdge *x = (const StatsEdge *)a, *y = (const StatsEdge *)b;
+    if (x->func != y->func) {
+        return x->func < y->func ? -1 : 1;
+    }
+    if (x->caller != y->caller) {
+        return x->caller < y->caller ? -1 : 1;
+    }
+    return 0;
+}
+
+/* Return the index of str in the string table, adding it if it is new */
+static Py_ssize_t
+stats_string_index(PyObject *indexes, PyObject *encoded, PyObject *str)
+{
+    PyObject *index = PyDict_GetItemWithError(indexes, str);
+    if (index != NULL) {
+        return PyLong_AsSsize_t(index);
+    }
+    if (PyErr_Occurred()) {
+        return -1;
+    }
+    PyObject *bytes = PyUnicode_AsEncodedString(str, "utf-8", "surrogatepass");
+    if (bytes == NULL) {
+        return -1;
+    }
+    Py_ssize_t i = PyList_GET_SIZE(encoded);
+    int err = PyList_Append(encoded, bytes);
+    Py_DECREF(bytes);
+    if (err < 0) {
+        return -1;
+    }
+    index = PyLong_FromSsize_t(i);
+    if (index == NULL) {
+        return -1;
+    }
+    err = PyDict_SetItem(indexes, str, index);
+    Py_DECREF(index);
+    return err < 0 ? -1 : i;
+}
+
+/* Serialize the accumulated statistics in the binary format */
+static PyObject *
+stats_builder_serialize(StatsBuilder *builder)
+{
+    Py_ssize_t nfuncs = PyList_GET_SIZE(builder->labels);
+    Py_ssize_t nedges = builder->nedges;
+    PyObject *string_indexes = NULL, *encoded = NULL, *result = NULL;
+    Py_ssize_t *funcs = NULL, *ncallers = NULL;
+    StatsEdge *edges = NULL;
+
+    string_indexes = PyDict_New();
+    encoded = PyList_New(0);
+    funcs = PyMem_New(Py_ssize_t, 2 * nfuncs + 1);
+    ncallers = PyMem_New(Py_ssize_t, nfuncs + 1);
+    edges = PyMem_New(StatsEdge, nedges + 1);
+    if (string_indexes == NULL || encoded == NULL) {
+        goto error;
+    }
+    if (funcs == NULL || ncallers == NULL || edges == NULL) {
+        PyErr_NoMemory();
+        goto error;
+    }
+
+    for (Py_ssize_t i = 0; i < nfuncs; i++) {
+        PyObject *label = PyList_GET_ITEM(builder->labels, i);
+        funcs[2 * i] = stats_string_index(string_indexes, encoded,
+                                          PyTuple_GET_ITEM(label, 0));
+        funcs[2 * i + 1] = stats_string_index(string_indexes, encoded,
+                                              PyTuple_GET_ITEM(label, 2));
+        if (funcs[2 * i] < 0 || funcs[2 * i + 1] < 0) {
+            goto error;
+        }
+        ncallers[i] = 0;
+    }
+
+    /* group the edges by function, in the order of the records */
+    memcpy(edges, builder->edges, nedges * sizeof(StatsEdge));
+    qsort(edges, nedges, sizeof(StatsEdge), compare_edges);
+    for (Py_ssize_t i = 0; i < nedges; i++) {
+        ncallers[edges[i].func]++;
+    }
+    Py_ssize_t nrecords = 0;
+    for (Py_ssize_t i = 0; i < nfuncs; i++) {
+        if (builder->records[i].known || ncallers[i]) {
+            nrecords++;
+        }
+    }
+
+    /* allocate for the largest integers, then shrink */
+    Py_ssize_t nstrings = PyList_GET_SIZE(encoded);
+    double max_size = (STATS_MAGIC_SIZE + 4 * VARINT_MAX_SIZE
+                       + (double)nfuncs * 3 * VARINT_MAX_SIZE
+                       + (double)nrecords * (4 * VARINT_MAX_SIZE + 16)
+                       + (double)nedges * (3 * VARINT_MAX_SIZE + 16));
+    for (Py_ssize_t i = 0; i < nstrings; i++) {
+        max_size += VARINT_MAX_SIZE + PyBytes_GET_SIZE(
+            PyList_GET_ITEM(encoded, i));
+    }
+    if (max_size > PY_SSIZE_T_MAX) {
+        PyErr_NoMemory();
+        goto error;
+    }
+    result = PyBytes_FromStringAndSize(NULL, (Py_ssize_t)max_size);
+    if (result == NULL) {
+        goto error;
+    }
+
+    unsigned char *start = (unsigned char *)PyBytes_AS_STRING(result);
+    unsigned char *p = start;
+    memcpy(p, STATS_MAGIC, STATS_MAGIC_SIZE);
+    p += STATS_MAGIC_SIZE;
+    p = write_varint(p, STATS_VERSION);
+    p = write_varint(p, nstrings);
+    for (Py_ssize_t i = 0; i < nstrings; i++) {
+        PyObject *bytes = PyList_GET_ITEM(encoded, i);
+        p = write_varint(p, PyBytes_GET_SIZE(bytes));
+        memcpy(p, PyBytes_AS_STRING(bytes), PyBytes_GET_SIZE(bytes));
+        p += PyBytes_GET_SIZE(bytes);
+    }
+    p = write_varint(p, nfuncs);
+    for (Py_ssize_t i = 0; i < nfuncs; i++) {
+        PyObject *label = PyList_GET_ITEM(builder->labels, i);
+        long long lineno = PyLong_AsLongLong(PyTuple_GET_ITEM(label, 1));
+        if (lineno == -1 && PyErr_Occurred()) {
+            goto error;
+        }
+        p = write_varint(p, funcs[2 * i]);
+        p = write_signed(p, lineno);
+        p = write_varint(p, funcs[2 * i + 1]);
+    }
+    p = write_varint(p, nrecords);
+    StatsEdge *edge = edges;
+    for (Py_ssize_t i = 0; i < nfuncs; i++) {
+        StatsRecord *record = &builder->records[i];
+        if (!record->known && !ncallers[i]) {
+            continue;
+        }
+        p = write_varint(p, i);
+        p = write_signed(p, record->cc);
+        p = write_signed(p, record->nc);
+        p = write_double(p, record->tt);
+        p = write_double(p, record->ct);
+        p = write_varint(p, ncallers[i]);
+        for (Py_ssize_t j = 0; j < ncallers[i]; j++, edge++) {
+            assert(edge->func == i);
+            p = write_varint(p, edge->caller);
+            p = write_signed(p, edge->nc);
+            p = write_signed(p, edge->cc);
+            p = write_double(p, edge->tt);
+            p = write_double(p, edge->ct);
+        }
+    }
+    assert(edge == edges + nedges);
+    if (_PyBytes_Resize(&result, p - start) < 0) {
+        goto error;
+    }
+    goto done;
+
+error:
+    Py_CLEAR(result);
+done:
+    Py_XDECREF(string_indexes);
+    Py_XDECREF(encoded);
+    PyMem_Free(funcs);
+    PyMem_Free(ncallers);
+    PyMem_Free(edges);
+    return result;
+}
+
+/* Return the accumulated statistics as a pstats dictionary */
+static PyObject *
+stats_builder_to_dict(StatsBuilder *builder)
+{
+    Py_ssize_t nfuncs = PyList_GET_SIZE(builder->labels);
+    PyObject *result = NULL;
+    PyObject **callers = PyMem_Calloc(nfuncs + 1, sizeof(PyObject *));
+    if (callers == NULL) {
+        return PyErr_NoMemory();
+    }
+
+    for (Py_ssize_t i = 0; i < builder->nedges; i++) {
+        StatsEdge *edge = &builder->edges[i];
+        if (callers[edge->func] == NULL) {
+            callers[edge->func] = PyDict_New();
+            if (callers[edge->func] == NULL) {
+                goto error;
+            }
+        }
+        PyObject *value = Py_BuildValue("(LLdd)", edge->nc, edge->cc,
+                                        edge->tt, edge->ct);
+        if (value == NULL) {
+            goto error;
+        }
+        int err = PyDict_SetItem(callers[edge->func],
+                                 PyList_GET_ITEM(builder->labels,
+                                                 edge->caller),
+                                 value);
+        Py_DECREF(value);
+        if (err < 0) {
+            goto error;
+        }
+    }
+
+    result = PyDict_New();
+    if (result == NULL) {
+        goto error;
+    }
+    for (Py_ssize_t i = 0; i < nfuncs; i++) {
+        StatsRecord *record = &builder->records[i];
+        if (!record->known && callers[i] == NULL) {
+            continue;
+        }
+        if (callers[i] == NULL) {
+            callers[i] = PyDict_New();
+            if (callers[i] == NULL) {
+                goto error;
+            }
+        }
+        PyObject *value = Py_BuildValue("(LLddO)", record->cc, record->nc,
+                                        record->tt, record->ct, callers[i]);
+        if (value == NULL) {
+            goto error;
+        }
+        int err = PyDict_SetItem(result, PyList_GET_ITEM(builder->labels, i),
+                                 value);
+        Py_DECREF(value);
+        if (err < 0) {
+            goto error;
+        }
+    }
+    goto done;
+
+error:
+    Py_CLEAR(result);
+done:
+    for (Py_ssize_t i = 0; i < nfuncs; i++) {
+        Py_XDECREF(callers[i]);
+    }
+    PyMem_Free(callers);
+    return result;
+}
+
+/*[clinic input]
+_lsprof.Profiler.getstats_binary
+
+Return all information collected by the profiler in a binary format.
+
+The result holds the statistics that create_stats() stores in the
+stats attribute of cProfile.Profile, serialized in the compact format
+read by stats_from_binary() and pstats.Stats.
+[clinic start generated code]*/
+
+static PyObject *
+_lsprof_Profiler_getstats_binary_impl(ProfilerObject *self)
+/*[clinic end generated code: output=6abfb79f9d335177 input=7781a8f0fe2b3994]*/
+{
+    StatsBuilder builder;
+    binarycollector_t collect;
+    PyObject *result = NULL;
+
+    if (pending_exception(self)) {
+        return NULL;
+    }
+    if (stats_builder_init(&builder) < 0) {
+        goto done;
+    }
+    collect.builder = &builder;
+    collect.factor = profiler_time_factor(self);
+    if (RotatingTree_Enum(self->profilerEntries, binaryStatsForEntry,
+                          &collect) != 0) {
+        goto done;
+    }
+    result = stats_builder_serialize(&builder);
+
+done:
+    stats_builder_fini(&builder);
+    return result;
+}
+
 static int
 setSubcalls(ProfilerObject *pObj, int nvalue)
 {
@@ -774,6 +1652,7 @@ profiler_init(ProfilerObject *pObj, PyObject *args, PyObject *kw)
 
 static PyMethodDef profiler_methods[] = {
     _LSPROF_PROFILER_GETSTATS_METHODDEF
+    _LSPROF_PROFILER_GETSTATS_BINARY_METHODDEF
     {"enable",          (PyCFunction)(void(*)(void))profiler_enable,
                     METH_VARARGS | METH_KEYWORDS,       enable_doc},
     {"disable",         (PyCFunction)profiler_disable,
@@ -811,7 +1690,356 @@ static PyType_Spec _lsprof_profiler_type_spec = {
     .slots = _lsprof_profiler_type_spec_slots,
 };
 
+/*** SamplerObject ***/
+
+/* A node of the call tree built from the sampled stacks: the key is the
+   code object of a frame, the children are the frames it called. */
+typedef struct _SamplerNode {
+    rotating_node_t header;
+    long samples; /* how many samples had this frame at the top of the stack */
+    _PyTime_t tt; /* total time credited to these samples */
+    rotating_node_t *children;
+} SamplerNode;
+
+typedef struct {
+    PyObject_HEAD
+    rotating_node_t *roots;
+    PyCodeObject **stack; /* buffer used to walk a stack from its bottom */
+    Py_ssize_t stack_size;
+} SamplerObject;
+
+static SamplerNode *
+getSamplerNode(rotating_node_t **tree, PyCodeObject *code)
+{
+    SamplerNode *node;
+    node = (SamplerNode *)RotatingTree_Get(tree, (void *)code);
+    if (node != NULL) {
+        return node;
+    }
+    node = (SamplerNode *)PyMem_Malloc(sizeof(SamplerNode));
+    if (node == NULL) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+    Py_INCREF(code);
+    node->header.key = (void *)code;
+    node->samples = 0;
+    node->tt = 0;
+    node->children = EMPTY_ROTATING_TREE;
+    RotatingTree_Add(tree, &node->header);
+    return node;
+}
+
+static int freeSamplerNode(rotating_node_t *header, void *arg)
+{
+    SamplerNode *node = (SamplerNode *)header;
+    RotatingTree_Enum(node->children, freeSamplerNode, NULL);
+    Py_DECREF((PyObject *)node->header.key);
+    PyMem_Free(node);
+    return 0;
+}
+
+static int
+sampler_add_stack(SamplerObject *self, PyFrameObject *frame, _PyTime_t tt)
+{
+    Py_ssize_t depth = 0;
+    PyFrameObject *f;
+    for (f = frame; f != NULL; f = f->f_back) {
+        depth++;
+    }
+    if (depth > self->stack_size) {
+        PyCodeObject **stack = PyMem_Realloc(self->stack,
+                                             depth * sizeof(PyCodeObject *));
+        if (stack == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        self->stack = stack;
+        self->stack_size = depth;
+    }
+    Py_ssize_t i = depth;
+    for (f = frame; f != NULL; f = f->f_back) {
+        self->stack[--i] = f->f_code;
+    }
+
+    rotating_node_t **tree = &self->roots;
+    SamplerNode *node = NULL;
+    for (i = 0; i < depth; i++) {
+        node = getSamplerNode(tree, self->stack[i]);
+        if (node == NULL) {
+            return -1;
+        }
+        tree = &node->children;
+    }
+    node->samples++;
+    node->tt += tt;
+    return 0;
+}
+
+PyDoc_STRVAR(sample_doc, "\
+sample(elapsed)\n\
+\n\
+Record the current Python stack of every thread except the calling one.\n\
+'elapsed' is the time in seconds, usually since the previous sample,\n\
+which is credited to each of the recorded stacks.\n\
+");
+
+static PyObject*
+sampler_sample(SamplerObject *self, PyObject *elapsed)
+{
+    _PyTime_t tt;
+    if (_PyTime_FromSecondsObject(&tt, elapsed, _PyTime_ROUND_FLOOR) < 0) {
+        return NULL;
+    }
+
+    /* Other threads cannot run while the GIL is held: their stacks
+       can be walked without taking references */
+    PyThreadState *current = PyThreadState_GET();
+    PyThreadState *tstate = PyInterpreterState_ThreadHead(current->interp);
+    for (; tstate != NULL; tstate = PyThreadState_Next(tstate)) {
+        if (tstate == current || tstate->frame == NULL) {
+            continue;
+        }
+        if (sampler_add_stack(self, tstate->frame, tt) < 0) {
+            return NULL;
+        }
+    }
+    Py_RETURN_NONE;
+}
+
+typedef struct {
+    PyObject *list;
+    PyObject **path;
+    Py_ssize_t depth;
+    double factor;
+} samplecollector_t;
+
+static int
+samplesForNode(rotating_node_t *header, void *arg)
+{
+    SamplerNode *node = (SamplerNode *)header;
+    samplecollector_t *collect = (samplecollector_t *)arg;
+    Py_ssize_t depth = collect->depth;
+
+    collect->path[depth] = (PyObject *)node->header.key;
+    if (node->samples) {
+        PyObject *stack = PyTuple_New(depth + 1);
+        if (stack == NULL) {
+            return -1;
+        }
+        for (Py_ssize_t i = 0; i <= depth; i++) {
+            Py_INCREF(collect->path[i]);
+            PyTuple_SET_ITEM(stack, i, collect->path[i]);
+        }
+        PyObject *info = Py_BuildValue("Nld", stack, node->samples,
+                                       collect->factor * node->tt);
+        if (info == NULL) {
+            return -1;
+        }
+        int err = PyList_Append(collect->list, info);
+        Py_DECREF(info);
+        if (err < 0) {
+            return -1;
+        }
+    }
+    collect->depth = depth + 1;
+    int err = RotatingTree_Enum(node->children, samplesForNode, collect);
+    collect->depth = depth;
+    return err;
+}
+
+PyDoc_STRVAR(sampler_getstats_doc, "\
+getstats() -> list of (stack, samples, totaltime) tuples\n\
+\n\
+Return all the stacks recorded by the sampler.\n\
+'stack' is a tuple of code objects, from the outermost frame to\n\
+the frame at the top of the stack, 'samples' is how many times\n\
+it was recorded and 'totaltime' is the sum of the times passed\n\
+to sample() for it.\n\
+");
+
+static PyObject*
+sampler_getstats(SamplerObject *self, PyObject *noarg)
+{
+    samplecollector_t collect;
+    collect.depth = 0;
+    collect.factor = (double)1 / _PyTime_FromSeconds(1);
+    /* the deepest recorded stack has been walked by sample() */
+    collect.path = PyMem_New(PyObject *, Py_MAX(self->stack_size, 1));
+    if (collect.path == NULL) {
+        return PyErr_NoMemory();
+    }
+    collect.list = PyList_New(0);
+    if (collect.list != NULL
+        && RotatingTree_Enum(self->roots, samplesForNode, &collect) != 0) {
+        Py_CLEAR(collect.list);
+    }
+    PyMem_Free(collect.path);
+    return collect.list;
+}
+
+PyDoc_STRVAR(sampler_clear_doc, "\
+clear()\n\
+\n\
+Clear all the stacks recorded so far.\n\
+");
+
+static PyObject*
+sampler_clear(SamplerObject *self, PyObject *noarg)
+{
+    RotatingTree_Enum(self->roots, freeSamplerNode, NULL);
+    self->roots = EMPTY_ROTATING_TREE;
+    Py_RETURN_NONE;
+}
+
+static void
+sampler_dealloc(SamplerObject *op)
+{
+    RotatingTree_Enum(op->roots, freeSamplerNode, NULL);
+    PyMem_Free(op->stack);
+    PyTypeObject *tp = Py_TYPE(op);
+    tp->tp_free(op);
+    Py_DECREF(tp);
+}
+
+static PyMethodDef sampler_methods[] = {
+    {"sample",          (PyCFunction)sampler_sample,
+                    METH_O,                             sample_doc},
+    {"getstats",        (PyCFunction)sampler_getstats,
+                    METH_NOARGS,                        sampler_getstats_doc},
+    {"clear",           (PyCFunction)sampler_clear,
+                    METH_NOARGS,                        sampler_clear_doc},
+    {NULL, NULL}
+};
+
+PyDoc_STRVAR(sampler_doc, "\
+Sampler()\n\
+\n\
+    Builds an object aggregating samples of the Python stacks of\n\
+    threads into a call tree.  Samples are taken by calling sample(),\n\
+    usually from a dedicated thread at regular intervals.\n\
+");
+
+static PyType_Slot _lsprof_sampler_type_spec_slots[] = {
+    {Py_tp_doc, (void *)sampler_doc},
+    {Py_tp_methods, sampler_methods},
+    {Py_tp_dealloc, sampler_dealloc},
+    {Py_tp_alloc, PyType_GenericAlloc},
+    {Py_tp_new, PyType_GenericNew},
+    {Py_tp_free, PyObject_Del},
+    {0, 0}
+};
+
+static PyType_Spec _lsprof_sampler_type_spec = {
+    .name = "_lsprof.Sampler",
+    .basicsize = sizeof(SamplerObject),
+    .flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,
+    .slots = _lsprof_sampler_type_spec_slots,
+};
+
+/*** Module functions ***/
+
+/*[clinic input]
+_lsprof.stats_to_binary
+
+    stats: object(subclass_of='&PyDict_Type')
+    /
+
+Serialize profile statistics in a compact binary format.
+
+stats is a dictionary with the layout of the stats attribute of
+pstats.Stats.
+[clinic start generated code]*/
+
+static PyObject *
+_lsprof_stats_to_binary_impl(PyObject *module, PyObject *stats)
+/*[clinic end generated code: output=d38fb34c248248b8 input=563aa28ac2acc5f8]*/
+{
+    StatsBuilder builder;
+    PyObject *result = NULL;
+    if (stats_builder_init(&builder) == 0
+        && stats_builder_add_dict(&builder, stats) == 0) {
+        result = stats_builder_serialize(&builder);
+    }
+    stats_builder_fini(&builder);
+    return result;
+}
+
+/*[clinic input]
+_lsprof.stats_from_binary
+
+    data: Py_buffer
+    /
+
+Return the dictionary of profile statistics serialized in data.
+[clinic start generated code]*/
+
+static PyObject *
+_lsprof_stats_from_binary_impl(PyObject *module, Py_buffer *data)
+/*[clinic end generated code: output=035f0211c2f53f9a input=bf7d91b642a2f70c]*/
+{
+    StatsBuilder builder;
+    PyObject *result = NULL;
+    if (stats_builder_init(&builder) == 0
+        && stats_builder_add_binary(&builder, data->buf, data->len) == 0) {
+        result = stats_builder_to_dict(&builder);
+    }
+    stats_builder_fini(&builder);
+    return result;
+}
+
+/*[clinic input]
+_lsprof.merge_binary_stats
+
+    profiles: object
+    /
+
+Merge an iterable of profile statistics in the binary format.
+
+Return the sum of the statistics, in the binary format.
+[clinic start generated code]*/
+
+static PyObject *
+_lsprof_merge_binary_stats(PyObject *module, PyObject *profiles)
+/*[clinic end generated code: output=0493b86c80061fd1 input=b98e92ecf79c6548]*/
+{
+    StatsBuilder builder;
+    PyObject *iter, *item, *result = NULL;
+
+    iter = PyObject_GetIter(profiles);
+    if (iter == NULL) {
+        return NULL;
+    }
+    if (stats_builder_init(&builder) < 0) {
+        goto done;
+    }
+    while ((item = PyIter_Next(iter)) != NULL) {
+        Py_buffer view;
+        int err = PyObject_GetBuffer(item, &view, PyBUF_SIMPLE);
+        Py_DECREF(item);
+        if (err < 0) {
+            goto done;
+        }
+        err = stats_builder_add_binary(&builder, view.buf, view.len);
+        PyBuffer_Release(&view);
+        if (err < 0) {
+            goto done;
+        }
+    }
+    if (!PyErr_Occurred()) {
+        result = stats_builder_serialize(&builder);
+    }
+
+done:
+    Py_DECREF(iter);
+    stats_builder_fini(&builder);
+    return result;
+}
+
 static PyMethodDef moduleMethods[] = {
+    _LSPROF_STATS_TO_BINARY_METHODDEF
+    _LSPROF_STATS_FROM_BINARY_METHODDEF
+    _LSPROF_MERGE_BINARY_STATS_METHODDEF
     {NULL, NULL}
 };
 
@@ -820,6 +2048,7 @@ _lsprof_traverse(PyObject *module, visitproc visit, void *arg)
 {
     _lsprof_state *state = _lsprof_get_state(module);
     Py_VISIT(state->profiler_type);
+    Py_VISIT(state->sampler_type);
     Py_VISIT(state->stats_entry_type);
     Py_VISIT(state->stats_subentry_type);
     return 0;
@@ -830,6 +2059,7 @@ _lsprof_clear(PyObject *module)
 {
     _lsprof_state *state = _lsprof_get_state(module);
     Py_CLEAR(state->profiler_type);
+    Py_CLEAR(state->sampler_type);
     Py_CLEAR(state->stats_entry_type);
     Py_CLEAR(state->stats_subentry_type);
     return 0;
@@ -856,6 +2086,16 @@ _lsprof_exec(PyObject *module)
         return -1;
     }
 
+    state->sampler_type = (PyTypeObject *)PyType_FromModuleAndSpec(
+        module, &_lsprof_sampler_type_spec, NULL);
+    if (state->sampler_type == NULL) {
+        return -1;
+    }
+
+    if (PyModule_AddType(module, state->sampler_type) < 0) {
+        return -1;
+    }
+
     state->stats_entry_type = PyStructSequence_NewType(&profiler_entry_desc);
     if (state->stats_entry_type == NULL) {
         return -1;
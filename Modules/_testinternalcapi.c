@@ -14,6 +14,7 @@
 #include "Python.h"
 #include "pycore_atomic_funcs.h" // _Py_atomic_int_get()
 #include "pycore_bitutils.h"     // _Py_bswap32()
+#include "pycore_dtoa.h"         // _Py_dg_dtoa()
 #include "pycore_gc.h"           // PyGC_Head
 #include "pycore_hashtable.h"    // _Py_hashtable_new()
 #include "pycore_initconfig.h"   // _Py_GetConfigsAsDict()
@@ -365,6 +366,29 @@ test_edit_cost(PyObject *self, PyObject *Py_UNUSED(args))
 }
 
 
+#ifndef PY_NO_SHORT_FLOAT_REPR
+static PyObject *
+dg_dtoa(PyObject *self, PyObject *args)
+{
+    double x;
+    int mode, ndigits, decpt, sign;
+    char *digits, *end;
+
+    if (!PyArg_ParseTuple(args, "dii:dg_dtoa", &x, &mode, &ndigits)) {
+        return NULL;
+    }
+    digits = _Py_dg_dtoa(x, mode, ndigits, &decpt, &sign, &end);
+    if (digits == NULL) {
+        return PyErr_NoMemory();
+    }
+    PyObject *result = Py_BuildValue("(s#ii)", digits,
+                                     (Py_ssize_t)(end - digits), decpt, sign);
+    _Py_dg_freedtoa(digits);
+    return result;
+}
+#endif
+
+
 static PyMethodDef TestMethods[] = {
     {"get_configs", get_configs, METH_NOARGS},
     {"get_recursion_depth", get_recursion_depth, METH_NOARGS},
@@ -376,6 +400,9 @@ static PyMethodDef TestMethods[] = {
     {"set_config", test_set_config, METH_O},
     {"test_atomic_funcs", test_atomic_funcs, METH_NOARGS},
     {"test_edit_cost", test_edit_cost, METH_NOARGS},
+#ifndef PY_NO_SHORT_FLOAT_REPR
+    {"dg_dtoa", dg_dtoa, METH_VARARGS},
+#endif
     {NULL, NULL} /* sentinel */
 };
 
@@ -13,6 +13,16 @@
 #ifdef HAVE_SIGNAL_H
 #  include <signal.h>             // SIGINT
 #endif
+#if defined(HAVE_PTHREAD_H)
+#  include <pthread.h>            // pthread_getcpuclockid()
+#endif
+#if defined(HAVE_SYS_RESOURCE_H)
+#  include <sys/resource.h>       // getrusage()
+#endif
+
+#if defined(HAVE_PTHREAD_GETCPUCLOCKID) && defined(HAVE_CLOCK_GETTIME)
+#  define HAVE_THREAD_STATS
+#endif
 
 // ThreadError is just an alias to PyExc_RuntimeError
 #define ThreadError PyExc_RuntimeError
@@ -1532,6 +1542,160 @@ PyDoc_STRVAR(excepthook_doc,
 \n\
 Handle uncaught Thread.run() exception.");
 
+#ifdef HAVE_THREAD_STATS
+PyDoc_STRVAR(ThreadStats__doc__,
+"ThreadStats\n\
+\n\
+CPU time and context switches of a thread, see threading.Thread.stats().");
+
+static PyTypeObject ThreadStatsType;
+
+static PyStructSequence_Field ThreadStats_fields[] = {
+    {"cpu_time", "CPU time used by the thread, in seconds"},
+    {"voluntary_switches", "Number of voluntary context switches"},
+    {"involuntary_switches", "Number of involuntary context switches"},
+    {0}
+};
+
+static PyStructSequence_Desc ThreadStats_desc = {
+    .name = "_thread._ThreadStats",
+    .doc = ThreadStats__doc__,
+    .fields = ThreadStats_fields,
+    .n_in_sequence = 3
+};
+
+#ifdef __linux__
+/* Read the numbers of context switches of a thread from /proc */
+static int
+read_context_switches(unsigned long native_id,
+                      long long *voluntary, long long *involuntary)
+{
+    char path[64], line[256];
+    PyOS_snprintf(path, sizeof(path), "/proc/self/task/%lu/status",
+                  native_id);
+    FILE *fp = fopen(path, "re");
+    if (fp == NULL) {
+        return -1;
+    }
+    *voluntary = *involuntary = -1;
+    while (fgets(line, sizeof(line), fp) != NULL) {
+        sscanf(line, "voluntary_ctxt_switches: %lld", voluntary);
+        sscanf(line, "nonvoluntary_ctxt_switches: %lld", involuntary);
+    }
+    fclose(fp);
+    return (*voluntary >= 0 && *involuntary >= 0) ? 0 : -1;
+}
+#endif
+
+static PyObject *
+thread__get_thread_stats(PyObject *module, PyObject *args)
+{
+    PyObject *ident_obj, *native_id_obj = Py_None;
+    long long voluntary = -1, involuntary = -1;
+    clockid_t clk_id;
+    struct timespec ts;
+
+    if (!PyArg_ParseTuple(args, "O|O:_get_thread_stats",
+                          &ident_obj, &native_id_obj)) {
+        return NULL;
+    }
+    unsigned long ident = PyLong_AsUnsignedLong(ident_obj);
+    if (ident == (unsigned long)-1 && PyErr_Occurred()) {
+        return NULL;
+    }
+    unsigned long native_id = 0;
+    if (native_id_obj != Py_None) {
+        native_id = PyLong_AsUnsignedLong(native_id_obj);
+        if (native_id == (unsigned long)-1 && PyErr_Occurred()) {
+            return NULL;
+        }
+    }
+
+    /* The thread cannot exit while it has a thread state and we hold the
+       GIL, so its pthread_t stays valid. */
+    PyThreadState *tstate = _PyThreadState_GET();
+    PyThreadState *thread = PyInterpreterState_ThreadHead(tstate->interp);
+    while (thread != NULL && thread->thread_id != ident) {
+        thread = PyThreadState_Next(thread);
+    }
+    if (thread == NULL) {
+        PyErr_Format(PyExc_ValueError, "no thread with identifier %R",
+                     ident_obj);
+        return NULL;
+    }
+
+    if (thread == tstate) {
+        clk_id = CLOCK_THREAD_CPUTIME_ID;
+#ifdef RUSAGE_THREAD
+        struct rusage ru;
+        if (getrusage(RUSAGE_THREAD, &ru) == 0) {
+            voluntary = ru.ru_nvcsw;
+            involuntary = ru.ru_nivcsw;
+        }
+#endif
+    }
+    else {
+        int err = pthread_getcpuclockid((pthread_t)ident, &clk_id);
+        if (err) {
+            errno = err;
+            return PyErr_SetFromErrno(PyExc_OSError);
+        }
+    }
+    if (clock_gettime(clk_id, &ts) != 0) {
+        return PyErr_SetFromErrno(PyExc_OSError);
+    }
+
+#ifdef __linux__
+    if (voluntary < 0 && native_id_obj != Py_None) {
+        int res;
+        Py_BEGIN_ALLOW_THREADS
+        res = read_context_switches(native_id, &voluntary, &involuntary);
+        Py_END_ALLOW_THREADS
+        if (res < 0) {
+            voluntary = involuntary = -1;
+        }
+    }
+#endif
+
+    PyObject *stats = PyStructSequence_New(&ThreadStatsType);
+    if (stats == NULL) {
+        return NULL;
+    }
+    PyObject *cpu_time = PyFloat_FromDouble(ts.tv_sec + ts.tv_nsec * 1e-9);
+    if (cpu_time == NULL) {
+        Py_DECREF(stats);
+        return NULL;
+    }
+    PyStructSequence_SET_ITEM(stats, 0, cpu_time);
+    for (int i = 1; i <= 2; i++) {
+        long long count = i == 1 ? voluntary : involuntary;
+        PyObject *item;
+        if (count < 0) {
+            item = Py_None;
+            Py_INCREF(item);
+        }
+        else {
+            item = PyLong_FromLongLong(count);
+            if (item == NULL) {
+                Py_DECREF(stats);
+                return NULL;
+            }
+        }
+        PyStructSequence_SET_ITEM(stats, i, item);
+    }
+    return stats;
+}
+
+PyDoc_STRVAR(_get_thread_stats_doc,
+"_get_thread_stats(ident, native_id=None) -> ThreadStats\n\
+\n\
+Return the CPU time and the numbers of context switches of the thread\n\
+with the given identifier, which must have a Python thread state in the\n\
+current interpreter.  The numbers of context switches of other threads\n\
+than the current one are only available if native_id is given.\n\
+(internal use only)");
+#endif
+
 static PyMethodDef thread_methods[] = {
     {"start_new_thread",        (PyCFunction)thread_PyThread_start_new_thread,
      METH_VARARGS, start_new_doc},
@@ -1561,6 +1725,10 @@ static PyMethodDef thread_methods[] = {
      METH_NOARGS, _set_sentinel_doc},
     {"_excepthook",              thread_excepthook,
      METH_O, excepthook_doc},
+#ifdef HAVE_THREAD_STATS
+    {"_get_thread_stats",       thread__get_thread_stats,
+     METH_VARARGS, _get_thread_stats_doc},
+#endif
     {NULL,                      NULL}           /* sentinel */
 };
 
@@ -1626,6 +1794,18 @@ thread_module_exec(PyObject *module)
         return -1;
     }
 
+#ifdef HAVE_THREAD_STATS
+    if (ThreadStatsType.tp_name == NULL) {
+        if (PyStructSequence_InitType2(&ThreadStatsType,
+                                       &ThreadStats_desc) < 0) {
+            return -1;
+        }
+    }
+    if (PyModule_AddType(module, &ThreadStatsType) < 0) {
+        return -1;
+    }
+#endif
+
     // TIMEOUT_MAX
     double timeout_max = (_PyTime_t)PY_TIMEOUT_MAX * 1e-6;
     double time_max = _PyTime_AsSecondsDouble(_PyTime_MAX);
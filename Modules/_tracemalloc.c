@@ -130,6 +130,27 @@ static _Py_hashtable_t *tracemalloc_traces = NULL;
    Protected by TABLES_LOCK(). */
 static _Py_hashtable_t *tracemalloc_domains = NULL;
 
+/* Mean number of bytes between two sampled memory blocks, or 0 if every
+   memory block is traced.  Only modified while tracing is stopped. */
+static size_t tracemalloc_sampling_interval = 0;
+
+/* Number of bytes left to allocate before the next sample, and the state
+   of the xorshift64* generator used to draw it.
+   Protected by the GIL: the decision to sample a memory block is taken
+   before TABLES_LOCK() is acquired, to keep the cost of memory blocks which
+   are not sampled low. */
+static size_t tracemalloc_bytes_until_sample = 0;
+static uint64_t tracemalloc_sampling_rng = 0;
+
+/* In sampling mode, counting filter of the addresses of traced memory
+   blocks: most memory blocks are not traced, and the filter avoids taking
+   TABLES_LOCK() to look them up when they are released.  A counter stays
+   at UINT8_MAX once it is saturated.
+   Protected by TABLES_LOCK(), but read without it. */
+#define SAMPLED_FILTER_BITS 20
+#define SAMPLED_FILTER_SIZE ((size_t)1 << SAMPLED_FILTER_BITS)
+static uint8_t *tracemalloc_sampled_filter = NULL;
+
 
 #ifdef TRACE_DEBUG
 static void
@@ -205,6 +226,34 @@ set_reentrant(int reentrant)
 #endif
 
 
+/* In sampling mode, functions called with the GIL held use a reentrant flag
+   protected by the GIL rather than the thread local one: most memory blocks
+   are not traced, and accessing a thread local variable would dominate the
+   cost of allocating them. */
+static int tracemalloc_gil_reentrant = 0;
+
+static inline int
+get_reentrant_gil(void)
+{
+    if (tracemalloc_sampling_interval) {
+        return tracemalloc_gil_reentrant;
+    }
+    return get_reentrant();
+}
+
+static inline void
+set_reentrant_gil(int reentrant)
+{
+    if (tracemalloc_sampling_interval) {
+        assert(reentrant != tracemalloc_gil_reentrant);
+        tracemalloc_gil_reentrant = reentrant;
+    }
+    else {
+        set_reentrant(reentrant);
+    }
+}
+
+
 static Py_uhash_t
 hashtable_hash_pyobject(const void *key)
 {
@@ -261,6 +310,25 @@ raw_free(void *ptr)
 }
 
 
+static inline uint8_t *
+sampled_filter_entry(uintptr_t ptr)
+{
+    /* Fibonacci hashing of the address */
+    uint64_t hash = (uint64_t)ptr * UINT64_C(0x9E3779B97F4A7C15);
+    return &tracemalloc_sampled_filter[hash >> (64 - SAMPLED_FILTER_BITS)];
+}
+
+
+/* Return 0 if no memory block is traced at the address ptr, or 1 if a
+   memory block may be traced at ptr. */
+static inline int
+tracemalloc_maybe_traced(uintptr_t ptr)
+{
+    return (tracemalloc_sampling_interval == 0
+            || *sampled_filter_entry(ptr) != 0);
+}
+
+
 static Py_uhash_t
 hashtable_hash_traceback(const void *key)
 {
@@ -508,6 +576,12 @@ tracemalloc_remove_trace(unsigned int domain, uintptr_t ptr)
     if (!trace) {
         return;
     }
+    if (tracemalloc_sampling_interval) {
+        uint8_t *count = sampled_filter_entry(ptr);
+        if (*count != UINT8_MAX) {
+            *count -= 1;
+        }
+    }
     assert(tracemalloc_traced_memory >= trace->size);
     tracemalloc_traced_memory -= trace->size;
     raw_free(trace);
@@ -517,6 +591,49 @@ tracemalloc_remove_trace(unsigned int domain, uintptr_t ptr)
             tracemalloc_remove_trace(DEFAULT_DOMAIN, (uintptr_t)(ptr))
 
 
+/* Draw the distance in bytes to the next sample from an exponential
+   distribution, so that sampled bytes form a Poisson process: a memory
+   block of size bytes is sampled with probability 1 - exp(-size/interval). */
+static size_t
+tracemalloc_next_sample(void)
+{
+    uint64_t x = tracemalloc_sampling_rng;
+    x ^= x >> 12;
+    x ^= x << 25;
+    x ^= x >> 27;
+    tracemalloc_sampling_rng = x;
+    x *= UINT64_C(0x2545F4914F6CDD1D);
+
+    /* uniform in (0.0, 1.0] */
+    double u = ((x >> 11) + 1) * (1.0 / 9007199254740992.0);
+    double distance = -log(u) * (double)tracemalloc_sampling_interval;
+    if (distance < 1.0) {
+        return 1;
+    }
+    if (distance >= (double)PY_SSIZE_T_MAX) {
+        return PY_SSIZE_T_MAX;
+    }
+    return (size_t)distance;
+}
+
+
+/* Return 1 if a new memory block of size bytes must be traced.
+   The caller must hold the GIL. */
+static inline int
+tracemalloc_sample(size_t size)
+{
+    if (tracemalloc_sampling_interval == 0) {
+        return 1;
+    }
+    if (size < tracemalloc_bytes_until_sample) {
+        tracemalloc_bytes_until_sample -= size;
+        return 0;
+    }
+    tracemalloc_bytes_until_sample = tracemalloc_next_sample();
+    return 1;
+}
+
+
 static int
 tracemalloc_add_trace(unsigned int domain, uintptr_t ptr,
                       size_t size)
@@ -563,6 +680,12 @@ tracemalloc_add_trace(unsigned int domain, uintptr_t ptr,
             raw_free(trace);
             return res;
         }
+        if (tracemalloc_sampling_interval) {
+            uint8_t *count = sampled_filter_entry(ptr);
+            if (*count != UINT8_MAX) {
+                *count += 1;
+            }
+        }
     }
 
     assert(tracemalloc_traced_memory <= SIZE_MAX - size);
@@ -592,6 +715,10 @@ tracemalloc_alloc(int use_calloc, void *ctx, size_t nelem, size_t elsize)
     if (ptr == NULL)
         return NULL;
 
+    if (!tracemalloc_sample(nelem * elsize)) {
+        return ptr;
+    }
+
     TABLES_LOCK();
     if (ADD_TRACE(ptr, nelem * elsize) < 0) {
         /* Failed to allocate a trace for the new memory block */
@@ -617,6 +744,15 @@ tracemalloc_realloc(void *ctx, void *ptr, size_t new_size)
     if (ptr != NULL) {
         /* an existing memory block has been resized */
 
+        if (!tracemalloc_sample(new_size)) {
+            if (tracemalloc_maybe_traced((uintptr_t)ptr)) {
+                TABLES_LOCK();
+                REMOVE_TRACE(ptr);
+                TABLES_UNLOCK();
+            }
+            return ptr2;
+        }
+
         TABLES_LOCK();
 
         /* tracemalloc_add_trace() updates the trace if there is already
@@ -642,6 +778,10 @@ tracemalloc_realloc(void *ctx, void *ptr, size_t new_size)
     else {
         /* new allocation */
 
+        if (!tracemalloc_sample(new_size)) {
+            return ptr2;
+        }
+
         TABLES_LOCK();
         if (ADD_TRACE(ptr2, new_size) < 0) {
             /* Failed to allocate a trace for the new memory block */
@@ -668,6 +808,10 @@ tracemalloc_free(void *ctx, void *ptr)
 
     alloc->free(alloc->ctx, ptr);
 
+    if (!tracemalloc_maybe_traced((uintptr_t)ptr)) {
+        return;
+    }
+
     TABLES_LOCK();
     REMOVE_TRACE(ptr);
     TABLES_UNLOCK();
@@ -679,7 +823,7 @@ tracemalloc_alloc_gil(int use_calloc, void *ctx, size_t nelem, size_t elsize)
 {
     void *ptr;
 
-    if (get_reentrant()) {
+    if (get_reentrant_gil()) {
         PyMemAllocatorEx *alloc = (PyMemAllocatorEx *)ctx;
         if (use_calloc)
             return alloc->calloc(alloc->ctx, nelem, elsize);
@@ -690,11 +834,11 @@ tracemalloc_alloc_gil(int use_calloc, void *ctx, size_t nelem, size_t elsize)
     /* Ignore reentrant call. PyObjet_Malloc() calls PyMem_Malloc() for
        allocations larger than 512 bytes, don't trace the same memory
        allocation twice. */
-    set_reentrant(1);
+    set_reentrant_gil(1);
 
     ptr = tracemalloc_alloc(use_calloc, ctx, nelem, elsize);
 
-    set_reentrant(0);
+    set_reentrant_gil(0);
     return ptr;
 }
 
@@ -718,7 +862,7 @@ tracemalloc_realloc_gil(void *ctx, void *ptr, size_t new_size)
 {
     void *ptr2;
 
-    if (get_reentrant()) {
+    if (get_reentrant_gil()) {
         /* Reentrant call to PyMem_Realloc() and PyMem_RawRealloc().
            Example: PyMem_RawRealloc() is called internally by pymalloc
            (_PyObject_Malloc() and  _PyObject_Realloc()) to allocate a new
@@ -737,16 +881,50 @@ tracemalloc_realloc_gil(void *ctx, void *ptr, size_t new_size)
     /* Ignore reentrant call. PyObjet_Realloc() calls PyMem_Realloc() for
        allocations larger than 512 bytes. Don't trace the same memory
        allocation twice. */
-    set_reentrant(1);
+    set_reentrant_gil(1);
 
     ptr2 = tracemalloc_realloc(ctx, ptr, new_size);
 
-    set_reentrant(0);
+    set_reentrant_gil(0);
     return ptr2;
 }
 
 
 #ifdef TRACE_RAW_MALLOC
+static void*
+tracemalloc_raw_alloc_untraced(int use_calloc, void *ctx,
+                               size_t nelem, size_t elsize)
+{
+    PyMemAllocatorEx *alloc = (PyMemAllocatorEx *)ctx;
+    if (use_calloc)
+        return alloc->calloc(alloc->ctx, nelem, elsize);
+    else
+        return alloc->malloc(alloc->ctx, nelem * elsize);
+}
+
+
+static void*
+tracemalloc_raw_realloc_untraced(void *ctx, void *ptr, size_t new_size)
+{
+    PyMemAllocatorEx *alloc = (PyMemAllocatorEx *)ctx;
+    void *ptr2;
+
+    ptr2 = alloc->realloc(alloc->ctx, ptr, new_size);
+
+    if (ptr2 != NULL && ptr != NULL) {
+        TABLES_LOCK();
+        REMOVE_TRACE(ptr);
+        TABLES_UNLOCK();
+    }
+    return ptr2;
+}
+
+
+/* In sampling mode, the functions called with the GIL held only set
+   tracemalloc_gil_reentrant, not the thread local flag.  Once the GIL is
+   held, tracemalloc_gil_reentrant can only have been set by the current
+   thread: the raw functions check it after PyGILState_Ensure(). */
+
 static void*
 tracemalloc_raw_alloc(int use_calloc, void *ctx, size_t nelem, size_t elsize)
 {
@@ -754,11 +932,7 @@ tracemalloc_raw_alloc(int use_calloc, void *ctx, size_t nelem, size_t elsize)
     void *ptr;
 
     if (get_reentrant()) {
-        PyMemAllocatorEx *alloc = (PyMemAllocatorEx *)ctx;
-        if (use_calloc)
-            return alloc->calloc(alloc->ctx, nelem, elsize);
-        else
-            return alloc->malloc(alloc->ctx, nelem * elsize);
+        return tracemalloc_raw_alloc_untraced(use_calloc, ctx, nelem, elsize);
     }
 
     /* Ignore reentrant call. PyGILState_Ensure() may call PyMem_RawMalloc()
@@ -767,7 +941,12 @@ tracemalloc_raw_alloc(int use_calloc, void *ctx, size_t nelem, size_t elsize)
     set_reentrant(1);
 
     gil_state = PyGILState_Ensure();
-    ptr = tracemalloc_alloc(use_calloc, ctx, nelem, elsize);
+    if (tracemalloc_gil_reentrant) {
+        ptr = tracemalloc_raw_alloc_untraced(use_calloc, ctx, nelem, elsize);
+    }
+    else {
+        ptr = tracemalloc_alloc(use_calloc, ctx, nelem, elsize);
+    }
     PyGILState_Release(gil_state);
 
     set_reentrant(0);
@@ -797,16 +976,7 @@ tracemalloc_raw_realloc(void *ctx, void *ptr, size_t new_size)
 
     if (get_reentrant()) {
         /* Reentrant call to PyMem_RawRealloc(). */
-        PyMemAllocatorEx *alloc = (PyMemAllocatorEx *)ctx;
-
-        ptr2 = alloc->realloc(alloc->ctx, ptr, new_size);
-
-        if (ptr2 != NULL && ptr != NULL) {
-            TABLES_LOCK();
-            REMOVE_TRACE(ptr);
-            TABLES_UNLOCK();
-        }
-        return ptr2;
+        return tracemalloc_raw_realloc_untraced(ctx, ptr, new_size);
     }
 
     /* Ignore reentrant call. PyGILState_Ensure() may call PyMem_RawMalloc()
@@ -815,7 +985,12 @@ tracemalloc_raw_realloc(void *ctx, void *ptr, size_t new_size)
     set_reentrant(1);
 
     gil_state = PyGILState_Ensure();
-    ptr2 = tracemalloc_realloc(ctx, ptr, new_size);
+    if (tracemalloc_gil_reentrant) {
+        ptr2 = tracemalloc_raw_realloc_untraced(ctx, ptr, new_size);
+    }
+    else {
+        ptr2 = tracemalloc_realloc(ctx, ptr, new_size);
+    }
     PyGILState_Release(gil_state);
 
     set_reentrant(0);
@@ -844,6 +1019,9 @@ tracemalloc_clear_traces(void)
     _Py_hashtable_clear(tracemalloc_domains);
     tracemalloc_traced_memory = 0;
     tracemalloc_peak_traced_memory = 0;
+    if (tracemalloc_sampled_filter != NULL) {
+        memset(tracemalloc_sampled_filter, 0, SAMPLED_FILTER_SIZE);
+    }
     TABLES_UNLOCK();
 
     _Py_hashtable_clear(tracemalloc_tracebacks);
@@ -936,6 +1114,9 @@ tracemalloc_deinit(void)
     _Py_hashtable_destroy(tracemalloc_tracebacks);
     _Py_hashtable_destroy(tracemalloc_filenames);
 
+    raw_free(tracemalloc_sampled_filter);
+    tracemalloc_sampled_filter = NULL;
+
 #if defined(TRACE_RAW_MALLOC)
     if (tables_lock != NULL) {
         PyThread_free_lock(tables_lock);
@@ -952,7 +1133,7 @@ tracemalloc_deinit(void)
 
 
 static int
-tracemalloc_start(int max_nframe)
+tracemalloc_start(int max_nframe, Py_ssize_t sampling_interval)
 {
     PyMemAllocatorEx alloc;
     size_t size;
@@ -964,6 +1145,12 @@ tracemalloc_start(int max_nframe)
         return -1;
     }
 
+    if (sampling_interval < 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "the sampling interval must not be negative");
+        return -1;
+    }
+
     if (tracemalloc_init() < 0) {
         return -1;
     }
@@ -975,6 +1162,17 @@ tracemalloc_start(int max_nframe)
 
     _Py_tracemalloc_config.max_nframe = max_nframe;
 
+    if (sampling_interval && tracemalloc_sampled_filter == NULL) {
+        /* the filter is not released by tracemalloc_stop(): tracemalloc_free()
+           reads it without holding the GIL nor TABLES_LOCK() */
+        tracemalloc_sampled_filter = raw_malloc(SAMPLED_FILTER_SIZE);
+        if (tracemalloc_sampled_filter == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        memset(tracemalloc_sampled_filter, 0, SAMPLED_FILTER_SIZE);
+    }
+
     /* allocate a buffer to store a new traceback */
     size = TRACEBACK_SIZE(max_nframe);
     assert(tracemalloc_traceback == NULL);
@@ -984,6 +1182,17 @@ tracemalloc_start(int max_nframe)
         return -1;
     }
 
+    tracemalloc_sampling_interval = (size_t)sampling_interval;
+    if (sampling_interval) {
+        if (_PyOS_URandomNonblock(&tracemalloc_sampling_rng,
+                                  sizeof(tracemalloc_sampling_rng)) < 0) {
+            PyErr_Clear();
+        }
+        /* xorshift64* must not be seeded with zero */
+        tracemalloc_sampling_rng |= 1;
+        tracemalloc_bytes_until_sample = tracemalloc_next_sample();
+    }
+
 #ifdef TRACE_RAW_MALLOC
     alloc.malloc = tracemalloc_raw_malloc;
     alloc.calloc = tracemalloc_raw_calloc;
@@ -1032,6 +1241,7 @@ tracemalloc_stop(void)
     PyMem_SetAllocator(PYMEM_DOMAIN_OBJ, &allocators.obj);
 
     tracemalloc_clear_traces();
+    tracemalloc_sampling_interval = 0;
 
     /* release memory */
     raw_free(tracemalloc_traceback);
@@ -1067,9 +1277,9 @@ _tracemalloc_clear_traces_impl(PyObject *module)
     if (!_Py_tracemalloc_config.tracing)
         Py_RETURN_NONE;
 
-    set_reentrant(1);
+    set_reentrant_gil(1);
     tracemalloc_clear_traces();
-    set_reentrant(0);
+    set_reentrant_gil(0);
 
     Py_RETURN_NONE;
 }
@@ -1375,7 +1585,7 @@ _tracemalloc__get_traces_impl(PyObject *module)
     }
 
     // Convert traces to a list of tuples
-    set_reentrant(1);
+    set_reentrant_gil(1);
     int err = _Py_hashtable_foreach(get_traces.traces,
                                     tracemalloc_get_traces_fill,
                                     &get_traces);
@@ -1384,7 +1594,7 @@ _tracemalloc__get_traces_impl(PyObject *module)
                                     tracemalloc_get_traces_domain,
                                     &get_traces);
     }
-    set_reentrant(0);
+    set_reentrant_gil(0);
     if (err) {
         goto error;
     }
@@ -1522,18 +1732,24 @@ _tracemalloc.start
 
     nframe: int = 1
     /
+    *
+    sampling_interval: Py_ssize_t = 0
 
 Start tracing Python memory allocations.
 
 Also set the maximum number of frames stored in the traceback of a
 trace to nframe.
+
+If sampling_interval is greater than zero, only trace a random sample of
+the memory blocks, on average one per sampling_interval bytes allocated.
 [clinic start generated code]*/
 
 static PyObject *
-_tracemalloc_start_impl(PyObject *module, int nframe)
-/*[clinic end generated code: output=caae05c23c159d3c input=40d849b5b29d1933]*/
+_tracemalloc_start_impl(PyObject *module, int nframe,
+                        Py_ssize_t sampling_interval)
+/*[clinic end generated code: output=f521f11b9fa9943e input=62279090502f8e59]*/
 {
-    if (tracemalloc_start(nframe) < 0) {
+    if (tracemalloc_start(nframe, sampling_interval) < 0) {
         return NULL;
     }
     Py_RETURN_NONE;
@@ -1574,6 +1790,22 @@ _tracemalloc_get_traceback_limit_impl(PyObject *module)
 }
 
 
+/*[clinic input]
+_tracemalloc.get_sampling_interval
+
+Get the mean number of bytes allocated between two traced memory blocks.
+
+Return 0 if every memory block is traced.
+[clinic start generated code]*/
+
+static PyObject *
+_tracemalloc_get_sampling_interval_impl(PyObject *module)
+/*[clinic end generated code: output=5011d3b4ab086319 input=31c05f21225be6ba]*/
+{
+    return PyLong_FromSize_t(tracemalloc_sampling_interval);
+}
+
+
 static int
 tracemalloc_get_tracemalloc_memory_cb(_Py_hashtable_t *domains,
                                       const void *key, const void *value,
@@ -1672,6 +1904,7 @@ static PyMethodDef module_methods[] = {
     _TRACEMALLOC_START_METHODDEF
     _TRACEMALLOC_STOP_METHODDEF
     _TRACEMALLOC_GET_TRACEBACK_LIMIT_METHODDEF
+    _TRACEMALLOC_GET_SAMPLING_INTERVAL_METHODDEF
     _TRACEMALLOC_GET_TRACEMALLOC_MEMORY_METHODDEF
     _TRACEMALLOC_GET_TRACED_MEMORY_METHODDEF
     _TRACEMALLOC_RESET_PEAK_METHODDEF
@@ -1715,7 +1948,7 @@ _PyTraceMalloc_Init(int nframe)
     if (nframe == 0) {
         return 0;
     }
-    return tracemalloc_start(nframe);
+    return tracemalloc_start(nframe, 0);
 }
 
 
@@ -1741,7 +1974,14 @@ PyTraceMalloc_Track(unsigned int domain, uintptr_t ptr,
     gil_state = PyGILState_Ensure();
 
     TABLES_LOCK();
-    res = tracemalloc_add_trace(domain, ptr, size);
+    if (tracemalloc_sample(size)) {
+        res = tracemalloc_add_trace(domain, ptr, size);
+    }
+    else {
+        /* the memory block may reuse the address of a traced block */
+        tracemalloc_remove_trace(domain, ptr);
+        res = 0;
+    }
     TABLES_UNLOCK();
 
     PyGILState_Release(gil_state);
@@ -1789,6 +2029,10 @@ _PyTraceMalloc_NewReference(PyObject *op)
         ptr = (uintptr_t)op;
     }
 
+    if (!tracemalloc_maybe_traced(ptr)) {
+        return -1;
+    }
+
     int res = -1;
 
     TABLES_LOCK();
@@ -1133,6 +1133,901 @@ array_array_count(arrayobject *self, PyObject *v)
 }
 
 
+/* Reductions over the items of an array, computed directly on the C values
+   instead of on the objects created by getitem. */
+
+/* Call MACRO with the C type of the items of an integer array.  The
+   signed and unsigned variants of each type are dispatched separately. */
+#define DISPATCH_SIGNED(typecode, MACRO)                \
+    switch (typecode) {                                 \
+    case 'b': MACRO(signed char); break;                \
+    case 'h': MACRO(short); break;                      \
+    case 'i': MACRO(int); break;                        \
+    case 'l': MACRO(long); break;                       \
+    case 'q': MACRO(long long); break;                  \
+    default: Py_UNREACHABLE();                          \
+    }
+
+#define DISPATCH_UNSIGNED(typecode, MACRO)              \
+    switch (typecode) {                                 \
+    case 'B': MACRO(unsigned char); break;              \
+    case 'H': MACRO(unsigned short); break;             \
+    case 'I': MACRO(unsigned int); break;               \
+    case 'L': MACRO(unsigned long); break;              \
+    case 'Q': MACRO(unsigned long long); break;         \
+    default: Py_UNREACHABLE();                          \
+    }
+
+static int
+check_numeric_array(arrayobject *self)
+{
+    if (!self->ob_descr->is_integer_type && self->ob_descr->typecode != 'f'
+        && self->ob_descr->typecode != 'd')
+    {
+        PyErr_Format(PyExc_TypeError,
+                     "'%c' arrays do not support arithmetic",
+                     self->ob_descr->typecode);
+        return -1;
+    }
+    return 0;
+}
+
+/* Exact integer sums are accumulated in a C integer, which is added to the
+   Python int *total whenever the next addition would overflow it. */
+static int
+intsum_flush(PyObject **total, PyObject *value)
+{
+    PyObject *sum;
+
+    if (value == NULL)
+        return -1;
+    if (*total == NULL) {
+        *total = value;
+        return 0;
+    }
+    sum = PyNumber_Add(*total, value);
+    Py_DECREF(value);
+    Py_SETREF(*total, sum);
+    return sum == NULL ? -1 : 0;
+}
+
+Py_LOCAL_INLINE(int)
+intsum_add_signed(PyObject **total, long long *acc, long long x)
+{
+    if (x > 0 ? *acc > LLONG_MAX - x : *acc < LLONG_MIN - x) {
+        if (intsum_flush(total, PyLong_FromLongLong(*acc)) < 0)
+            return -1;
+        *acc = 0;
+    }
+    *acc += x;
+    return 0;
+}
+
+Py_LOCAL_INLINE(int)
+intsum_add_unsigned(PyObject **total, unsigned long long *acc,
+                    unsigned long long x)
+{
+    if (*acc > ULLONG_MAX - x) {
+        if (intsum_flush(total, PyLong_FromUnsignedLongLong(*acc)) < 0)
+            return -1;
+        *acc = 0;
+    }
+    *acc += x;
+    return 0;
+}
+
+/* Products of items that could overflow are computed with Python ints. */
+static PyObject *
+int_product(long long x, long long y)
+{
+    PyObject *a, *b, *product;
+
+    a = PyLong_FromLongLong(x);
+    b = PyLong_FromLongLong(y);
+    product = (a && b) ? PyNumber_Multiply(a, b) : NULL;
+    Py_XDECREF(a);
+    Py_XDECREF(b);
+    return product;
+}
+
+static PyObject *
+uint_product(unsigned long long x, unsigned long long y)
+{
+    PyObject *a, *b, *product;
+
+    a = PyLong_FromUnsignedLongLong(x);
+    b = PyLong_FromUnsignedLongLong(y);
+    product = (a && b) ? PyNumber_Multiply(a, b) : NULL;
+    Py_XDECREF(a);
+    Py_XDECREF(b);
+    return product;
+}
+
+static PyObject *
+intsum_finish(PyObject *total, PyObject *acc)
+{
+    if (intsum_flush(&total, acc) < 0) {
+        Py_XDECREF(total);
+        return NULL;
+    }
+    return total;
+}
+
+/*[clinic input]
+array.array.sum
+
+Return the sum of the items of the array.
+
+The result is the same as sum(array), but no object is created for each
+item.  The sum of an integer array is exact, and a float array is summed
+in double precision, in order.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_sum_impl(arrayobject *self)
+/*[clinic end generated code: output=1fea0a058435b932 input=aac8aa28e26ac950]*/
+{
+    Py_ssize_t i, n = Py_SIZE(self);
+    char typecode = self->ob_descr->typecode;
+    PyObject *total = NULL;
+
+    if (check_numeric_array(self) < 0)
+        return NULL;
+
+    if (typecode == 'f' || typecode == 'd') {
+        double sum = 0.0;
+        if (typecode == 'f') {
+            const float *items = (const float *)self->ob_item;
+            for (i = 0; i < n; i++)
+                sum += items[i];
+        }
+        else {
+            const double *items = (const double *)self->ob_item;
+            for (i = 0; i < n; i++)
+                sum += items[i];
+        }
+        return PyFloat_FromDouble(sum);
+    }
+
+    if (self->ob_descr->is_signed) {
+        long long acc = 0;
+#define SUM(TYPE) {                                                 \
+        const TYPE *items = (const TYPE *)self->ob_item;            \
+        for (i = 0; i < n; i++) {                                   \
+            if (intsum_add_signed(&total, &acc, items[i]) < 0)      \
+                goto error;                                         \
+        }                                                           \
+    }
+        DISPATCH_SIGNED(typecode, SUM)
+#undef SUM
+        return intsum_finish(total, PyLong_FromLongLong(acc));
+    }
+    else {
+        unsigned long long acc = 0;
+#define SUM(TYPE) {                                                 \
+        const TYPE *items = (const TYPE *)self->ob_item;            \
+        for (i = 0; i < n; i++) {                                   \
+            if (intsum_add_unsigned(&total, &acc, items[i]) < 0)    \
+                goto error;                                         \
+        }                                                           \
+    }
+        DISPATCH_UNSIGNED(typecode, SUM)
+#undef SUM
+        return intsum_finish(total, PyLong_FromUnsignedLongLong(acc));
+    }
+
+  error:
+    Py_XDECREF(total);
+    return NULL;
+}
+
+/* Return the index of the first smallest (if sign is 1) or largest (if sign
+   is -1) item of a non-empty array, with the comparisons done by min() and
+   max(). */
+static Py_ssize_t
+array_extreme_index(arrayobject *self, int sign)
+{
+    Py_ssize_t i, best = 0, n = Py_SIZE(self);
+
+#define EXTREME(TYPE) {                                             \
+        const TYPE *items = (const TYPE *)self->ob_item;            \
+        if (sign > 0) {                                             \
+            for (i = 1; i < n; i++) {                               \
+                if (items[i] < items[best])                         \
+                    best = i;                                       \
+            }                                                       \
+        }                                                           \
+        else {                                                      \
+            for (i = 1; i < n; i++) {                               \
+                if (items[i] > items[best])                         \
+                    best = i;                                       \
+            }                                                       \
+        }                                                           \
+    }
+    switch (self->ob_descr->typecode) {
+    case 'f': EXTREME(float); break;
+    case 'd': EXTREME(double); break;
+    default:
+        if (self->ob_descr->is_signed) {
+            DISPATCH_SIGNED(self->ob_descr->typecode, EXTREME)
+        }
+        else {
+            DISPATCH_UNSIGNED(self->ob_descr->typecode, EXTREME)
+        }
+    }
+#undef EXTREME
+    return best;
+}
+
+static PyObject *
+array_extreme(arrayobject *self, int sign, const char *name)
+{
+    if (check_numeric_array(self) < 0)
+        return NULL;
+    if (Py_SIZE(self) == 0) {
+        PyErr_Format(PyExc_ValueError, "%s() of an empty array", name);
+        return NULL;
+    }
+    return getarrayitem((PyObject *)self, array_extreme_index(self, sign));
+}
+
+/*[clinic input]
+array.array.min
+
+Return the smallest item of the array.
+
+The result is the same as min(array).  Raise ValueError if the array is
+empty.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_min_impl(arrayobject *self)
+/*[clinic end generated code: output=f87ea946f2832bda input=94bcc37275d46dcd]*/
+{
+    return array_extreme(self, 1, "min");
+}
+
+/*[clinic input]
+array.array.max
+
+Return the largest item of the array.
+
+The result is the same as max(array).  Raise ValueError if the array is
+empty.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_max_impl(arrayobject *self)
+/*[clinic end generated code: output=a7d50dfabda245cf input=7431867d7664d592]*/
+{
+    return array_extreme(self, -1, "max");
+}
+
+/* Magnitude below which the product of two integer items can't overflow
+   a long long. */
+#define DOT_SAFE_FACTOR (1LL << 31)
+
+/* Check that other is a numeric array with the same typecode and length as
+   self, for the method name. */
+static int
+check_array_operand(arrayobject *self, PyObject *other, array_state *state,
+                    const char *name)
+{
+    if (!array_Check(other, state)) {
+        PyErr_Format(PyExc_TypeError,
+                     "%s() argument must be an array, not %.200s",
+                     name, Py_TYPE(other)->tp_name);
+        return -1;
+    }
+    if (((arrayobject *)other)->ob_descr != self->ob_descr) {
+        PyErr_Format(PyExc_TypeError,
+                     "%s() arrays must have the same typecode", name);
+        return -1;
+    }
+    if (Py_SIZE(other) != Py_SIZE(self)) {
+        PyErr_Format(PyExc_ValueError,
+                     "%s() arrays must have the same length", name);
+        return -1;
+    }
+    return check_numeric_array(self);
+}
+
+/*[clinic input]
+array.array.dot
+
+    cls: defining_class
+    other: object
+    /
+
+Return the sum of the products of the items of two arrays.
+
+The arrays must have the same typecode and length.  The result is the same
+as sum(x * y for x, y in zip(array, other)), but no object is created for
+each item.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_dot_impl(arrayobject *self, PyTypeObject *cls, PyObject *other)
+/*[clinic end generated code: output=caed11dcd2abbb81 input=8de7b9444dc2cf8d]*/
+{
+    array_state *state = get_array_state_by_class(cls);
+    arrayobject *b;
+    Py_ssize_t i, n = Py_SIZE(self);
+    char typecode = self->ob_descr->typecode;
+    PyObject *total = NULL;
+
+    if (check_array_operand(self, other, state, "dot") < 0)
+        return NULL;
+    b = (arrayobject *)other;
+
+    if (typecode == 'f' || typecode == 'd') {
+        double sum = 0.0;
+        if (typecode == 'f') {
+            const float *x = (const float *)self->ob_item;
+            const float *y = (const float *)b->ob_item;
+            for (i = 0; i < n; i++)
+                sum += (double)x[i] * (double)y[i];
+        }
+        else {
+            const double *x = (const double *)self->ob_item;
+            const double *y = (const double *)b->ob_item;
+            for (i = 0; i < n; i++)
+                sum += x[i] * y[i];
+        }
+        return PyFloat_FromDouble(sum);
+    }
+
+    /* Products of items of at most 4 bytes always fit in a long long;
+       larger ones are multiplied as Python ints if they could overflow. */
+    if (self->ob_descr->is_signed) {
+        long long acc = 0;
+#define DOT(TYPE) {                                                 \
+        const TYPE *x = (const TYPE *)self->ob_item;                \
+        const TYPE *y = (const TYPE *)b->ob_item;                   \
+        for (i = 0; i < n; i++) {                                   \
+            long long xi = x[i], yi = y[i];                         \
+            if (sizeof(TYPE) > 4 &&                                 \
+                (xi >= DOT_SAFE_FACTOR || xi <= -DOT_SAFE_FACTOR || \
+                 yi >= DOT_SAFE_FACTOR || yi <= -DOT_SAFE_FACTOR))  \
+            {                                                       \
+                if (intsum_flush(&total, int_product(xi, yi)) < 0)  \
+                    goto error;                                     \
+            }                                                       \
+            else if (intsum_add_signed(&total, &acc, xi * yi) < 0)  \
+                goto error;                                         \
+        }                                                           \
+    }
+        DISPATCH_SIGNED(typecode, DOT)
+#undef DOT
+        return intsum_finish(total, PyLong_FromLongLong(acc));
+    }
+    else {
+        unsigned long long acc = 0;
+#define DOT(TYPE) {                                                 \
+        const TYPE *x = (const TYPE *)self->ob_item;                \
+        const TYPE *y = (const TYPE *)b->ob_item;                   \
+        for (i = 0; i < n; i++) {                                   \
+            unsigned long long xi = x[i], yi = y[i];                \
+            if (sizeof(TYPE) > 4 &&                                 \
+                (xi >= (1ULL << 32) || yi >= (1ULL << 32)))         \
+            {                                                       \
+                if (intsum_flush(&total, uint_product(xi, yi)) < 0) \
+                    goto error;                                     \
+            }                                                       \
+            else if (intsum_add_unsigned(&total, &acc, xi * yi) < 0) \
+                goto error;                                         \
+        }                                                           \
+    }
+        DISPATCH_UNSIGNED(typecode, DOT)
+#undef DOT
+        return intsum_finish(total, PyLong_FromUnsignedLongLong(acc));
+    }
+
+  error:
+    Py_XDECREF(total);
+    return NULL;
+}
+
+/*[clinic input]
+array.array.mean
+
+Return the arithmetic mean of the items of the array.
+
+The result is a float, computed as array.sum() / len(array).  Raise
+ValueError if the array is empty.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_mean_impl(arrayobject *self)
+/*[clinic end generated code: output=568a7f94fb357201 input=1d87824588883654]*/
+{
+    PyObject *sum, *n, *mean;
+
+    if (check_numeric_array(self) < 0)
+        return NULL;
+    if (Py_SIZE(self) == 0) {
+        PyErr_SetString(PyExc_ValueError, "mean() of an empty array");
+        return NULL;
+    }
+    sum = array_array_sum_impl(self);
+    if (sum == NULL)
+        return NULL;
+    n = PyLong_FromSsize_t(Py_SIZE(self));
+    if (n == NULL) {
+        Py_DECREF(sum);
+        return NULL;
+    }
+    /* true division of two ints is correctly rounded */
+    mean = PyNumber_TrueDivide(sum, n);
+    Py_DECREF(sum);
+    Py_DECREF(n);
+    return mean;
+}
+
+/* Element-wise operations, which replace the items x of an array by x + y,
+   x - y, x * y or x / y.  The results of integer arrays are checked before
+   any item is changed, so that the array is left unchanged on
+   OverflowError.  True division is only supported by float arrays. */
+
+enum array_op { ARRAY_ADD, ARRAY_SUB, ARRAY_MUL, ARRAY_DIV };
+
+/* Store x op y in *result.  Return 0 on success, 1 if the result is not in
+   [lo, hi] and -1 on error. */
+static int
+int_apply(enum array_op op, long long x, long long y,
+          long long lo, long long hi, long long *result)
+{
+    assert(op != ARRAY_DIV);
+    if (op == ARRAY_ADD) {
+        if (y > 0 ? x > hi - y : x < lo - y)
+            return 1;
+        *result = x + y;
+        return 0;
+    }
+    if (op == ARRAY_SUB) {
+        if (y > 0 ? x < lo + y : x > hi + y)
+            return 1;
+        *result = x - y;
+        return 0;
+    }
+    if (x < DOT_SAFE_FACTOR && x > -DOT_SAFE_FACTOR &&
+        y < DOT_SAFE_FACTOR && y > -DOT_SAFE_FACTOR)
+    {
+        *result = x * y;
+    }
+    else {
+        int overflow;
+        PyObject *product = int_product(x, y);
+        if (product == NULL)
+            return -1;
+        *result = PyLong_AsLongLongAndOverflow(product, &overflow);
+        Py_DECREF(product);
+        if (overflow)
+            return 1;
+        if (*result == -1 && PyErr_Occurred())
+            return -1;
+    }
+    return (*result < lo || *result > hi);
+}
+
+static int
+uint_apply(enum array_op op, unsigned long long x, unsigned long long y,
+           unsigned long long hi, unsigned long long *result)
+{
+    assert(op != ARRAY_DIV);
+    if (op == ARRAY_ADD) {
+        if (x > hi - y)
+            return 1;
+        *result = x + y;
+        return 0;
+    }
+    if (op == ARRAY_SUB) {
+        if (x < y)
+            return 1;
+        *result = x - y;
+        return 0;
+    }
+    if (x == 0 || y == 0) {
+        *result = 0;
+        return 0;
+    }
+    if (x > hi / y)
+        return 1;
+    *result = x * y;
+    return 0;
+}
+
+/* Apply op to the items of self and the items of y, which advance by ystep
+   items: 1 for the items of an array, 0 for a scalar. */
+static PyObject *
+array_apply(arrayobject *self, enum array_op op, const char *y, int ystep)
+{
+    Py_ssize_t i, n = Py_SIZE(self);
+    char typecode = self->ob_descr->typecode;
+    char *results;
+    int rc = 0;
+
+    if (typecode == 'f' || typecode == 'd') {
+        /* float results can't overflow: store them directly, once the
+           divisors have been checked */
+#define APPLY(TYPE) {                                               \
+        TYPE *x = (TYPE *)self->ob_item;                            \
+        const TYPE *yi = (const TYPE *)y;                           \
+        switch (op) {                                               \
+        case ARRAY_ADD:                                             \
+            for (i = 0; i < n; i++, yi += ystep)                    \
+                x[i] = (TYPE)((double)x[i] + (double)*yi);          \
+            break;                                                  \
+        case ARRAY_SUB:                                             \
+            for (i = 0; i < n; i++, yi += ystep)                    \
+                x[i] = (TYPE)((double)x[i] - (double)*yi);          \
+            break;                                                  \
+        case ARRAY_MUL:                                             \
+            for (i = 0; i < n; i++, yi += ystep)                    \
+                x[i] = (TYPE)((double)x[i] * (double)*yi);          \
+            break;                                                  \
+        case ARRAY_DIV:                                             \
+            for (i = 0; i < n; i++) {                               \
+                if (yi[i * ystep] == 0) {                           \
+                    PyErr_SetString(PyExc_ZeroDivisionError,        \
+                                    "float division by zero");      \
+                    return NULL;                                    \
+                }                                                   \
+            }                                                       \
+            for (i = 0; i < n; i++, yi += ystep)                    \
+                x[i] = (TYPE)((double)x[i] / (double)*yi);          \
+            break;                                                  \
+        }                                                           \
+    }
+        if (typecode == 'f')
+            APPLY(float)
+        else
+            APPLY(double)
+#undef APPLY
+        Py_RETURN_NONE;
+    }
+
+    results = PyMem_Malloc(n * self->ob_descr->itemsize);
+    if (results == NULL && n > 0)
+        return PyErr_NoMemory();
+    if (self->ob_descr->is_signed) {
+#define APPLY(TYPE) {                                               \
+        const long long hi = (long long)                            \
+            (((unsigned long long)1 << (8 * sizeof(TYPE) - 1)) - 1);\
+        const TYPE *x = (const TYPE *)self->ob_item;                \
+        const TYPE *yi = (const TYPE *)y;                           \
+        TYPE *r = (TYPE *)results;                                  \
+        long long result;                                           \
+        for (i = 0; i < n; i++, yi += ystep) {                      \
+            rc = int_apply(op, x[i], *yi, -hi - 1, hi, &result);    \
+            if (rc)                                                 \
+                break;                                              \
+            r[i] = (TYPE)result;                                    \
+        }                                                           \
+    }
+        DISPATCH_SIGNED(typecode, APPLY)
+#undef APPLY
+    }
+    else {
+#define APPLY(TYPE) {                                               \
+        const unsigned long long hi = (TYPE)-1;                     \
+        const TYPE *x = (const TYPE *)self->ob_item;                \
+        const TYPE *yi = (const TYPE *)y;                           \
+        TYPE *r = (TYPE *)results;                                  \
+        unsigned long long result;                                  \
+        for (i = 0; i < n; i++, yi += ystep) {                      \
+            rc = uint_apply(op, x[i], *yi, hi, &result);            \
+            if (rc)                                                 \
+                break;                                              \
+            r[i] = (TYPE)result;                                    \
+        }                                                           \
+    }
+        DISPATCH_UNSIGNED(typecode, APPLY)
+#undef APPLY
+    }
+    if (rc == 0)
+        memcpy(self->ob_item, results, n * self->ob_descr->itemsize);
+    PyMem_Free(results);
+    if (rc > 0) {
+        PyErr_Format(PyExc_OverflowError,
+                     "result out of range for '%c' array", typecode);
+    }
+    if (rc)
+        return NULL;
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+array.array.add
+
+    cls: defining_class
+    other: object
+    /
+
+Add the items of another array to the items of the array, in place.
+
+The arrays must have the same typecode and length.  The array is left
+unchanged if a result does not fit in its typecode.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_add_impl(arrayobject *self, PyTypeObject *cls, PyObject *other)
+/*[clinic end generated code: output=e5539151b2db2983 input=3b1ff4b434f7a67f]*/
+{
+    array_state *state = get_array_state_by_class(cls);
+
+    if (check_array_operand(self, other, state, "add") < 0)
+        return NULL;
+    return array_apply(self, ARRAY_ADD, ((arrayobject *)other)->ob_item, 1);
+}
+
+/*[clinic input]
+array.array.mul
+
+    cls: defining_class
+    other: object
+    /
+
+Multiply the items of the array by the items of another array, in place.
+
+The arrays must have the same typecode and length.  The array is left
+unchanged if a result does not fit in its typecode.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_mul_impl(arrayobject *self, PyTypeObject *cls, PyObject *other)
+/*[clinic end generated code: output=1fcc2078325e2c93 input=db4076de390241ff]*/
+{
+    array_state *state = get_array_state_by_class(cls);
+
+    if (check_array_operand(self, other, state, "mul") < 0)
+        return NULL;
+    return array_apply(self, ARRAY_MUL, ((arrayobject *)other)->ob_item, 1);
+}
+
+/*[clinic input]
+array.array.scale
+
+    cls: defining_class
+    factor: object
+    /
+
+Multiply the items of the array by factor, in place.
+
+factor must be a valid item of the array.  The array is left unchanged if
+a result does not fit in its typecode.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_scale_impl(arrayobject *self, PyTypeObject *cls,
+                       PyObject *factor)
+/*[clinic end generated code: output=6846038aead7bcd1 input=da898878bf6e610d]*/
+{
+    array_state *state = get_array_state_by_class(cls);
+    arrayobject *k;
+    PyObject *res;
+
+    if (check_numeric_array(self) < 0)
+        return NULL;
+    /* convert factor with the setitem function of the typecode */
+    k = (arrayobject *)newarrayobject(state->ArrayType, 1, self->ob_descr);
+    if (k == NULL)
+        return NULL;
+    if (self->ob_descr->setitem(k, 0, factor) < 0) {
+        Py_DECREF(k);
+        return NULL;
+    }
+    res = array_apply(self, ARRAY_MUL, k->ob_item, 0);
+    Py_DECREF(k);
+    return res;
+}
+
+/*[clinic input]
+array.array.sub
+
+    cls: defining_class
+    other: object
+    /
+
+Subtract the items of another array from the items of the array, in place.
+
+The arrays must have the same typecode and length.  The array is left
+unchanged if a result does not fit in its typecode.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_sub_impl(arrayobject *self, PyTypeObject *cls, PyObject *other)
+/*[clinic end generated code: output=0941a55c38fb4376 input=5a907db4a8def777]*/
+{
+    array_state *state = get_array_state_by_class(cls);
+
+    if (check_array_operand(self, other, state, "sub") < 0)
+        return NULL;
+    return array_apply(self, ARRAY_SUB, ((arrayobject *)other)->ob_item, 1);
+}
+
+/*[clinic input]
+array.array.truediv
+
+    cls: defining_class
+    other: object
+    /
+
+Divide the items of the array by the items of another array, in place.
+
+The arrays must have the same floating point typecode and length.  Raise
+ZeroDivisionError, leaving the array unchanged, if an item of other is
+zero.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_truediv_impl(arrayobject *self, PyTypeObject *cls,
+                         PyObject *other)
+/*[clinic end generated code: output=bbba3a62103da271 input=3fea3f581ec690ca]*/
+{
+    array_state *state = get_array_state_by_class(cls);
+    char typecode = self->ob_descr->typecode;
+
+    if (check_array_operand(self, other, state, "truediv") < 0)
+        return NULL;
+    if (typecode != 'f' && typecode != 'd') {
+        PyErr_Format(PyExc_TypeError,
+                     "truediv() requires a floating point array, not '%c'",
+                     typecode);
+        return NULL;
+    }
+    return array_apply(self, ARRAY_DIV, ((arrayobject *)other)->ob_item, 1);
+}
+
+/* Element-wise comparisons, which return an array('b') holding 1 where the
+   comparison of the items of two arrays is true and 0 where it is false. */
+static PyObject *
+array_compare_items(arrayobject *self, PyTypeObject *cls, PyObject *other,
+                    int op, const char *name)
+{
+    array_state *state = get_array_state_by_class(cls);
+    arrayobject *b, *mask;
+    Py_ssize_t i, n = Py_SIZE(self);
+    signed char *r;
+
+    if (check_array_operand(self, other, state, name) < 0)
+        return NULL;
+    b = (arrayobject *)other;
+    assert(descriptors[0].typecode == 'b');
+    mask = (arrayobject *)newarrayobject(state->ArrayType, n, &descriptors[0]);
+    if (mask == NULL)
+        return NULL;
+    r = (signed char *)mask->ob_item;
+
+#define COMPARE(TYPE) {                                             \
+        const TYPE *x = (const TYPE *)self->ob_item;                \
+        const TYPE *y = (const TYPE *)b->ob_item;                   \
+        switch (op) {                                               \
+        case Py_LT: for (i = 0; i < n; i++) r[i] = x[i] < y[i]; break; \
+        case Py_LE: for (i = 0; i < n; i++) r[i] = x[i] <= y[i]; break; \
+        case Py_EQ: for (i = 0; i < n; i++) r[i] = x[i] == y[i]; break; \
+        case Py_NE: for (i = 0; i < n; i++) r[i] = x[i] != y[i]; break; \
+        case Py_GT: for (i = 0; i < n; i++) r[i] = x[i] > y[i]; break; \
+        case Py_GE: for (i = 0; i < n; i++) r[i] = x[i] >= y[i]; break; \
+        default: Py_UNREACHABLE();                                  \
+        }                                                           \
+    }
+    if (self->ob_descr->typecode == 'f')
+        COMPARE(float)
+    else if (self->ob_descr->typecode == 'd')
+        COMPARE(double)
+    else if (self->ob_descr->is_signed)
+        DISPATCH_SIGNED(self->ob_descr->typecode, COMPARE)
+    else
+        DISPATCH_UNSIGNED(self->ob_descr->typecode, COMPARE)
+#undef COMPARE
+    return (PyObject *)mask;
+}
+
+/*[clinic input]
+array.array.eq
+
+    cls: defining_class
+    other: object
+    /
+
+Return an array('b') which is 1 where the items of two arrays are equal.
+
+The arrays must have the same typecode and length.  The item of the result
+is 0 where the comparison is false.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_eq_impl(arrayobject *self, PyTypeObject *cls, PyObject *other)
+/*[clinic end generated code: output=62699d4a585fd8a8 input=246bfb8192bdcbdd]*/
+{
+    return array_compare_items(self, cls, other, Py_EQ, "eq");
+}
+
+/*[clinic input]
+array.array.ne = array.array.eq
+
+Return an array('b') which is 1 where the items of two arrays differ.
+
+The arrays must have the same typecode and length.  The item of the result
+is 0 where the comparison is false.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_ne_impl(arrayobject *self, PyTypeObject *cls, PyObject *other)
+/*[clinic end generated code: output=ebb4c4ca8382422b input=576ce2015399e1e2]*/
+{
+    return array_compare_items(self, cls, other, Py_NE, "ne");
+}
+
+/*[clinic input]
+array.array.lt = array.array.eq
+
+Return an array('b') which is 1 where an item is less than the other one.
+
+The arrays must have the same typecode and length.  The item of the result
+is 0 where the comparison is false.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_lt_impl(arrayobject *self, PyTypeObject *cls, PyObject *other)
+/*[clinic end generated code: output=feb59563bdc67209 input=c55ce00cde3aaccc]*/
+{
+    return array_compare_items(self, cls, other, Py_LT, "lt");
+}
+
+/*[clinic input]
+array.array.le = array.array.eq
+
+Return an array('b') which is 1 where an item is at most the other one.
+
+The arrays must have the same typecode and length.  The item of the result
+is 0 where the comparison is false.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_le_impl(arrayobject *self, PyTypeObject *cls, PyObject *other)
+/*[clinic end generated code: output=36bdecff5ab72fed input=23eac5d7c61d9953]*/
+{
+    return array_compare_items(self, cls, other, Py_LE, "le");
+}
+
+/*[clinic input]
+array.array.gt = array.array.eq
+
+Return an array('b') which is 1 where an item is greater than the other one.
+
+The arrays must have the same typecode and length.  The item of the result
+is 0 where the comparison is false.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_gt_impl(arrayobject *self, PyTypeObject *cls, PyObject *other)
+/*[clinic end generated code: output=892225325d576ae1 input=6578fc0586401af9]*/
+{
+    return array_compare_items(self, cls, other, Py_GT, "gt");
+}
+
+/*[clinic input]
+array.array.ge = array.array.eq
+
+Return an array('b') which is 1 where an item is at least the other one.
+
+The arrays must have the same typecode and length.  The item of the result
+is 0 where the comparison is false.
+[clinic start generated code]*/
+
+static PyObject *
+array_array_ge_impl(arrayobject *self, PyTypeObject *cls, PyObject *other)
+/*[clinic end generated code: output=b7a9146ff881053e input=0ad6e7e637d8e7b0]*/
+{
+    return array_compare_items(self, cls, other, Py_GE, "ge");
+}
+
+#undef DISPATCH_SIGNED
+#undef DISPATCH_UNSIGNED
+
+
 /*[clinic input]
 array.array.index
 
@@ -2278,27 +3173,43 @@ static PyGetSetDef array_getsets [] = {
 };
 
 static PyMethodDef array_methods[] = {
+    ARRAY_ARRAY_ADD_METHODDEF
     ARRAY_ARRAY_APPEND_METHODDEF
     ARRAY_ARRAY_BUFFER_INFO_METHODDEF
     ARRAY_ARRAY_BYTESWAP_METHODDEF
     ARRAY_ARRAY___COPY___METHODDEF
     ARRAY_ARRAY_COUNT_METHODDEF
     ARRAY_ARRAY___DEEPCOPY___METHODDEF
+    ARRAY_ARRAY_DOT_METHODDEF
+    ARRAY_ARRAY_EQ_METHODDEF
     ARRAY_ARRAY_EXTEND_METHODDEF
     ARRAY_ARRAY_FROMFILE_METHODDEF
     ARRAY_ARRAY_FROMLIST_METHODDEF
     ARRAY_ARRAY_FROMBYTES_METHODDEF
     ARRAY_ARRAY_FROMUNICODE_METHODDEF
+    ARRAY_ARRAY_GE_METHODDEF
+    ARRAY_ARRAY_GT_METHODDEF
     ARRAY_ARRAY_INDEX_METHODDEF
     ARRAY_ARRAY_INSERT_METHODDEF
+    ARRAY_ARRAY_LE_METHODDEF
+    ARRAY_ARRAY_LT_METHODDEF
+    ARRAY_ARRAY_MAX_METHODDEF
+    ARRAY_ARRAY_MEAN_METHODDEF
+    ARRAY_ARRAY_MIN_METHODDEF
+    ARRAY_ARRAY_MUL_METHODDEF
+    ARRAY_ARRAY_NE_METHODDEF
     ARRAY_ARRAY_POP_METHODDEF
     ARRAY_ARRAY___REDUCE_EX___METHODDEF
     ARRAY_ARRAY_REMOVE_METHODDEF
     ARRAY_ARRAY_REVERSE_METHODDEF
+    ARRAY_ARRAY_SCALE_METHODDEF
+    ARRAY_ARRAY_SUB_METHODDEF
+    ARRAY_ARRAY_SUM_METHODDEF
     ARRAY_ARRAY_TOFILE_METHODDEF
     ARRAY_ARRAY_TOLIST_METHODDEF
     ARRAY_ARRAY_TOBYTES_METHODDEF
     ARRAY_ARRAY_TOUNICODE_METHODDEF
+    ARRAY_ARRAY_TRUEDIV_METHODDEF
     ARRAY_ARRAY___SIZEOF___METHODDEF
     {NULL, NULL}  /* sentinel */
 };
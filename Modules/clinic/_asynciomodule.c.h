@@ -611,6 +611,624 @@ PyDoc_STRVAR(_asyncio_Task_set_name__doc__,
 #define _ASYNCIO_TASK_SET_NAME_METHODDEF    \
     {"set_name", (PyCFunction)_asyncio_Task_set_name, METH_O, _asyncio_Task_set_name__doc__},
 
+PyDoc_STRVAR(_asyncio_Handle___init____doc__,
+"Handle(callback, args, loop, context=None)\n"
+"--\n"
+"\n"
+"Object returned by callback registration methods.");
+
+static int
+_asyncio_Handle___init___impl(HandleObj *self, PyObject *callback,
+                              PyObject *callback_args, PyObject *loop,
+                              PyObject *context);
+
+static int
+_asyncio_Handle___init__(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    int return_value = -1;
+    static const char * const _keywords[] = {"callback", "args", "loop", "context", NULL};
+    static _PyArg_Parser _parser = {NULL, _keywords, "Handle", 0};
+    PyObject *argsbuf[4];
+    PyObject * const *fastargs;
+    Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+    Py_ssize_t noptargs = nargs + (kwargs ? PyDict_GET_SIZE(kwargs) : 0) - 3;
+    PyObject *callback;
+    PyObject *callback_args;
+    PyObject *loop;
+    PyObject *context = Py_None;
+
+    fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser, 3, 4, 0, argsbuf);
+    if (!fastargs) {
+        goto exit;
+    }
+    callback = fastargs[0];
+    callback_args = fastargs[1];
+    loop = fastargs[2];
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    context = fastargs[3];
+skip_optional_pos:
+    return_value = _asyncio_Handle___init___impl((HandleObj *)self, callback, callback_args, loop, context);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_asyncio_Handle_cancel__doc__,
+"cancel($self, /)\n"
+"--\n"
+"\n"
+"Cancel the callback.\n"
+"\n"
+"If the callback has already been cancelled or executed,\n"
+"this method has no effect.");
+
+#define _ASYNCIO_HANDLE_CANCEL_METHODDEF    \
+    {"cancel", (PyCFunction)_asyncio_Handle_cancel, METH_NOARGS, _asyncio_Handle_cancel__doc__},
+
+static PyObject *
+_asyncio_Handle_cancel_impl(HandleObj *self);
+
+static PyObject *
+_asyncio_Handle_cancel(HandleObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio_Handle_cancel_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio_Handle_cancelled__doc__,
+"cancelled($self, /)\n"
+"--\n"
+"\n"
+"Return True if the callback was cancelled.");
+
+#define _ASYNCIO_HANDLE_CANCELLED_METHODDEF    \
+    {"cancelled", (PyCFunction)_asyncio_Handle_cancelled, METH_NOARGS, _asyncio_Handle_cancelled__doc__},
+
+static PyObject *
+_asyncio_Handle_cancelled_impl(HandleObj *self);
+
+static PyObject *
+_asyncio_Handle_cancelled(HandleObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio_Handle_cancelled_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio_Handle__run__doc__,
+"_run($self, /)\n"
+"--\n"
+"\n"
+"Run the callback in its context.\n"
+"\n"
+"Exceptions other than SystemExit and KeyboardInterrupt are passed\n"
+"to the exception handler of the event loop.");
+
+#define _ASYNCIO_HANDLE__RUN_METHODDEF    \
+    {"_run", (PyCFunction)_asyncio_Handle__run, METH_NOARGS, _asyncio_Handle__run__doc__},
+
+static PyObject *
+_asyncio_Handle__run_impl(HandleObj *self);
+
+static PyObject *
+_asyncio_Handle__run(HandleObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio_Handle__run_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio_Handle__repr_info__doc__,
+"_repr_info($self, /)\n"
+"--\n"
+"\n");
+
+#define _ASYNCIO_HANDLE__REPR_INFO_METHODDEF    \
+    {"_repr_info", (PyCFunction)_asyncio_Handle__repr_info, METH_NOARGS, _asyncio_Handle__repr_info__doc__},
+
+static PyObject *
+_asyncio_Handle__repr_info_impl(HandleObj *self);
+
+static PyObject *
+_asyncio_Handle__repr_info(HandleObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio_Handle__repr_info_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio_TimerHandle___init____doc__,
+"TimerHandle(when, callback, args, loop, context=None)\n"
+"--\n"
+"\n"
+"Object returned by timed callback registration methods.");
+
+static int
+_asyncio_TimerHandle___init___impl(TimerHandleObj *self, PyObject *when,
+                                   PyObject *callback,
+                                   PyObject *callback_args, PyObject *loop,
+                                   PyObject *context);
+
+static int
+_asyncio_TimerHandle___init__(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    int return_value = -1;
+    static const char * const _keywords[] = {"when", "callback", "args", "loop", "context", NULL};
+    static _PyArg_Parser _parser = {NULL, _keywords, "TimerHandle", 0};
+    PyObject *argsbuf[5];
+    PyObject * const *fastargs;
+    Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+    Py_ssize_t noptargs = nargs + (kwargs ? PyDict_GET_SIZE(kwargs) : 0) - 4;
+    PyObject *when;
+    PyObject *callback;
+    PyObject *callback_args;
+    PyObject *loop;
+    PyObject *context = Py_None;
+
+    fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser, 4, 5, 0, argsbuf);
+    if (!fastargs) {
+        goto exit;
+    }
+    when = fastargs[0];
+    callback = fastargs[1];
+    callback_args = fastargs[2];
+    loop = fastargs[3];
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    context = fastargs[4];
+skip_optional_pos:
+    return_value = _asyncio_TimerHandle___init___impl((TimerHandleObj *)self, when, callback, callback_args, loop, context);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_asyncio_TimerHandle_cancel__doc__,
+"cancel($self, /)\n"
+"--\n"
+"\n"
+"Cancel the callback.\n"
+"\n"
+"If the callback has already been cancelled or executed,\n"
+"this method has no effect.");
+
+#define _ASYNCIO_TIMERHANDLE_CANCEL_METHODDEF    \
+    {"cancel", (PyCFunction)_asyncio_TimerHandle_cancel, METH_NOARGS, _asyncio_TimerHandle_cancel__doc__},
+
+static PyObject *
+_asyncio_TimerHandle_cancel_impl(TimerHandleObj *self);
+
+static PyObject *
+_asyncio_TimerHandle_cancel(TimerHandleObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio_TimerHandle_cancel_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio_TimerHandle_when__doc__,
+"when($self, /)\n"
+"--\n"
+"\n"
+"Return a scheduled callback time.\n"
+"\n"
+"The time is an absolute timestamp, using the same time\n"
+"reference as loop.time().");
+
+#define _ASYNCIO_TIMERHANDLE_WHEN_METHODDEF    \
+    {"when", (PyCFunction)_asyncio_TimerHandle_when, METH_NOARGS, _asyncio_TimerHandle_when__doc__},
+
+static PyObject *
+_asyncio_TimerHandle_when_impl(TimerHandleObj *self);
+
+static PyObject *
+_asyncio_TimerHandle_when(TimerHandleObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio_TimerHandle_when_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio_TimerHandle__repr_info__doc__,
+"_repr_info($self, /)\n"
+"--\n"
+"\n");
+
+#define _ASYNCIO_TIMERHANDLE__REPR_INFO_METHODDEF    \
+    {"_repr_info", (PyCFunction)_asyncio_TimerHandle__repr_info, METH_NOARGS, _asyncio_TimerHandle__repr_info__doc__},
+
+static PyObject *
+_asyncio_TimerHandle__repr_info_impl(TimerHandleObj *self);
+
+static PyObject *
+_asyncio_TimerHandle__repr_info(TimerHandleObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio_TimerHandle__repr_info_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio_TimerWheel___init____doc__,
+"TimerWheel(now)\n"
+"--\n"
+"\n"
+"Hierarchical timer wheel holding the timers due after the next tick.\n"
+"\n"
+"A slot of the level N spans 64 ** N ticks of 1 millisecond.  Adding\n"
+"and removing a timer is O(1).  As time advances, the timers of a slot\n"
+"of a higher level are moved to lower levels, and the timers due in the\n"
+"next tick are pushed to the heap of the event loop, which runs them at\n"
+"their exact time.");
+
+static int
+_asyncio_TimerWheel___init___impl(TimerWheelObj *self, double now);
+
+static int
+_asyncio_TimerWheel___init__(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    int return_value = -1;
+    static const char * const _keywords[] = {"now", NULL};
+    static _PyArg_Parser _parser = {NULL, _keywords, "TimerWheel", 0};
+    PyObject *argsbuf[1];
+    PyObject * const *fastargs;
+    Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+    double now;
+
+    fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser, 1, 1, 0, argsbuf);
+    if (!fastargs) {
+        goto exit;
+    }
+    if (PyFloat_CheckExact(fastargs[0])) {
+        now = PyFloat_AS_DOUBLE(fastargs[0]);
+    }
+    else
+    {
+        now = PyFloat_AsDouble(fastargs[0]);
+        if (now == -1.0 && PyErr_Occurred()) {
+            goto exit;
+        }
+    }
+    return_value = _asyncio_TimerWheel___init___impl((TimerWheelObj *)self, now);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_asyncio_TimerWheel_add__doc__,
+"add($self, timer, /)\n"
+"--\n"
+"\n"
+"Add a TimerHandle to the wheel.\n"
+"\n"
+"Return False if the timer is due in the next tick, the caller must\n"
+"then push it to the heap itself.");
+
+#define _ASYNCIO_TIMERWHEEL_ADD_METHODDEF    \
+    {"add", (PyCFunction)_asyncio_TimerWheel_add, METH_O, _asyncio_TimerWheel_add__doc__},
+
+PyDoc_STRVAR(_asyncio_TimerWheel_remove__doc__,
+"remove($self, timer, /)\n"
+"--\n"
+"\n"
+"Remove a TimerHandle, return False if it is not in the wheel.");
+
+#define _ASYNCIO_TIMERWHEEL_REMOVE_METHODDEF    \
+    {"remove", (PyCFunction)_asyncio_TimerWheel_remove, METH_O, _asyncio_TimerWheel_remove__doc__},
+
+PyDoc_STRVAR(_asyncio_TimerWheel_pop_all__doc__,
+"pop_all($self, /)\n"
+"--\n"
+"\n"
+"Remove all timers from the wheel and return them.");
+
+#define _ASYNCIO_TIMERWHEEL_POP_ALL_METHODDEF    \
+    {"pop_all", (PyCFunction)_asyncio_TimerWheel_pop_all, METH_NOARGS, _asyncio_TimerWheel_pop_all__doc__},
+
+static PyObject *
+_asyncio_TimerWheel_pop_all_impl(TimerWheelObj *self);
+
+static PyObject *
+_asyncio_TimerWheel_pop_all(TimerWheelObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio_TimerWheel_pop_all_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio_TimerWheel_next_time__doc__,
+"next_time($self, /)\n"
+"--\n"
+"\n"
+"Return when advance() should be called, or None if empty.");
+
+#define _ASYNCIO_TIMERWHEEL_NEXT_TIME_METHODDEF    \
+    {"next_time", (PyCFunction)_asyncio_TimerWheel_next_time, METH_NOARGS, _asyncio_TimerWheel_next_time__doc__},
+
+static PyObject *
+_asyncio_TimerWheel_next_time_impl(TimerWheelObj *self);
+
+static PyObject *
+_asyncio_TimerWheel_next_time(TimerWheelObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio_TimerWheel_next_time_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio_TimerWheel_advance__doc__,
+"advance($self, now, heap, /)\n"
+"--\n"
+"\n"
+"Push the timers due before the end of the next tick to heap.");
+
+#define _ASYNCIO_TIMERWHEEL_ADVANCE_METHODDEF    \
+    {"advance", (PyCFunction)(void(*)(void))_asyncio_TimerWheel_advance, METH_FASTCALL, _asyncio_TimerWheel_advance__doc__},
+
+static PyObject *
+_asyncio_TimerWheel_advance_impl(TimerWheelObj *self, double now,
+                                 PyObject *heap);
+
+static PyObject *
+_asyncio_TimerWheel_advance(TimerWheelObj *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    double now;
+    PyObject *heap;
+
+    if (!_PyArg_CheckPositional("advance", nargs, 2, 2)) {
+        goto exit;
+    }
+    if (PyFloat_CheckExact(args[0])) {
+        now = PyFloat_AS_DOUBLE(args[0]);
+    }
+    else
+    {
+        now = PyFloat_AsDouble(args[0]);
+        if (now == -1.0 && PyErr_Occurred()) {
+            goto exit;
+        }
+    }
+    heap = args[1];
+    return_value = _asyncio_TimerWheel_advance_impl(self, now, heap);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_asyncio__Queue_qsize__doc__,
+"qsize($self, /)\n"
+"--\n"
+"\n"
+"Number of items in the queue.");
+
+#define _ASYNCIO__QUEUE_QSIZE_METHODDEF    \
+    {"qsize", (PyCFunction)_asyncio__Queue_qsize, METH_NOARGS, _asyncio__Queue_qsize__doc__},
+
+static PyObject *
+_asyncio__Queue_qsize_impl(QueueObj *self);
+
+static PyObject *
+_asyncio__Queue_qsize(QueueObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio__Queue_qsize_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio__Queue_empty__doc__,
+"empty($self, /)\n"
+"--\n"
+"\n"
+"Return True if the queue is empty, False otherwise.");
+
+#define _ASYNCIO__QUEUE_EMPTY_METHODDEF    \
+    {"empty", (PyCFunction)_asyncio__Queue_empty, METH_NOARGS, _asyncio__Queue_empty__doc__},
+
+static PyObject *
+_asyncio__Queue_empty_impl(QueueObj *self);
+
+static PyObject *
+_asyncio__Queue_empty(QueueObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio__Queue_empty_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio__Queue_full__doc__,
+"full($self, /)\n"
+"--\n"
+"\n"
+"Return True if there are maxsize items in the queue.\n"
+"\n"
+"Note: if the Queue was initialized with maxsize=0 (the default),\n"
+"then full() is never True.");
+
+#define _ASYNCIO__QUEUE_FULL_METHODDEF    \
+    {"full", (PyCFunction)_asyncio__Queue_full, METH_NOARGS, _asyncio__Queue_full__doc__},
+
+static PyObject *
+_asyncio__Queue_full_impl(QueueObj *self);
+
+static PyObject *
+_asyncio__Queue_full(QueueObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio__Queue_full_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio__Queue_put__doc__,
+"put($self, item, /)\n"
+"--\n"
+"\n"
+"Put an item into the queue.\n"
+"\n"
+"Put an item into the queue. If the queue is full, wait until a free\n"
+"slot is available before adding item.");
+
+#define _ASYNCIO__QUEUE_PUT_METHODDEF    \
+    {"put", (PyCFunction)_asyncio__Queue_put, METH_O, _asyncio__Queue_put__doc__},
+
+PyDoc_STRVAR(_asyncio__Queue_put_nowait__doc__,
+"put_nowait($self, item, /)\n"
+"--\n"
+"\n"
+"Put an item into the queue without blocking.\n"
+"\n"
+"If no free slot is immediately available, raise QueueFull.");
+
+#define _ASYNCIO__QUEUE_PUT_NOWAIT_METHODDEF    \
+    {"put_nowait", (PyCFunction)_asyncio__Queue_put_nowait, METH_O, _asyncio__Queue_put_nowait__doc__},
+
+PyDoc_STRVAR(_asyncio__Queue_get__doc__,
+"get($self, /)\n"
+"--\n"
+"\n"
+"Remove and return an item from the queue.\n"
+"\n"
+"If queue is empty, wait until an item is available.");
+
+#define _ASYNCIO__QUEUE_GET_METHODDEF    \
+    {"get", (PyCFunction)_asyncio__Queue_get, METH_NOARGS, _asyncio__Queue_get__doc__},
+
+static PyObject *
+_asyncio__Queue_get_impl(QueueObj *self);
+
+static PyObject *
+_asyncio__Queue_get(QueueObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio__Queue_get_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio__Queue_get_nowait__doc__,
+"get_nowait($self, /)\n"
+"--\n"
+"\n"
+"Remove and return an item from the queue.\n"
+"\n"
+"Return an item if one is immediately available, else raise QueueEmpty.");
+
+#define _ASYNCIO__QUEUE_GET_NOWAIT_METHODDEF    \
+    {"get_nowait", (PyCFunction)_asyncio__Queue_get_nowait, METH_NOARGS, _asyncio__Queue_get_nowait__doc__},
+
+static PyObject *
+_asyncio__Queue_get_nowait_impl(QueueObj *self);
+
+static PyObject *
+_asyncio__Queue_get_nowait(QueueObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio__Queue_get_nowait_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio__Queue_task_done__doc__,
+"task_done($self, /)\n"
+"--\n"
+"\n"
+"Indicate that a formerly enqueued task is complete.\n"
+"\n"
+"Used by queue consumers. For each get() used to fetch a task,\n"
+"a subsequent call to task_done() tells the queue that the processing\n"
+"on the task is complete.\n"
+"\n"
+"If a join() is currently blocking, it will resume when all items have\n"
+"been processed (meaning that a task_done() call was received for every\n"
+"item that had been put() into the queue).\n"
+"\n"
+"Raises ValueError if called more times than there were items placed in\n"
+"the queue.");
+
+#define _ASYNCIO__QUEUE_TASK_DONE_METHODDEF    \
+    {"task_done", (PyCFunction)_asyncio__Queue_task_done, METH_NOARGS, _asyncio__Queue_task_done__doc__},
+
+static PyObject *
+_asyncio__Queue_task_done_impl(QueueObj *self);
+
+static PyObject *
+_asyncio__Queue_task_done(QueueObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio__Queue_task_done_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio__Queue__init__doc__,
+"_init($self, maxsize, /)\n"
+"--\n"
+"\n");
+
+#define _ASYNCIO__QUEUE__INIT_METHODDEF    \
+    {"_init", (PyCFunction)_asyncio__Queue__init, METH_O, _asyncio__Queue__init__doc__},
+
+PyDoc_STRVAR(_asyncio__Queue__get__doc__,
+"_get($self, /)\n"
+"--\n"
+"\n");
+
+#define _ASYNCIO__QUEUE__GET_METHODDEF    \
+    {"_get", (PyCFunction)_asyncio__Queue__get, METH_NOARGS, _asyncio__Queue__get__doc__},
+
+static PyObject *
+_asyncio__Queue__get_impl(QueueObj *self);
+
+static PyObject *
+_asyncio__Queue__get(QueueObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio__Queue__get_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio__Queue__put__doc__,
+"_put($self, item, /)\n"
+"--\n"
+"\n");
+
+#define _ASYNCIO__QUEUE__PUT_METHODDEF    \
+    {"_put", (PyCFunction)_asyncio__Queue__put, METH_O, _asyncio__Queue__put__doc__},
+
+PyDoc_STRVAR(_asyncio__LifoQueue__init__doc__,
+"_init($self, maxsize, /)\n"
+"--\n"
+"\n");
+
+#define _ASYNCIO__LIFOQUEUE__INIT_METHODDEF    \
+    {"_init", (PyCFunction)_asyncio__LifoQueue__init, METH_O, _asyncio__LifoQueue__init__doc__},
+
+PyDoc_STRVAR(_asyncio__LifoQueue__get__doc__,
+"_get($self, /)\n"
+"--\n"
+"\n");
+
+#define _ASYNCIO__LIFOQUEUE__GET_METHODDEF    \
+    {"_get", (PyCFunction)_asyncio__LifoQueue__get, METH_NOARGS, _asyncio__LifoQueue__get__doc__},
+
+static PyObject *
+_asyncio__LifoQueue__get_impl(QueueObj *self);
+
+static PyObject *
+_asyncio__LifoQueue__get(QueueObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio__LifoQueue__get_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio__LifoQueue__put__doc__,
+"_put($self, item, /)\n"
+"--\n"
+"\n");
+
+#define _ASYNCIO__LIFOQUEUE__PUT_METHODDEF    \
+    {"_put", (PyCFunction)_asyncio__LifoQueue__put, METH_O, _asyncio__LifoQueue__put__doc__},
+
+PyDoc_STRVAR(_asyncio__PriorityQueue__init__doc__,
+"_init($self, maxsize, /)\n"
+"--\n"
+"\n");
+
+#define _ASYNCIO__PRIORITYQUEUE__INIT_METHODDEF    \
+    {"_init", (PyCFunction)_asyncio__PriorityQueue__init, METH_O, _asyncio__PriorityQueue__init__doc__},
+
+PyDoc_STRVAR(_asyncio__PriorityQueue__get__doc__,
+"_get($self, /)\n"
+"--\n"
+"\n");
+
+#define _ASYNCIO__PRIORITYQUEUE__GET_METHODDEF    \
+    {"_get", (PyCFunction)_asyncio__PriorityQueue__get, METH_NOARGS, _asyncio__PriorityQueue__get__doc__},
+
+static PyObject *
+_asyncio__PriorityQueue__get_impl(QueueObj *self);
+
+static PyObject *
+_asyncio__PriorityQueue__get(QueueObj *self, PyObject *Py_UNUSED(ignored))
+{
+    return _asyncio__PriorityQueue__get_impl(self);
+}
+
+PyDoc_STRVAR(_asyncio__PriorityQueue__put__doc__,
+"_put($self, item, /)\n"
+"--\n"
+"\n");
+
+#define _ASYNCIO__PRIORITYQUEUE__PUT_METHODDEF    \
+    {"_put", (PyCFunction)_asyncio__PriorityQueue__put, METH_O, _asyncio__PriorityQueue__put__doc__},
+
 PyDoc_STRVAR(_asyncio__get_running_loop__doc__,
 "_get_running_loop($module, /)\n"
 "--\n"
@@ -871,4 +1489,4 @@ _asyncio__leave_task(PyObject *module, PyObject *const *args, Py_ssize_t nargs,
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=0d127162ac92e0c0 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=366191980bfdadff input=a9049054013a1b77]*/
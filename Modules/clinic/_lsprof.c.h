@@ -52,4 +52,105 @@ _lsprof_Profiler_getstats(ProfilerObject *self, PyTypeObject *cls, PyObject *con
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=b4727cfebecdd22d input=a9049054013a1b77]*/
+
+PyDoc_STRVAR(_lsprof_Profiler_getstats_binary__doc__,
+"getstats_binary($self, /)\n"
+"--\n"
+"\n"
+"Return all information collected by the profiler in a binary format.\n"
+"\n"
+"The result holds the statistics that create_stats() stores in the\n"
+"stats attribute of cProfile.Profile, serialized in the compact format\n"
+"read by stats_from_binary() and pstats.Stats.");
+
+#define _LSPROF_PROFILER_GETSTATS_BINARY_METHODDEF    \
+    {"getstats_binary", (PyCFunction)_lsprof_Profiler_getstats_binary, METH_NOARGS, _lsprof_Profiler_getstats_binary__doc__},
+
+static PyObject *
+_lsprof_Profiler_getstats_binary_impl(ProfilerObject *self);
+
+static PyObject *
+_lsprof_Profiler_getstats_binary(ProfilerObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _lsprof_Profiler_getstats_binary_impl(self);
+}
+
+PyDoc_STRVAR(_lsprof_stats_to_binary__doc__,
+"stats_to_binary($module, stats, /)\n"
+"--\n"
+"\n"
+"Serialize profile statistics in a compact binary format.\n"
+"\n"
+"stats is a dictionary with the layout of the stats attribute of\n"
+"pstats.Stats.");
+
+#define _LSPROF_STATS_TO_BINARY_METHODDEF    \
+    {"stats_to_binary", (PyCFunction)_lsprof_stats_to_binary, METH_O, _lsprof_stats_to_binary__doc__},
+
+static PyObject *
+_lsprof_stats_to_binary_impl(PyObject *module, PyObject *stats);
+
+static PyObject *
+_lsprof_stats_to_binary(PyObject *module, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    PyObject *stats;
+
+    if (!PyDict_Check(arg)) {
+        _PyArg_BadArgument("stats_to_binary", "argument", "dict", arg);
+        goto exit;
+    }
+    stats = arg;
+    return_value = _lsprof_stats_to_binary_impl(module, stats);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_lsprof_stats_from_binary__doc__,
+"stats_from_binary($module, data, /)\n"
+"--\n"
+"\n"
+"Return the dictionary of profile statistics serialized in data.");
+
+#define _LSPROF_STATS_FROM_BINARY_METHODDEF    \
+    {"stats_from_binary", (PyCFunction)_lsprof_stats_from_binary, METH_O, _lsprof_stats_from_binary__doc__},
+
+static PyObject *
+_lsprof_stats_from_binary_impl(PyObject *module, Py_buffer *data);
+
+static PyObject *
+_lsprof_stats_from_binary(PyObject *module, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    Py_buffer data = {NULL, NULL};
+
+    if (PyObject_GetBuffer(arg, &data, PyBUF_SIMPLE) != 0) {
+        goto exit;
+    }
+    if (!PyBuffer_IsContiguous(&data, 'C')) {
+        _PyArg_BadArgument("stats_from_binary", "argument", "contiguous buffer", arg);
+        goto exit;
+    }
+    return_value = _lsprof_stats_from_binary_impl(module, &data);
+
+exit:
+    /* Cleanup for data */
+    if (data.obj) {
+       PyBuffer_Release(&data);
+    }
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_lsprof_merge_binary_stats__doc__,
+"merge_binary_stats($module, profiles, /)\n"
+"--\n"
+"\n"
+"Merge an iterable of profile statistics in the binary format.\n"
+"\n"
+"Return the sum of the statistics, in the binary format.");
+
+#define _LSPROF_MERGE_BINARY_STATS_METHODDEF    \
+    {"merge_binary_stats", (PyCFunction)_lsprof_merge_binary_stats, METH_O, _lsprof_merge_binary_stats__doc__},
+/*[clinic end generated code: output=2388b16cf42f5ab9 input=a9049054013a1b77]*/
@@ -75,38 +75,65 @@ PyDoc_STRVAR(_tracemalloc__get_object_traceback__doc__,
     {"_get_object_traceback", (PyCFunction)_tracemalloc__get_object_traceback, METH_O, _tracemalloc__get_object_traceback__doc__},
 
 PyDoc_STRVAR(_tracemalloc_start__doc__,
-"start($module, nframe=1, /)\n"
+"start($module, nframe=1, /, *, sampling_interval=0)\n"
 "--\n"
 "\n"
 "Start tracing Python memory allocations.\n"
 "\n"
 "Also set the maximum number of frames stored in the traceback of a\n"
-"trace to nframe.");
+"trace to nframe.\n"
+"\n"
+"If sampling_interval is greater than zero, only trace a random sample of\n"
+"the memory blocks, on average one per sampling_interval bytes allocated.");
 
 #define _TRACEMALLOC_START_METHODDEF    \
-    {"start", (PyCFunction)(void(*)(void))_tracemalloc_start, METH_FASTCALL, _tracemalloc_start__doc__},
+    {"start", (PyCFunction)(void(*)(void))_tracemalloc_start, METH_FASTCALL|METH_KEYWORDS, _tracemalloc_start__doc__},
 
 static PyObject *
-_tracemalloc_start_impl(PyObject *module, int nframe);
+_tracemalloc_start_impl(PyObject *module, int nframe,
+                        Py_ssize_t sampling_interval);
 
 static PyObject *
-_tracemalloc_start(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+_tracemalloc_start(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
     PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"", "sampling_interval", NULL};
+    static _PyArg_Parser _parser = {NULL, _keywords, "start", 0};
+    PyObject *argsbuf[2];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
     int nframe = 1;
+    Py_ssize_t sampling_interval = 0;
 
-    if (!_PyArg_CheckPositional("start", nargs, 0, 1)) {
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 0, 1, 0, argsbuf);
+    if (!args) {
         goto exit;
     }
     if (nargs < 1) {
-        goto skip_optional;
+        goto skip_optional_posonly;
     }
+    noptargs--;
     nframe = _PyLong_AsInt(args[0]);
     if (nframe == -1 && PyErr_Occurred()) {
         goto exit;
     }
-skip_optional:
-    return_value = _tracemalloc_start_impl(module, nframe);
+skip_optional_posonly:
+    if (!noptargs) {
+        goto skip_optional_kwonly;
+    }
+    {
+        Py_ssize_t ival = -1;
+        PyObject *iobj = _PyNumber_Index(args[1]);
+        if (iobj != NULL) {
+            ival = PyLong_AsSsize_t(iobj);
+            Py_DECREF(iobj);
+        }
+        if (ival == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+        sampling_interval = ival;
+    }
+skip_optional_kwonly:
+    return_value = _tracemalloc_start_impl(module, nframe, sampling_interval);
 
 exit:
     return return_value;
@@ -153,6 +180,26 @@ _tracemalloc_get_traceback_limit(PyObject *module, PyObject *Py_UNUSED(ignored))
     return _tracemalloc_get_traceback_limit_impl(module);
 }
 
+PyDoc_STRVAR(_tracemalloc_get_sampling_interval__doc__,
+"get_sampling_interval($module, /)\n"
+"--\n"
+"\n"
+"Get the mean number of bytes allocated between two traced memory blocks.\n"
+"\n"
+"Return 0 if every memory block is traced.");
+
+#define _TRACEMALLOC_GET_SAMPLING_INTERVAL_METHODDEF    \
+    {"get_sampling_interval", (PyCFunction)_tracemalloc_get_sampling_interval, METH_NOARGS, _tracemalloc_get_sampling_interval__doc__},
+
+static PyObject *
+_tracemalloc_get_sampling_interval_impl(PyObject *module);
+
+static PyObject *
+_tracemalloc_get_sampling_interval(PyObject *module, PyObject *Py_UNUSED(ignored))
+{
+    return _tracemalloc_get_sampling_interval_impl(module);
+}
+
 PyDoc_STRVAR(_tracemalloc_get_tracemalloc_memory__doc__,
 "get_tracemalloc_memory($module, /)\n"
 "--\n"
@@ -212,4 +259,4 @@ _tracemalloc_reset_peak(PyObject *module, PyObject *Py_UNUSED(ignored))
 {
     return _tracemalloc_reset_peak_impl(module);
 }
-/*[clinic end generated code: output=bafca0a19b0b0823 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=a6c463b45fa4981b input=a9049054013a1b77]*/
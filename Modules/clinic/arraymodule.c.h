@@ -38,6 +38,491 @@ PyDoc_STRVAR(array_array_count__doc__,
 #define ARRAY_ARRAY_COUNT_METHODDEF    \
     {"count", (PyCFunction)array_array_count, METH_O, array_array_count__doc__},
 
+PyDoc_STRVAR(array_array_sum__doc__,
+"sum($self, /)\n"
+"--\n"
+"\n"
+"Return the sum of the items of the array.\n"
+"\n"
+"The result is the same as sum(array), but no object is created for each\n"
+"item.  The sum of an integer array is exact, and a float array is summed\n"
+"in double precision, in order.");
+
+#define ARRAY_ARRAY_SUM_METHODDEF    \
+    {"sum", (PyCFunction)array_array_sum, METH_NOARGS, array_array_sum__doc__},
+
+static PyObject *
+array_array_sum_impl(arrayobject *self);
+
+static PyObject *
+array_array_sum(arrayobject *self, PyObject *Py_UNUSED(ignored))
+{
+    return array_array_sum_impl(self);
+}
+
+PyDoc_STRVAR(array_array_min__doc__,
+"min($self, /)\n"
+"--\n"
+"\n"
+"Return the smallest item of the array.\n"
+"\n"
+"The result is the same as min(array).  Raise ValueError if the array is\n"
+"empty.");
+
+#define ARRAY_ARRAY_MIN_METHODDEF    \
+    {"min", (PyCFunction)array_array_min, METH_NOARGS, array_array_min__doc__},
+
+static PyObject *
+array_array_min_impl(arrayobject *self);
+
+static PyObject *
+array_array_min(arrayobject *self, PyObject *Py_UNUSED(ignored))
+{
+    return array_array_min_impl(self);
+}
+
+PyDoc_STRVAR(array_array_max__doc__,
+"max($self, /)\n"
+"--\n"
+"\n"
+"Return the largest item of the array.\n"
+"\n"
+"The result is the same as max(array).  Raise ValueError if the array is\n"
+"empty.");
+
+#define ARRAY_ARRAY_MAX_METHODDEF    \
+    {"max", (PyCFunction)array_array_max, METH_NOARGS, array_array_max__doc__},
+
+static PyObject *
+array_array_max_impl(arrayobject *self);
+
+static PyObject *
+array_array_max(arrayobject *self, PyObject *Py_UNUSED(ignored))
+{
+    return array_array_max_impl(self);
+}
+
+PyDoc_STRVAR(array_array_dot__doc__,
+"dot($self, other, /)\n"
+"--\n"
+"\n"
+"Return the sum of the products of the items of two arrays.\n"
+"\n"
+"The arrays must have the same typecode and length.  The result is the same\n"
+"as sum(x * y for x, y in zip(array, other)), but no object is created for\n"
+"each item.");
+
+#define ARRAY_ARRAY_DOT_METHODDEF    \
+    {"dot", (PyCFunction)(void(*)(void))array_array_dot, METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_dot__doc__},
+
+static PyObject *
+array_array_dot_impl(arrayobject *self, PyTypeObject *cls, PyObject *other);
+
+static PyObject *
+array_array_dot(arrayobject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {"O:dot", _keywords, 0};
+    PyObject *other;
+
+    if (!_PyArg_ParseStackAndKeywords(args, nargs, kwnames, &_parser,
+        &other)) {
+        goto exit;
+    }
+    return_value = array_array_dot_impl(self, cls, other);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_mean__doc__,
+"mean($self, /)\n"
+"--\n"
+"\n"
+"Return the arithmetic mean of the items of the array.\n"
+"\n"
+"The result is a float, computed as array.sum() / len(array).  Raise\n"
+"ValueError if the array is empty.");
+
+#define ARRAY_ARRAY_MEAN_METHODDEF    \
+    {"mean", (PyCFunction)array_array_mean, METH_NOARGS, array_array_mean__doc__},
+
+static PyObject *
+array_array_mean_impl(arrayobject *self);
+
+static PyObject *
+array_array_mean(arrayobject *self, PyObject *Py_UNUSED(ignored))
+{
+    return array_array_mean_impl(self);
+}
+
+PyDoc_STRVAR(array_array_add__doc__,
+"add($self, other, /)\n"
+"--\n"
+"\n"
+"Add the items of another array to the items of the array, in place.\n"
+"\n"
+"The arrays must have the same typecode and length.  The array is left\n"
+"unchanged if a result does not fit in its typecode.");
+
+#define ARRAY_ARRAY_ADD_METHODDEF    \
+    {"add", (PyCFunction)(void(*)(void))array_array_add, METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_add__doc__},
+
+static PyObject *
+array_array_add_impl(arrayobject *self, PyTypeObject *cls, PyObject *other);
+
+static PyObject *
+array_array_add(arrayobject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {"O:add", _keywords, 0};
+    PyObject *other;
+
+    if (!_PyArg_ParseStackAndKeywords(args, nargs, kwnames, &_parser,
+        &other)) {
+        goto exit;
+    }
+    return_value = array_array_add_impl(self, cls, other);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_mul__doc__,
+"mul($self, other, /)\n"
+"--\n"
+"\n"
+"Multiply the items of the array by the items of another array, in place.\n"
+"\n"
+"The arrays must have the same typecode and length.  The array is left\n"
+"unchanged if a result does not fit in its typecode.");
+
+#define ARRAY_ARRAY_MUL_METHODDEF    \
+    {"mul", (PyCFunction)(void(*)(void))array_array_mul, METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_mul__doc__},
+
+static PyObject *
+array_array_mul_impl(arrayobject *self, PyTypeObject *cls, PyObject *other);
+
+static PyObject *
+array_array_mul(arrayobject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {"O:mul", _keywords, 0};
+    PyObject *other;
+
+    if (!_PyArg_ParseStackAndKeywords(args, nargs, kwnames, &_parser,
+        &other)) {
+        goto exit;
+    }
+    return_value = array_array_mul_impl(self, cls, other);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_scale__doc__,
+"scale($self, factor, /)\n"
+"--\n"
+"\n"
+"Multiply the items of the array by factor, in place.\n"
+"\n"
+"factor must be a valid item of the array.  The array is left unchanged if\n"
+"a result does not fit in its typecode.");
+
+#define ARRAY_ARRAY_SCALE_METHODDEF    \
+    {"scale", (PyCFunction)(void(*)(void))array_array_scale, METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_scale__doc__},
+
+static PyObject *
+array_array_scale_impl(arrayobject *self, PyTypeObject *cls,
+                       PyObject *factor);
+
+static PyObject *
+array_array_scale(arrayobject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {"O:scale", _keywords, 0};
+    PyObject *factor;
+
+    if (!_PyArg_ParseStackAndKeywords(args, nargs, kwnames, &_parser,
+        &factor)) {
+        goto exit;
+    }
+    return_value = array_array_scale_impl(self, cls, factor);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_sub__doc__,
+"sub($self, other, /)\n"
+"--\n"
+"\n"
+"Subtract the items of another array from the items of the array, in place.\n"
+"\n"
+"The arrays must have the same typecode and length.  The array is left\n"
+"unchanged if a result does not fit in its typecode.");
+
+#define ARRAY_ARRAY_SUB_METHODDEF    \
+    {"sub", (PyCFunction)(void(*)(void))array_array_sub, METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_sub__doc__},
+
+static PyObject *
+array_array_sub_impl(arrayobject *self, PyTypeObject *cls, PyObject *other);
+
+static PyObject *
+array_array_sub(arrayobject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {"O:sub", _keywords, 0};
+    PyObject *other;
+
+    if (!_PyArg_ParseStackAndKeywords(args, nargs, kwnames, &_parser,
+        &other)) {
+        goto exit;
+    }
+    return_value = array_array_sub_impl(self, cls, other);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_truediv__doc__,
+"truediv($self, other, /)\n"
+"--\n"
+"\n"
+"Divide the items of the array by the items of another array, in place.\n"
+"\n"
+"The arrays must have the same floating point typecode and length.  Raise\n"
+"ZeroDivisionError, leaving the array unchanged, if an item of other is\n"
+"zero.");
+
+#define ARRAY_ARRAY_TRUEDIV_METHODDEF    \
+    {"truediv", (PyCFunction)(void(*)(void))array_array_truediv, METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_truediv__doc__},
+
+static PyObject *
+array_array_truediv_impl(arrayobject *self, PyTypeObject *cls,
+                         PyObject *other);
+
+static PyObject *
+array_array_truediv(arrayobject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {"O:truediv", _keywords, 0};
+    PyObject *other;
+
+    if (!_PyArg_ParseStackAndKeywords(args, nargs, kwnames, &_parser,
+        &other)) {
+        goto exit;
+    }
+    return_value = array_array_truediv_impl(self, cls, other);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_eq__doc__,
+"eq($self, other, /)\n"
+"--\n"
+"\n"
+"Return an array(\'b\') which is 1 where the items of two arrays are equal.\n"
+"\n"
+"The arrays must have the same typecode and length.  The item of the result\n"
+"is 0 where the comparison is false.");
+
+#define ARRAY_ARRAY_EQ_METHODDEF    \
+    {"eq", (PyCFunction)(void(*)(void))array_array_eq, METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_eq__doc__},
+
+static PyObject *
+array_array_eq_impl(arrayobject *self, PyTypeObject *cls, PyObject *other);
+
+static PyObject *
+array_array_eq(arrayobject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {"O:eq", _keywords, 0};
+    PyObject *other;
+
+    if (!_PyArg_ParseStackAndKeywords(args, nargs, kwnames, &_parser,
+        &other)) {
+        goto exit;
+    }
+    return_value = array_array_eq_impl(self, cls, other);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_ne__doc__,
+"ne($self, other, /)\n"
+"--\n"
+"\n"
+"Return an array(\'b\') which is 1 where the items of two arrays differ.\n"
+"\n"
+"The arrays must have the same typecode and length.  The item of the result\n"
+"is 0 where the comparison is false.");
+
+#define ARRAY_ARRAY_NE_METHODDEF    \
+    {"ne", (PyCFunction)(void(*)(void))array_array_ne, METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_ne__doc__},
+
+static PyObject *
+array_array_ne_impl(arrayobject *self, PyTypeObject *cls, PyObject *other);
+
+static PyObject *
+array_array_ne(arrayobject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {"O:ne", _keywords, 0};
+    PyObject *other;
+
+    if (!_PyArg_ParseStackAndKeywords(args, nargs, kwnames, &_parser,
+        &other)) {
+        goto exit;
+    }
+    return_value = array_array_ne_impl(self, cls, other);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_lt__doc__,
+"lt($self, other, /)\n"
+"--\n"
+"\n"
+"Return an array(\'b\') which is 1 where an item is less than the other one.\n"
+"\n"
+"The arrays must have the same typecode and length.  The item of the result\n"
+"is 0 where the comparison is false.");
+
+#define ARRAY_ARRAY_LT_METHODDEF    \
+    {"lt", (PyCFunction)(void(*)(void))array_array_lt, METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_lt__doc__},
+
+static PyObject *
+array_array_lt_impl(arrayobject *self, PyTypeObject *cls, PyObject *other);
+
+static PyObject *
+array_array_lt(arrayobject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {"O:lt", _keywords, 0};
+    PyObject *other;
+
+    if (!_PyArg_ParseStackAndKeywords(args, nargs, kwnames, &_parser,
+        &other)) {
+        goto exit;
+    }
+    return_value = array_array_lt_impl(self, cls, other);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_le__doc__,
+"le($self, other, /)\n"
+"--\n"
+"\n"
+"Return an array(\'b\') which is 1 where an item is at most the other one.\n"
+"\n"
+"The arrays must have the same typecode and length.  The item of the result\n"
+"is 0 where the comparison is false.");
+
+#define ARRAY_ARRAY_LE_METHODDEF    \
+    {"le", (PyCFunction)(void(*)(void))array_array_le, METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_le__doc__},
+
+static PyObject *
+array_array_le_impl(arrayobject *self, PyTypeObject *cls, PyObject *other);
+
+static PyObject *
+array_array_le(arrayobject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {"O:le", _keywords, 0};
+    PyObject *other;
+
+    if (!_PyArg_ParseStackAndKeywords(args, nargs, kwnames, &_parser,
+        &other)) {
+        goto exit;
+    }
+    return_value = array_array_le_impl(self, cls, other);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_gt__doc__,
+"gt($self, other, /)\n"
+"--\n"
+"\n"
+"Return an array(\'b\') which is 1 where an item is greater than the other one.\n"
+"\n"
+"The arrays must have the same typecode and length.  The item of the result\n"
+"is 0 where the comparison is false.");
+
+#define ARRAY_ARRAY_GT_METHODDEF    \
+    {"gt", (PyCFunction)(void(*)(void))array_array_gt, METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_gt__doc__},
+
+static PyObject *
+array_array_gt_impl(arrayobject *self, PyTypeObject *cls, PyObject *other);
+
+static PyObject *
+array_array_gt(arrayobject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {"O:gt", _keywords, 0};
+    PyObject *other;
+
+    if (!_PyArg_ParseStackAndKeywords(args, nargs, kwnames, &_parser,
+        &other)) {
+        goto exit;
+    }
+    return_value = array_array_gt_impl(self, cls, other);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(array_array_ge__doc__,
+"ge($self, other, /)\n"
+"--\n"
+"\n"
+"Return an array(\'b\') which is 1 where an item is at least the other one.\n"
+"\n"
+"The arrays must have the same typecode and length.  The item of the result\n"
+"is 0 where the comparison is false.");
+
+#define ARRAY_ARRAY_GE_METHODDEF    \
+    {"ge", (PyCFunction)(void(*)(void))array_array_ge, METH_METHOD|METH_FASTCALL|METH_KEYWORDS, array_array_ge__doc__},
+
+static PyObject *
+array_array_ge_impl(arrayobject *self, PyTypeObject *cls, PyObject *other);
+
+static PyObject *
+array_array_ge(arrayobject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"", NULL};
+    static _PyArg_Parser _parser = {"O:ge", _keywords, 0};
+    PyObject *other;
+
+    if (!_PyArg_ParseStackAndKeywords(args, nargs, kwnames, &_parser,
+        &other)) {
+        goto exit;
+    }
+    return_value = array_array_ge_impl(self, cls, other);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(array_array_index__doc__,
 "index($self, v, start=0, stop=sys.maxsize, /)\n"
 "--\n"
@@ -572,4 +1057,4 @@ PyDoc_STRVAR(array_arrayiterator___setstate____doc__,
 
 #define ARRAY_ARRAYITERATOR___SETSTATE___METHODDEF    \
     {"__setstate__", (PyCFunction)array_arrayiterator___setstate__, METH_O, array_arrayiterator___setstate____doc__},
-/*[clinic end generated code: output=376001addedc67ee input=a9049054013a1b77]*/
+/*[clinic end generated code: output=0cce00ee88dcab8a input=a9049054013a1b77]*/
@@ -265,6 +265,75 @@ gc_get_objects(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObje
     return return_value;
 }
 
+PyDoc_STRVAR(gc_get_census__doc__,
+"get_census($module, /, generation=None, *, by_module=False)\n"
+"--\n"
+"\n"
+"Return a dictionary mapping types to (count, size) of tracked objects.\n"
+"\n"
+"  generation\n"
+"    Generation to take the census of.\n"
+"  by_module\n"
+"    Group the objects by the file where they were allocated.\n"
+"\n"
+"The objects tracked by the collector are counted per type without\n"
+"creating a list of them.  size is an estimate of the number of bytes\n"
+"used by the objects, including the storage of dicts, lists, sets and\n"
+"bytearrays.  If generation is not None, only the objects in that\n"
+"generation are counted.\n"
+"\n"
+"If by_module is true, the keys are (type, filename) tuples, where\n"
+"filename is the file of the most recent frame where the object was\n"
+"allocated according to tracemalloc, or None if the object is not traced.\n"
+"tracemalloc must be tracing memory allocations.");
+
+#define GC_GET_CENSUS_METHODDEF    \
+    {"get_census", (PyCFunction)(void(*)(void))gc_get_census, METH_FASTCALL|METH_KEYWORDS, gc_get_census__doc__},
+
+static PyObject *
+gc_get_census_impl(PyObject *module, Py_ssize_t generation, int by_module);
+
+static PyObject *
+gc_get_census(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"generation", "by_module", NULL};
+    static _PyArg_Parser _parser = {NULL, _keywords, "get_census", 0};
+    PyObject *argsbuf[2];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    Py_ssize_t generation = -1;
+    int by_module = 0;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 0, 1, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (args[0]) {
+        if (!_Py_convert_optional_to_ssize_t(args[0], &generation)) {
+            goto exit;
+        }
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+skip_optional_pos:
+    if (!noptargs) {
+        goto skip_optional_kwonly;
+    }
+    by_module = PyObject_IsTrue(args[1]);
+    if (by_module < 0) {
+        goto exit;
+    }
+skip_optional_kwonly:
+    return_value = gc_get_census_impl(module, generation, by_module);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(gc_get_stats__doc__,
 "get_stats($module, /)\n"
 "--\n"
@@ -372,4 +441,4 @@ gc_get_freeze_count(PyObject *module, PyObject *Py_UNUSED(ignored))
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=61e15f3a549f3ab5 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=fe4422e5bac46e61 input=a9049054013a1b77]*/
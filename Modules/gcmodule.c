@@ -25,10 +25,12 @@
 
 #include "Python.h"
 #include "pycore_context.h"
+#include "pycore_hashtable.h"     // _Py_hashtable_new_full()
 #include "pycore_initconfig.h"
 #include "pycore_interp.h"      // PyInterpreterState.gc
 #include "pycore_object.h"
 #include "pycore_pyerrors.h"
+#include "pycore_pymem.h"       // _Py_tracemalloc_config
 #include "pycore_pystate.h"     // _PyThreadState_GET()
 #include "pydtrace.h"
 
@@ -1811,6 +1813,286 @@ gc_get_objects_impl(PyObject *module, Py_ssize_t generation)
     return NULL;
 }
 
+/* Key of the census: the type and, when grouping by module, the filename
+   of the most recent frame where the object was allocated (NULL if the
+   object is not traced by tracemalloc). */
+typedef struct {
+    PyTypeObject *type;
+    PyObject *filename;
+} census_key;
+
+/* Per-key totals accumulated by gc.get_census(). */
+typedef struct {
+    Py_ssize_t count;
+    Py_ssize_t size;
+} census_entry;
+
+/* Estimate the memory used by a GC tracked object without calling
+   __sizeof__, so that no Python code runs while the lists are walked.
+   The separately allocated storage of the common containers is included;
+   for other types the estimate is the size of the object itself. */
+static Py_ssize_t
+census_sizeof(PyObject *op)
+{
+    PyTypeObject *tp = Py_TYPE(op);
+    Py_ssize_t size;
+
+    if (PyDict_Check(op)) {
+        size = _PyDict_SizeOf((PyDictObject *)op);
+    }
+    else {
+        size = tp->tp_basicsize;
+        if (tp->tp_itemsize) {
+            size += Py_ABS(Py_SIZE(op)) * tp->tp_itemsize;
+        }
+        if (PyList_Check(op)) {
+            size += ((PyListObject *)op)->allocated * sizeof(PyObject *);
+        }
+        else if (PyAnySet_Check(op)) {
+            PySetObject *so = (PySetObject *)op;
+            if (so->table != so->smalltable) {
+                size += (so->mask + 1) * sizeof(setentry);
+            }
+        }
+        else if (PyByteArray_Check(op)) {
+            size += ((PyByteArrayObject *)op)->ob_alloc;
+        }
+    }
+    return size + sizeof(PyGC_Head);
+}
+
+static Py_uhash_t
+census_key_hash(const void *key)
+{
+    const census_key *ck = (const census_key *)key;
+    return (_Py_hashtable_hash_ptr(ck->type)
+            ^ (_Py_hashtable_hash_ptr(ck->filename) * 1000003));
+}
+
+/* tracemalloc stores each filename once, so filenames can be compared by
+   identity. */
+static int
+census_key_compare(const void *key1, const void *key2)
+{
+    const census_key *ck1 = (const census_key *)key1;
+    const census_key *ck2 = (const census_key *)key2;
+    return ck1->type == ck2->type && ck1->filename == ck2->filename;
+}
+
+static void
+census_key_destroy(void *key)
+{
+    census_key *ck = (census_key *)key;
+    Py_DECREF(ck->type);
+    Py_XDECREF(ck->filename);
+    PyMem_Free(ck);
+}
+
+/* Get a new reference to the filename of the most recent frame where the
+   memory block of the object was allocated, or NULL if it is not traced.
+   Return -1 with an exception set on error. */
+static int
+census_get_filename(PyGC_Head *gc, PyObject **filename)
+{
+    /* The memory block of a GC object starts with its PyGC_Head */
+    PyObject *traceback = _PyTraceMalloc_GetTraceback(0, (uintptr_t)gc);
+    if (traceback == NULL) {
+        return -1;
+    }
+    *filename = NULL;
+    if (traceback != Py_None && PyTuple_GET_SIZE(traceback) > 0) {
+        PyObject *frame = PyTuple_GET_ITEM(traceback, 0);
+        *filename = PyTuple_GET_ITEM(frame, 0);
+        Py_INCREF(*filename);
+    }
+    Py_DECREF(traceback);
+    return 0;
+}
+
+static int
+census_add_objects(_Py_hashtable_t *census, PyGC_Head *gc_list,
+                   int by_module)
+{
+    PyGC_Head *gc;
+    for (gc = GC_NEXT(gc_list); gc != gc_list; gc = GC_NEXT(gc)) {
+        PyObject *op = FROM_GC(gc);
+        census_key key = {Py_TYPE(op), NULL};
+        /* The traceback built here is destroyed before moving to the next
+           object, so it is never visited by the loop. */
+        if (by_module && census_get_filename(gc, &key.filename) < 0) {
+            return -1;
+        }
+        census_entry *entry = _Py_hashtable_get(census, &key);
+        if (entry == NULL) {
+            census_key *new_key = PyMem_Malloc(sizeof(census_key));
+            if (new_key == NULL) {
+                Py_XDECREF(key.filename);
+                PyErr_NoMemory();
+                return -1;
+            }
+            entry = PyMem_Malloc(sizeof(census_entry));
+            if (entry == NULL) {
+                PyMem_Free(new_key);
+                Py_XDECREF(key.filename);
+                PyErr_NoMemory();
+                return -1;
+            }
+            entry->count = 0;
+            entry->size = 0;
+            *new_key = key;
+            if (_Py_hashtable_set(census, new_key, entry) < 0) {
+                PyMem_Free(entry);
+                PyMem_Free(new_key);
+                Py_XDECREF(key.filename);
+                PyErr_NoMemory();
+                return -1;
+            }
+            /* Keep the type alive until the result has been built */
+            Py_INCREF(key.type);
+        }
+        else {
+            Py_XDECREF(key.filename);
+        }
+        entry->count++;
+        entry->size += census_sizeof(op);
+    }
+    return 0;
+}
+
+typedef struct {
+    PyObject *result;
+    int by_module;
+} census_result;
+
+static int
+census_add_to_dict(_Py_hashtable_t *census, const void *key,
+                   const void *value, void *user_data)
+{
+    const census_key *ck = (const census_key *)key;
+    const census_entry *entry = (const census_entry *)value;
+    census_result *data = (census_result *)user_data;
+    PyObject *dict_key;
+    if (data->by_module) {
+        dict_key = PyTuple_Pack(2, (PyObject *)ck->type,
+                                ck->filename ? ck->filename : Py_None);
+        if (dict_key == NULL) {
+            return -1;
+        }
+    }
+    else {
+        dict_key = (PyObject *)ck->type;
+        Py_INCREF(dict_key);
+    }
+    PyObject *item = Py_BuildValue("nn", entry->count, entry->size);
+    if (item == NULL) {
+        Py_DECREF(dict_key);
+        return -1;
+    }
+    int res = PyDict_SetItem(data->result, dict_key, item);
+    Py_DECREF(dict_key);
+    Py_DECREF(item);
+    return res;
+}
+
+/*[clinic input]
+gc.get_census
+    generation: Py_ssize_t(accept={int, NoneType}, c_default="-1") = None
+        Generation to take the census of.
+    *
+    by_module: bool = False
+        Group the objects by the file where they were allocated.
+
+Return a dictionary mapping types to (count, size) of tracked objects.
+
+The objects tracked by the collector are counted per type without
+creating a list of them.  size is an estimate of the number of bytes
+used by the objects, including the storage of dicts, lists, sets and
+bytearrays.  If generation is not None, only the objects in that
+generation are counted.
+
+If by_module is true, the keys are (type, filename) tuples, where
+filename is the file of the most recent frame where the object was
+allocated according to tracemalloc, or None if the object is not traced.
+tracemalloc must be tracing memory allocations.
+[clinic start generated code]*/
+
+static PyObject *
+gc_get_census_impl(PyObject *module, Py_ssize_t generation, int by_module)
+/*[clinic end generated code: output=350fc460de78d638 input=1ace497ac55dab65]*/
+{
+    PyThreadState *tstate = _PyThreadState_GET();
+    GCState *gcstate = &tstate->interp->gc;
+    _Py_hashtable_t *census;
+    census_result data = {NULL, by_module};
+    int collecting, res = 0;
+    int i;
+
+    if (PySys_Audit("gc.get_census", "n", generation) < 0) {
+        return NULL;
+    }
+
+    if (generation != -1) {
+        if (generation >= NUM_GENERATIONS) {
+            _PyErr_Format(tstate, PyExc_ValueError,
+                          "generation parameter must be less than the number of "
+                          "available generations (%i)",
+                           NUM_GENERATIONS);
+            return NULL;
+        }
+
+        if (generation < 0) {
+            _PyErr_SetString(tstate, PyExc_ValueError,
+                             "generation parameter cannot be negative");
+            return NULL;
+        }
+    }
+
+    if (by_module && !_Py_tracemalloc_config.tracing) {
+        _PyErr_SetString(tstate, PyExc_RuntimeError,
+                         "the tracemalloc module must be tracing memory "
+                         "allocations to group objects by module");
+        return NULL;
+    }
+
+    census = _Py_hashtable_new_full(census_key_hash, census_key_compare,
+                                    census_key_destroy, PyMem_Free, NULL);
+    if (census == NULL) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+
+    /* Getting the tracebacks of the objects allocates Python objects:
+       prevent the collector from running and moving objects between
+       generations while the lists are walked. */
+    collecting = gcstate->collecting;
+    gcstate->collecting = 1;
+    for (i = 0; i < NUM_GENERATIONS; i++) {
+        if (generation != -1 && generation != i) {
+            continue;
+        }
+        res = census_add_objects(census, GEN_HEAD(gcstate, i), by_module);
+        if (res < 0) {
+            break;
+        }
+    }
+    gcstate->collecting = collecting;
+    if (res < 0) {
+        goto done;
+    }
+
+    data.result = PyDict_New();
+    if (data.result == NULL) {
+        goto done;
+    }
+    if (_Py_hashtable_foreach(census, census_add_to_dict, &data) < 0) {
+        Py_CLEAR(data.result);
+    }
+
+done:
+    _Py_hashtable_destroy(census);
+    return data.result;
+}
+
 /*[clinic input]
 gc.get_stats
 
@@ -1972,6 +2254,7 @@ PyDoc_STRVAR(gc__doc__,
 "set_threshold() -- Set the collection thresholds.\n"
 "get_threshold() -- Return the current the collection thresholds.\n"
 "get_objects() -- Return a list of all objects tracked by the collector.\n"
+"get_census() -- Return per-type counts and sizes of tracked objects.\n"
 "is_tracked() -- Returns true if a given object is tracked.\n"
 "is_finalized() -- Returns true if a given object has been already finalized.\n"
 "get_referrers() -- Return the list of objects that refer to an object.\n"
@@ -1991,6 +2274,7 @@ static PyMethodDef GcMethods[] = {
     GC_GET_THRESHOLD_METHODDEF
     GC_COLLECT_METHODDEF
     GC_GET_OBJECTS_METHODDEF
+    GC_GET_CENSUS_METHODDEF
     GC_GET_STATS_METHODDEF
     GC_IS_TRACKED_METHODDEF
     GC_IS_FINALIZED_METHODDEF
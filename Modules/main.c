@@ -573,6 +573,7 @@ pymain_run_python(int *exitcode)
 
     pymain_header(config);
     pymain_import_readline(config);
+    _Py_StartupTiming(config, "main");
 
     if (config->run_command) {
         *exitcode = pymain_run_command(config->run_command);
@@ -266,6 +266,8 @@ PyCode_NewWithPosOnlyArgs(int argcount, int posonlyargcount, int kwonlyargcount,
     co->co_zombieframe = NULL;
     co->co_weakreflist = NULL;
     co->co_extra = NULL;
+    co->co_monitors = NULL;
+    co->co_monitor_events = 0;
 
     co->co_opcache_map = NULL;
     co->co_opcache = NULL;
@@ -635,6 +637,26 @@ code_new_impl(PyTypeObject *type, int argcount, int posonlyargcount,
     return co;
 }
 
+PyObject *
+_PyCode_GetMonitorCallback(PyObject *ref)
+{
+    if (PyTuple_CheckExact(ref)) {
+        /* Bound method: weak references to its function and to self */
+        PyObject *func = PyWeakref_GET_OBJECT(PyTuple_GET_ITEM(ref, 0));
+        PyObject *self = PyWeakref_GET_OBJECT(PyTuple_GET_ITEM(ref, 1));
+        if (func == Py_None || self == Py_None) {
+            return NULL;
+        }
+        return PyMethod_New(func, self);
+    }
+    PyObject *callback = PyWeakref_GET_OBJECT(ref);
+    if (callback == Py_None) {
+        return NULL;
+    }
+    Py_INCREF(callback);
+    return callback;
+}
+
 static void
 code_dealloc(PyCodeObject *co)
 {
@@ -672,6 +694,7 @@ code_dealloc(PyCodeObject *co)
     Py_XDECREF(co->co_name);
     Py_XDECREF(co->co_linetable);
     Py_XDECREF(co->co_exceptiontable);
+    Py_XDECREF(co->co_monitors);
     if (co->co_cell2arg != NULL)
         PyMem_Free(co->co_cell2arg);
     if (co->co_zombieframe != NULL)
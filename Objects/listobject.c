@@ -2165,6 +2165,155 @@ unsafe_tuple_compare(PyObject *v, PyObject *w, MergeState *ms)
         return PyObject_RichCompareBool(vt->ob_item[i], wt->ob_item[i], Py_LT);
 }
 
+/* Lists of at least this many keys, all of them floats or all of them ints
+ * fitting in a single digit, are sorted by radix_sort() instead.
+ */
+#define RADIX_SORT_MIN 256
+
+/* radix_sort() leaves data made of long ascending or descending runs to the
+ * merge sort, which handles it in linear time.  To tell, it looks at
+ * RADIX_SORT_SAMPLE pairs of adjacent keys spread over the list, and gives
+ * up unless at least RADIX_SORT_MIN_DISORDER of them are in ascending order
+ * and as many are in descending order.
+ */
+#define RADIX_SORT_SAMPLE 64
+#define RADIX_SORT_MIN_DISORDER 2
+
+typedef struct {
+    uint64_t key;
+    Py_ssize_t index;
+} radix_item;
+
+/* Map a float or single-digit int key to an unsigned integer, such that the
+ * order of the integers is the order of the keys.  Return -1 for a NaN,
+ * which doesn't compare consistently, and 0 otherwise.
+ */
+Py_LOCAL_INLINE(int)
+radix_key(PyObject *key, PyTypeObject *key_type, uint64_t *result)
+{
+    uint64_t u;
+
+    if (key_type == &PyFloat_Type) {
+        double d = PyFloat_AS_DOUBLE(key);
+        if (Py_IS_NAN(d))
+            return -1;
+        if (d == 0.0)
+            d = 0.0;  /* -0.0 == 0.0 */
+        memcpy(&u, &d, sizeof(u));
+        /* Flip all bits of negative floats and the sign bit of positive
+           ones. */
+        u ^= (u & ((uint64_t)1 << 63)) ? ~(uint64_t)0 : (uint64_t)1 << 63;
+    }
+    else {
+        Py_ssize_t size = Py_SIZE(key);
+        int64_t v;
+
+        assert(key_type == &PyLong_Type);
+        assert(Py_ABS(size) <= 1);
+        v = size == 0 ? 0 : (int64_t)((PyLongObject *)key)->ob_digit[0];
+        if (size < 0)
+            v = -v;
+        u = (uint64_t)(v + (int64_t)PyLong_BASE);
+    }
+    *result = u;
+    return 0;
+}
+
+/* Stable LSD radix sort for the n keys in lo, which must all be floats or
+ * all be ints with at most one digit (key_type tells which).  The keys are
+ * mapped to unsigned 64-bit integers by radix_key(), and the (integer,
+ * index) pairs are sorted one byte at a time, skipping the bytes that are
+ * the same for all keys.  The permutation found is then applied to lo.
+ *
+ * Returns 1 if lo was sorted, and 0 if the keys are better left to the merge
+ * sort:  if some float is a NaN, if the keys seem to be mostly in order
+ * already, or if memory for the pairs can't be allocated.  No exception is
+ * set in any case.
+ */
+static int
+radix_sort(sortslice *lo, Py_ssize_t n, PyTypeObject *key_type)
+{
+    radix_item *src, *dst, *tmp;
+    Py_ssize_t counts[8][256];
+    Py_ssize_t i, ascents = 0, descents = 0;
+    int byte;
+
+    assert(n > RADIX_SORT_SAMPLE);
+    for (i = 0; i < RADIX_SORT_SAMPLE; i++) {
+        Py_ssize_t j = i * (n - 1) / RADIX_SORT_SAMPLE;
+        uint64_t u, v;
+
+        if (radix_key(lo->keys[j], key_type, &u) < 0 ||
+            radix_key(lo->keys[j + 1], key_type, &v) < 0)
+            return 0;
+        ascents += u < v;
+        descents += u > v;
+    }
+    if (ascents < RADIX_SORT_MIN_DISORDER ||
+        descents < RADIX_SORT_MIN_DISORDER)
+        return 0;
+
+    if ((size_t)n > PY_SSIZE_T_MAX / (2 * sizeof(radix_item)))
+        return 0;
+    src = PyMem_Malloc(2 * n * sizeof(radix_item));
+    if (src == NULL)
+        return 0;
+    dst = src + n;
+
+    memset(counts, 0, sizeof(counts));
+    for (i = 0; i < n; i++) {
+        uint64_t u;
+
+        if (radix_key(lo->keys[i], key_type, &u) < 0) {
+            PyMem_Free(src);
+            return 0;
+        }
+        src[i].key = u;
+        src[i].index = i;
+        for (byte = 0; byte < 8; byte++)
+            counts[byte][(u >> (8 * byte)) & 0xff]++;
+    }
+
+    for (byte = 0; byte < 8; byte++) {
+        Py_ssize_t *count = counts[byte];
+        Py_ssize_t pos = 0;
+        int shift = 8 * byte;
+        int b;
+
+        if (count[(src[0].key >> shift) & 0xff] == n)
+            continue;  /* all keys have the same byte here */
+        for (b = 0; b < 256; b++) {
+            Py_ssize_t c = count[b];
+            count[b] = pos;
+            pos += c;
+        }
+        for (i = 0; i < n; i++)
+            dst[count[(src[i].key >> shift) & 0xff]++] = src[i];
+        tmp = src;
+        src = dst;
+        dst = tmp;
+    }
+
+    /* Apply the permutation, using dst (2 * n pointers fit in it) as the
+       scratch space. */
+    {
+        PyObject **keys = (PyObject **)dst;
+        PyObject **values = keys + n;
+
+        memcpy(keys, lo->keys, n * sizeof(PyObject *));
+        for (i = 0; i < n; i++)
+            lo->keys[i] = keys[src[i].index];
+        if (lo->values != NULL) {
+            memcpy(values, lo->values, n * sizeof(PyObject *));
+            for (i = 0; i < n; i++)
+                lo->values[i] = values[src[i].index];
+        }
+    }
+
+    PyMem_Free(src < dst ? src : dst);
+    return 1;
+}
+
 /* An adaptive, stable, natural mergesort.  See listsort.txt.
  * Returns Py_None on success, NULL on error.  Even in case of error, the
  * list will be some permutation of its input state (nothing is lost or
@@ -2202,6 +2351,7 @@ list_sort_impl(PyListObject *self, PyObject *keyfunc, int reverse)
     PyObject *result = NULL;            /* guilty until proved innocent */
     Py_ssize_t i;
     PyObject **keys;
+    int use_radix_sort = 0;
 
     assert(self != NULL);
     assert(PyList_Check(self));
@@ -2320,9 +2470,11 @@ list_sort_impl(PyListObject *self, PyObject *keyfunc, int reverse)
             }
             else if (key_type == &PyLong_Type && ints_are_bounded) {
                 ms.key_compare = unsafe_long_compare;
+                use_radix_sort = !keys_are_in_tuples;
             }
             else if (key_type == &PyFloat_Type) {
                 ms.key_compare = unsafe_float_compare;
+                use_radix_sort = !keys_are_in_tuples;
             }
             else if ((ms.key_richcompare = key_type->tp_richcompare) != NULL) {
                 ms.key_compare = unsafe_object_compare;
@@ -2364,6 +2516,10 @@ list_sort_impl(PyListObject *self, PyObject *keyfunc, int reverse)
         reverse_slice(&saved_ob_item[0], &saved_ob_item[saved_ob_size]);
     }
 
+    if (use_radix_sort && saved_ob_size >= RADIX_SORT_MIN &&
+        radix_sort(&lo, saved_ob_size, Py_TYPE(lo.keys[0])))
+        goto succeed;
+
     /* March over the array once, left to right, finding natural runs,
      * and extending short natural runs to minrun elements.
      */
@@ -251,8 +251,6 @@ STRINGLIB(utf8_decode)(const char **inptr, const char *end,
     goto Return;
 }
 
-#undef ASCII_CHAR_MASK
-
 
 /* UTF-8 encoder specialized for a Unicode kind to avoid the slow
    PyUnicode_READ() macro. Delete some parts of the code depending on the kind:
@@ -293,6 +291,27 @@ STRINGLIB(utf8_encoder)(_PyBytesWriter *writer,
         return NULL;
 
     for (i = 0; i < size;) {
+#if STRINGLIB_SIZEOF_CHAR == 1
+        /* Fast path for runs of ASCII characters: copy a whole size_t at
+           a time, see STRINGLIB(utf8_decode) for an explanation. */
+        if (_Py_IS_ALIGNED(data + i, ALIGNOF_SIZE_T)) {
+            /* Help register allocation */
+            Py_ssize_t _i = i;
+            char *_p = p;
+            while (_i + SIZEOF_SIZE_T <= size) {
+                size_t value = *(const size_t *) (data + _i);
+                if (value & ASCII_CHAR_MASK)
+                    break;
+                memcpy(_p, &value, SIZEOF_SIZE_T);
+                _i += SIZEOF_SIZE_T;
+                _p += SIZEOF_SIZE_T;
+            }
+            i = _i;
+            p = _p;
+            if (i == size)
+                break;
+        }
+#endif
         Py_UCS4 ch = data[i++];
 
         if (ch < 0x80) {
@@ -819,4 +838,6 @@ STRINGLIB(utf32_encode)(const STRINGLIB_CHAR *in,
 #endif
 }
 
+#undef ASCII_CHAR_MASK
+
 #endif
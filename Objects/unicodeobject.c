@@ -5128,6 +5128,111 @@ ascii_decode(const char *start, const char *end, Py_UCS1 *dest)
     return p - start;
 }
 
+#if (SIZEOF_SIZE_T == 8)
+# define UTF8_ONES_MASK 0x0101010101010101ULL
+#else
+# define UTF8_ONES_MASK 0x01010101U
+#endif
+
+/* Scan the UTF-8 encoded data in [start, end) and return the number of code
+   points it decodes to, and in *maxchar the maximum character value to pass
+   to PyUnicode_New() to hold them.  The result is only meaningful if the
+   data is valid UTF-8; the caller must still validate it while decoding.
+
+   The number of code points is the number of bytes that are not
+   continuation bytes (0b10xxxxxx), and the kind of the result only depends
+   on the largest lead byte: 0xF0 and above start a non-BMP character, and
+   0xC4 and above a character outside of Latin-1.  Like ascii_decode(), the
+   scan looks at a whole size_t at a time; bit 7 of each byte of a word is
+   combined with its lower bits shifted into that position. */
+static Py_ssize_t
+utf8_count_chars(const char *start, const char *end, Py_UCS4 *maxchar)
+{
+    const unsigned char *p = (const unsigned char *)start;
+    const unsigned char *q = (const unsigned char *)end;
+    Py_ssize_t ncont = 0;
+    size_t ucs2 = 0, ucs4 = 0;
+
+    while (p < q) {
+        if (_Py_IS_ALIGNED(p, ALIGNOF_SIZE_T)) {
+            /* Help register allocation */
+            const unsigned char *_p = p;
+            while (_p + SIZEOF_SIZE_T <= q) {
+                size_t value = *(const size_t *) _p;
+                size_t cont = value & ~(value << 1) & ASCII_CHAR_MASK;
+                size_t lead = value & (value << 1);
+                ncont += (Py_ssize_t)(((cont >> 7) * UTF8_ONES_MASK)
+                                      >> (8 * (SIZEOF_SIZE_T - 1)));
+                ucs2 |= lead & ((value << 2) | (value << 3) |
+                                (value << 4) | (value << 5));
+                ucs4 |= lead & (value << 2) & (value << 3);
+                _p += SIZEOF_SIZE_T;
+            }
+            p = _p;
+            if (p == q)
+                break;
+        }
+        ncont += (*p & 0xC0) == 0x80;
+        ucs2 |= *p >= 0xC4 ? 0x80 : 0;
+        ucs4 |= *p >= 0xF0 ? 0x80 : 0;
+        p++;
+    }
+
+    if (ucs4 & ASCII_CHAR_MASK)
+        *maxchar = MAX_UNICODE;
+    else if (ucs2 & ASCII_CHAR_MASK)
+        *maxchar = 0xFFFF;
+    else
+        *maxchar = 0xFF;
+    return (end - start) - ncont;
+}
+
+/* Decode the UTF-8 encoded data in [s, end), the first prefix bytes of which
+   are ASCII and have already been copied to ascii, directly into a string of
+   the exact final size and kind.  Return NULL without an exception set if
+   the data is not valid UTF-8; the caller then falls back to the generic
+   decoder, which handles errors. */
+static PyObject *
+unicode_decode_utf8_exact(const char *s, const char *end,
+                          PyObject *ascii, Py_ssize_t prefix)
+{
+    Py_UCS4 maxchar, ch;
+    Py_ssize_t pos = prefix;
+    Py_ssize_t length = prefix + utf8_count_chars(s + prefix, end, &maxchar);
+    PyObject *u = PyUnicode_New(length, maxchar);
+    if (u == NULL) {
+        return NULL;
+    }
+
+    const Py_UCS1 *src = PyUnicode_1BYTE_DATA(ascii);
+    void *data = PyUnicode_DATA(u);
+    s += prefix;
+    switch (PyUnicode_KIND(u)) {
+    case PyUnicode_1BYTE_KIND:
+        memcpy(data, src, prefix);
+        ch = ucs1lib_utf8_decode(&s, end, data, &pos);
+        break;
+    case PyUnicode_2BYTE_KIND:
+        _PyUnicode_CONVERT_BYTES(Py_UCS1, Py_UCS2, src, src + prefix, data);
+        ch = ucs2lib_utf8_decode(&s, end, data, &pos);
+        break;
+    default:
+        assert(PyUnicode_KIND(u) == PyUnicode_4BYTE_KIND);
+        _PyUnicode_CONVERT_BYTES(Py_UCS1, Py_UCS4, src, src + prefix, data);
+        ch = ucs4lib_utf8_decode(&s, end, data, &pos);
+        break;
+    }
+
+    if (ch != 0 || s != end) {
+        /* invalid or truncated data */
+        Py_DECREF(u);
+        return NULL;
+    }
+    assert(pos == length);
+    assert(_PyUnicode_CheckConsistency(u, 1));
+    return u;
+}
+
 static PyObject *
 unicode_decode_utf8(const char *s, Py_ssize_t size,
                     _Py_error_handler error_handler, const char *errors,
@@ -5160,6 +5265,21 @@ unicode_decode_utf8(const char *s, Py_ssize_t size,
         return u;
     }
 
+    // fast path: the data is valid UTF-8, decode it into a string of the
+    // right size and kind.
+    PyObject *v = unicode_decode_utf8_exact(starts, end, u, s - starts);
+    if (v != NULL) {
+        Py_DECREF(u);
+        if (consumed) {
+            *consumed = size;
+        }
+        return v;
+    }
+    if (PyErr_Occurred()) {
+        Py_DECREF(u);
+        return NULL;
+    }
+
     // Use _PyUnicodeWriter after fast path is failed.
     _PyUnicodeWriter writer;
     _PyUnicodeWriter_InitWithBuffer(&writer, u);
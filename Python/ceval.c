@@ -37,6 +37,10 @@ typedef struct {
     PyCodeObject *code; // The code object for the bounds. May be NULL.
     int instr_prev;  // Only valid if code != NULL.
     PyCodeAddressRange bounds; // Only valid if code != NULL.
+    // Same as instr_prev and bounds, for the code monitors.  Only valid
+    // if the code has monitors (cframe.use_tracing & _PyCFrame_MONITORED).
+    int monitor_prev;
+    PyCodeAddressRange monitor_bounds;
     CFrame cframe;
 } PyTraceInfo;
 
@@ -79,6 +83,12 @@ static void call_exc_trace(Py_tracefunc, PyObject *,
 static int maybe_call_line_trace(Py_tracefunc, PyObject *,
                                  PyThreadState *, PyFrameObject *,
                                  PyTraceInfo *);
+static int call_monitors(PyThreadState *, PyFrameObject *, int, PyObject *);
+static int call_monitors_protected(PyThreadState *, PyFrameObject *,
+                                   int, PyObject *);
+static void call_exc_monitors(PyThreadState *, PyFrameObject *);
+static int maybe_call_line_monitors(PyThreadState *, PyFrameObject *,
+                                    PyTraceInfo *);
 static void maybe_dtrace_line(PyFrameObject *, PyTraceInfo *);
 static void dtrace_function_entry(PyFrameObject *);
 static void dtrace_function_return(PyFrameObject *);
@@ -1592,7 +1602,7 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
      * strict stack discipline must be maintained.
      */
     CFrame *prev_cframe = tstate->cframe;
-    trace_info.cframe.use_tracing = prev_cframe->use_tracing;
+    trace_info.cframe.use_tracing = prev_cframe->use_tracing & ~_PyCFrame_MONITORED;
     trace_info.cframe.previous = prev_cframe;
     tstate->cframe = &trace_info.cframe;
 
@@ -1600,6 +1610,17 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
     tstate->frame = f;
     co = f->f_code;
 
+    /* Only code objects with monitors take the slow path of tracing, the
+       others are evaluated at full speed. */
+    if (co->co_monitor_events) {
+        trace_info.cframe.use_tracing |= _PyCFrame_MONITORED;
+        trace_info.monitor_prev = -1;
+        _PyCode_InitAddressRange(co, &trace_info.monitor_bounds);
+        if (call_monitors_protected(tstate, f, _PyCode_MONITOR_CALL, Py_None)) {
+            goto exit_eval_frame;
+        }
+    }
+
     if (trace_info.cframe.use_tracing) {
         if (tstate->c_tracefunc != NULL) {
             /* tstate->c_tracefunc, if defined, is a
@@ -1759,6 +1780,23 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
 
         /* line-by-line tracing support */
 
+        if ((trace_info.cframe.use_tracing & _PyCFrame_MONITORED) &&
+            !tstate->tracing) {
+            int err;
+            f->f_stackdepth = (int)(stack_pointer - f->f_valuestack);
+
+            err = maybe_call_line_monitors(tstate, f, &trace_info);
+            if (err) {
+                /* monitor raised an exception */
+                goto error;
+            }
+            /* Reload possibly changed frame fields */
+            JUMPTO(f->f_lasti);
+            stack_pointer = f->f_valuestack+f->f_stackdepth;
+            f->f_stackdepth = -1;
+            NEXTOPARG();
+        }
+
         if (trace_info.cframe.use_tracing &&
             tstate->c_tracefunc != NULL && !tstate->tracing) {
             int err;
@@ -4474,6 +4512,9 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
             call_exc_trace(tstate->c_tracefunc, tstate->c_traceobj,
                            tstate, f, &trace_info);
         }
+        if (trace_info.cframe.use_tracing & _PyCFrame_MONITORED) {
+            call_exc_monitors(tstate, f);
+        }
 exception_unwind:
         f->f_state = FRAME_UNWINDING;
         /* We can't use f->f_lasti here, as RERAISE may have set it */
@@ -4517,6 +4558,7 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
         JUMPTO(handler);
         if (trace_info.cframe.use_tracing) {
             trace_info.instr_prev = INT_MAX;
+            trace_info.monitor_prev = INT_MAX;
         }
         /* Resume normal execution */
         f->f_state = FRAME_EXECUTING;
@@ -4549,13 +4591,20 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
                 Py_CLEAR(retval);
             }
         }
+        if (trace_info.cframe.use_tracing & _PyCFrame_MONITORED) {
+            if (call_monitors_protected(tstate, f, _PyCode_MONITOR_RETURN, retval)) {
+                Py_CLEAR(retval);
+            }
+        }
     }
 
     /* pop frame */
 exit_eval_frame:
     /* Restore previous cframe */
     tstate->cframe = trace_info.cframe.previous;
-    tstate->cframe->use_tracing = trace_info.cframe.use_tracing;
+    tstate->cframe->use_tracing =
+        (tstate->cframe->use_tracing & _PyCFrame_MONITORED) |
+        (trace_info.cframe.use_tracing & ~_PyCFrame_MONITORED);
 
     if (PyDTrace_FUNCTION_RETURN_ENABLED())
         dtrace_function_return(f);
@@ -5570,7 +5619,7 @@ call_trace(Py_tracefunc func, PyObject *obj,
     if (tstate->tracing)
         return 0;
     tstate->tracing++;
-    tstate->cframe->use_tracing = 0;
+    _PyThreadState_PauseTracing(tstate);
     if (frame->f_lasti < 0) {
         frame->f_lineno = frame->f_code->co_firstlineno;
     }
@@ -5580,8 +5629,7 @@ call_trace(Py_tracefunc func, PyObject *obj,
     }
     result = func(obj, frame, what, arg);
     frame->f_lineno = 0;
-    tstate->cframe->use_tracing = ((tstate->c_tracefunc != NULL)
-                           || (tstate->c_profilefunc != NULL));
+    _PyThreadState_UpdateTracing(tstate);
     tstate->tracing--;
     return result;
 }
@@ -5595,8 +5643,7 @@ _PyEval_CallTracing(PyObject *func, PyObject *args)
     PyObject *result;
 
     tstate->tracing = 0;
-    tstate->cframe->use_tracing = ((tstate->c_tracefunc != NULL)
-                           || (tstate->c_profilefunc != NULL));
+    _PyThreadState_UpdateTracing(tstate);
     result = PyObject_Call(func, args, NULL);
     tstate->tracing = save_tracing;
     tstate->cframe->use_tracing = save_use_tracing;
@@ -5634,6 +5681,199 @@ maybe_call_line_trace(Py_tracefunc func, PyObject *obj,
     return result;
 }
 
+static PyObject *
+monitor_event_name(int event)
+{
+    _Py_IDENTIFIER(call);
+    _Py_IDENTIFIER(line);
+    _Py_IDENTIFIER(return);
+    _Py_IDENTIFIER(exception);
+    _Py_IDENTIFIER(branch);
+    switch (event) {
+    case _PyCode_MONITOR_CALL:
+        return _PyUnicode_FromId(&PyId_call);
+    case _PyCode_MONITOR_LINE:
+        return _PyUnicode_FromId(&PyId_line);
+    case _PyCode_MONITOR_RETURN:
+        return _PyUnicode_FromId(&PyId_return);
+    case _PyCode_MONITOR_EXCEPTION:
+        return _PyUnicode_FromId(&PyId_exception);
+    default:
+        assert(event == _PyCode_MONITOR_BRANCH);
+        return _PyUnicode_FromId(&PyId_branch);
+    }
+}
+
+/* Call the monitors of the frame's code object which are registered for
+   event as callback(frame, event, arg), see sys.add_code_monitor(). */
+static int
+call_monitors(PyThreadState *tstate, PyFrameObject *frame,
+              int event, PyObject *arg)
+{
+    PyCodeObject *co = frame->f_code;
+    if (tstate->tracing || !(co->co_monitor_events & event)) {
+        return 0;
+    }
+    PyObject *name = monitor_event_name(event);  // borrowed reference
+    if (name == NULL) {
+        return -1;
+    }
+    /* A monitor can remove monitors while they are iterated */
+    PyObject *monitors = co->co_monitors;
+    Py_INCREF(monitors);
+
+    int result = 0;
+    tstate->tracing++;
+    _PyThreadState_PauseTracing(tstate);
+    for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(monitors); i++) {
+        PyObject *monitor = PyTuple_GET_ITEM(monitors, i);
+        long events = PyLong_AsLong(PyTuple_GET_ITEM(monitor, 1));
+        if (!(events & event)) {
+            continue;
+        }
+        PyObject *callback = _PyCode_GetMonitorCallback(
+            PyTuple_GET_ITEM(monitor, 0));
+        if (callback == NULL) {
+            if (_PyErr_Occurred(tstate)) {
+                result = -1;
+                break;
+            }
+            /* The callback was destroyed */
+            continue;
+        }
+        PyObject *args[3] = {(PyObject *)frame, name, arg};
+        PyObject *res = _PyObject_VectorcallTstate(
+            tstate, callback, args, 3, NULL);
+        Py_DECREF(callback);
+        if (res == NULL) {
+            result = -1;
+            break;
+        }
+        Py_DECREF(res);
+    }
+    _PyThreadState_UpdateTracing(tstate);
+    tstate->tracing--;
+    Py_DECREF(monitors);
+    return result;
+}
+
+static int
+call_monitors_protected(PyThreadState *tstate, PyFrameObject *frame,
+                        int event, PyObject *arg)
+{
+    PyObject *type, *value, *traceback;
+    int err;
+    _PyErr_Fetch(tstate, &type, &value, &traceback);
+    err = call_monitors(tstate, frame, event, arg);
+    if (err == 0) {
+        _PyErr_Restore(tstate, type, value, traceback);
+        return 0;
+    }
+    else {
+        Py_XDECREF(type);
+        Py_XDECREF(value);
+        Py_XDECREF(traceback);
+        return -1;
+    }
+}
+
+static void
+call_exc_monitors(PyThreadState *tstate, PyFrameObject *f)
+{
+    PyObject *type, *value, *traceback, *orig_traceback, *arg;
+    int err;
+    if (tstate->tracing
+        || !(f->f_code->co_monitor_events & _PyCode_MONITOR_EXCEPTION)) {
+        return;
+    }
+    _PyErr_Fetch(tstate, &type, &value, &orig_traceback);
+    if (value == NULL) {
+        value = Py_None;
+        Py_INCREF(value);
+    }
+    _PyErr_NormalizeException(tstate, &type, &value, &orig_traceback);
+    traceback = (orig_traceback != NULL) ? orig_traceback : Py_None;
+    arg = PyTuple_Pack(3, type, value, traceback);
+    if (arg == NULL) {
+        _PyErr_Restore(tstate, type, value, orig_traceback);
+        return;
+    }
+    err = call_monitors(tstate, f, _PyCode_MONITOR_EXCEPTION, arg);
+    Py_DECREF(arg);
+    if (err == 0) {
+        _PyErr_Restore(tstate, type, value, orig_traceback);
+    }
+    else {
+        Py_XDECREF(type);
+        Py_XDECREF(value);
+        Py_XDECREF(orig_traceback);
+    }
+}
+
+static int
+is_branch(int opcode)
+{
+    switch (opcode) {
+    case POP_JUMP_IF_FALSE:
+    case POP_JUMP_IF_TRUE:
+    case JUMP_IF_FALSE_OR_POP:
+    case JUMP_IF_TRUE_OR_POP:
+    case JUMP_IF_NOT_EXC_MATCH:
+    case FOR_ITER:
+        return 1;
+    default:
+        return 0;
+    }
+}
+
+/* Same as maybe_call_line_trace() for the code monitors, which also get
+   a "branch" event with the offsets of the conditional jump and of the
+   instruction it went to as argument, whether it jumped or not. */
+static int
+maybe_call_line_monitors(PyThreadState *tstate, PyFrameObject *frame,
+                         PyTraceInfo *trace_info)
+{
+    PyCodeObject *co = frame->f_code;
+    int prev = trace_info->monitor_prev;
+    trace_info->monitor_prev = frame->f_lasti;
+
+    if ((co->co_monitor_events & _PyCode_MONITOR_BRANCH)
+        && prev >= 0 && prev != INT_MAX)
+    {
+        const _Py_CODEUNIT *code = (const _Py_CODEUNIT *)PyBytes_AS_STRING(co->co_code);
+        int src = prev;
+        while (_Py_OPCODE(code[src]) == EXTENDED_ARG) {
+            src++;
+        }
+        if (is_branch(_Py_OPCODE(code[src]))) {
+            PyObject *arg = Py_BuildValue("(ii)", src * 2, frame->f_lasti * 2);
+            if (arg == NULL) {
+                return -1;
+            }
+            int err = call_monitors(tstate, frame, _PyCode_MONITOR_BRANCH, arg);
+            Py_DECREF(arg);
+            if (err) {
+                return -1;
+            }
+        }
+    }
+
+    if (co->co_monitor_events & _PyCode_MONITOR_LINE) {
+        int lastline = trace_info->monitor_bounds.ar_line;
+        int line = _PyCode_CheckLineNumber(frame->f_lasti*2,
+                                           &trace_info->monitor_bounds);
+        /* Monitor backward edges or first instruction of a new line */
+        if (line != -1 &&
+            (frame->f_lasti < prev ||
+             (line != lastline
+              && frame->f_lasti*2 == trace_info->monitor_bounds.ar_start)))
+        {
+            return call_monitors(tstate, frame, _PyCode_MONITOR_LINE, Py_None);
+        }
+    }
+    return 0;
+}
+
 int
 _PyEval_SetProfile(PyThreadState *tstate, Py_tracefunc func, PyObject *arg)
 {
@@ -5653,7 +5893,7 @@ _PyEval_SetProfile(PyThreadState *tstate, Py_tracefunc func, PyObject *arg)
     tstate->c_profilefunc = NULL;
     tstate->c_profileobj = NULL;
     /* Must make sure that tracing is not ignored if 'profileobj' is freed */
-    tstate->cframe->use_tracing = tstate->c_tracefunc != NULL;
+    _PyThreadState_UpdateTracing(tstate);
     Py_XDECREF(profileobj);
 
     Py_XINCREF(arg);
@@ -5661,7 +5901,7 @@ _PyEval_SetProfile(PyThreadState *tstate, Py_tracefunc func, PyObject *arg)
     tstate->c_profilefunc = func;
 
     /* Flag that tracing or profiling is turned on */
-    tstate->cframe->use_tracing = (func != NULL) || (tstate->c_tracefunc != NULL);
+    _PyThreadState_UpdateTracing(tstate);
     return 0;
 }
 
@@ -5694,7 +5934,7 @@ _PyEval_SetTrace(PyThreadState *tstate, Py_tracefunc func, PyObject *arg)
     tstate->c_tracefunc = NULL;
     tstate->c_traceobj = NULL;
     /* Must make sure that profiling is not ignored if 'traceobj' is freed */
-    tstate->cframe->use_tracing = (tstate->c_profilefunc != NULL);
+    _PyThreadState_UpdateTracing(tstate);
     Py_XDECREF(traceobj);
 
     Py_XINCREF(arg);
@@ -5702,8 +5942,7 @@ _PyEval_SetTrace(PyThreadState *tstate, Py_tracefunc func, PyObject *arg)
     tstate->c_tracefunc = func;
 
     /* Flag that tracing or profiling is turned on */
-    tstate->cframe->use_tracing = ((func != NULL)
-                           || (tstate->c_profilefunc != NULL));
+    _PyThreadState_UpdateTracing(tstate);
 
     return 0;
 }
@@ -140,6 +140,22 @@ static void recreate_gil(struct _gil_runtime_state *gil)
     create_gil(gil);
 }
 
+static inline void
+update_gil_stats(_PyGILStats *stats, int switched, _PyTime_t wait_time)
+{
+    stats->acquisitions++;
+    if (switched) {
+        stats->switches++;
+    }
+    if (wait_time >= 0) {
+        stats->contentions++;
+        stats->wait_time += wait_time;
+        if (wait_time > stats->max_wait_time) {
+            stats->max_wait_time = wait_time;
+        }
+    }
+}
+
 static void
 drop_gil(struct _ceval_runtime_state *ceval, struct _ceval_state *ceval2,
          PyThreadState *tstate)
@@ -162,6 +178,11 @@ drop_gil(struct _ceval_runtime_state *ceval, struct _ceval_state *ceval2,
     }
 
     MUTEX_LOCK(gil->mutex);
+    _PyTime_t hold_time = _PyTime_GetMonotonicClock() - gil->hold_start;
+    gil->stats.hold_time += hold_time;
+    if (tstate != NULL) {
+        tstate->gil_stats.hold_time += hold_time;
+    }
     _Py_ANNOTATE_RWLOCK_RELEASED(&gil->locked, /*is_write=*/1);
     _Py_atomic_store_relaxed(&gil->locked, 0);
     COND_SIGNAL(gil->cond);
@@ -215,6 +236,10 @@ static void
 take_gil(PyThreadState *tstate)
 {
     int err = errno;
+    /* Timestamp at which the thread started to wait for the GIL, or -1 if
+       the GIL was free */
+    _PyTime_t wait_start = -1;
+    int switched = 0;
 
     assert(tstate != NULL);
 
@@ -247,6 +272,7 @@ take_gil(PyThreadState *tstate)
         goto _ready;
     }
 
+    wait_start = _PyTime_GetMonotonicClock();
     while (_Py_atomic_load_relaxed(&gil->locked)) {
         unsigned long saved_switchnum = gil->switch_number;
 
@@ -267,6 +293,8 @@ take_gil(PyThreadState *tstate)
             assert(is_tstate_valid(tstate));
 
             SET_GIL_DROP_REQUEST(interp);
+            gil->stats.drop_requests++;
+            tstate->gil_stats.drop_requests++;
         }
     }
 
@@ -283,6 +311,7 @@ take_gil(PyThreadState *tstate)
     if (tstate != (PyThreadState*)_Py_atomic_load_relaxed(&gil->last_holder)) {
         _Py_atomic_store_relaxed(&gil->last_holder, (uintptr_t)tstate);
         ++gil->switch_number;
+        switched = 1;
     }
 
 #ifdef FORCE_SWITCHING
@@ -304,6 +333,11 @@ take_gil(PyThreadState *tstate)
     }
     assert(is_tstate_valid(tstate));
 
+    gil->hold_start = _PyTime_GetMonotonicClock();
+    _PyTime_t wait_time = (wait_start >= 0 ? gil->hold_start - wait_start : -1);
+    update_gil_stats(&gil->stats, switched, wait_time);
+    update_gil_stats(&tstate->gil_stats, switched, wait_time);
+
     if (_Py_atomic_load_relaxed(&ceval2->gil_drop_request)) {
         RESET_GIL_DROP_REQUEST(interp);
     }
@@ -337,6 +371,26 @@ void _PyEval_SetSwitchInterval(unsigned long microseconds)
     gil->interval = microseconds;
 }
 
+/* Copy the statistics on the GIL of thread, or of all threads if thread is
+   NULL, into stats.  tstate must hold the GIL: its current hold time is
+   included. */
+void
+_PyEval_GetGILStats(PyThreadState *tstate, PyThreadState *thread,
+                    _PyGILStats *stats)
+{
+#ifdef EXPERIMENTAL_ISOLATED_SUBINTERPRETERS
+    struct _gil_runtime_state *gil = &tstate->interp->ceval.gil;
+#else
+    struct _gil_runtime_state *gil = &tstate->interp->runtime->ceval.gil;
+#endif
+    MUTEX_LOCK(gil->mutex);
+    *stats = (thread != NULL ? thread->gil_stats : gil->stats);
+    if (thread == NULL || thread == tstate) {
+        stats->hold_time += _PyTime_GetMonotonicClock() - gil->hold_start;
+    }
+    MUTEX_UNLOCK(gil->mutex);
+}
+
 unsigned long _PyEval_GetSwitchInterval()
 {
 #ifdef EXPERIMENTAL_ISOLATED_SUBINTERPRETERS
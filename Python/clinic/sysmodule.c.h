@@ -281,6 +281,83 @@ sys_getprofile(PyObject *module, PyObject *Py_UNUSED(ignored))
     return sys_getprofile_impl(module);
 }
 
+PyDoc_STRVAR(sys_add_code_monitor__doc__,
+"add_code_monitor($module, code, callback, events, /)\n"
+"--\n"
+"\n"
+"Call callback(frame, event, arg) on the given events of a code object.\n"
+"\n"
+"events is an iterable of event names: \'call\', \'line\', \'return\',\n"
+"\'exception\' and \'branch\'.  If callback is already monitoring code,\n"
+"its events are replaced.  The other code objects are not affected.\n"
+"Only a weak reference to callback is kept.");
+
+#define SYS_ADD_CODE_MONITOR_METHODDEF    \
+    {"add_code_monitor", (PyCFunction)(void(*)(void))sys_add_code_monitor, METH_FASTCALL, sys_add_code_monitor__doc__},
+
+static PyObject *
+sys_add_code_monitor_impl(PyObject *module, PyCodeObject *code,
+                          PyObject *callback, PyObject *events);
+
+static PyObject *
+sys_add_code_monitor(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyCodeObject *code;
+    PyObject *callback;
+    PyObject *events;
+
+    if (!_PyArg_CheckPositional("add_code_monitor", nargs, 3, 3)) {
+        goto exit;
+    }
+    if (!PyObject_TypeCheck(args[0], &PyCode_Type)) {
+        _PyArg_BadArgument("add_code_monitor", "argument 1", (&PyCode_Type)->tp_name, args[0]);
+        goto exit;
+    }
+    code = (PyCodeObject *)args[0];
+    callback = args[1];
+    events = args[2];
+    return_value = sys_add_code_monitor_impl(module, code, callback, events);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(sys_remove_code_monitor__doc__,
+"remove_code_monitor($module, code, callback, /)\n"
+"--\n"
+"\n"
+"Remove a monitor added by sys.add_code_monitor().");
+
+#define SYS_REMOVE_CODE_MONITOR_METHODDEF    \
+    {"remove_code_monitor", (PyCFunction)(void(*)(void))sys_remove_code_monitor, METH_FASTCALL, sys_remove_code_monitor__doc__},
+
+static PyObject *
+sys_remove_code_monitor_impl(PyObject *module, PyCodeObject *code,
+                             PyObject *callback);
+
+static PyObject *
+sys_remove_code_monitor(PyObject *module, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyCodeObject *code;
+    PyObject *callback;
+
+    if (!_PyArg_CheckPositional("remove_code_monitor", nargs, 2, 2)) {
+        goto exit;
+    }
+    if (!PyObject_TypeCheck(args[0], &PyCode_Type)) {
+        _PyArg_BadArgument("remove_code_monitor", "argument 1", (&PyCode_Type)->tp_name, args[0]);
+        goto exit;
+    }
+    code = (PyCodeObject *)args[0];
+    callback = args[1];
+    return_value = sys_remove_code_monitor_impl(module, code, callback);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(sys_setswitchinterval__doc__,
 "setswitchinterval($module, interval, /)\n"
 "--\n"
@@ -350,6 +427,46 @@ sys_getswitchinterval(PyObject *module, PyObject *Py_UNUSED(ignored))
     return return_value;
 }
 
+PyDoc_STRVAR(sys_getgilstats__doc__,
+"getgilstats($module, /, thread_id=None)\n"
+"--\n"
+"\n"
+"Return a dict of statistics on the global interpreter lock.\n"
+"\n"
+"Return the statistics of all threads if thread_id is None, else of the\n"
+"thread with this identifier, as returned by threading.get_ident().");
+
+#define SYS_GETGILSTATS_METHODDEF    \
+    {"getgilstats", (PyCFunction)(void(*)(void))sys_getgilstats, METH_FASTCALL|METH_KEYWORDS, sys_getgilstats__doc__},
+
+static PyObject *
+sys_getgilstats_impl(PyObject *module, PyObject *thread_id);
+
+static PyObject *
+sys_getgilstats(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"thread_id", NULL};
+    static _PyArg_Parser _parser = {NULL, _keywords, "getgilstats", 0};
+    PyObject *argsbuf[1];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    PyObject *thread_id = Py_None;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 0, 1, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    thread_id = args[0];
+skip_optional_pos:
+    return_value = sys_getgilstats_impl(module, thread_id);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(sys_setrecursionlimit__doc__,
 "setrecursionlimit($module, limit, /)\n"
 "--\n"
@@ -983,4 +1100,4 @@ sys__deactivate_opcache(PyObject *module, PyObject *Py_UNUSED(ignored))
 #ifndef SYS_GETANDROIDAPILEVEL_METHODDEF
     #define SYS_GETANDROIDAPILEVEL_METHODDEF
 #endif /* !defined(SYS_GETANDROIDAPILEVEL_METHODDEF) */
-/*[clinic end generated code: output=68c62b9ca317a0c8 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=da64d468147dae9a input=a9049054013a1b77]*/
@@ -67,6 +67,10 @@
  *  8. A corner case where _Py_dg_dtoa didn't strip trailing zeros has been
  *     fixed. (bugs.python.org/issue40780)
  *
+ *  9. _Py_dg_dtoa tries Loitsch's Grisu3 algorithm first for mode 0, and only
+ *     falls back to the multiple-precision code when Grisu3 cannot guarantee
+ *     the shortest, correctly rounded result.
+ *
  ***************************************************************/
 
 /* Please send bug reports for the original dtoa.c code to David M. Gay (dmg
@@ -2205,6 +2209,324 @@ _Py_dg_freedtoa(char *s)
     Bfree(b);
 }
 
+/* Grisu3 fast path for mode 0 (shortest round-trip) conversions.
+ *
+ * See Florian Loitsch, "Printing Floating-Point Numbers Quickly and
+ * Accurately with Integers" [Proc. ACM SIGPLAN PLDI '10, pp. 233-243].
+ * The algorithm uses a single 64-bit scaling by a cached power of ten and
+ * generates digits with integer arithmetic only.  It either produces the
+ * shortest, correctly rounded digit string or reports that it cannot be
+ * sure of the result (roughly 0.5% of all doubles), in which case
+ * _Py_dg_dtoa falls back to the multiple-precision algorithm below.
+ *
+ * Grisu3 never returns a digit string lying on one of the boundaries of the
+ * rounding interval of d: such a candidate makes it bail out instead.  The
+ * bignum code therefore still decides the cases where mode 0 accepts the
+ * boundaries (see note 3 above _Py_dg_dtoa), so the output is identical to
+ * that of the bignum algorithm.
+ */
+
+typedef struct {
+    ULLong f;
+    int e;
+} DiyFp;
+
+/* Normalized 64-bit approximations of 10**k, rounded to nearest, for
+   k = -348, -340, ..., 340: 10**k ~= f * 2**e. */
+static const struct {
+    ULLong f;
+    short e;
+    short k;
+} grisu_cached_powers[] = {
+    {0xfa8fd5a0081c0288, -1220, -348},
+    {0xbaaee17fa23ebf76, -1193, -340},
+    {0x8b16fb203055ac76, -1166, -332},
+    {0xcf42894a5dce35ea, -1140, -324},
+    {0x9a6bb0aa55653b2d, -1113, -316},
+    {0xe61acf033d1a45df, -1087, -308},
+    {0xab70fe17c79ac6ca, -1060, -300},
+    {0xff77b1fcbebcdc4f, -1034, -292},
+    {0xbe5691ef416bd60c, -1007, -284},
+    {0x8dd01fad907ffc3c, -980, -276},
+    {0xd3515c2831559a83, -954, -268},
+    {0x9d71ac8fada6c9b5, -927, -260},
+    {0xea9c227723ee8bcb, -901, -252},
+    {0xaecc49914078536d, -874, -244},
+    {0x823c12795db6ce57, -847, -236},
+    {0xc21094364dfb5637, -821, -228},
+    {0x9096ea6f3848984f, -794, -220},
+    {0xd77485cb25823ac7, -768, -212},
+    {0xa086cfcd97bf97f4, -741, -204},
+    {0xef340a98172aace5, -715, -196},
+    {0xb23867fb2a35b28e, -688, -188},
+    {0x84c8d4dfd2c63f3b, -661, -180},
+    {0xc5dd44271ad3cdba, -635, -172},
+    {0x936b9fcebb25c996, -608, -164},
+    {0xdbac6c247d62a584, -582, -156},
+    {0xa3ab66580d5fdaf6, -555, -148},
+    {0xf3e2f893dec3f126, -529, -140},
+    {0xb5b5ada8aaff80b8, -502, -132},
+    {0x87625f056c7c4a8b, -475, -124},
+    {0xc9bcff6034c13053, -449, -116},
+    {0x964e858c91ba2655, -422, -108},
+    {0xdff9772470297ebd, -396, -100},
+    {0xa6dfbd9fb8e5b88f, -369, -92},
+    {0xf8a95fcf88747d94, -343, -84},
+    {0xb94470938fa89bcf, -316, -76},
+    {0x8a08f0f8bf0f156b, -289, -68},
+    {0xcdb02555653131b6, -263, -60},
+    {0x993fe2c6d07b7fac, -236, -52},
+    {0xe45c10c42a2b3b06, -210, -44},
+    {0xaa242499697392d3, -183, -36},
+    {0xfd87b5f28300ca0e, -157, -28},
+    {0xbce5086492111aeb, -130, -20},
+    {0x8cbccc096f5088cc, -103, -12},
+    {0xd1b71758e219652c, -77, -4},
+    {0x9c40000000000000, -50, 4},
+    {0xe8d4a51000000000, -24, 12},
+    {0xad78ebc5ac620000, 3, 20},
+    {0x813f3978f8940984, 30, 28},
+    {0xc097ce7bc90715b3, 56, 36},
+    {0x8f7e32ce7bea5c70, 83, 44},
+    {0xd5d238a4abe98068, 109, 52},
+    {0x9f4f2726179a2245, 136, 60},
+    {0xed63a231d4c4fb27, 162, 68},
+    {0xb0de65388cc8ada8, 189, 76},
+    {0x83c7088e1aab65db, 216, 84},
+    {0xc45d1df942711d9a, 242, 92},
+    {0x924d692ca61be758, 269, 100},
+    {0xda01ee641a708dea, 295, 108},
+    {0xa26da3999aef774a, 322, 116},
+    {0xf209787bb47d6b85, 348, 124},
+    {0xb454e4a179dd1877, 375, 132},
+    {0x865b86925b9bc5c2, 402, 140},
+    {0xc83553c5c8965d3d, 428, 148},
+    {0x952ab45cfa97a0b3, 455, 156},
+    {0xde469fbd99a05fe3, 481, 164},
+    {0xa59bc234db398c25, 508, 172},
+    {0xf6c69a72a3989f5c, 534, 180},
+    {0xb7dcbf5354e9bece, 561, 188},
+    {0x88fcf317f22241e2, 588, 196},
+    {0xcc20ce9bd35c78a5, 614, 204},
+    {0x98165af37b2153df, 641, 212},
+    {0xe2a0b5dc971f303a, 667, 220},
+    {0xa8d9d1535ce3b396, 694, 228},
+    {0xfb9b7cd9a4a7443c, 720, 236},
+    {0xbb764c4ca7a44410, 747, 244},
+    {0x8bab8eefb6409c1a, 774, 252},
+    {0xd01fef10a657842c, 800, 260},
+    {0x9b10a4e5e9913129, 827, 268},
+    {0xe7109bfba19c0c9d, 853, 276},
+    {0xac2820d9623bf429, 880, 284},
+    {0x80444b5e7aa7cf85, 907, 292},
+    {0xbf21e44003acdd2d, 933, 300},
+    {0x8e679c2f5e44ff8f, 960, 308},
+    {0xd433179d9c8cb841, 986, 316},
+    {0x9e19db92b4e31ba9, 1013, 324},
+    {0xeb96bf6ebadf77d9, 1039, 332},
+    {0xaf87023b9bf0ee6b, 1066, 340},
+};
+
+#define GRISU_CACHED_POWERS_OFFSET 348
+#define GRISU_CACHED_POWERS_STEP 8
+#define GRISU_MIN_TARGET_EXP (-60)
+#define GRISU_MAX_TARGET_EXP (-32)
+
+/* Maximum number of digits produced by grisu3(), plus slack. */
+#define GRISU_BUFSIZE 20
+
+static const ULong grisu_small_powers[] = {
+    1, 10, 100, 1000, 10000, 100000, 1000000, 10000000, 100000000,
+    1000000000
+};
+
+static DiyFp
+diyfp_normalize(DiyFp x)
+{
+    while (!(x.f & 0xffc0000000000000ULL)) {
+        x.f <<= 10;
+        x.e -= 10;
+    }
+    while (!(x.f & 0x8000000000000000ULL)) {
+        x.f <<= 1;
+        x.e -= 1;
+    }
+    return x;
+}
+
+/* Return x * y, with the 128-bit product of the significands rounded to its
+   upper 64 bits. */
+static DiyFp
+diyfp_multiply(DiyFp x, DiyFp y)
+{
+    ULLong a, b, c, d, ac, bc, ad, bd, tmp;
+    DiyFp r;
+
+    a = x.f >> 32;
+    b = x.f & 0xffffffffU;
+    c = y.f >> 32;
+    d = y.f & 0xffffffffU;
+    ac = a * c;
+    bc = b * c;
+    ad = a * d;
+    bd = b * d;
+    tmp = (bd >> 32) + (ad & 0xffffffffU) + (bc & 0xffffffffU);
+    tmp += 1U << 31;  /* round */
+    r.f = ac + (ad >> 32) + (bc >> 32) + (tmp >> 32);
+    r.e = x.e + y.e + 64;
+    return r;
+}
+
+/* Adjust the last digit of buf towards w, the scaled value of d, as far as
+   the rounding interval allows, and check that the result is guaranteed to
+   be closest to the exact value of d.  All quantities are scaled by
+   10**kappa; see RoundWeed in Loitsch's paper for details.  Return 1 on
+   success and 0 if the result cannot be trusted. */
+static int
+grisu_round_weed(char *buf, int len, ULLong distance_too_high_w,
+                 ULLong unsafe_interval, ULLong rest, ULLong ten_kappa,
+                 ULLong unit)
+{
+    ULLong small_distance = distance_too_high_w - unit;
+    ULLong big_distance = distance_too_high_w + unit;
+
+    while (rest < small_distance &&
+           unsafe_interval - rest >= ten_kappa &&
+           (rest + ten_kappa < small_distance ||
+            small_distance - rest >= rest + ten_kappa - small_distance)) {
+        buf[len - 1]--;
+        rest += ten_kappa;
+    }
+    if (rest < big_distance &&
+        unsafe_interval - rest >= ten_kappa &&
+        (rest + ten_kappa < big_distance ||
+         big_distance - rest > rest + ten_kappa - big_distance)) {
+        return 0;
+    }
+    return 2 * unit <= rest && rest <= unsafe_interval - 4 * unit;
+}
+
+/* Generate the shortest digit string in the (scaled) interval (low, high)
+   around w.  On success, the digits are stored in buf, and w ~= buf *
+   10**kappa. */
+static int
+grisu_digit_gen(DiyFp low, DiyFp w, DiyFp high, char *buf, int *len,
+                int *kappa)
+{
+    ULLong unit = 1, unsafe_interval, one_f, fractionals, rest;
+    ULong integrals, divisor;
+    int one_e, n = 0, kap;
+
+    /* low and high are only known to within one unit; widen the interval
+       so that it surely contains the exact one. */
+    low.f -= unit;
+    high.f += unit;
+    unsafe_interval = high.f - low.f;
+    one_e = -w.e;
+    one_f = (ULLong)1 << one_e;
+    integrals = (ULong)(high.f >> one_e);
+    fractionals = high.f & (one_f - 1);
+
+    kap = 10;
+    while (kap > 0 && grisu_small_powers[kap - 1] > integrals)
+        kap--;
+    divisor = kap > 0 ? grisu_small_powers[kap - 1] : 0;
+
+    while (kap > 0) {
+        buf[n++] = (char)('0' + integrals / divisor);
+        integrals %= divisor;
+        kap--;
+        rest = ((ULLong)integrals << one_e) + fractionals;
+        if (rest < unsafe_interval) {
+            *len = n;
+            *kappa = kap;
+            return grisu_round_weed(buf, n, high.f - w.f, unsafe_interval,
+                                    rest, (ULLong)divisor << one_e, unit);
+        }
+        divisor /= 10;
+    }
+
+    for (;;) {
+        fractionals *= 10;
+        unit *= 10;
+        unsafe_interval *= 10;
+        buf[n++] = (char)('0' + (fractionals >> one_e));
+        fractionals &= one_f - 1;
+        kap--;
+        if (fractionals < unsafe_interval) {
+            *len = n;
+            *kappa = kap;
+            return grisu_round_weed(buf, n, (high.f - w.f) * unit,
+                                    unsafe_interval, fractionals, one_f,
+                                    unit);
+        }
+        if (n >= GRISU_BUFSIZE - 1)
+            return 0;
+    }
+}
+
+/* Try to compute the shortest digit string for the positive, finite and
+   nonzero double in u.  On success, store the digits (without a trailing
+   NUL) in buf, their number in *len and the decimal exponent in *decexp,
+   such that u == 0.buf * 10**(*decexp) after rounding, and return 1.
+   Return 0 if the result cannot be determined with certainty. */
+static int
+grisu3(U *u, char *buf, int *len, int *decexp)
+{
+    ULLong bits, frac;
+    int biased_e, k, index, mk, kappa;
+    DiyFp v, w, m_plus, m_minus, ten_mk;
+
+    bits = (ULLong)word0(u) << 32 | word1(u);
+    frac = bits & 0x000fffffffffffffULL;
+    biased_e = (int)(bits >> 52);
+    if (biased_e) {
+        v.f = frac | 0x0010000000000000ULL;
+        v.e = biased_e - 1075;
+    }
+    else {
+        v.f = frac;
+        v.e = -1074;
+    }
+    w = diyfp_normalize(v);
+
+    /* Boundaries of the rounding interval of v.  The lower one is closer
+       if v is a power of two (other than the smallest normal). */
+    m_plus.f = (v.f << 1) + 1;
+    m_plus.e = v.e - 1;
+    m_plus = diyfp_normalize(m_plus);
+    if (frac == 0 && biased_e > 1) {
+        m_minus.f = (v.f << 2) - 1;
+        m_minus.e = v.e - 2;
+    }
+    else {
+        m_minus.f = (v.f << 1) - 1;
+        m_minus.e = v.e - 1;
+    }
+    m_minus.f <<= m_minus.e - m_plus.e;
+    m_minus.e = m_plus.e;
+
+    /* Find a cached power 10**mk such that the binary exponent of
+       w * 10**mk lies in [GRISU_MIN_TARGET_EXP, GRISU_MAX_TARGET_EXP]. */
+    k = (int)ceil((GRISU_MIN_TARGET_EXP - (w.e + 64) + 63) *
+                  0.30102999566398114);
+    index = (GRISU_CACHED_POWERS_OFFSET + k - 1) / GRISU_CACHED_POWERS_STEP
+            + 1;
+    ten_mk.f = grisu_cached_powers[index].f;
+    ten_mk.e = grisu_cached_powers[index].e;
+    mk = grisu_cached_powers[index].k;
+    assert(GRISU_MIN_TARGET_EXP <= w.e + ten_mk.e + 64);
+    assert(w.e + ten_mk.e + 64 <= GRISU_MAX_TARGET_EXP);
+
+    if (!grisu_digit_gen(diyfp_multiply(m_minus, ten_mk),
+                         diyfp_multiply(w, ten_mk),
+                         diyfp_multiply(m_plus, ten_mk),
+                         buf, len, &kappa))
+        return 0;
+    *decexp = *len + kappa - mk;
+    return 1;
+}
+
 /* dtoa for IEEE arithmetic (dmg): convert double to ASCII string.
  *
  * Inspired by "How to Print Floating-Point Numbers Accurately" by
@@ -2275,7 +2597,9 @@ _Py_dg_dtoa(double dd, int mode, int ndigits,
         6-9 ==> Debugging modes similar to mode - 4:  don't try
         fast floating-point estimate (if applicable).
 
-        Values of mode other than 0-9 are treated as mode 0.
+        Values of mode other than 0-9 are treated as mode 0, but
+        without trying the Grisu3 fast path; the tests use this to
+        check the fast path against the multiple-precision code.
 
         Sufficient space is allocated to the return value
         to hold the suppressed trailing zeros.
@@ -2320,6 +2644,25 @@ _Py_dg_dtoa(double dd, int mode, int ndigits,
         return nrv_alloc("0", rve, 1);
     }
 
+    /* try the Grisu3 fast path for shortest conversions */
+    if (mode == 0) {
+        char digits[GRISU_BUFSIZE];
+        int ndigits_grisu;
+
+        if (grisu3(&u, digits, &ndigits_grisu, decpt)) {
+            while (ndigits_grisu > 1 && digits[ndigits_grisu - 1] == '0')
+                ndigits_grisu--;
+            s0 = rv_alloc(ndigits_grisu);
+            if (s0 == NULL)
+                return NULL;
+            memcpy(s0, digits, ndigits_grisu);
+            s0[ndigits_grisu] = '\0';
+            if (rve)
+                *rve = s0 + ndigits_grisu;
+            return s0;
+        }
+    }
+
     /* compute k = floor(log10(d)).  The computation may leave k
        one too large, but should never leave k too small. */
     b = d2b(&u, &be, &bbits);
@@ -76,7 +76,13 @@ _PyRuntime_Initialize(void)
     }
     runtime_initialized = 1;
 
-    return _PyRuntimeState_Init(&_PyRuntime);
+    PyStatus status = _PyRuntimeState_Init(&_PyRuntime);
+    if (_PyStatus_EXCEPTION(status)) {
+        return status;
+    }
+    _PyRuntime.startup_timing.start = _PyTime_GetPerfCounter();
+    _PyRuntime.startup_timing.last = _PyRuntime.startup_timing.start;
+    return _PyStatus_OK();
 }
 
 void
@@ -92,6 +98,33 @@ _Py_IsFinalizing(void)
     return _PyRuntimeState_GetFinalizing(&_PyRuntime) != NULL;
 }
 
+/* -X startup_timing: report the time spent in an initialization phase,
+   since the end of the previous phase, and the time elapsed since the
+   runtime initialization. */
+void
+_Py_StartupTiming(const PyConfig *config, const char *phase)
+{
+    if (!config->startup_timing) {
+        return;
+    }
+
+    static int header = 1;
+    if (header) {
+        fputs("startup time: self [us] | cumulative | phase\n", stderr);
+        header = 0;
+    }
+
+    struct _startup_timing *timing = &_PyRuntime.startup_timing;
+    _PyTime_t now = _PyTime_GetPerfCounter();
+    fprintf(stderr, "startup time: %9ld | %10ld | %s\n",
+            (long)_PyTime_AsMicroseconds(now - timing->last,
+                                         _PyTime_ROUND_CEILING),
+            (long)_PyTime_AsMicroseconds(now - timing->start,
+                                         _PyTime_ROUND_CEILING),
+            phase);
+    timing->last = now;
+}
+
 /* Hack to force loading of object files */
 int (*_PyOS_mystrnicmp_hack)(const char *, const char *, Py_ssize_t) = \
     PyOS_mystrnicmp; /* Python/pystrcmp.o */
@@ -806,11 +839,18 @@ pycore_interp_init(PyThreadState *tstate)
     }
 
     const PyConfig *config = _PyInterpreterState_GetConfig(interp);
+    int is_main_interp = _Py_IsMainInterpreter(interp);
+    if (is_main_interp) {
+        _Py_StartupTiming(config, "runtime, types, sys and builtins");
+    }
     if (config->_install_importlib) {
         /* This call sets up builtin and frozen import support */
         if (init_importlib(tstate, sysmod) < 0) {
             return _PyStatus_ERR("failed to initialize importlib");
         }
+        if (is_main_interp) {
+            _Py_StartupTiming(config, "importlib bootstrap");
+        }
     }
 
 done:
@@ -1000,6 +1040,7 @@ pyinit_core(_PyRuntimeState *runtime,
     }
 
     if (!runtime->core_initialized) {
+        _Py_StartupTiming(&config, "read config");
         status = pyinit_config(runtime, tstate_p, &config);
     }
     else {
@@ -1059,11 +1100,17 @@ init_interp_main(PyThreadState *tstate)
     if (interpreter_update_config(tstate, 1) < 0) {
         return _PyStatus_ERR("failed to update the Python config");
     }
+    if (is_main_interp) {
+        _Py_StartupTiming(config, "path config");
+    }
 
     status = init_importlib_external(tstate);
     if (_PyStatus_EXCEPTION(status)) {
         return status;
     }
+    if (is_main_interp) {
+        _Py_StartupTiming(config, "importlib external");
+    }
 
     if (is_main_interp) {
         /* initialize the faulthandler module */
@@ -1071,6 +1118,7 @@ init_interp_main(PyThreadState *tstate)
         if (_PyStatus_EXCEPTION(status)) {
             return status;
         }
+        _Py_StartupTiming(config, "faulthandler");
     }
 
     status = _PyUnicode_InitEncodings(tstate);
@@ -1079,6 +1127,8 @@ init_interp_main(PyThreadState *tstate)
     }
 
     if (is_main_interp) {
+        _Py_StartupTiming(config, "encodings");
+
         if (_PySignal_Init(config->install_signal_handlers) < 0) {
             return _PyStatus_ERR("can't initialize signals");
         }
@@ -1086,12 +1136,16 @@ init_interp_main(PyThreadState *tstate)
         if (_PyTraceMalloc_Init(config->tracemalloc) < 0) {
             return _PyStatus_ERR("can't initialize tracemalloc");
         }
+        _Py_StartupTiming(config, "signals and tracemalloc");
     }
 
     status = init_sys_streams(tstate);
     if (_PyStatus_EXCEPTION(status)) {
         return status;
     }
+    if (is_main_interp) {
+        _Py_StartupTiming(config, "sys streams");
+    }
 
     status = init_set_builtins_open();
     if (_PyStatus_EXCEPTION(status)) {
@@ -1104,6 +1158,8 @@ init_interp_main(PyThreadState *tstate)
     }
 
     if (is_main_interp) {
+        _Py_StartupTiming(config, "builtins.open and __main__");
+
         /* Initialize warnings. */
         PyObject *warnoptions = PySys_GetObject("warnoptions");
         if (warnoptions != NULL && PyList_Size(warnoptions) > 0)
@@ -1115,6 +1171,7 @@ init_interp_main(PyThreadState *tstate)
             }
             Py_XDECREF(warnings_module);
         }
+        _Py_StartupTiming(config, "warnings");
 
         interp->runtime->initialized = 1;
     }
@@ -1124,6 +1181,9 @@ init_interp_main(PyThreadState *tstate)
         if (_PyStatus_EXCEPTION(status)) {
             return status;
         }
+        if (is_main_interp) {
+            _Py_StartupTiming(config, "site");
+        }
     }
 
     if (is_main_interp) {
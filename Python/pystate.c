@@ -659,6 +659,8 @@ new_threadstate(PyInterpreterState *interp, int init)
     tstate->context = NULL;
     tstate->context_ver = 1;
 
+    memset(&tstate->gil_stats, 0, sizeof(tstate->gil_stats));
+
     if (init) {
         _PyThreadState_Init(tstate);
     }
@@ -231,6 +231,7 @@ static const char* _Py_stdlib_module_names[] = {
 "resource",
 "rlcompleter",
 "runpy",
+"sampleprof",
 "sched",
 "secrets",
 "select",
@@ -16,6 +16,7 @@ Data members:
 
 #include "Python.h"
 #include "pycore_ceval.h"         // _Py_RecursionLimitLowerWaterMark()
+#include "pycore_code.h"          // _PyCode_MONITOR_CALL
 #include "pycore_initconfig.h"    // _PyStatus_EXCEPTION()
 #include "pycore_object.h"        // _PyObject_IS_GC()
 #include "pycore_pathconfig.h"    // _PyPathConfig_ComputeSysPath0()
@@ -253,7 +254,7 @@ sys_audit_tstate(PyThreadState *ts, const char *event,
 
         /* Disallow tracing in hooks unless explicitly enabled */
         ts->tracing++;
-        ts->cframe->use_tracing = 0;
+        _PyThreadState_PauseTracing(ts);
         while ((hook = PyIter_Next(hooks)) != NULL) {
             _Py_IDENTIFIER(__cantrace__);
             PyObject *o;
@@ -266,14 +267,14 @@ sys_audit_tstate(PyThreadState *ts, const char *event,
                 break;
             }
             if (canTrace) {
-                ts->cframe->use_tracing = (ts->c_tracefunc || ts->c_profilefunc);
+                _PyThreadState_UpdateTracing(ts);
                 ts->tracing--;
             }
             PyObject* args[2] = {eventName, eventArgs};
             o = _PyObject_FastCallTstate(ts, hook, args, 2);
             if (canTrace) {
                 ts->tracing++;
-                ts->cframe->use_tracing = 0;
+                _PyThreadState_PauseTracing(ts);
             }
             if (!o) {
                 break;
@@ -281,7 +282,7 @@ sys_audit_tstate(PyThreadState *ts, const char *event,
             Py_DECREF(o);
             Py_CLEAR(hook);
         }
-        ts->cframe->use_tracing = (ts->c_tracefunc || ts->c_profilefunc);
+        _PyThreadState_UpdateTracing(ts);
         ts->tracing--;
         if (_PyErr_Occurred(ts)) {
             goto exit;
@@ -1119,6 +1120,215 @@ sys_getprofile_impl(PyObject *module)
 }
 
 
+static const struct {
+    const char *name;
+    int event;
+} monitor_events[] = {
+    {"call", _PyCode_MONITOR_CALL},
+    {"line", _PyCode_MONITOR_LINE},
+    {"return", _PyCode_MONITOR_RETURN},
+    {"exception", _PyCode_MONITOR_EXCEPTION},
+    {"branch", _PyCode_MONITOR_BRANCH},
+};
+
+/* Return a weak reference to the callback of a monitor.  Code objects are
+   not tracked by the garbage collector: a strong reference to a callback
+   which references the monitored function would create an uncollectable
+   reference cycle.  A bound method is created on each access, so weak
+   references to its function and to self are kept instead. */
+static PyObject *
+new_monitor_ref(PyObject *callback)
+{
+    if (!PyMethod_Check(callback)) {
+        return PyWeakref_NewRef(callback, NULL);
+    }
+    PyObject *func = PyWeakref_NewRef(PyMethod_GET_FUNCTION(callback), NULL);
+    if (func == NULL) {
+        return NULL;
+    }
+    PyObject *self = PyWeakref_NewRef(PyMethod_GET_SELF(callback), NULL);
+    if (self == NULL) {
+        Py_DECREF(func);
+        return NULL;
+    }
+    PyObject *ref = PyTuple_Pack(2, func, self);
+    Py_DECREF(func);
+    Py_DECREF(self);
+    return ref;
+}
+
+/* Replace the events of callback in the monitors of code, or remove it if
+   events is 0.  The monitors whose callback was destroyed are removed.
+   Return 1 if callback was already registered. */
+static int
+set_code_monitor(PyCodeObject *code, PyObject *callback, int events)
+{
+    PyObject *ref = NULL;
+    if (events) {
+        ref = new_monitor_ref(callback);
+        if (ref == NULL) {
+            return -1;
+        }
+    }
+    Py_ssize_t size = (code->co_monitors != NULL
+                       ? PyTuple_GET_SIZE(code->co_monitors) : 0);
+    PyObject *monitors = PyTuple_New(size + 1);
+    if (monitors == NULL) {
+        Py_XDECREF(ref);
+        return -1;
+    }
+    Py_ssize_t n = 0;
+    int found = 0;
+    int union_events = events;
+    for (Py_ssize_t i = 0; i < size; i++) {
+        PyObject *monitor = PyTuple_GET_ITEM(code->co_monitors, i);
+        PyObject *other = _PyCode_GetMonitorCallback(
+            PyTuple_GET_ITEM(monitor, 0));
+        if (other == NULL) {
+            if (PyErr_Occurred()) {
+                goto error;
+            }
+            continue;
+        }
+        int equal = PyObject_RichCompareBool(other, callback, Py_EQ);
+        Py_DECREF(other);
+        if (equal < 0) {
+            goto error;
+        }
+        if (equal) {
+            found = 1;
+            continue;
+        }
+        union_events |= (int)PyLong_AsLong(PyTuple_GET_ITEM(monitor, 1));
+        Py_INCREF(monitor);
+        PyTuple_SET_ITEM(monitors, n++, monitor);
+    }
+    if (events) {
+        PyObject *monitor = Py_BuildValue("(Ni)", ref, events);
+        ref = NULL;
+        if (monitor == NULL) {
+            goto error;
+        }
+        PyTuple_SET_ITEM(monitors, n++, monitor);
+    }
+    if (n == 0) {
+        Py_CLEAR(monitors);
+    }
+    else if (_PyTuple_Resize(&monitors, n) < 0) {
+        return -1;
+    }
+    Py_XSETREF(code->co_monitors, monitors);
+    code->co_monitor_events = union_events;
+    return found;
+
+error:
+    Py_XDECREF(ref);
+    Py_DECREF(monitors);
+    return -1;
+}
+
+/*[clinic input]
+sys.add_code_monitor
+
+    code: object(subclass_of='&PyCode_Type', type='PyCodeObject *')
+    callback: object
+    events: object
+    /
+
+Call callback(frame, event, arg) on the given events of a code object.
+
+events is an iterable of event names: 'call', 'line', 'return',
+'exception' and 'branch'.  If callback is already monitoring code,
+its events are replaced.  The other code objects are not affected.
+Only a weak reference to callback is kept.
+[clinic start generated code]*/
+
+static PyObject *
+sys_add_code_monitor_impl(PyObject *module, PyCodeObject *code,
+                          PyObject *callback, PyObject *events)
+/*[clinic end generated code: output=8c8b094774863b08 input=87188ecda726f115]*/
+{
+    if (!PyCallable_Check(callback)) {
+        PyErr_SetString(PyExc_TypeError, "callback must be callable");
+        return NULL;
+    }
+
+    PyObject *iterator = PyObject_GetIter(events);
+    if (iterator == NULL) {
+        return NULL;
+    }
+    int mask = 0;
+    PyObject *item;
+    while ((item = PyIter_Next(iterator)) != NULL) {
+        if (!PyUnicode_Check(item)) {
+            PyErr_Format(PyExc_TypeError,
+                         "event must be a str, not %.100s",
+                         Py_TYPE(item)->tp_name);
+            Py_DECREF(item);
+            Py_DECREF(iterator);
+            return NULL;
+        }
+        size_t i;
+        for (i = 0; i < Py_ARRAY_LENGTH(monitor_events); i++) {
+            if (_PyUnicode_EqualToASCIIString(item, monitor_events[i].name)) {
+                mask |= monitor_events[i].event;
+                break;
+            }
+        }
+        if (i == Py_ARRAY_LENGTH(monitor_events)) {
+            PyErr_Format(PyExc_ValueError, "unknown event %R", item);
+            Py_DECREF(item);
+            Py_DECREF(iterator);
+            return NULL;
+        }
+        Py_DECREF(item);
+    }
+    Py_DECREF(iterator);
+    if (PyErr_Occurred()) {
+        return NULL;
+    }
+    if (mask == 0) {
+        PyErr_SetString(PyExc_ValueError, "events must not be empty");
+        return NULL;
+    }
+
+    if (PySys_Audit("sys.add_code_monitor", "O", code) < 0) {
+        return NULL;
+    }
+    if (set_code_monitor(code, callback, mask) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+sys.remove_code_monitor
+
+    code: object(subclass_of='&PyCode_Type', type='PyCodeObject *')
+    callback: object
+    /
+
+Remove a monitor added by sys.add_code_monitor().
+[clinic start generated code]*/
+
+static PyObject *
+sys_remove_code_monitor_impl(PyObject *module, PyCodeObject *code,
+                             PyObject *callback)
+/*[clinic end generated code: output=eb38144cec76c488 input=cb9bc56d8c4eedd7]*/
+{
+    int found = set_code_monitor(code, callback, 0);
+    if (found < 0) {
+        return NULL;
+    }
+    if (!found) {
+        PyErr_SetString(PyExc_ValueError,
+                        "callback is not monitoring this code object");
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+
 /*[clinic input]
 sys.setswitchinterval
 
@@ -1162,6 +1372,51 @@ sys_getswitchinterval_impl(PyObject *module)
     return 1e-6 * _PyEval_GetSwitchInterval();
 }
 
+/*[clinic input]
+sys.getgilstats
+
+    thread_id: object = None
+
+Return a dict of statistics on the global interpreter lock.
+
+Return the statistics of all threads if thread_id is None, else of the
+thread with this identifier, as returned by threading.get_ident().
+[clinic start generated code]*/
+
+static PyObject *
+sys_getgilstats_impl(PyObject *module, PyObject *thread_id)
+/*[clinic end generated code: output=7afd5d659a7b3d90 input=d7e1acbee5edfeb4]*/
+{
+    PyThreadState *tstate = _PyThreadState_GET();
+    PyThreadState *thread = NULL;
+    _PyGILStats stats;
+
+    if (thread_id != Py_None) {
+        unsigned long ident = PyLong_AsUnsignedLong(thread_id);
+        if (ident == (unsigned long)-1 && _PyErr_Occurred(tstate)) {
+            return NULL;
+        }
+        thread = PyInterpreterState_ThreadHead(tstate->interp);
+        while (thread != NULL && thread->thread_id != ident) {
+            thread = PyThreadState_Next(thread);
+        }
+        if (thread == NULL) {
+            _PyErr_Format(tstate, PyExc_ValueError,
+                          "no thread with identifier %R", thread_id);
+            return NULL;
+        }
+    }
+    _PyEval_GetGILStats(tstate, thread, &stats);
+    return Py_BuildValue("{sKsKsKsKsdsdsd}",
+        "acquisitions", (unsigned long long)stats.acquisitions,
+        "switches", (unsigned long long)stats.switches,
+        "contentions", (unsigned long long)stats.contentions,
+        "drop_requests", (unsigned long long)stats.drop_requests,
+        "wait_time", _PyTime_AsSecondsDouble(stats.wait_time),
+        "max_wait_time", _PyTime_AsSecondsDouble(stats.max_wait_time),
+        "hold_time", _PyTime_AsSecondsDouble(stats.hold_time));
+}
+
 /*[clinic input]
 sys.setrecursionlimit
 
@@ -2011,9 +2266,12 @@ static PyMethodDef sys_methods[] = {
     SYS_MDEBUG_METHODDEF
     SYS_SETSWITCHINTERVAL_METHODDEF
     SYS_GETSWITCHINTERVAL_METHODDEF
+    SYS_GETGILSTATS_METHODDEF
     SYS_SETDLOPENFLAGS_METHODDEF
     {"setprofile",      sys_setprofile, METH_O, setprofile_doc},
     SYS_GETPROFILE_METHODDEF
+    SYS_ADD_CODE_MONITOR_METHODDEF
+    SYS_REMOVE_CODE_MONITOR_METHODDEF
     SYS_SETRECURSIONLIMIT_METHODDEF
     {"settrace",        sys_settrace, METH_O, settrace_doc},
     SYS_GETTRACE_METHODDEF
@@ -2476,11 +2734,13 @@ __excepthook__ -- the original excepthook; don't touch!\n\
 \n\
 Functions:\n\
 \n\
+add_code_monitor() -- monitor events of a code object\n\
 displayhook() -- print an object to the screen, and save it in builtins._\n\
 excepthook() -- print an exception and its traceback to sys.stderr\n\
 exc_info() -- return thread-safe information about the current exception\n\
 exit() -- exit the interpreter by raising SystemExit\n\
 getdlopenflags() -- returns flags to be used for dlopen() calls\n\
+getgilstats() -- return statistics on the global interpreter lock\n\
 getprofile() -- get the global profiling function\n\
 getrefcount() -- return the reference count for an object (plus one :-)\n\
 getrecursionlimit() -- return the max recursion depth for the interpreter\n\
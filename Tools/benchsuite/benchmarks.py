@@ -0,0 +1,647 @@
+"""Benchmarks of the benchsuite.
+
+Each benchmark is a function taking a number of loops, running its
+workload that many times and returning the elapsed time in seconds, as
+measured by time.perf_counter().  Setup which must not be timed is done
+before starting the clock.  The @benchmark decorator registers the
+function in a group; its name is the function name without the
+"bench_" prefix.
+
+The benchmarks are run by benchsuite.py, in worker processes of the
+Python being measured: they must only use the standard library.
+"""
+
+import collections
+import io
+import json
+import os
+import pickle
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+perf_counter = time.perf_counter
+
+BENCHMARKS = {}
+GROUPS = ('core', 'startup', 'import', 'io', 'strings', 'containers',
+          'json', 'pickle', 're', 'asyncio')
+
+
+def benchmark(group):
+    assert group in GROUPS, group
+    def decorator(func):
+        name = func.__name__
+        assert name.startswith('bench_'), name
+        name = name[len('bench_'):]
+        assert name not in BENCHMARKS, name
+        func.group = group
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+# Interpreter core
+
+def _func(a, b):
+    return a
+
+class _Obj:
+    def __init__(self):
+        self.attr = 1
+
+    def method(self, a):
+        return a
+
+    @property
+    def prop(self):
+        return self.attr
+
+
+@benchmark('core')
+def bench_call_function(loops):
+    f = _func
+    t0 = perf_counter()
+    for _ in range(loops):
+        f(1, 2); f(1, 2); f(1, 2); f(1, 2); f(1, 2)
+        f(1, 2); f(1, 2); f(1, 2); f(1, 2); f(1, 2)
+    return perf_counter() - t0
+
+@benchmark('core')
+def bench_call_kwargs(loops):
+    f = _func
+    t0 = perf_counter()
+    for _ in range(loops):
+        f(1, b=2); f(a=1, b=2); f(1, b=2); f(a=1, b=2); f(1, b=2)
+    return perf_counter() - t0
+
+@benchmark('core')
+def bench_call_method(loops):
+    obj = _Obj()
+    t0 = perf_counter()
+    for _ in range(loops):
+        obj.method(1); obj.method(1); obj.method(1); obj.method(1)
+        obj.method(1); obj.method(1); obj.method(1); obj.method(1)
+    return perf_counter() - t0
+
+@benchmark('core')
+def bench_attributes(loops):
+    obj = _Obj()
+    t0 = perf_counter()
+    for _ in range(loops):
+        obj.attr = obj.attr + 1
+        obj.attr = obj.attr + 1
+        obj.attr = obj.attr + 1
+        obj.attr = obj.attr + 1
+        obj.prop; obj.prop; obj.prop; obj.prop
+    return perf_counter() - t0
+
+@benchmark('core')
+def bench_globals_builtins(loops):
+    t0 = perf_counter()
+    for _ in range(loops):
+        _func; _func; _func; _func; _func
+        len; len; len; len; len
+    return perf_counter() - t0
+
+@benchmark('core')
+def bench_int_arith(loops):
+    t0 = perf_counter()
+    for _ in range(loops):
+        x = 0
+        for i in range(100):
+            x = (x + i * 3) % 1000003
+    return perf_counter() - t0
+
+@benchmark('core')
+def bench_float_arith(loops):
+    t0 = perf_counter()
+    for _ in range(loops):
+        x = y = 0.5
+        for i in range(100):
+            x = x * 1.000001 + y / 3.0
+            y = y - x * 0.001
+    return perf_counter() - t0
+
+@benchmark('core')
+def bench_bigint_arith(loops):
+    a = 7 ** 300
+    b = 3 ** 250
+    t0 = perf_counter()
+    for _ in range(loops):
+        a * b; a // b; a + b; a % b; a << 100
+    return perf_counter() - t0
+
+@benchmark('core')
+def bench_generators(loops):
+    def gen(n):
+        for i in range(n):
+            yield i
+    t0 = perf_counter()
+    for _ in range(loops):
+        for x in gen(100):
+            pass
+    return perf_counter() - t0
+
+@benchmark('core')
+def bench_comprehensions(loops):
+    data = list(range(100))
+    t0 = perf_counter()
+    for _ in range(loops):
+        [x * 2 for x in data]
+        {x: x for x in data}
+        {x for x in data}
+    return perf_counter() - t0
+
+@benchmark('core')
+def bench_exceptions(loops):
+    t0 = perf_counter()
+    for _ in range(loops):
+        for i in range(10):
+            try:
+                raise ValueError(i)
+            except ValueError:
+                pass
+    return perf_counter() - t0
+
+@benchmark('core')
+def bench_try_no_exception(loops):
+    t0 = perf_counter()
+    for _ in range(loops):
+        for i in range(100):
+            try:
+                i + 1
+            except ValueError:
+                pass
+    return perf_counter() - t0
+
+@benchmark('core')
+def bench_unpack_sequence(loops):
+    t = (1, 2, 3, 4, 5)
+    t0 = perf_counter()
+    for _ in range(loops):
+        a, b, c, d, e = t; a, b, c, d, e = t; a, b, c, d, e = t
+        a, b, c, d, e = t; a, b, c, d, e = t; a, b, c, d, e = t
+    return perf_counter() - t0
+
+@benchmark('core')
+def bench_class_creation(loops):
+    t0 = perf_counter()
+    for _ in range(loops):
+        class C:
+            def method(self):
+                pass
+    return perf_counter() - t0
+
+
+# Startup
+
+def _run_python(args, loops):
+    cmd = [sys.executable, *args, '-c', 'pass']
+    t0 = perf_counter()
+    for _ in range(loops):
+        subprocess.run(cmd, check=True)
+    return perf_counter() - t0
+
+@benchmark('startup')
+def bench_startup(loops):
+    return _run_python(['-I'], loops)
+
+@benchmark('startup')
+def bench_startup_no_site(loops):
+    return _run_python(['-I', '-S'], loops)
+
+
+# Import
+
+def _bench_import(names, loops):
+    import importlib
+    before = set(sys.modules)
+    def unload():
+        for name in set(sys.modules) - before:
+            del sys.modules[name]
+    # Load all the dependencies once, so that the first loop does not
+    # have to write the bytecode cache.
+    for name in names:
+        importlib.import_module(name)
+    unload()
+    elapsed = 0
+    for _ in range(loops):
+        t0 = perf_counter()
+        for name in names:
+            importlib.import_module(name)
+        elapsed += perf_counter() - t0
+        unload()
+    return elapsed
+
+@benchmark('import')
+def bench_import_small(loops):
+    return _bench_import(['colorsys', 'keyword', 'bisect'], loops)
+
+@benchmark('import')
+def bench_import_package(loops):
+    return _bench_import(['email.message', 'json', 'http.client'], loops)
+
+
+# I/O
+
+def _tempfile():
+    fd, filename = tempfile.mkstemp()
+    os.close(fd)
+    return filename
+
+@benchmark('io')
+def bench_io_write_binary(loops):
+    filename = _tempfile()
+    chunk = b'x' * 4096
+    try:
+        t0 = perf_counter()
+        for _ in range(loops):
+            with open(filename, 'wb') as f:
+                for i in range(256):
+                    f.write(chunk)
+        return perf_counter() - t0
+    finally:
+        os.unlink(filename)
+
+@benchmark('io')
+def bench_io_read_binary(loops):
+    filename = _tempfile()
+    try:
+        with open(filename, 'wb') as f:
+            f.write(b'x' * (1024 * 1024))
+        t0 = perf_counter()
+        for _ in range(loops):
+            with open(filename, 'rb') as f:
+                while f.read(4096):
+                    pass
+        return perf_counter() - t0
+    finally:
+        os.unlink(filename)
+
+@benchmark('io')
+def bench_io_write_text(loops):
+    filename = _tempfile()
+    line = 'The quick brown fox jumps over the lazy dog €\n'
+    try:
+        t0 = perf_counter()
+        for _ in range(loops):
+            with open(filename, 'w', encoding='utf-8') as f:
+                for i in range(1000):
+                    f.write(line)
+        return perf_counter() - t0
+    finally:
+        os.unlink(filename)
+
+@benchmark('io')
+def bench_io_read_lines(loops):
+    filename = _tempfile()
+    try:
+        with open(filename, 'w', encoding='utf-8') as f:
+            for i in range(10000):
+                f.write(f'line {i}: the quick brown fox jumps €\n')
+        t0 = perf_counter()
+        for _ in range(loops):
+            with open(filename, encoding='utf-8') as f:
+                for line in f:
+                    pass
+        return perf_counter() - t0
+    finally:
+        os.unlink(filename)
+
+@benchmark('io')
+def bench_io_bytesio(loops):
+    chunk = b'x' * 100
+    t0 = perf_counter()
+    for _ in range(loops):
+        f = io.BytesIO()
+        for i in range(100):
+            f.write(chunk)
+        f.getvalue()
+    return perf_counter() - t0
+
+
+# Strings
+
+_TEXT = ' '.join(['lorem', 'ipsum', 'dolor', 'sit', 'amet'] * 200)
+_UTEXT = _TEXT.replace('o', '\xf6').replace('m', '€')
+
+@benchmark('strings')
+def bench_str_join(loops):
+    words = _TEXT.split()
+    t0 = perf_counter()
+    for _ in range(loops):
+        ' '.join(words)
+    return perf_counter() - t0
+
+@benchmark('strings')
+def bench_str_split(loops):
+    text = _TEXT
+    t0 = perf_counter()
+    for _ in range(loops):
+        text.split()
+        text.split(' ')
+    return perf_counter() - t0
+
+@benchmark('strings')
+def bench_str_find_replace(loops):
+    text = _TEXT
+    t0 = perf_counter()
+    for _ in range(loops):
+        text.find('amet lorem', 1000)
+        text.replace('ipsum', 'IPSUM')
+        'sit' in text
+    return perf_counter() - t0
+
+@benchmark('strings')
+def bench_str_format(loops):
+    a, b, c = 'abc', 123, 4.5
+    t0 = perf_counter()
+    for _ in range(loops):
+        f'{a} {b} {c}'; f'{a!r:>10} {b:05d} {c:.3f}'
+        '%s %d %.2f' % (a, b, c); '{} {} {}'.format(a, b, c)
+    return perf_counter() - t0
+
+@benchmark('strings')
+def bench_str_encode_decode(loops):
+    text = _UTEXT
+    data = text.encode('utf-8')
+    t0 = perf_counter()
+    for _ in range(loops):
+        text.encode('utf-8')
+        data.decode('utf-8')
+        text.encode('latin-1', 'replace')
+    return perf_counter() - t0
+
+@benchmark('strings')
+def bench_str_methods(loops):
+    text = _UTEXT
+    t0 = perf_counter()
+    for _ in range(loops):
+        text.upper(); text.lower(); text.strip(); text.isalpha()
+    return perf_counter() - t0
+
+
+# Containers
+
+@benchmark('containers')
+def bench_list_append_pop(loops):
+    t0 = perf_counter()
+    for _ in range(loops):
+        lst = []
+        append = lst.append
+        for i in range(100):
+            append(i)
+        while lst:
+            lst.pop()
+    return perf_counter() - t0
+
+@benchmark('containers')
+def bench_list_sort(loops):
+    import random
+    data = list(range(1000))
+    random.Random(5).shuffle(data)
+    t0 = perf_counter()
+    for _ in range(loops):
+        sorted(data)
+    return perf_counter() - t0
+
+@benchmark('containers')
+def bench_dict_ops(loops):
+    keys = [f'key{i}' for i in range(100)]
+    t0 = perf_counter()
+    for _ in range(loops):
+        d = {}
+        for k in keys:
+            d[k] = k
+        for k in keys:
+            d[k]
+        for k in d:
+            pass
+    return perf_counter() - t0
+
+@benchmark('containers')
+def bench_set_ops(loops):
+    a = set(range(0, 200, 2))
+    b = set(range(0, 200, 3))
+    t0 = perf_counter()
+    for _ in range(loops):
+        a | b; a & b; a - b; a ^ b
+        50 in a; 51 in a
+    return perf_counter() - t0
+
+@benchmark('containers')
+def bench_deque_ops(loops):
+    t0 = perf_counter()
+    for _ in range(loops):
+        d = collections.deque()
+        for i in range(100):
+            d.append(i)
+        for i in range(100):
+            d.popleft()
+    return perf_counter() - t0
+
+@benchmark('containers')
+def bench_tuple_hash(loops):
+    tuples = [(i, str(i), float(i)) for i in range(100)]
+    t0 = perf_counter()
+    for _ in range(loops):
+        for t in tuples:
+            hash(t)
+    return perf_counter() - t0
+
+
+# json
+
+_DATA = {
+    'name': 'benchmark',
+    'values': list(range(100)),
+    'floats': [i / 7 for i in range(50)],
+    'nested': [{'id': i, 'tags': ['a', 'b', '\xe9t\xe9'], 'ok': i % 2 == 0,
+                'missing': None}
+               for i in range(50)],
+    'text': _UTEXT[:500],
+}
+
+@benchmark('json')
+def bench_json_dumps(loops):
+    data = _DATA
+    t0 = perf_counter()
+    for _ in range(loops):
+        json.dumps(data)
+    return perf_counter() - t0
+
+@benchmark('json')
+def bench_json_loads(loops):
+    text = json.dumps(_DATA)
+    t0 = perf_counter()
+    for _ in range(loops):
+        json.loads(text)
+    return perf_counter() - t0
+
+
+# pickle
+
+class _Record:
+    def __init__(self, i):
+        self.id = i
+        self.name = f'record {i}'
+        self.values = [i, i * 2.0]
+
+_RECORDS = [_Record(i) for i in range(100)]
+
+@benchmark('pickle')
+def bench_pickle_dumps(loops):
+    data = _DATA
+    t0 = perf_counter()
+    for _ in range(loops):
+        pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+    return perf_counter() - t0
+
+@benchmark('pickle')
+def bench_pickle_loads(loops):
+    data = pickle.dumps(_DATA, pickle.HIGHEST_PROTOCOL)
+    t0 = perf_counter()
+    for _ in range(loops):
+        pickle.loads(data)
+    return perf_counter() - t0
+
+@benchmark('pickle')
+def bench_pickle_objects(loops):
+    records = _RECORDS
+    t0 = perf_counter()
+    for _ in range(loops):
+        pickle.loads(pickle.dumps(records, pickle.HIGHEST_PROTOCOL))
+    return perf_counter() - t0
+
+
+# re
+
+_LOG = '\n'.join(f'2021-06-{i % 28 + 1:02d} 12:{i % 60:02d}:00 '
+                 f'host{i % 7} GET /index{i}.html 200 {i * 37 % 5000}'
+                 for i in range(200))
+
+@benchmark('re')
+def bench_re_search(loops):
+    text = _LOG
+    pattern = re.compile(r'host3 GET /index(1\d\d)\.html')
+    t0 = perf_counter()
+    for _ in range(loops):
+        pattern.search(text)
+    return perf_counter() - t0
+
+@benchmark('re')
+def bench_re_findall(loops):
+    text = _LOG
+    pattern = re.compile(r'(\d+-\d+-\d+) \S+ (\w+) GET (\S+) (\d+)')
+    t0 = perf_counter()
+    for _ in range(loops):
+        pattern.findall(text)
+    return perf_counter() - t0
+
+@benchmark('re')
+def bench_re_sub(loops):
+    text = _LOG
+    pattern = re.compile(r'\d+')
+    t0 = perf_counter()
+    for _ in range(loops):
+        pattern.sub('N', text)
+    return perf_counter() - t0
+
+@benchmark('re')
+def bench_re_compile(loops):
+    patterns = [r'(\d+-\d+-\d+) \S+ (\w+)', r'[a-z]+@[a-z]+\.(com|org)',
+                r'^\s*(?P<key>\w+)\s*=\s*(?P<value>.*)$']
+    t0 = perf_counter()
+    for _ in range(loops):
+        re.purge()
+        for p in patterns:
+            re.compile(p)
+    return perf_counter() - t0
+
+
+# asyncio
+
+def _run_async(main, loops):
+    import asyncio
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(main(loops))
+    finally:
+        loop.close()
+
+@benchmark('asyncio')
+def bench_asyncio_tasks(loops):
+    import asyncio
+    async def child():
+        await asyncio.sleep(0)
+    async def main(loops):
+        t0 = perf_counter()
+        for _ in range(loops):
+            await asyncio.gather(*[child() for i in range(100)])
+        return perf_counter() - t0
+    return _run_async(main, loops)
+
+@benchmark('asyncio')
+def bench_asyncio_call_soon(loops):
+    import asyncio
+    async def main(loops):
+        loop = asyncio.get_running_loop()
+        t0 = perf_counter()
+        for _ in range(loops):
+            fut = loop.create_future()
+            count = 0
+            def callback():
+                nonlocal count
+                count += 1
+                if count == 100:
+                    fut.set_result(None)
+            for i in range(100):
+                loop.call_soon(callback)
+            await fut
+        return perf_counter() - t0
+    return _run_async(main, loops)
+
+@benchmark('asyncio')
+def bench_asyncio_queue(loops):
+    import asyncio
+    async def main(loops):
+        queue = asyncio.Queue()
+        async def consumer(n):
+            for i in range(n):
+                await queue.get()
+        t0 = perf_counter()
+        for _ in range(loops):
+            task = asyncio.ensure_future(consumer(100))
+            for i in range(100):
+                await queue.put(i)
+                if i % 10 == 0:
+                    await asyncio.sleep(0)
+            await task
+        return perf_counter() - t0
+    return _run_async(main, loops)
+
+@benchmark('asyncio')
+def bench_asyncio_streams(loops):
+    import asyncio
+    import socket
+    async def main(loops):
+        rsock, wsock = socket.socketpair()
+        reader, rwriter = await asyncio.open_connection(sock=rsock)
+        _, writer = await asyncio.open_connection(sock=wsock)
+        line = b'x' * 100 + b'\n'
+        t0 = perf_counter()
+        for _ in range(loops):
+            for i in range(10):
+                writer.write(line)
+            await writer.drain()
+            for i in range(10):
+                await reader.readline()
+        elapsed = perf_counter() - t0
+        writer.close()
+        rwriter.close()
+        await writer.wait_closed()
+        await rwriter.wait_closed()
+        return elapsed
+    return _run_async(main, loops)
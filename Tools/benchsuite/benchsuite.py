@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""Run the benchmark suite of the interpreter and compare results.
+
+Usage:
+
+    benchsuite.py list
+    benchsuite.py run [-p PYTHON] [-b BENCH,...] [-o FILE] [--fast|--rigorous]
+    benchsuite.py show FILE
+    benchsuite.py compare BASE CHANGED
+
+The "run" command measures each benchmark in several fresh worker
+processes of the Python being measured (-p, this Python by default).
+The number of loops is calibrated first, so that each value takes
+about --min-time seconds; then every worker runs warmup values, which
+are recorded but ignored, followed by the values used in the results.
+Spreading the values over processes averages out the effects of hash
+randomization and of memory layout, which a single process can't show.
+
+The results are written as JSON with -o.  The "compare" command reads
+the results of two runs, typically of two builds, and uses Welch's
+t-test to report which benchmarks are significantly slower or faster.
+It exits with status 1 when a benchmark is significantly slower.
+"""
+
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import timeit
+
+import benchmarks
+
+SCRIPT = os.path.abspath(__file__)
+FORMAT_VERSION = 1
+
+PROFILES = {
+    # name: (processes, values, warmups, min_time)
+    'fast': (3, 3, 1, 0.05),
+    'default': (8, 3, 1, 0.1),
+    'rigorous': (16, 5, 2, 0.2),
+}
+
+
+# Statistics
+
+def summarize(values, confidence=0.95):
+    """Return the mean, the standard deviation and the half width of the
+    confidence interval of the mean of values."""
+    mean = statistics.fmean(values)
+    if len(values) < 2:
+        return mean, 0.0, math.inf
+    stdev = statistics.stdev(values, mean)
+    t = timeit._t_quantile(confidence, len(values) - 1)
+    return mean, stdev, t * stdev / math.sqrt(len(values))
+
+def format_time(seconds, ref=None):
+    if ref is None:
+        ref = seconds
+    for unit, scale in (('sec', 1.0), ('ms', 1e-3), ('us', 1e-6)):
+        if ref >= scale:
+            break
+    else:
+        unit, scale = 'ns', 1e-9
+    return f'{seconds / scale:.3g} {unit}'
+
+def format_result(values):
+    mean, stdev, ci = summarize(values)
+    return f'{format_time(mean)} +- {format_time(stdev, mean)}'
+
+
+# Worker, run in the measured Python
+
+def worker_calibrate(name, min_time):
+    func = benchmarks.BENCHMARKS[name]
+    loops = 1
+    while True:
+        elapsed = func(loops)
+        if elapsed >= min_time or loops >= 2 ** 32:
+            break
+        # Aim a little above min_time, but never more than 10x the loops
+        # since the first values are dominated by fixed costs.
+        if elapsed > 0:
+            factor = min(max(min_time * 1.2 / elapsed, 2), 10)
+        else:
+            factor = 10
+        loops = int(loops * factor)
+    return {'loops': loops}
+
+def worker_run(name, loops, warmups, values):
+    func = benchmarks.BENCHMARKS[name]
+    return {
+        'warmups': [func(loops) / loops for _ in range(warmups)],
+        'values': [func(loops) / loops for _ in range(values)],
+    }
+
+def worker_metadata():
+    import sysconfig
+    return {
+        'python_version': sys.version,
+        'python_implementation': platform.python_implementation(),
+        'python_executable': sys.executable,
+        'python_cflags': sysconfig.get_config_var('PY_CFLAGS') or '',
+        'python_config_args': sysconfig.get_config_var('CONFIG_ARGS') or '',
+        'debug_build': hasattr(sys, 'gettotalrefcount'),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+# Runner
+
+class WorkerError(Exception):
+    pass
+
+def run_worker(python, *args):
+    cmd = [python, '-E', SCRIPT, 'worker', *map(str, args)]
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE,
+                          stderr=subprocess.PIPE, text=True)
+    if proc.returncode:
+        raise WorkerError(f'{" ".join(cmd)} failed with exit code '
+                          f'{proc.returncode}:\n{proc.stderr}')
+    return json.loads(proc.stdout)
+
+def list_benchmarks():
+    return {name: func.group for name, func in benchmarks.BENCHMARKS.items()}
+
+def select_benchmarks(selection):
+    all_benchmarks = list_benchmarks()
+    if not selection:
+        return list(all_benchmarks)
+    names = []
+    for item in selection.split(','):
+        item = item.strip()
+        if item in all_benchmarks:
+            names.append(item)
+        elif item in all_benchmarks.values():
+            names.extend(name for name, group in all_benchmarks.items()
+                         if group == item)
+        else:
+            raise ValueError(f'unknown benchmark or group: {item!r}')
+    # remove duplicates, keep the order
+    return list(dict.fromkeys(names))
+
+def run_benchmarks(python, names, processes, values, warmups, min_time,
+                   loops=None, verbose=False, out=None):
+    if out is None:
+        out = sys.stdout
+    groups = list_benchmarks()
+    metadata = run_worker(python, 'metadata')
+    metadata['hostname'] = socket.gethostname()
+    metadata['date'] = datetime.datetime.now().isoformat(' ', 'seconds')
+    results = {'version': FORMAT_VERSION, 'metadata': metadata,
+               'benchmarks': {}}
+    for index, name in enumerate(names, 1):
+        if loops is None:
+            bench_loops = run_worker(python, 'calibrate', name,
+                                     min_time)['loops']
+        else:
+            bench_loops = loops
+        all_warmups = []
+        all_values = []
+        for process in range(processes):
+            result = run_worker(python, 'run', name, bench_loops,
+                                warmups, values)
+            all_warmups.extend(result['warmups'])
+            all_values.extend(result['values'])
+            if verbose:
+                print(f'  process {process + 1}/{processes}: '
+                      + ', '.join(map(format_time, result['values'])),
+                      file=out)
+        results['benchmarks'][name] = {
+            'group': groups[name],
+            'loops': bench_loops,
+            'warmups': all_warmups,
+            'values': all_values,
+        }
+        print(f'[{index}/{len(names)}] {name}: {format_result(all_values)}',
+              file=out, flush=True)
+    return results
+
+def load_results(filename):
+    with open(filename, encoding='utf-8') as f:
+        results = json.load(f)
+    if results.get('version') != FORMAT_VERSION:
+        raise ValueError(f'{filename}: unsupported format version '
+                         f'{results.get("version")!r}')
+    return results
+
+def show_results(results, out=None):
+    if out is None:
+        out = sys.stdout
+    for key, value in results['metadata'].items():
+        print(f'{key}: {value}', file=out)
+    print(file=out)
+    width = max(map(len, results['benchmarks']), default=0)
+    for name, bench in results['benchmarks'].items():
+        values = bench['values']
+        mean, stdev, ci = summarize(values)
+        print(f'{name:<{width}}  {format_time(mean)} +- '
+              f'{format_time(stdev, mean)} '
+              f'(95% CI: {format_time(mean - ci, mean)} .. '
+              f'{format_time(mean + ci, mean)}, '
+              f'{len(values)} values x {bench["loops"]} loops)',
+              file=out)
+
+def compare_results(base, changed, alpha=0.05, min_change=0.01):
+    """Compare the benchmarks of two results.
+
+    Return a list of (name, base mean, changed mean, ratio, p-value,
+    significant) tuples, where ratio is changed mean / base mean.  A
+    difference is significant if its p-value is lower than alpha and the
+    means differ by more than min_change (a fraction).
+    """
+    comparison = []
+    for name, bench in base['benchmarks'].items():
+        other = changed['benchmarks'].get(name)
+        if other is None:
+            continue
+        values1 = bench['values']
+        values2 = other['values']
+        mean1 = statistics.fmean(values1)
+        mean2 = statistics.fmean(values2)
+        ratio = mean2 / mean1
+        if len(values1) < 2 or len(values2) < 2:
+            pvalue = 1.0
+        else:
+            pvalue = timeit._welch_ttest(values1, values2)[1]
+        significant = pvalue < alpha and abs(ratio - 1.0) > min_change
+        comparison.append((name, mean1, mean2, ratio, pvalue, significant))
+    return comparison
+
+def show_comparison(comparison, out=None):
+    """Print the comparison and return the number of significantly slower
+    benchmarks."""
+    if out is None:
+        out = sys.stdout
+    slower = faster = 0
+    rows = [('Benchmark', 'base', 'changed', 'change', 'significance')]
+    for name, mean1, mean2, ratio, pvalue, significant in comparison:
+        if ratio >= 1.0:
+            change = f'{ratio:.2f}x slower'
+        else:
+            change = f'{1.0 / ratio:.2f}x faster'
+        if significant:
+            if ratio > 1.0:
+                slower += 1
+            else:
+                faster += 1
+            significance = f'significant (p={pvalue:.3f})'
+        else:
+            significance = f'not significant (p={pvalue:.3f})'
+        rows.append((name, format_time(mean1), format_time(mean2, mean1),
+                     change, significance))
+    widths = [max(len(row[i]) for row in rows) for i in range(4)]
+    for row in rows:
+        print('  '.join(cell.ljust(width)
+                        for cell, width in zip(row, widths)) + '  ' + row[4],
+              file=out)
+    if comparison:
+        geomean = math.exp(statistics.fmean(math.log(c[3])
+                                            for c in comparison))
+        print(file=out)
+        print(f'Geometric mean: {geomean:.3f}x', file=out)
+    print(f'{slower} significantly slower, {faster} significantly faster, '
+          f'{len(comparison) - slower - faster} not significant',
+          file=out)
+    return slower
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    subparsers.add_parser('list', help='list the benchmarks and their groups')
+
+    cmd = subparsers.add_parser('run', help='run benchmarks')
+    cmd.add_argument('-p', '--python', default=sys.executable,
+                     help='Python executable to benchmark '
+                          '(default: %(default)s)')
+    cmd.add_argument('-b', '--benchmarks', default='',
+                     help='comma separated list of benchmarks or groups '
+                          '(default: all)')
+    cmd.add_argument('-o', '--output', help='write the results as JSON')
+    cmd.add_argument('-v', '--verbose', action='store_true',
+                     help='show the values of each process')
+    profile = cmd.add_mutually_exclusive_group()
+    profile.add_argument('--fast', dest='profile', action='store_const',
+                         const='fast', help='fewer processes and values')
+    profile.add_argument('--rigorous', dest='profile', action='store_const',
+                         const='rigorous', help='more processes and values')
+    cmd.add_argument('--processes', type=int,
+                     help='number of worker processes per benchmark')
+    cmd.add_argument('--values', type=int,
+                     help='number of values per process')
+    cmd.add_argument('--warmups', type=int,
+                     help='number of ignored warmup values per process')
+    cmd.add_argument('--min-time', type=float,
+                     help='minimum duration of a value in seconds, used '
+                          'to calibrate the loops')
+    cmd.add_argument('--loops', type=int,
+                     help='number of loops per value (default: calibrated)')
+
+    cmd = subparsers.add_parser('show', help='show results')
+    cmd.add_argument('filename')
+
+    cmd = subparsers.add_parser('compare',
+                                help='compare the results of two runs')
+    cmd.add_argument('base')
+    cmd.add_argument('changed')
+    cmd.add_argument('--alpha', type=float, default=0.05,
+                     help='significance level of the t-test '
+                          '(default: %(default)s)')
+    cmd.add_argument('--min-change', type=float, default=1.0,
+                     help='ignore changes smaller than this percentage '
+                          '(default: %(default)s)')
+
+    cmd = subparsers.add_parser('worker')
+    cmd.add_argument('action', choices=('calibrate', 'run', 'metadata'))
+    cmd.add_argument('arguments', nargs='*')
+
+    args = parser.parse_args(args)
+
+    if args.command == 'list':
+        for name, group in list_benchmarks().items():
+            print(f'{group:<12} {name}')
+
+    elif args.command == 'run':
+        processes, values, warmups, min_time = \
+            PROFILES[args.profile or 'default']
+        try:
+            names = select_benchmarks(args.benchmarks)
+        except ValueError as exc:
+            parser.error(str(exc))
+        try:
+            results = run_benchmarks(
+                args.python, names,
+                processes=args.processes or processes,
+                values=args.values or values,
+                warmups=args.warmups if args.warmups is not None else warmups,
+                min_time=args.min_time or min_time,
+                loops=args.loops, verbose=args.verbose)
+        except WorkerError as exc:
+            print(exc, file=sys.stderr)
+            return 1
+        if args.output:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                json.dump(results, f, indent=1)
+                f.write('\n')
+
+    elif args.command == 'show':
+        show_results(load_results(args.filename))
+
+    elif args.command == 'compare':
+        comparison = compare_results(load_results(args.base),
+                                     load_results(args.changed),
+                                     args.alpha, args.min_change / 100)
+        if show_comparison(comparison):
+            return 1
+
+    elif args.command == 'worker':
+        if args.action == 'calibrate':
+            name, min_time = args.arguments
+            result = worker_calibrate(name, float(min_time))
+        elif args.action == 'run':
+            name, loops, warmups, values = args.arguments
+            result = worker_run(name, int(loops), int(warmups), int(values))
+        else:
+            result = worker_metadata()
+        json.dump(result, sys.stdout)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())